@@ -0,0 +1,57 @@
+"""
+Single-phase states of water vapor in the (pressure, enthalpy) rectangle:
+flash calculations vs. the piecewise Chebyshev surrogate model
+(see `ChebyshevSurrogate`).
+
+    python benchmarks/chebyshev_surrogates.py [states]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from pyfluids import ChebyshevSurrogate, Fluid, FluidsList, Input
+
+PRESSURES = (1e4, 1e6)
+ENTHALPIES = (2.8e6, 3.5e6)
+PROPERTIES = ["temperature", "density", "dynamic_viscosity", "sound_speed"]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    fluid = Fluid(FluidsList.Water)
+    rng = np.random.default_rng(0)
+    pressures = np.exp(rng.uniform(*np.log(PRESSURES), count))
+    enthalpies = rng.uniform(*ENTHALPIES, count)
+    start = perf_counter()
+    expected = {key: np.empty(count) for key in PROPERTIES}
+    for i, (pressure, enthalpy) in enumerate(zip(pressures, enthalpies)):
+        state = fluid.with_state(Input.pressure(pressure), Input.enthalpy(enthalpy))
+        for key in PROPERTIES:
+            expected[key][i] = getattr(state, key)
+    flash = (perf_counter() - start) / count * 1e6
+    start = perf_counter()
+    surrogate = ChebyshevSurrogate.fit(
+        fluid, Input.pressure, PRESSURES, Input.enthalpy, ENTHALPIES, PROPERTIES
+    )
+    fitting = (perf_counter() - start) * 1e3
+    start = perf_counter()
+    actual = surrogate.evaluate(pressures, enthalpies)
+    evaluation = (perf_counter() - start) / count * 1e6
+    error = max(
+        float(np.max(np.abs(actual[key] - expected[key]) / np.abs(expected[key])))
+        for key in PROPERTIES
+    )
+    print(f"States: {count}, patches: {surrogate.patches}")
+    print(f"Flash calculations: {flash:.1f} us per state")
+    print(f"Fitting of the surrogate model: {fitting:.0f} ms")
+    print(f"Surrogate model: {evaluation:.2f} us per state ({flash / evaluation:.0f}x)")
+    print(f"Max relative error ({', '.join(PROPERTIES)}): {error:.1e}")
+    print(f"Size of the JSON model: {len(surrogate.as_json(False)) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+States of the R32/R125 blends with different fractions:
+new mixture instance for each composition vs. `composition_sweep`
+and `composition_grid` (a single CoolProp backend).
+
+    python benchmarks/composition_sweep.py [compositions]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import FluidsList, Input, Mixture
+
+FLUIDS = [FluidsList.R32, FluidsList.R125]
+
+
+def new_instances(fractions: list[list[float]], states: list[list[Input]]):
+    for composition in fractions:
+        mixture = Mixture(FLUIDS, composition)
+        for inputs in states:
+            mixture.update(*inputs)
+            mixture.density
+
+
+def sweep(fractions: list[list[float]], states: list[list[Input]]):
+    for inputs in states:
+        for mixture in Mixture(FLUIDS, fractions[0]).composition_sweep(
+            fractions, *inputs
+        ):
+            mixture.density
+
+
+def grid(fractions: list[list[float]], states: list[list[Input]]):
+    Mixture(FLUIDS, fractions[0]).composition_grid(fractions, states, ["density"])
+
+
+def duration(method, fractions: list[list[float]], states: list[list[Input]]):
+    start = perf_counter()
+    method(fractions, states)
+    return (perf_counter() - start) / (len(fractions) * len(states)) * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    fractions = [
+        [10 + 80 * i / (count - 1), 90 - 80 * i / (count - 1)] for i in range(count)
+    ]
+    print(f"{'States':>6} {'New instances, us':>18} {'Sweep, us':>10} {'Grid, us':>9}")
+    for pressures in ([1e5], [1e5, 2e5, 5e5]):
+        states = [[Input.pressure(i), Input.temperature(20)] for i in pressures]
+        print(
+            f"{len(states):>6} {duration(new_instances, fractions, states):>18.0f} "
+            f"{duration(sweep, fractions, states):>10.0f} "
+            f"{duration(grid, fractions, states):>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compressor map of R134a (outlet states for a grid of pressures and efficiencies):
+an intermediate fluid instance for each isentropic end state,
+the single process methods and the batch variant.
+
+    python benchmarks/compressor_map.py [pressures] [efficiencies]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList, Input
+
+
+def intermediate_instances(inlet: Fluid, pressures, efficiencies):
+    return [
+        inlet.with_state(
+            Input.pressure(pressure),
+            Input.enthalpy(
+                inlet.enthalpy
+                + (
+                    inlet.isentropic_compression_to_pressure(pressure).enthalpy
+                    - inlet.enthalpy
+                )
+                / (efficiency * 1e-2)
+            ),
+        )
+        for pressure, efficiency in zip(pressures, efficiencies)
+    ]
+
+
+def single_processes(inlet: Fluid, pressures, efficiencies):
+    return [
+        inlet.compression_to_pressure(pressure, efficiency)
+        for pressure, efficiency in zip(pressures, efficiencies)
+    ]
+
+
+def batch_process(inlet: Fluid, pressures, efficiencies):
+    return inlet.compression_to_pressures(pressures, efficiencies)
+
+
+def duration(method, inlet: Fluid, pressures, efficiencies, repeats: int = 3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        method(inlet, pressures, efficiencies)
+        best = min(best, perf_counter() - start)
+    return best / len(pressures) * 1e6
+
+
+def main():
+    pressures_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    efficiencies_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    inlet = Fluid(FluidsList.R134a).with_state(
+        Input.pressure(3e5), Input.temperature(10)
+    )
+    grid = [
+        (6e5 + 1.4e6 * i / (pressures_count - 1), 50 + 40 * j / efficiencies_count)
+        for i in range(pressures_count)
+        for j in range(efficiencies_count)
+    ]
+    pressures, efficiencies = [i[0] for i in grid], [i[1] for i in grid]
+    print(f"{'Method':>24} {'us per outlet state':>20}")
+    for name, method in [
+        ("Intermediate instances", intermediate_instances),
+        ("Single processes", single_processes),
+        ("Batch variant", batch_process),
+    ]:
+        print(f"{name:>24} {duration(method, inlet, pressures, efficiencies):>20.0f}")
+
+
+if __name__ == "__main__":
+    main()
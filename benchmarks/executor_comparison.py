@@ -0,0 +1,77 @@
+"""
+Thread vs process vs sub-interpreter workers of the batch evaluator
+on the pure fluid and humid air workloads:
+
+    python benchmarks/executor_comparison.py [states] [workers]
+
+Sub-interpreter workers are measured only if they are available
+(Python 3.14+) and CoolProp can be loaded by isolated sub-interpreters.
+"""
+
+from __future__ import annotations
+
+import sys
+from os import cpu_count
+from time import perf_counter
+
+from pyfluids import (
+    BatchEvaluator,
+    Executors,
+    Fluid,
+    FluidsList,
+    HumidAir,
+    Input,
+    InputHumidAir,
+)
+
+
+def workloads(count: int) -> dict[str, tuple]:
+    return {
+        "Fluid (PT)": (
+            Fluid(FluidsList.Water),
+            [
+                (Input.pressure(101325), Input.temperature(5 + 90 * i / count))
+                for i in range(count)
+            ],
+            ["density", "enthalpy"],
+        ),
+        "Humid air (PTR)": (
+            HumidAir(),
+            [
+                (
+                    InputHumidAir.pressure(101325),
+                    InputHumidAir.temperature(40 * i / count),
+                    InputHumidAir.relative_humidity(50),
+                )
+                for i in range(count // 10)
+            ],
+            ["enthalpy", "humidity"],
+        ),
+    }
+
+
+def elapsed(evaluator: BatchEvaluator, prototype, states, properties) -> float:
+    start = perf_counter()
+    evaluator.evaluate(prototype, states, properties)
+    return perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else cpu_count() or 1
+    print(f"Workers: {workers}, states: {count}")
+    for executor in Executors:
+        try:
+            evaluator = BatchEvaluator(workers, executor=executor)
+            with evaluator:
+                for name, (prototype, states, properties) in workloads(count).items():
+                    # Warm up the pool (imports and backends of the workers)
+                    elapsed(evaluator, prototype, states[:workers], properties)
+                    duration = elapsed(evaluator, prototype, states, properties)
+                    print(f"{executor.name:<12} {name:<16} {duration:.3f} s")
+        except (ValueError, RuntimeError) as e:
+            print(f"{executor.name:<12} unavailable: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Temperature profiles of the refrigerant condenser cooled by water:
+independent flash calculations for each node (`with_state`)
+vs. warm-started nodes (`CounterflowHeatExchanger.profile`).
+
+    python benchmarks/heat_exchanger_profile.py [segments]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import CounterflowHeatExchanger, Fluid, FluidsList, Input
+
+
+def independent(
+    hot, hot_mass_flow_rate, cold, cold_mass_flow_rate, heat_flow, segments
+):
+    for i in range(segments + 1):
+        transferred = heat_flow * i / segments
+        hot.with_state(
+            Input.pressure(hot.pressure),
+            Input.enthalpy(hot.enthalpy - transferred / hot_mass_flow_rate),
+        ).temperature
+        cold.with_state(
+            Input.pressure(cold.pressure),
+            Input.enthalpy(
+                cold.enthalpy + (heat_flow - transferred) / cold_mass_flow_rate
+            ),
+        ).temperature
+
+
+def duration(method, *args, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        method(*args)
+        best = min(best, perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    segments = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    water = Fluid(FluidsList.Water).with_state(
+        Input.pressure(2e5), Input.temperature(25)
+    )
+    print(f"{'Refrigerant':>12} {'Independent, ms':>16} {'Profile, ms':>12}")
+    for name in (FluidsList.R134a, FluidsList.R290, FluidsList.Water):
+        refrigerant = Fluid(name)
+        condensing = 40 if name != FluidsList.Water else 110
+        hot = refrigerant.dew_point_at_temperature(condensing).heating_to_temperature(
+            condensing + 30
+        )
+        heat_flow = 0.1 * (
+            hot.enthalpy
+            - refrigerant.bubble_point_at_temperature(condensing - 2).enthalpy
+        )
+        cold_mass_flow_rate = heat_flow / 4180 / 10
+        args = (hot, 0.1, water, cold_mass_flow_rate, heat_flow)
+        exchanger = CounterflowHeatExchanger(segments)
+        print(
+            f"{name.name:>12} {duration(independent, *args, segments):>16.2f} "
+            f"{duration(exchanger.profile, *args):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Static vs cost-aware chunking of a heterogeneous batch of fluid states
+(cheap PT flashes mixed with expensive HS flashes):
+
+    python benchmarks/heterogeneous_batch.py [states] [workers]
+"""
+
+from __future__ import annotations
+
+import sys
+from math import ceil
+from os import cpu_count
+from time import perf_counter
+
+from pyfluids import BatchEvaluator, Fluid, FluidsList, Input
+
+
+def states(count: int) -> list[tuple[Input, Input]]:
+    result = [
+        (Input.pressure(101325 + 10 * i), Input.temperature(20 + 60 * i / count))
+        for i in range(count)
+    ]
+    # Expensive states are clustered, so static chunks are unbalanced
+    for i in range(count // 50):
+        result[i] = (Input.enthalpy(2.7e6 + 10 * i), Input.entropy(7e3))
+    return result
+
+
+def elapsed(evaluator: BatchEvaluator, batch: list[tuple[Input, Input]]) -> float:
+    start = perf_counter()
+    evaluator.evaluate(Fluid(FluidsList.Water), batch, ["density", "enthalpy"])
+    return perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else cpu_count() or 1
+    batch = states(count)
+    static = BatchEvaluator(workers, chunk_size=ceil(count / (4 * workers)))
+    adaptive = BatchEvaluator(workers)
+    # Warm up the running statistics of the cost model
+    elapsed(adaptive, batch[:: max(1, count // 1000)])
+    print(f"Workers: {workers}, states: {count}")
+    print(f"Static chunks:     {elapsed(static, batch):.3f} s")
+    print(f"Cost-aware chunks: {elapsed(adaptive, batch):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
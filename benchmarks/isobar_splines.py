@@ -0,0 +1,67 @@
+"""
+Single-phase states of water at a handful of fixed pressures
+with enthalpy as input: flash calculations vs. prepared isobars
+(see `prepare_isobars` and `IsobarSplineCache`).
+
+    python benchmarks/isobar_splines.py [states]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList, Input, IsobarSplineCache
+
+PRESSURES = [2e5, 1e6, 5e6, 3e7]
+
+
+def evaluate(fluid: Fluid, states: list[tuple[float, float]]) -> list[float]:
+    results = []
+    for pressure, enthalpy in states:
+        fluid.update(Input.pressure(pressure), Input.enthalpy(enthalpy))
+        results.append(fluid.temperature)
+        results.append(fluid.density)
+        results.append(fluid.conductivity)
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    fluid = Fluid(FluidsList.Water)
+    random.seed(0)
+    states = []
+    for pressure in PRESSURES:
+        liquid = fluid.with_state(Input.pressure(pressure), Input.temperature(5))
+        vapor = fluid.with_state(Input.pressure(pressure), Input.temperature(600))
+        for _ in range(count // len(PRESSURES)):
+            enthalpy = random.uniform(liquid.enthalpy, vapor.enthalpy)
+            if pressure < fluid.critical_pressure:
+                # Only the single-phase states
+                bubble = fluid.bubble_point_at_pressure(pressure).enthalpy
+                dew = fluid.dew_point_at_pressure(pressure).enthalpy
+                if bubble <= enthalpy <= dew:
+                    continue
+            states.append((pressure, enthalpy))
+    IsobarSplineCache().clear()
+    start = perf_counter()
+    expected = evaluate(fluid.factory(), states)
+    flash = (perf_counter() - start) / len(states) * 1e6
+    start = perf_counter()
+    prepared = fluid.factory().prepare_isobars(PRESSURES)
+    preparation = (perf_counter() - start) * 1e3
+    start = perf_counter()
+    actual = evaluate(prepared, states)
+    interpolation = (perf_counter() - start) / len(states) * 1e6
+    error = max(abs(i - j) / abs(j) for i, j in zip(actual, expected))
+    print(f"States: {len(states)}, pressures: {len(PRESSURES)}")
+    print(f"Flash calculations: {flash:.1f} us per state")
+    print(f"Preparation of the isobars: {preparation:.0f} ms")
+    print(f"Prepared isobars: {interpolation:.1f} us per state")
+    print(f"Max relative error (temperature, density, conductivity): {error:.1e}")
+    IsobarSplineCache().clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Isolines of the p-h diagram of water: independent flash calculations
+for each point (`with_state`) vs. `IsolineGenerator` (warm-started points,
+refinement near the saturation line) vs. the cached isolines.
+
+    python benchmarks/isolines.py [points]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList, Input, IsolineGenerator
+
+
+def independent(fluid: Fluid, constants: list[Input], pressures: list[float]):
+    for constant in constants:
+        for pressure in pressures:
+            try:
+                fluid.with_state(constant, Input.pressure(pressure)).enthalpy
+            except ValueError:
+                pass
+
+
+def generated(
+    generator: IsolineGenerator,
+    fluid: Fluid,
+    constants: list[Input],
+    pressures: list[float],
+):
+    generator.isolines(
+        fluid,
+        constants,
+        Input.pressure,
+        pressures[0],
+        pressures[-1],
+        len(pressures),
+        True,
+    )
+
+
+def duration(method, *args) -> float:
+    start = perf_counter()
+    method(*args)
+    return (perf_counter() - start) * 1e3
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    fluid = Fluid(FluidsList.Water)
+    constants = (
+        [Input.temperature(i) for i in range(50, 601, 50)]
+        + [Input.entropy(i) for i in range(1000, 9001, 1000)]
+        + [Input.density(i) for i in (0.1, 1, 10, 100)]
+        + [Input.quality(i) for i in range(0, 101, 20)]
+    )
+    pressures = [1e3 * (1e5 ** (i / (points - 1))) for i in range(points)]
+    generator = IsolineGenerator()
+    print(f"{len(constants)} isolines, {points} points")
+    print(
+        f"{'Independent, ms':>16} {duration(independent, fluid, constants, pressures):>8.0f}"
+    )
+    print(
+        f"{'Generator, ms':>16} "
+        f"{duration(generated, generator, fluid, constants, pressures):>8.0f}"
+    )
+    print(
+        f"{'Cached, ms':>16} "
+        f"{duration(generated, generator, fluid, constants, pressures):>8.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
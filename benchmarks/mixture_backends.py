@@ -0,0 +1,80 @@
+"""
+Speed and accuracy of the mixture backends: HEOS vs. the cubic equations
+of state (PR and SRK), relative to HEOS.
+
+    python benchmarks/mixture_backends.py [states]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import FluidsList, Input, Mixture, Phases
+
+FLUIDS = [FluidsList.R32, FluidsList.R125]
+FRACTIONS = [50, 50]
+
+
+def evaluate(
+    mixture: Mixture, inputs: list[list[Input]]
+) -> tuple[float, list[float], list[float]]:
+    temperatures, densities = [], []
+    start = perf_counter()
+    for i in inputs:
+        mixture.update(*i)
+        temperatures.append(mixture.temperature)
+        densities.append(mixture.density)
+    return (perf_counter() - start) / len(inputs) * 1e6, temperatures, densities
+
+
+def linspace(start: float, stop: float, count: int) -> list[float]:
+    return [start + (stop - start) * i / (count - 1) for i in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    pressures = linspace(2e5, 2e6, count)
+    temperatures = linspace(20, 100, count)
+    cases = {
+        "Bubble points (PQ)": (
+            None,
+            [[Input.pressure(i), Input.quality(0)] for i in pressures],
+        ),
+        "Dew points (PQ)": (
+            None,
+            [[Input.pressure(i), Input.quality(100)] for i in pressures],
+        ),
+        "Gas (PT)": (
+            Phases.Gas,
+            [[Input.pressure(1e5), Input.temperature(i)] for i in temperatures],
+        ),
+    }
+    print(
+        f"{'States':>18} {'Backend':>8} {'Time, us':>9} "
+        f"{'Max dT, K':>10} {'Max dD, %':>10}"
+    )
+    for name, (phase, inputs) in cases.items():
+        reference = None
+        for backend in ("HEOS", "PR", "SRK"):
+            mixture = Mixture(FLUIDS, FRACTIONS, backend)
+            if phase is not None:
+                # The cubic backends cannot evaluate the phase of some mixtures
+                mixture.specify_phase(phase)
+            duration, temperatures, densities = evaluate(mixture, inputs)
+            if reference is None:
+                reference = temperatures, densities
+            temperature_error = max(
+                abs(i - j) for i, j in zip(temperatures, reference[0])
+            )
+            density_error = max(
+                abs(i - j) / j * 100 for i, j in zip(densities, reference[1])
+            )
+            print(
+                f"{name:>18} {backend:>8} {duration:>9.0f} "
+                f"{temperature_error:>10.2f} {density_error:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
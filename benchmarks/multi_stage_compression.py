@@ -0,0 +1,84 @@
+"""
+Two-stage compression of CO2 with intercooling on a grid
+of intermediate pressures and isentropic efficiencies:
+chained process methods vs. the batch solution.
+
+    python benchmarks/multi_stage_compression.py [pressures] [efficiencies]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList, Input, MultiStageCompression
+
+OUTLET_PRESSURE = 10e6
+INTERCOOLING_TEMPERATURE = 35
+
+
+def by_hand(inlet: Fluid, points: list[tuple[float, float]]) -> list[float]:
+    works = []
+    for pressure, efficiency in points:
+        first_outlet = inlet.compression_to_pressure(pressure, efficiency)
+        second_inlet = (
+            first_outlet.cooling_to_temperature(INTERCOOLING_TEMPERATURE)
+            if first_outlet.temperature > INTERCOOLING_TEMPERATURE
+            else first_outlet
+        )
+        second_outlet = second_inlet.compression_to_pressure(
+            OUTLET_PRESSURE, efficiency
+        )
+        works.append(
+            first_outlet.enthalpy
+            - inlet.enthalpy
+            + second_outlet.enthalpy
+            - second_inlet.enthalpy
+        )
+    return works
+
+
+def batch(inlet: Fluid, points: list[tuple[float, float]]) -> list[float]:
+    solutions = MultiStageCompression(
+        inlet, OUTLET_PRESSURE, INTERCOOLING_TEMPERATURE
+    ).solve_batch([[i[0]] for i in points], [i[1] for i in points])
+    return [i.specific_work for i in solutions]
+
+
+def main():
+    pressures_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    efficiencies_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    inlet = Fluid(FluidsList.R744).with_state(
+        Input.pressure(15e5), Input.temperature(-25)
+    )
+    points = [
+        (
+            inlet.pressure
+            * (OUTLET_PRESSURE / inlet.pressure) ** ((i + 1) / (pressures_count + 1)),
+            65 + 20 * j / max(efficiencies_count - 1, 1),
+        )
+        for i in range(pressures_count)
+        for j in range(efficiencies_count)
+    ]
+    print(f"{'Method':>10} {'us per point':>13}")
+    for name, method in [("By hand", by_hand), ("Batch", batch)]:
+        start = perf_counter()
+        method(inlet, points)
+        duration = (perf_counter() - start) / len(points) * 1e6
+        print(f"{name:>10} {duration:>13.0f}")
+    compression = MultiStageCompression(
+        inlet, OUTLET_PRESSURE, INTERCOOLING_TEMPERATURE
+    )
+    for stages in (2, 3, 4):
+        start = perf_counter()
+        solution = compression.optimal(stages, 75)
+        print(
+            f"Optimal {stages} stages: "
+            f"{', '.join(f'{i / 1e5:.2f}' for i in solution.intermediate_pressures)}"
+            f" bar, {solution.specific_work / 1e3:.2f} kJ/kg "
+            f"({(perf_counter() - start) * 1e3:.0f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
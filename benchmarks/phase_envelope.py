@@ -0,0 +1,60 @@
+"""
+Bubble and dew points of the mixture at given pressures:
+flash calculations from scratch vs. initial guesses interpolated
+from the cached phase envelope (see `PhaseEnvelopeCache`).
+
+    python benchmarks/phase_envelope.py [points]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import FluidsList, Input, Mixture, PhaseEnvelopeCache
+
+
+def points(mixture: Mixture, pressures: list[float]) -> int:
+    fluid, failures = mixture.factory(), 0
+    for pressure in pressures:
+        for quality in (0, 100):
+            try:
+                fluid.update(Input.pressure(pressure), Input.quality(quality))
+            except ValueError:
+                failures += 1
+    return failures
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    cases = [
+        ([FluidsList.R32, FluidsList.R125], [50, 50], (1e5, 4.5e6)),
+        ([FluidsList.Water, FluidsList.Ethanol], [60, 40], (1e4, 1e7)),
+    ]
+    print(
+        f"{'Mixture':>14} {'Build, ms':>10} {'Scratch, us':>12} {'Failures':>9} "
+        f"{'Envelope, us':>13} {'Failures':>9}"
+    )
+    for fluids, fractions, (start, stop) in cases:
+        mixture = Mixture(fluids, fractions)
+        pressures = [start + (stop - start) * i / (count - 1) for i in range(count)]
+        results = []
+        PhaseEnvelopeCache().clear()
+        begin = perf_counter()
+        mixture.phase_envelope()
+        build = (perf_counter() - begin) * 1e3
+        for enabled in (False, True):
+            PhaseEnvelopeCache().enabled = enabled
+            begin = perf_counter()
+            failures = points(mixture, pressures)
+            results += [(perf_counter() - begin) / count / 2 * 1e6, failures]
+        name = "&".join(i.name for i in fluids)
+        print(
+            f"{name:>14} {build:>10.1f} {results[0]:>12.0f} {results[1]:>9} "
+            f"{results[2]:>13.0f} {results[3]:>9}"
+        )
+    PhaseEnvelopeCache().enabled = True
+
+
+if __name__ == "__main__":
+    main()
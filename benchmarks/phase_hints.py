@@ -0,0 +1,83 @@
+"""
+Process methods of the fluid with and without the phase hints.
+
+    python benchmarks/phase_hints.py [processes]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList, Input
+
+
+def duration(fluid: Fluid, process, count: int, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        for i in range(count):
+            process(fluid, i)
+        best = min(best, perf_counter() - start)
+    return best / count * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    water = Fluid(FluidsList.Water)
+    steam = water.with_state(Input.pressure(1e5), Input.temperature(150))
+    liquid = water.with_state(Input.pressure(1e6), Input.temperature(80))
+    refrigerant = Fluid(FluidsList.R134a).with_state(
+        Input.pressure(3e5), Input.temperature(10)
+    )
+    cases = [
+        (
+            "Steam, isentropic compression",
+            steam,
+            lambda fluid, i: fluid.isentropic_compression_to_pressure(5e5 + i),
+        ),
+        (
+            "Steam, compression",
+            steam,
+            lambda fluid, i: fluid.compression_to_pressure(5e5 + i, 80),
+        ),
+        (
+            "R134a, compression",
+            refrigerant,
+            lambda fluid, i: fluid.compression_to_pressure(1.5e6 + i, 80),
+        ),
+        (
+            "R134a, isenthalpic expansion",
+            refrigerant,
+            lambda fluid, i: fluid.isenthalpic_expansion_to_pressure(1e5 + i),
+        ),
+        (
+            "Water, cooling to enthalpy",
+            liquid,
+            lambda fluid, i: fluid.cooling_to_enthalpy(2e5 + i),
+        ),
+        (
+            "Water, cooling to temperature",
+            liquid,
+            lambda fluid, i: fluid.cooling_to_temperature(20 + i * 1e-3),
+        ),
+        (
+            "Steam, heating to temperature",
+            steam,
+            lambda fluid, i: fluid.heating_to_temperature(300 + i * 1e-3),
+        ),
+        (
+            "Steam, expansion (wrong hint)",
+            steam,
+            lambda fluid, i: fluid.isentropic_expansion_to_pressure(1e4 + i),
+        ),
+    ]
+    print(f"{'Process':>30} {'Without hints, us':>18} {'With hints, us':>15}")
+    for name, fluid, process in cases:
+        without_hints = duration(fluid, process, count)
+        with_hints = duration(fluid.clone().enable_phase_hints(), process, count)
+        print(f"{name:>30} {without_hints:>18.0f} {with_hints:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+States of water in the (pressure, enthalpy) rectangle, which contains
+the saturation dome: flash calculations vs. the memory-mapped
+adaptive quadtree table (see `QuadtreeTable`).
+
+    python benchmarks/quadtree_tables.py [states] [max depth]
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+
+from pyfluids import Fluid, FluidsList, Input, QuadtreeTable
+
+PRESSURES = (1e4, 1e7)
+ENTHALPIES = (1e5, 3.5e6)
+PROPERTIES = ["temperature", "specific_volume", "entropy"]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    max_depth = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    fluid = Fluid(FluidsList.Water)
+    rng = np.random.default_rng(0)
+    pressures = np.exp(rng.uniform(*np.log(PRESSURES), count))
+    enthalpies = rng.uniform(*ENTHALPIES, count)
+    instance = fluid.factory()
+    expected = {key: np.empty(count) for key in PROPERTIES}
+    start = perf_counter()
+    for i, (pressure, enthalpy) in enumerate(zip(pressures, enthalpies)):
+        instance.update(Input.pressure(pressure), Input.enthalpy(enthalpy))
+        for key in PROPERTIES:
+            expected[key][i] = getattr(instance, key)
+    flash = (perf_counter() - start) / count * 1e6
+    start = perf_counter()
+    table = QuadtreeTable.build(
+        fluid, PRESSURES, ENTHALPIES, PROPERTIES, max_depth=max_depth
+    )
+    building = perf_counter() - start
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "water.npy"
+        table.save(path)
+        table = QuadtreeTable.load(path)
+        start = perf_counter()
+        actual = table.evaluate(pressures, enthalpies)
+        lookup = (perf_counter() - start) / count * 1e6
+        valid = ~np.isnan(actual[PROPERTIES[0]])
+        error = max(
+            float(
+                np.max(
+                    np.abs(actual[key][valid] - expected[key][valid])
+                    / np.maximum(np.abs(expected[key][valid]), 1)
+                )
+            )
+            for key in PROPERTIES
+        )
+        print(f"States: {count}, max depth: {max_depth}")
+        print(f"Flash calculations: {flash:.1f} us per state")
+        print(
+            f"Building of the table: {building:.1f} s, {table.nodes} nodes, "
+            f"{table.leaves} leaves ({table.invalid_leaves} invalid), "
+            f"{table.nbytes / 1024:.0f} KiB"
+        )
+        print(f"Memory-mapped table: {lookup:.2f} us per state")
+        print(f"States in the invalid leaves: {np.count_nonzero(~valid)}")
+        print(f"Max relative error ({', '.join(PROPERTIES)}): {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
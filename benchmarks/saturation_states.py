@@ -0,0 +1,63 @@
+"""
+Saturation states of pure fluids: superancillary fast path
+(see `SuperancillaryCache`) vs. the general CoolProp flash.
+
+    python benchmarks/saturation_states.py [states]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList, SuperancillaryCache
+
+
+def duration(method, values: list[float], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        method(values)
+        best = min(best, perf_counter() - start)
+    return best / len(values) * 1e6
+
+
+def linspace(start: float, stop: float, count: int) -> list[float]:
+    return [start + (stop - start) * i / (count - 1) for i in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    fluid = Fluid(FluidsList.Water)
+    pressures = linspace(1e4, 2e7, count)
+    temperatures = linspace(10, 350, count)
+    cases = [
+        ("bubble_point_at_pressure", pressures, fluid.bubble_point_at_pressure),
+        ("dew_point_at_pressure", pressures, fluid.dew_point_at_pressure),
+        (
+            "bubble_point_at_temperature",
+            temperatures,
+            fluid.bubble_point_at_temperature,
+        ),
+    ]
+    print(f"{'Method':>30} {'Fast path, us':>14} {'General, us':>12}")
+    for name, values, method in cases:
+        results = []
+        for enabled in (True, False):
+            SuperancillaryCache().enabled = enabled
+            results.append(duration(lambda x: [method(i) for i in x], values))
+        print(f"{name:>30} {results[0]:>14.0f} {results[1]:>12.0f}")
+    results = []
+    for enabled in (True, False):
+        SuperancillaryCache().enabled = enabled
+        results.append(
+            duration(lambda x: fluid.two_phase_points_at_pressures(x, 50), pressures)
+        )
+    print(
+        f"{'two_phase_points_at_pressures':>30} {results[0]:>14.0f} {results[1]:>12.0f}"
+    )
+    SuperancillaryCache().enabled = True
+
+
+if __name__ == "__main__":
+    main()
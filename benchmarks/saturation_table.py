@@ -0,0 +1,75 @@
+"""
+Saturation tables: bubble and dew points evaluated row by row
+(`bubble_point_at_*` and `dew_point_at_*`) vs. `saturation_table`.
+
+    python benchmarks/saturation_table.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList
+
+
+def row_by_row(fluid: Fluid, temperatures: list[float], pressures: list[float]):
+    points = [
+        point
+        for temperature in temperatures
+        for point in (
+            fluid.bubble_point_at_temperature(temperature),
+            fluid.dew_point_at_temperature(temperature),
+        )
+    ] + [
+        point
+        for pressure in pressures
+        for point in (
+            fluid.bubble_point_at_pressure(pressure),
+            fluid.dew_point_at_pressure(pressure),
+        )
+    ]
+    for point in points:
+        point.density, point.enthalpy, point.entropy, point.conductivity
+
+
+def table(fluid: Fluid, temperatures: list[float], pressures: list[float]):
+    fluid.saturation_table(temperatures=temperatures)
+    fluid.saturation_table(pressures=pressures)
+
+
+def duration(method, *args, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        method(*args)
+        best = min(best, perf_counter() - start)
+    return best * 1e3
+
+
+def linspace(start: float, stop: float, count: int) -> list[float]:
+    return [start + (stop - start) * i / (count - 1) for i in range(count)]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cases = [
+        (FluidsList.Water, (10, 350), (1e4, 2e7)),
+        (FluidsList.R134a, (-40, 90), (5e4, 3.5e6)),
+        (FluidsList.R407C, (-40, 70), (5e4, 3e6)),
+    ]
+    print(f"{'Fluid':>8} {'Row by row, ms':>15} {'Table, ms':>10}")
+    for name, temperatures, pressures in cases:
+        args = (
+            Fluid(name),
+            linspace(*temperatures, rows),
+            linspace(*pressures, rows),
+        )
+        print(
+            f"{name.name:>8} {duration(row_by_row, *args):>15.1f} "
+            f"{duration(table, *args):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Thread scaling of the batch evaluation of fluids and humid air states.
+
+Run on a free-threaded Python build (3.13t/3.14t) to see the scaling
+without the GIL:
+
+    python benchmarks/thread_scaling.py [states]
+"""
+
+from __future__ import annotations
+
+import sys
+from os import cpu_count
+from time import perf_counter
+
+from pyfluids import BatchEvaluator, Fluid, FluidsList, HumidAir, Input, InputHumidAir
+
+
+def fluid_states(count: int) -> list[tuple[Input, Input]]:
+    return [
+        (Input.pressure(101325 + 10 * i), Input.temperature(20 + 60 * i / count))
+        for i in range(count)
+    ]
+
+
+def humid_air_states(count: int) -> list[tuple[InputHumidAir, ...]]:
+    return [
+        (
+            InputHumidAir.pressure(101325),
+            InputHumidAir.temperature(10 + 30 * i / count),
+            InputHumidAir.relative_humidity(30 + 40 * i / count),
+        )
+        for i in range(count)
+    ]
+
+
+def throughput(prototype, states, properties: list[str], workers: int) -> float:
+    evaluator = BatchEvaluator(max_workers=workers)
+    start = perf_counter()
+    evaluator.evaluate(prototype, states, properties)
+    return len(states) / (perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {gil_enabled}")
+    print(f"{'Workers':>8} {'Fluid, states/s':>18} {'HumidAir, states/s':>20}")
+    workers = 1
+    while workers <= max(cpu_count() or 1, 1):
+        fluid = throughput(
+            Fluid(FluidsList.Water),
+            fluid_states(count),
+            ["density", "enthalpy", "dynamic_viscosity"],
+            workers,
+        )
+        humid_air = throughput(
+            HumidAir(),
+            humid_air_states(count // 20),
+            ["enthalpy", "humidity"],
+            workers,
+        )
+        print(f"{workers:>8} {fluid:>18.0f} {humid_air:>20.0f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Two-phase states of pure fluids: interpolation between the cached
+saturated states (see `SuperancillaryCache`) vs. the general CoolProp flash.
+
+    python benchmarks/two_phase_states.py [states]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList, Input, SuperancillaryCache
+
+
+def duration(method, values: list[float], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        method(values)
+        best = min(best, perf_counter() - start)
+    return best / len(values) * 1e6
+
+
+def linspace(start: float, stop: float, count: int) -> list[float]:
+    return [start + (stop - start) * i / (count - 1) for i in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    fluid = Fluid(FluidsList.Water).enable_two_phase_interpolation()
+    pressure = Input.pressure(1e6)
+    liquid, vapor = fluid.bubble_point_at_pressure(1e6), fluid.dew_point_at_pressure(
+        1e6
+    )
+    enthalpies = linspace(liquid.enthalpy, vapor.enthalpy, count)
+    entropies = linspace(liquid.entropy, vapor.entropy, count)
+    qualities = linspace(0, 100, count)
+    cases = [
+        (
+            "with_state (P, H)",
+            enthalpies,
+            lambda x: [
+                fluid.with_state(pressure, Input.enthalpy(i)).temperature for i in x
+            ],
+        ),
+        (
+            "sweep (P, H)",
+            enthalpies,
+            lambda x: [i.density for i in fluid.sweep(pressure, Input.enthalpy, x)],
+        ),
+        (
+            "sweep (P, S)",
+            entropies,
+            lambda x: [i.density for i in fluid.sweep(pressure, Input.entropy, x)],
+        ),
+        (
+            "sweep (P, Q)",
+            qualities,
+            lambda x: [i.enthalpy for i in fluid.sweep(pressure, Input.quality, x)],
+        ),
+        (
+            "sweep (P, H), conductivity",
+            enthalpies,
+            lambda x: [
+                i.conductivity for i in fluid.sweep(pressure, Input.enthalpy, x)
+            ],
+        ),
+    ]
+    print(f"{'Method':>28} {'Fast path, us':>14} {'General, us':>12}")
+    for name, values, method in cases:
+        results = []
+        for enabled in (True, False):
+            SuperancillaryCache().enabled = enabled
+            results.append(duration(method, values))
+        print(f"{name:>28} {results[0]:>14.1f} {results[1]:>12.1f}")
+    SuperancillaryCache().enabled = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Vapor-compression cycle of R134a on a grid of operating points:
+built by hand from the process methods vs. the batch solution.
+
+    python benchmarks/vapor_compression_cycle.py [evaporating] [condensing]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from pyfluids import Fluid, FluidsList, VaporCompressionCycle
+
+
+def by_hand(refrigerant: Fluid, points) -> list[float]:
+    cops = []
+    for evaporating, condensing, efficiency, superheat, subcooling in points:
+        dew_point = refrigerant.dew_point_at_temperature(evaporating)
+        evaporator_outlet = dew_point.heating_to_temperature(evaporating + superheat)
+        bubble_point = refrigerant.bubble_point_at_temperature(condensing)
+        compressor_outlet = evaporator_outlet.compression_to_pressure(
+            bubble_point.pressure, efficiency
+        )
+        condenser_outlet = bubble_point.cooling_to_temperature(condensing - subcooling)
+        evaporator_inlet = condenser_outlet.isenthalpic_expansion_to_pressure(
+            dew_point.pressure
+        )
+        cops.append(
+            (evaporator_outlet.enthalpy - evaporator_inlet.enthalpy)
+            / (compressor_outlet.enthalpy - evaporator_outlet.enthalpy)
+        )
+    return cops
+
+
+def batch(refrigerant: Fluid, points) -> list[float]:
+    solutions = VaporCompressionCycle(refrigerant).solve_batch(*zip(*points))
+    return [i.cooling_cop for i in solutions]
+
+
+def main():
+    evaporating_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    condensing_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    points = [
+        (-20 + 2 * i, 30 + 2 * j, 75, 5, 3)
+        for i in range(evaporating_count)
+        for j in range(condensing_count)
+    ]
+    refrigerant = Fluid(FluidsList.R134a)
+    print(f"{'Method':>10} {'us per operating point':>24}")
+    for name, method in [("By hand", by_hand), ("Batch", batch)]:
+        start = perf_counter()
+        method(refrigerant, points)
+        duration = (perf_counter() - start) / len(points) * 1e6
+        print(f"{name:>10} {duration:>24.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Flash calculations along the isolines of water:
+from scratch (`update`) vs. warm-started from the previous state (`sweep`).
+
+    python benchmarks/warm_start_sweep.py [states]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+from typing import Callable
+
+from pyfluids import Fluid, FluidsList, Input
+
+
+def cold(fixed: Input, varying: Callable[[float], Input], values: list[float]):
+    fluid = Fluid(FluidsList.Water)
+    for value in values:
+        fluid.update(fixed, varying(value))
+
+
+def warm(fixed: Input, varying: Callable[[float], Input], values: list[float]):
+    for _ in Fluid(FluidsList.Water).sweep(fixed, varying, values):
+        pass
+
+
+def duration(method, fixed, varying, values: list[float]) -> float:
+    start = perf_counter()
+    method(fixed, varying, values)
+    return (perf_counter() - start) / len(values) * 1e6
+
+
+def linspace(start: float, stop: float, count: int) -> list[float]:
+    return [start + (stop - start) * i / (count - 1) for i in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    cases = [
+        ("PH, liquid", Input.pressure(1e6), Input.enthalpy, (1e5, 6e5)),
+        ("PH, two-phase", Input.pressure(1e6), Input.enthalpy, (8e5, 2.7e6)),
+        ("PH, vapor", Input.pressure(1e6), Input.enthalpy, (2.8e6, 3.3e6)),
+        ("PS, liquid", Input.pressure(1e6), Input.entropy, (500, 2500)),
+        ("HS, vapor", Input.entropy(7e3), Input.enthalpy, (2.9e6, 3.4e6)),
+    ]
+    print(f"{'Isoline':>14} {'Update, us':>12} {'Sweep, us':>11}")
+    for name, fixed, varying, bounds in cases:
+        values = linspace(*bounds, count)
+        print(
+            f"{name:>14} {duration(cold, fixed, varying, values):>12.0f} "
+            f"{duration(warm, fixed, varying, values):>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
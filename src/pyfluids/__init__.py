@@ -1,9 +1,27 @@
+from .backends import *
+from .batch import *
 from .config import *
+from .cycles import *
+from .diagrams import *
 from .enums import *
 from .fluids import *
+from .heat_exchangers import *
 from .humid_air import *
 from .io import *
+from .server import *
+from .surrogates import *
 
 __all__ = (
-    config.__all__ + enums.__all__ + fluids.__all__ + humid_air.__all__ + io.__all__
+    backends.__all__
+    + batch.__all__
+    + config.__all__
+    + cycles.__all__
+    + diagrams.__all__
+    + enums.__all__
+    + fluids.__all__
+    + heat_exchangers.__all__
+    + humid_air.__all__
+    + io.__all__
+    + server.__all__
+    + surrogates.__all__
 )
@@ -0,0 +1,17 @@
+from .backend_pool import *
+from .backend_warmup import *
+from .critical_points_cache import *
+from .isobar_spline import *
+from .isobar_spline_cache import *
+from .phase_envelope_cache import *
+from .superancillary_cache import *
+
+__all__ = (
+    backend_pool.__all__
+    + backend_warmup.__all__
+    + critical_points_cache.__all__
+    + isobar_spline.__all__
+    + isobar_spline_cache.__all__
+    + phase_envelope_cache.__all__
+    + superancillary_cache.__all__
+)
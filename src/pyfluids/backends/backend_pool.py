@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from CoolProp import AbstractState
+
+from ..config.fork_safety import reinit_after_fork
+from ..config.singleton import Singleton
+
+__all__ = ["BackendPool"]
+
+
+class BackendPool(metaclass=Singleton):
+    """Thread-safe source of CoolProp backends."""
+
+    def __init__(self):
+        """Thread-safe source of CoolProp backends."""
+        self.__lock: Lock = Lock()
+        self.__loaded: set[tuple[str, str]] = set()
+        # The loaded data is inherited by the child process after fork
+        reinit_after_fork(self.__reinit_lock)
+
+    def create(self, backend: str, fluid_names: str) -> AbstractState:
+        """
+        Creates a new CoolProp backend.
+
+        The first creation for each pair of backend and fluid names loads
+        the data shared by all backends (fluids library, interaction parameters,
+        tabular data, etc.), which is not thread-safe without the GIL,
+        so it is serialized. All subsequent creations run concurrently.
+
+        :param backend: Type of CoolProp backend (e.g., 'HEOS', 'INCOMP', etc.).
+        :param fluid_names: CoolProp fluid name (or names joined by '&').
+        :return: A new CoolProp backend.
+        :raises ValueError: If backend or fluid names are invalid.
+        """
+        key = (backend, fluid_names)
+        if key in self.__loaded:
+            return AbstractState(backend, fluid_names)
+        with self.__lock:
+            state = AbstractState(backend, fluid_names)
+            self.__loaded.add(key)
+            return state
+
+    def is_loaded(self, backend: str, fluid_names: str) -> bool:
+        """
+        Checks if the shared data for the backend has already been loaded.
+
+        :param backend: Type of CoolProp backend (e.g., 'HEOS', 'INCOMP', etc.).
+        :param fluid_names: CoolProp fluid name (or names joined by '&').
+        :return: True if at least one such backend has been created.
+        """
+        return (backend, fluid_names) in self.__loaded
+
+    def __reinit_lock(self):
+        self.__lock = Lock()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import CoolProp
+from CoolProp import AbstractState
+
+from .backend_pool import BackendPool
+from ..enums import FluidsList
+from ..fluids.abstract_fluid import AbstractFluid
+from ..fluids.fluid import Fluid
+from ..humid_air import HumidAir
+from ..io import InputHumidAir
+
+__all__ = ["warmup"]
+
+_TABULAR_BACKEND = "BICUBIC&HEOS"
+
+
+def warmup(
+    fluids: Iterable[FluidsList | AbstractFluid] = (),
+    humid_air: bool = False,
+    tables: bool = False,
+):
+    """
+    Preloads the data shared by all CoolProp backends.
+
+    Creates the backends of the specified fluids (fluids library,
+    interaction parameters of mixtures, etc.) and evaluates a few typical
+    states, so that the lazily initialized data (ancillaries, caches of
+    the equations of state, etc.) is ready. Call it in the parent process
+    before forking the workers (e.g., by gunicorn with the `preload_app` option
+    or by celery), so that the children inherit this data copy-on-write
+    instead of loading it once per worker.
+
+    :param fluids: Names of fluids or fluid and mixture instances (optional).
+    :param humid_air: True if the humid air routines
+        should be initialized as well (optional).
+    :param tables: True if the tabular data (see "BICUBIC&HEOS" and
+        "TTSE&HEOS" CoolProp backends) of the specified pure fluids
+        should be loaded as well (optional). The tables are built and saved
+        to the "~/.CoolProp/Tables" directory on the first run,
+        which can take a while.
+    :raises ValueError: If any of fluids is invalid.
+    """
+    pool = BackendPool()
+    for fluid in fluids:
+        if isinstance(fluid, FluidsList):
+            state = pool.create(fluid.coolprop_backend, fluid.coolprop_name)
+            tabular = tables and fluid.pure and fluid.coolprop_backend == "HEOS"
+            name = fluid.coolprop_name
+        elif isinstance(fluid, AbstractFluid):
+            state = fluid.factory()._backend
+            # Mixtures of pure fluids (see `Mixture`) are not tabulated
+            tabular = (
+                tables
+                and isinstance(fluid, Fluid)
+                and fluid.name.pure
+                and fluid.coolprop_backend == "HEOS"
+            )
+            name = fluid.name.coolprop_name if tabular else None
+        else:
+            raise ValueError(f"Invalid fluid: {fluid!r}!")
+        _evaluate_typical_states(state)
+        if tabular:
+            _evaluate_typical_states(pool.create(_TABULAR_BACKEND, name))
+    if humid_air:
+        HumidAir().with_state(
+            InputHumidAir("P", 101325),
+            InputHumidAir("T", 293.15),
+            InputHumidAir("R", 0.5),
+        ).humidity
+
+
+def _evaluate_typical_states(state: AbstractState):
+    try:
+        temperature = min(max(293.15, state.Tmin()), state.Tmax())
+        state.update(CoolProp.PT_INPUTS, 101325, temperature)
+        critical_temperature = state.T_critical()
+        state.update(CoolProp.QT_INPUTS, 0, (temperature + critical_temperature) / 2)
+    except ValueError:
+        pass
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Callable, Hashable
+
+from CoolProp import AbstractState
+
+from ..config.fork_safety import reinit_after_fork
+from ..config.singleton import Singleton
+
+__all__ = ["CriticalPointsCache"]
+
+# Temperature [K], pressure [Pa], mass density [kg/m3] and stability
+CriticalPointData = tuple[float, float, float, bool]
+
+
+class CriticalPointsCache(metaclass=Singleton):
+    """Thread-safe cache of the critical points of mixtures."""
+
+    def __init__(self):
+        """
+        Thread-safe cache of the critical points of mixtures.
+
+        The mixtures may have several critical points, and CoolProp
+        finds all of them at once, which costs as much as hundreds
+        of flash calculations. So they are found once for each composition
+        and shared between all the mixture instances with this composition
+        (the failures are cached too).
+        """
+        self.__lock: Lock = Lock()
+        self.__points: dict[Hashable, tuple[CriticalPointData, ...] | None] = {}
+        reinit_after_fork(self.__reinit_lock)
+
+    @property
+    def cached_compositions(self) -> int:
+        """Number of mixture compositions with cached critical points."""
+        return len(self.__points)
+
+    def is_cached(self, key: Hashable) -> bool:
+        """
+        Checks if the critical points of the mixture are cached.
+
+        :param key: Key of the mixture composition.
+        :return: True if the critical points (or the failure) are cached.
+        """
+        return key in self.__points
+
+    def critical_points(
+        self, key: Hashable | None, backend_factory: Callable[[], AbstractState]
+    ) -> tuple[CriticalPointData, ...]:
+        """
+        Critical points of the mixture (they are found if they are not cached yet).
+
+        :param key: Key of the mixture composition (None if it cannot be cached).
+        :param backend_factory: Factory of new CoolProp backends of the mixture.
+        :return: Temperatures [K], absolute pressures [Pa], mass densities [kg/m3]
+            and stability flags of the critical points.
+        :raises ValueError: If the critical points cannot be found.
+        """
+        if key is not None and key in self.__points:
+            points = self.__points[key]
+        else:
+            points = self.__find(backend_factory())
+            if key is not None:
+                with self.__lock:
+                    points = self.__points.setdefault(key, points)
+        if points is None:
+            raise ValueError("Unable to find the critical points of the mixture!")
+        return points
+
+    def clear(self):
+        """Removes all cached critical points."""
+        with self.__lock:
+            self.__points.clear()
+
+    @staticmethod
+    def __find(state: AbstractState) -> tuple[CriticalPointData, ...] | None:
+        try:
+            molar_mass = state.molar_mass()
+            return tuple(
+                (i.T, i.p, i.rhomolar * molar_mass, bool(i.stable))
+                for i in state.all_critical_points()
+            )
+        except ValueError:
+            return None
+
+    def __reinit_lock(self):
+        self.__lock = Lock()
@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from math import isnan, nan
+from typing import Optional
+
+import CoolProp
+from CoolProp import AbstractState
+
+__all__ = ["IsobarSpline"]
+
+# Outputs, derivatives of the outputs with respect to enthalpy at constant
+# pressure (NaN if not available) and the phase (None at the saturation lines)
+Node = tuple[list[float], list[float], Optional[int]]
+# Abscissas, available outputs with their values and slopes by abscissa,
+# validity and phases of the intervals
+Segment = tuple[
+    dict[int, list[float]],
+    dict[int, list[tuple[int, list[float], list[float]]]],
+    list[bool],
+    list[Optional[int]],
+]
+
+
+class IsobarSpline:
+    """Monotone cubic splines of the single-phase properties along an isobar."""
+
+    # Interpolated outputs (the derivatives of the thermodynamic properties
+    # are evaluated analytically, and of the transport properties are estimated)
+    __OUTPUTS: tuple[int, ...] = (
+        CoolProp.iT,
+        CoolProp.iDmass,
+        CoolProp.iHmass,
+        CoolProp.iSmass,
+        CoolProp.iUmass,
+        CoolProp.iCpmass,
+        CoolProp.ispeed_sound,
+        CoolProp.iZ,
+        CoolProp.iconductivity,
+        CoolProp.iviscosity,
+        CoolProp.iPrandtl,
+    )
+    # Number of outputs with the derivatives available in CoolProp
+    __DERIVATIVES: int = 7
+    # Number of outputs with the analytical derivatives (including Z)
+    __ANALYTICAL: int = 8
+    # The estimated derivatives are less accurate, and the maximum error
+    # is not in the middle of the interval, so they are checked more strictly
+    __ESTIMATED_SAFETY: float = 0.25
+    # Outputs with an arbitrary reference state
+    __REFERENCED: tuple[int, ...] = (2, 3, 4)
+    __ABSCISSAS: tuple[int, ...] = (CoolProp.iHmass, CoolProp.iSmass)
+    __INITIAL_NODES: int = 9
+
+    def __init__(
+        self,
+        backend: AbstractState,
+        pressure: float,
+        tolerance: float = 1e-6,
+        max_nodes: int = 2048,
+    ):
+        """
+        Monotone cubic splines of the single-phase properties along an isobar
+        with enthalpy or entropy as the argument.
+
+        The isobar is split at the saturation lines (if any) into the liquid
+        and vapor segments, each from the minimum or to the maximum
+        temperature of the fluid. The nodes of each segment are evaluated
+        at given temperatures (by the fast flash calculations with pressure
+        and temperature as inputs) and the segment is bisected until
+        the properties interpolated at the middle of each interval
+        match the flash calculation within given relative tolerance
+        (for enthalpy, entropy and internal energy, relative
+        to their maximum magnitude on the segment, since their reference
+        states are arbitrary; for the transport properties, within a quarter
+        of it). The intervals, which cannot be refined
+        (the number of nodes is exceeded), are not interpolated.
+
+        The splines are the cubic Hermite ones: the derivatives
+        of the thermodynamic properties at the nodes are evaluated
+        analytically, the derivatives of the transport properties
+        are estimated by the parabolas through the neighbouring nodes,
+        and all of them are limited to preserve the monotonicity of the data.
+
+        :param backend: CoolProp backend of the fluid
+            (it is used for the flash calculations and its state is changed).
+        :param pressure: Absolute pressure [Pa].
+        :param tolerance: Relative tolerance of the interpolation (optional).
+        :param max_nodes: Maximum number of nodes of each segment (optional).
+        :raises ValueError: If tolerance or maximum number of nodes is invalid
+            or the single-phase states at given pressure cannot be evaluated.
+        """
+        if not tolerance > 0:
+            raise ValueError("Invalid tolerance! It should be positive.")
+        if max_nodes < self.__INITIAL_NODES:
+            raise ValueError(
+                f"Invalid maximum number of nodes! "
+                f"It should be at least {self.__INITIAL_NODES}."
+            )
+        self.__pressure: float = pressure
+        self.__tolerance: float = tolerance
+        self.__max_nodes: int = max_nodes
+        self.__segments: list[Segment] = [
+            self.__segment(backend, *i) for i in self.__segment_bounds(backend)
+        ]
+
+    @property
+    def pressure(self) -> float:
+        """Absolute pressure [Pa]."""
+        return self.__pressure
+
+    @property
+    def tolerance(self) -> float:
+        """Relative tolerance of the interpolation."""
+        return self.__tolerance
+
+    @property
+    def nodes(self) -> int:
+        """Total number of nodes."""
+        return sum(len(i[0][CoolProp.iHmass]) for i in self.__segments)
+
+    @property
+    def invalid_intervals(self) -> int:
+        """Number of intervals, which are not interpolated."""
+        return sum(i[2].count(False) for i in self.__segments)
+
+    def outputs(self, coolprop_key: int, value: float) -> dict[int, float] | None:
+        """
+        Interpolated outputs of the single-phase state at given enthalpy
+        or entropy.
+
+        :param coolprop_key: CoolProp key of the argument
+            (mass specific enthalpy or entropy).
+        :param value: SI value of the argument.
+        :return: SI outputs by CoolProp keys (pressure, quality, phase,
+            temperature, density, enthalpy, entropy, internal energy,
+            specific heat, sound speed, compressibility and transport properties,
+            if they are available) or None if the state is out of the splines
+            (e.g., two-phase or out of the temperature limits).
+        """
+        if coolprop_key not in self.__ABSCISSAS:
+            return None
+        for abscissas, splines, valid, phases in self.__segments:
+            x = abscissas[coolprop_key]
+            if not x[0] <= value <= x[-1]:
+                continue
+            index = min(bisect_right(x, value), len(x) - 1) - 1
+            if not valid[index]:
+                return None
+            step = x[index + 1] - x[index]
+            t = (value - x[index]) / step
+            t2, t3 = t * t, t * t * t
+            h00, h10 = 2 * t3 - 3 * t2 + 1, (t3 - 2 * t2 + t) * step
+            h01, h11 = -2 * t3 + 3 * t2, (t3 - t2) * step
+            outputs = {
+                key: h00 * y[index]
+                + h10 * m[index]
+                + h01 * y[index + 1]
+                + h11 * m[index + 1]
+                for key, y, m in splines[coolprop_key]
+            }
+            outputs[coolprop_key] = value
+            outputs[CoolProp.iP] = self.__pressure
+            outputs[CoolProp.iQ] = -1.0
+            # The surface tension is defined only in the two-phase region
+            outputs[CoolProp.isurface_tension] = nan
+            if phases[index] is not None:
+                outputs[CoolProp.iPhase] = phases[index]
+            return outputs
+        return None
+
+    def __segment_bounds(
+        self, backend: AbstractState
+    ) -> list[tuple[float, float, int | None, dict[float, float]]]:
+        # Temperature limits, imposed phase
+        # and qualities of the saturated ends of the segments
+        t_min, t_max = backend.Tmin(), backend.Tmax()
+        try:
+            backend.update(CoolProp.PQ_INPUTS, self.__pressure, 0)
+            bubble = backend.T()
+            backend.update(CoolProp.PQ_INPUTS, self.__pressure, 1)
+            dew = backend.T()
+        except ValueError:  # e.g., supercritical pressure
+            return [(t_min, t_max, None, {})]
+        bounds = []
+        if bubble > t_min:
+            bounds.append((t_min, bubble, CoolProp.iphase_liquid, {bubble: 0}))
+        if dew < t_max:
+            bounds.append((dew, t_max, CoolProp.iphase_gas, {dew: 1}))
+        return bounds
+
+    def __segment(
+        self,
+        backend: AbstractState,
+        t_start: float,
+        t_end: float,
+        phase: int | None,
+        saturated: dict[float, float],
+    ) -> Segment:
+        count = self.__INITIAL_NODES
+        temperatures = [
+            t_start + (t_end - t_start) * i / (count - 1) for i in range(count)
+        ]
+        nodes = [self.__node(backend, i, phase, saturated) for i in temperatures]
+        slopes = [self.__slopes(nodes, i) for i in range(count)]
+        scales = [
+            max(abs(i[0][j]) for i in nodes) if j in self.__REFERENCED else None
+            for j in range(len(self.__OUTPUTS))
+        ]
+        middles: dict[tuple[float, float], Node] = {}
+        passed: set[tuple[float, float]] = set()
+        invalid: set[tuple[float, float]] = set()
+        while True:
+            failed = []
+            for index in range(len(nodes) - 1):
+                interval = temperatures[index], temperatures[index + 1]
+                if interval in passed or interval in invalid:
+                    continue
+                if interval not in middles:
+                    middles[interval] = self.__node(
+                        backend, (interval[0] + interval[1]) / 2, phase, saturated
+                    )
+                if self.__is_accurate(nodes, slopes, index, middles[interval], scales):
+                    passed.add(interval)
+                else:
+                    failed.append(index)
+            if not failed:
+                break
+            refined = []
+            for index in failed:
+                interval = temperatures[index], temperatures[index + 1]
+                if (
+                    len(nodes) + len(refined) >= self.__max_nodes
+                    or interval[1] - interval[0] <= 1e-9 * interval[1]
+                ):
+                    invalid.add(interval)
+                else:
+                    refined.append(index)
+            for index in reversed(refined):
+                interval = temperatures[index], temperatures[index + 1]
+                temperatures.insert(index + 1, (interval[0] + interval[1]) / 2)
+                nodes.insert(index + 1, middles.pop(interval))
+                slopes.insert(index + 1, [])
+            # The slopes depend on the neighbouring nodes,
+            # so they are updated around the new nodes
+            updated = {
+                j
+                for i, index in enumerate(sorted(refined))
+                for j in range(index + i - 1, index + i + 4)
+                if 0 <= j < len(nodes)
+            }
+            for index in updated:
+                slopes[index] = self.__slopes(nodes, index)
+                passed.difference_update(
+                    zip(
+                        temperatures[max(index - 1, 0) : index + 1],
+                        temperatures[index : index + 2],
+                    )
+                )
+        valid = [
+            (temperatures[i], temperatures[i + 1]) not in invalid
+            for i in range(len(nodes) - 1)
+        ]
+        phases = []
+        for index in range(len(nodes) - 1):
+            interval = temperatures[index], temperatures[index + 1]
+            middle = middles.get(interval)
+            phases.append(
+                middle[2]
+                if middle is not None
+                and middle[2] is not None
+                and nodes[index][2] in (None, middle[2])
+                and nodes[index + 1][2] in (None, middle[2])
+                else None
+            )
+        abscissas = {
+            i: [node[0][self.__OUTPUTS.index(i)] for node in nodes]
+            for i in self.__ABSCISSAS
+        }
+        # The outputs, which are not available at any node, are not interpolated
+        available = [
+            j
+            for j in range(len(self.__OUTPUTS))
+            if not any(isnan(node[0][j]) for node in nodes)
+        ]
+        splines = {
+            abscissa: [
+                (
+                    self.__OUTPUTS[j],
+                    [node[0][j] for node in nodes],
+                    [i[k][j] for i in slopes],
+                )
+                for j in available
+            ]
+            for k, abscissa in enumerate(self.__ABSCISSAS)
+        }
+        return abscissas, splines, valid, phases
+
+    def __node(
+        self,
+        backend: AbstractState,
+        temperature: float,
+        phase: int | None,
+        saturated: dict[float, float],
+    ) -> Node:
+        specified = False
+        try:
+            if temperature in saturated:
+                backend.update(
+                    CoolProp.PQ_INPUTS, self.__pressure, saturated[temperature]
+                )
+                # The single-phase derivatives at the saturation line
+                # are evaluated at the same density and temperature
+                backend.specify_phase(phase)
+                specified = True
+                backend.update(CoolProp.DmassT_INPUTS, backend.rhomass(), backend.T())
+            else:
+                try:
+                    backend.update(CoolProp.PT_INPUTS, self.__pressure, temperature)
+                except ValueError:
+                    # Too close to the saturation line
+                    if phase is None:
+                        raise
+                    backend.specify_phase(phase)
+                    specified = True
+                    backend.update(CoolProp.PT_INPUTS, self.__pressure, temperature)
+            outputs = [self.__output(backend, i) for i in self.__OUTPUTS]
+            derivatives = [
+                self.__derivative(backend, i)
+                for i in self.__OUTPUTS[: self.__DERIVATIVES]
+            ]
+            # Z = P / (ρ * R * T), so dZ/dh = -Z * (dρ/dh / ρ + dT/dh / T)
+            derivatives.append(
+                -outputs[7]
+                * (derivatives[1] / outputs[1] + derivatives[0] / outputs[0])
+            )
+            derivatives += [nan] * (len(self.__OUTPUTS) - len(derivatives))
+            return (
+                outputs,
+                derivatives,
+                None if temperature in saturated else self.__phase(backend),
+            )
+        finally:
+            if specified:
+                backend.unspecify_phase()
+
+    @staticmethod
+    def __phase(backend: AbstractState) -> int | None:
+        try:
+            return backend.phase()
+        except ValueError:  # e.g., for incompressible fluids
+            return None
+
+    @staticmethod
+    def __output(backend: AbstractState, coolprop_key: int) -> float:
+        try:
+            return backend.keyed_output(coolprop_key)
+        except ValueError:  # e.g., the transport properties are not available
+            return nan
+
+    @staticmethod
+    def __derivative(backend: AbstractState, coolprop_key: int) -> float:
+        try:
+            return backend.first_partial_deriv(
+                coolprop_key, CoolProp.iHmass, CoolProp.iP
+            )
+        except ValueError:
+            return nan
+
+    def __slopes(self, nodes: list[Node], index: int) -> list[list[float]]:
+        # Slopes of all the outputs at the node by abscissa
+        # (d/ds = T * d/dh at constant pressure)
+        first = min(max(index - 1, 0), len(nodes) - 3)
+        neighbours = [nodes[i] for i in (index - 1, index + 1) if 0 <= i < len(nodes)]
+        node = nodes[index]
+        slopes = []
+        for abscissa in self.__ABSCISSAS:
+            position = self.__OUTPUTS.index(abscissa)
+            x0, x1, x2 = (i[0][position] for i in nodes[first : first + 3])
+            factor = 1.0 if abscissa == CoolProp.iHmass else node[0][0]
+            slopes.append([])
+            for j in range(len(self.__OUTPUTS)):
+                slope = node[1][j] * factor
+                if isnan(slope):
+                    # Derivative of the parabola through the node and its neighbours
+                    y0, y1, y2 = (i[0][j] for i in nodes[first : first + 3])
+                    d0, d1 = (y1 - y0) / (x1 - x0), (y2 - y1) / (x2 - x1)
+                    slope = d0 + (d1 - d0) / (x2 - x0) * (
+                        2 * node[0][position] - x0 - x1
+                    )
+                # Fritsch-Carlson conditions: zero slopes at the local extrema
+                # and no more than three times the secant slopes
+                for neighbour in neighbours:
+                    secant = (neighbour[0][j] - node[0][j]) / (
+                        neighbour[0][position] - node[0][position]
+                    )
+                    if secant * slope <= 0:
+                        slope = 0.0
+                        break
+                    if abs(slope) > 3 * abs(secant):
+                        slope = 3 * secant
+                slopes[-1].append(slope)
+        return slopes
+
+    def __is_accurate(
+        self,
+        nodes: list[Node],
+        slopes: list[list[list[float]]],
+        index: int,
+        middle: Node,
+        scales: list[float | None],
+    ) -> bool:
+        for k, abscissa in enumerate(self.__ABSCISSAS):
+            position = self.__OUTPUTS.index(abscissa)
+            x0, x1 = nodes[index][0][position], nodes[index + 1][0][position]
+            step = x1 - x0
+            t = (middle[0][position] - x0) / step
+            t2, t3 = t * t, t * t * t
+            h00, h10 = 2 * t3 - 3 * t2 + 1, (t3 - 2 * t2 + t) * step
+            h01, h11 = -2 * t3 + 3 * t2, (t3 - t2) * step
+            for j, (m0, m1) in enumerate(zip(slopes[index][k], slopes[index + 1][k])):
+                expected = middle[0][j]
+                value = (
+                    h00 * nodes[index][0][j]
+                    + h10 * m0
+                    + h01 * nodes[index + 1][0][j]
+                    + h11 * m1
+                )
+                scale = scales[j] if scales[j] is not None else abs(expected)
+                # NaN outputs (not available) are not compared
+                if j >= self.__ANALYTICAL:
+                    scale *= self.__ESTIMATED_SAFETY
+                if abs(value - expected) > self.__tolerance * scale:
+                    return False
+        return True
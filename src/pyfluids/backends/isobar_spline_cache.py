@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Callable, Hashable
+
+from CoolProp import AbstractState
+
+from .isobar_spline import IsobarSpline
+from ..config.fork_safety import reinit_after_fork
+from ..config.singleton import Singleton
+
+__all__ = ["IsobarSplineCache"]
+
+
+class IsobarSplineCache(metaclass=Singleton):
+    """Thread-safe cache of the property splines along the isobars."""
+
+    def __init__(self):
+        """
+        Thread-safe cache of the property splines along the isobars.
+
+        The flash calculations with pressure and enthalpy (or entropy)
+        as inputs are iterative and rather expensive, but the heat exchanger
+        and pipe models evaluate thousands of them at a handful of fixed
+        pressures. So the splines of the single-phase properties along
+        these isobars (see `IsobarSpline`) can be built once
+        for each composition and pressure, and the further states at these
+        pressures are interpolated instead of the flash calculations
+        (only by the fluid instances which asked for it,
+        see `AbstractFluid.prepare_isobars`).
+        The splines are built only on demand (see `spline`),
+        and the failures are cached too.
+        """
+        self.__enabled: bool = True
+        self.__lock: Lock = Lock()
+        self.__splines: dict[tuple[Hashable, float], IsobarSpline | None] = {}
+        reinit_after_fork(self.__reinit_lock)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        True if the cached splines are used
+        instead of the flash calculations (by default, True).
+        """
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self.__enabled = value
+
+    @property
+    def cached_isobars(self) -> int:
+        """Number of cached isobars."""
+        return len(self.__splines)
+
+    def is_cached(self, key: Hashable, pressure: float) -> bool:
+        """
+        Checks if the splines along the isobar are cached.
+
+        :param key: Key of the fluid composition.
+        :param pressure: Absolute pressure [Pa].
+        :return: True if the splines (or the failure) are cached.
+        """
+        return (key, pressure) in self.__splines
+
+    def spline(
+        self,
+        key: Hashable | None,
+        pressure: float,
+        backend_factory: Callable[[], AbstractState],
+        tolerance: float = 1e-6,
+    ) -> IsobarSpline:
+        """
+        Splines along the isobar (they are built if they are not cached yet
+        or the cached ones are less accurate).
+
+        :param key: Key of the fluid composition (None if it cannot be cached).
+        :param pressure: Absolute pressure [Pa].
+        :param backend_factory: Factory of new CoolProp backends of the fluid.
+        :param tolerance: Relative tolerance of the interpolation (optional).
+        :return: Splines of the single-phase properties along the isobar.
+        :raises ValueError: If tolerance is invalid
+            or the splines cannot be built.
+        """
+        if not tolerance > 0:
+            raise ValueError("Invalid tolerance! It should be positive.")
+        cached = key is not None and (key, pressure) in self.__splines
+        spline = self.__splines.get((key, pressure)) if cached else None
+        if not cached or (spline is not None and spline.tolerance > tolerance):
+            try:
+                spline = IsobarSpline(backend_factory(), pressure, tolerance)
+            except ValueError:
+                spline = None
+            if key is not None:
+                with self.__lock:
+                    self.__splines[(key, pressure)] = spline
+        if spline is None:
+            raise ValueError("Unable to build the splines along the isobar!")
+        return spline
+
+    def outputs(
+        self,
+        key: Hashable,
+        pressure: float,
+        coolprop_key: int,
+        value: float,
+        tolerance: float | None = None,
+    ) -> dict[int, float] | None:
+        """
+        Interpolated outputs of the single-phase state at given pressure
+        and enthalpy or entropy (see `IsobarSpline.outputs`).
+
+        :param key: Key of the fluid composition.
+        :param pressure: Absolute pressure [Pa].
+        :param coolprop_key: CoolProp key of the second input
+            (mass specific enthalpy or entropy).
+        :param value: SI value of the second input.
+        :param tolerance: Maximum relative tolerance of the splines (optional).
+            By default, the splines of any tolerance are used.
+        :return: SI outputs by CoolProp keys or None if the cache is disabled,
+            the isobar is not cached (or its splines are less accurate)
+            or the state is out of the splines.
+        """
+        if not self.__enabled:
+            return None
+        spline = self.__splines.get((key, pressure))
+        if spline is None or (tolerance is not None and spline.tolerance > tolerance):
+            return None
+        return spline.outputs(coolprop_key, value)
+
+    def clear(self):
+        """Removes all cached splines."""
+        with self.__lock:
+            self.__splines.clear()
+
+    def __reinit_lock(self):
+        self.__lock = Lock()
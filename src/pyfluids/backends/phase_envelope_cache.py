@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from math import exp, log
+from threading import Lock
+from typing import Callable, Hashable
+
+from CoolProp import AbstractState
+from CoolProp.CoolProp import PyGuessesStructure, PyPhaseEnvelopeData
+
+from ..config.fork_safety import reinit_after_fork
+from ..config.singleton import Singleton
+
+__all__ = ["PhaseEnvelopeCache"]
+
+
+class PhaseEnvelopeCache(metaclass=Singleton):
+    """Thread-safe cache of the phase envelopes of mixtures."""
+
+    def __init__(self):
+        """
+        Thread-safe cache of the phase envelopes of mixtures.
+
+        CoolProp traces the whole phase envelope of the mixture
+        (from the dew line at low pressure through the critical region
+        to the bubble line at low pressure) at once, which costs as much as
+        dozens of flash calculations. So the envelope is built once
+        for each composition. The cached envelopes are the source
+        of initial guesses for the bubble and dew points at given pressure
+        (temperature, densities and compositions of both phases),
+        which are evaluated several times faster than from scratch.
+        """
+        self.__enabled: bool = True
+        self.__lock: Lock = Lock()
+        self.__envelopes: dict[Hashable, PyPhaseEnvelopeData] = {}
+        reinit_after_fork(self.__reinit_lock)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        True if the cached phase envelopes are used
+        as the source of initial guesses (by default, True).
+        """
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self.__enabled = value
+
+    @property
+    def cached_envelopes(self) -> int:
+        """Number of cached phase envelopes."""
+        return len(self.__envelopes)
+
+    def is_cached(self, key: Hashable) -> bool:
+        """
+        Checks if the phase envelope of the mixture is cached.
+
+        :param key: Key of the mixture composition.
+        :return: True if the phase envelope is cached.
+        """
+        return key in self.__envelopes
+
+    def envelope(
+        self, key: Hashable | None, backend_factory: Callable[[], AbstractState]
+    ) -> PyPhaseEnvelopeData:
+        """
+        Phase envelope of the mixture (it is built if it is not cached yet).
+
+        :param key: Key of the mixture composition (None if it cannot be cached).
+        :param backend_factory: Factory of new CoolProp backends of the mixture.
+        :return: CoolProp phase envelope data (molar SI units).
+        :raises ValueError: If the phase envelope cannot be built
+            (e.g., for pure fluids).
+        """
+        envelope = self.__envelopes.get(key) if key is not None else None
+        if envelope is not None:
+            return envelope
+        envelope = self.__build(backend_factory())
+        if key is None:
+            return envelope
+        with self.__lock:
+            return self.__envelopes.setdefault(key, envelope)
+
+    def guesses(
+        self, key: Hashable, pressure: float, quality: float
+    ) -> PyGuessesStructure | None:
+        """
+        Initial guesses for the bubble or dew point at given pressure
+        interpolated from the cached phase envelope.
+
+        :param key: Key of the mixture composition.
+        :param pressure: Absolute pressure [Pa].
+        :param quality: Vapor quality (0 for bubble point, 1 for dew point) [-].
+        :return: Initial guesses for the flash calculation or None
+            if the cached envelopes are not used, the envelope is not cached
+            or pressure is out of its range.
+        """
+        envelope = self.__envelopes.get(key) if self.__enabled else None
+        if envelope is None or quality not in (0, 1):
+            return None
+        p, q = envelope.p, envelope.Q
+        index = next(
+            (
+                i
+                for i in range(len(p) - 1)
+                if q[i] == quality
+                and q[i + 1] == quality
+                and min(p[i], p[i + 1]) <= pressure <= max(p[i], p[i + 1])
+                and p[i] != p[i + 1]
+            ),
+            None,
+        )
+        if index is None:
+            return None
+        weight = log(pressure / p[index]) / log(p[index + 1] / p[index])
+
+        def interpolate(values: list[float], logarithmic: bool = False) -> float:
+            if logarithmic:
+                return exp(
+                    log(values[index])
+                    + weight * (log(values[index + 1]) - log(values[index]))
+                )
+            return values[index] + weight * (values[index + 1] - values[index])
+
+        # The 'vap' phase of the envelope is the bulk phase (its composition
+        # is the composition of the mixture) and the 'liq' phase is incipient
+        incipient = (
+            interpolate(envelope.rhomolar_liq, True),
+            [interpolate(i) for i in envelope.x],
+        )
+        bulk = (
+            interpolate(envelope.rhomolar_vap, True),
+            [interpolate(i) for i in envelope.y],
+        )
+        liquid, vapor = (bulk, incipient) if quality == 0 else (incipient, bulk)
+        guesses = PyGuessesStructure()
+        guesses.T = interpolate(envelope.T)
+        guesses.p = pressure
+        guesses.rhomolar_liq, guesses.x = liquid
+        guesses.rhomolar_vap, guesses.y = vapor
+        return guesses
+
+    def clear(self):
+        """Removes all cached phase envelopes."""
+        with self.__lock:
+            self.__envelopes.clear()
+
+    @staticmethod
+    def __build(state: AbstractState) -> PyPhaseEnvelopeData:
+        try:
+            components = len(state.get_mole_fractions())
+        except ValueError:  # e.g., for incompressible fluids
+            components = 0
+        if components < 2:
+            raise ValueError("The phase envelope is available only for HEOS mixtures!")
+        state.build_phase_envelope("")
+        return state.get_phase_envelope_data()
+
+    def __reinit_lock(self):
+        self.__lock = Lock()
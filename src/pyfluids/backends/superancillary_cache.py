@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Sequence
+
+import CoolProp
+from CoolProp import AbstractState
+from CoolProp.CoolProp import get_config_bool
+
+from .backend_pool import BackendPool
+from ..config.fork_safety import reinit_after_fork
+from ..config.singleton import Singleton
+
+__all__ = ["SuperancillaryCache"]
+
+
+class SuperancillaryCache(metaclass=Singleton):
+    """Thread-safe source of saturation temperatures and states of pure fluids."""
+
+    # Outputs of the saturated states, which are cached
+    __SATURATED_OUTPUTS: tuple[int, ...] = (
+        CoolProp.iT,
+        CoolProp.iDmass,
+        CoolProp.iHmass,
+        CoolProp.iSmass,
+        CoolProp.iUmass,
+    )
+    __MAX_SATURATED_STATES: int = 4096
+
+    def __init__(self):
+        """
+        Thread-safe source of saturation temperatures and states of pure fluids.
+
+        For pure fluids, CoolProp evaluates the saturation states
+        by the superancillary functions (Chebyshev expansions accurate
+        to near-machine precision). The saturation state at given temperature
+        is cheap on any backend, but the saturation state at given pressure
+        requires the inversion of these functions, which is prepared lazily
+        for each new backend and costs hundreds of times more
+        than the evaluation itself.
+        This cache keeps one prepared backend per pure fluid, so the saturation
+        state at given pressure can be evaluated on any other backend
+        as the state at the cached saturation temperature.
+        The saturated liquid and vapor states at the recently used pressures
+        are also cached (the least recently used ones are evicted)
+        for the interpolated two-phase states
+        (see `AbstractFluid.enable_two_phase_interpolation`).
+        They are keyed by the exact pressure, since the typical callers
+        (sweeps along the isobars, heat exchanger and cycle models)
+        evaluate many states at the same few pressures, and the interpolation
+        between the states at other (even close) pressures is not exact.
+        The number of cached pairs is bounded (4096, about 4 MB), so an
+        arbitrary stream of distinct pressures does not grow the memory.
+        """
+        self.__enabled: bool = True
+        self.__lock: Lock = Lock()
+        self.__backends: dict[tuple[str, str], AbstractState | None] = {}
+        self.__locks: dict[tuple[str, str], Lock] = {}
+        self.__saturated_states: OrderedDict[
+            tuple[str, str, float], tuple[dict[int, float], dict[int, float]]
+        ] = OrderedDict()
+        reinit_after_fork(self.__reinit_locks)
+
+    @property
+    def enabled(self) -> bool:
+        """True if the superancillary fast path is used (by default, True)."""
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self.__enabled = value
+
+    def is_available(self, backend: str, fluid_name: str) -> bool:
+        """
+        Checks if the superancillary fast path can be used for the fluid.
+
+        :param backend: Type of CoolProp backend (e.g., 'HEOS', 'INCOMP', etc.).
+        :param fluid_name: CoolProp fluid name.
+        :return: True if the fast path is enabled (both in PyFluids and CoolProp)
+            and the superancillary functions are available for the fluid.
+        """
+        return (
+            self.__enabled
+            and get_config_bool(CoolProp.ENABLE_SUPERANCILLARIES)
+            and self.__backend(backend, fluid_name) is not None
+        )
+
+    def saturation_temperature(
+        self, backend: str, fluid_name: str, pressure: float
+    ) -> float:
+        """
+        Saturation temperature at given pressure.
+
+        :param backend: Type of CoolProp backend (e.g., 'HEOS', 'INCOMP', etc.).
+        :param fluid_name: CoolProp fluid name.
+        :param pressure: Absolute pressure [Pa].
+        :return: Saturation temperature [K].
+        :raises ValueError: If the superancillary functions are not available
+            for the fluid or pressure is invalid.
+        """
+        return self.saturation_temperatures(backend, fluid_name, [pressure])[0]
+
+    def saturation_temperatures(
+        self, backend: str, fluid_name: str, pressures: Sequence[float]
+    ) -> list[float]:
+        """
+        Saturation temperatures at given pressures.
+
+        :param backend: Type of CoolProp backend (e.g., 'HEOS', 'INCOMP', etc.).
+        :param fluid_name: CoolProp fluid name.
+        :param pressures: Absolute pressures [Pa].
+        :return: Saturation temperatures [K].
+        :raises ValueError: If the superancillary functions are not available
+            for the fluid or any pressure is invalid.
+        """
+        state = self.__backend(backend, fluid_name)
+        if state is None:
+            raise ValueError(
+                "The superancillary functions are not available for this fluid!"
+            )
+        temperatures = []
+        with self.__locks[(backend, fluid_name)]:
+            for pressure in pressures:
+                state.update(CoolProp.PQ_INPUTS, pressure, 0)
+                temperatures.append(state.T())
+        return temperatures
+
+    @property
+    def cached_saturated_states(self) -> int:
+        """Number of cached pairs of saturated liquid and vapor states."""
+        return len(self.__saturated_states)
+
+    def saturated_states(
+        self, backend: str, fluid_name: str, pressure: float
+    ) -> tuple[dict[int, float], dict[int, float]]:
+        """
+        Saturated liquid and vapor states at given pressure.
+
+        :param backend: Type of CoolProp backend (e.g., 'HEOS', 'INCOMP', etc.).
+        :param fluid_name: CoolProp fluid name.
+        :param pressure: Absolute pressure [Pa].
+        :return: SI temperature, density, enthalpy, entropy and internal energy
+            (by CoolProp keys) of the saturated liquid and vapor.
+        :raises ValueError: If the superancillary functions are not available
+            for the fluid or pressure is invalid.
+        """
+        key = (backend, fluid_name, pressure)
+        with self.__lock:
+            if key in self.__saturated_states:
+                self.__saturated_states.move_to_end(key)
+                return self.__saturated_states[key]
+        state = self.__backend(backend, fluid_name)
+        if state is None:
+            raise ValueError(
+                "The superancillary functions are not available for this fluid!"
+            )
+        with self.__locks[(backend, fluid_name)]:
+            states = []
+            for quality in (0, 1):
+                state.update(CoolProp.PQ_INPUTS, pressure, quality)
+                states.append(
+                    {i: state.keyed_output(i) for i in self.__SATURATED_OUTPUTS}
+                )
+        saturated_states = states[0], states[1]
+        with self.__lock:
+            self.__saturated_states[key] = saturated_states
+            if len(self.__saturated_states) > self.__MAX_SATURATED_STATES:
+                self.__saturated_states.popitem(last=False)
+        return saturated_states
+
+    def clear(self):
+        """Clears the cached saturated states."""
+        with self.__lock:
+            self.__saturated_states.clear()
+
+    def __backend(self, backend: str, fluid_name: str) -> AbstractState | None:
+        key = (backend, fluid_name)
+        if key in self.__backends:
+            return self.__backends[key]
+        with self.__lock:
+            if key not in self.__backends:
+                self.__locks[key] = Lock()
+                self.__backends[key] = self.__create_backend(backend, fluid_name)
+            return self.__backends[key]
+
+    @staticmethod
+    def __create_backend(backend: str, fluid_name: str) -> AbstractState | None:
+        if backend != "HEOS":
+            return None
+        try:
+            state = BackendPool().create(backend, fluid_name)
+            # Raises for pseudo-pure fluids and mixtures
+            state.update_QT_pure_superanc(0, 0.9 * state.T_critical())
+            # Prepares the inversion of the superancillary functions
+            state.update(CoolProp.PQ_INPUTS, 0.5 * state.p_critical(), 0)
+            return state
+        except ValueError:
+            return None
+
+    def __reinit_locks(self):
+        self.__lock = Lock()
+        self.__locks = {key: Lock() for key in self.__locks}
@@ -0,0 +1,19 @@
+from .batch_evaluator import *
+from .cost_model import *
+from .duration_histogram import *
+from .prototype_spec import *
+from .remote_worker import *
+from .supervised_evaluator import *
+from .supervised_worker import *
+from .work_queue import *
+
+__all__ = (
+    batch_evaluator.__all__
+    + cost_model.__all__
+    + duration_histogram.__all__
+    + prototype_spec.__all__
+    + remote_worker.__all__
+    + supervised_evaluator.__all__
+    + supervised_worker.__all__
+    + work_queue.__all__
+)
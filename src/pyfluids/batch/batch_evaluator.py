@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from os import cpu_count
+from threading import Lock
+from time import perf_counter
+from typing import Any, Sequence, Union
+
+from .cost_model import CostModel
+from .prototype_spec import PrototypeSpec
+from .remote_worker import RemoteWorker
+from .work_queue import WorkQueue
+from ..enums import Executors, Parameters
+from ..fluids.abstract_fluid import AbstractFluid
+from ..humid_air import HumidAir
+from ..io.abstract_input import AbstractInput
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:  # pragma: no cover
+    InterpreterPoolExecutor = None
+
+__all__ = ["BatchEvaluator"]
+
+Prototype = Union[AbstractFluid, HumidAir]
+
+
+class BatchEvaluator:
+    """Parallel evaluator of fluids, mixtures and humid air states."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        chunk_size: int | None = None,
+        cost_model: CostModel | None = None,
+        keep_instances: bool = False,
+        executor: Executors = Executors.Thread,
+    ):
+        """
+        Parallel evaluator of fluids, mixtures and humid air states.
+
+        By default, states are evaluated by a pool of threads, so all the workers
+        share the same CoolProp data (fluids library, tabular data, etc.).
+        Pools of processes or sub-interpreters (Python 3.14+) are also available;
+        they import PyFluids once per worker and are kept until the evaluator
+        is closed. Each worker evaluates its states on its own fluid instance.
+        The workers take the states from a shared queue
+        (the most expensive ones first) in chunks sized by their estimated cost,
+        so the load is balanced even if the cost varies by orders of magnitude.
+
+        :param max_workers: Maximum number of worker threads (optional).
+            By default, the number of CPUs.
+        :param chunk_size: Fixed number of states taken by a worker at once
+            (optional). By default, the chunk size is adaptive.
+        :param cost_model: Estimator of the states evaluation cost (optional).
+            By default, a new one is created and refined by
+            all evaluations of this evaluator.
+        :param keep_instances: True if the fluid instances (with their CoolProp
+            backends) should be kept warm between evaluations (optional).
+            The instances are kept by the full specification of the prototype
+            (see `PrototypeSpec`), so only `Fluid`, `Mixture` and `HumidAir`
+            instances (not their subclasses) are kept.
+            The process and sub-interpreter workers always keep them.
+        :param executor: Type of workers (optional). By default, threads.
+            The process and sub-interpreter workers support only
+            `Fluid`, `Mixture` and `HumidAir` instances (not their subclasses).
+        :raises ValueError: If number of workers, chunk size or
+            type of workers is invalid.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("Invalid number of workers! It should be positive.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("Invalid chunk size! It should be positive.")
+        if executor == Executors.Interpreter and InterpreterPoolExecutor is None:
+            raise ValueError(
+                "Sub-interpreter workers are available only since Python 3.14!"
+            )
+        self.__max_workers: int = (
+            max_workers if max_workers is not None else cpu_count() or 1
+        )
+        self.__chunk_size: int | None = chunk_size
+        self.__cost_model: CostModel = (
+            cost_model if cost_model is not None else CostModel()
+        )
+        self.__keep_instances: bool = keep_instances
+        self.__instances: dict[PrototypeSpec, list[Prototype]] = {}
+        self.__instances_lock: Lock = Lock()
+        self.__executor: Executors = executor
+        self.__pool: Executor | None = None
+        self.__pool_lock: Lock = Lock()
+
+    def __enter__(self) -> BatchEvaluator:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def max_workers(self) -> int:
+        """Maximum number of workers."""
+        return self.__max_workers
+
+    @property
+    def chunk_size(self) -> int | None:
+        """Fixed number of states taken by a worker at once."""
+        return self.__chunk_size
+
+    @property
+    def cost_model(self) -> CostModel:
+        """Estimator of the states evaluation cost."""
+        return self.__cost_model
+
+    @property
+    def keep_instances(self) -> bool:
+        """True if the fluid instances are kept warm between evaluations."""
+        return self.__keep_instances
+
+    @property
+    def kept_instances(self) -> int:
+        """Number of the fluid instances kept warm."""
+        with self.__instances_lock:
+            return sum(len(i) for i in self.__instances.values())
+
+    @property
+    def executor(self) -> Executors:
+        """Type of workers."""
+        return self.__executor
+
+    def close(self):
+        """Shuts down the pool of processes or sub-interpreters (if any)."""
+        with self.__pool_lock:
+            if self.__pool is not None:
+                self.__pool.shutdown()
+                self.__pool = None
+
+    def release_instances(self):
+        """Releases all the fluid instances kept warm."""
+        with self.__instances_lock:
+            self.__instances.clear()
+
+    def evaluate(
+        self,
+        prototype: Prototype,
+        states: Sequence[Sequence[AbstractInput]],
+        properties: Sequence[str | tuple[Parameters, Parameters, Parameters]],
+    ) -> list[dict[str, Any] | None]:
+        """
+        Evaluates properties of the fluid (mixture or humid air)
+        at each of the given states.
+
+        :param prototype: Fluid, mixture or humid air instance
+            used as a template for all states (specified phase is kept).
+        :param states: Inputs which define each of the states.
+        :param properties: Names of properties to be evaluated and/or
+            partial derivatives of fluids and mixtures as tuples of
+            state variables ``(of, wrt, constant)``
+            (see `AbstractFluid.partial_derivative`).
+        :return: Values of properties for each of the states
+            (in the same order, by the same keys) or None for invalid states
+            (or if any of the partial derivatives cannot be evaluated).
+        :raises ValueError: If property names are invalid or
+            the prototype is not supported by the process or sub-interpreter workers.
+        :raises RuntimeError: If PyFluids cannot be used by the workers
+            (e.g., the installed CoolProp does not support sub-interpreters).
+        """
+        self._check_properties(prototype, properties)
+        keys = [self.__cost_model.key(prototype, inputs) for inputs in states]
+        estimates = {key: self.__cost_model.estimate(key) for key in set(keys)}
+        workers = max(1, min(self.__max_workers, len(states)))
+        queue = WorkQueue([estimates[key] for key in keys], workers, self.__chunk_size)
+        results: list[dict[str, Any] | None] = [None] * len(states)
+        if self.__executor != Executors.Thread:
+            self._work_remotely(queue, prototype, states, keys, properties, results)
+            return results
+        if workers == 1:
+            self._work(queue, prototype, states, keys, properties, results)
+            return results
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._work, queue, prototype, states, keys, properties, results
+                )
+                for _ in range(workers)
+            ]
+            for future in futures:
+                future.result()
+        return results
+
+    def _work(
+        self,
+        queue: WorkQueue,
+        prototype: Prototype,
+        states: Sequence[Sequence[AbstractInput]],
+        keys: Sequence[tuple],
+        properties: Sequence[str | tuple[Parameters, Parameters, Parameters]],
+        results: list[dict[str, Any] | None],
+    ):
+        instance_key = self.__instance_key(prototype)
+        instance = self.__take_instance(instance_key)
+        chunk = queue.next_chunk()
+        while chunk:
+            durations: dict[tuple, list[float]] = {}
+            for index in chunk:
+                start = perf_counter()
+                created = instance is None
+                instance, results[index] = self._evaluate_state(
+                    prototype, instance, states[index], properties
+                )
+                if not created:
+                    duration = durations.setdefault(keys[index], [0.0, 0])
+                    duration[0] += perf_counter() - start
+                    duration[1] += 1
+            for key, (duration, count) in durations.items():
+                self.__cost_model.record(key, duration, count)
+            chunk = queue.next_chunk()
+        self.__keep_instance(instance_key, instance)
+
+    def _work_remotely(
+        self,
+        queue: WorkQueue,
+        prototype: Prototype,
+        states: Sequence[Sequence[AbstractInput]],
+        keys: Sequence[tuple],
+        properties: Sequence[str | tuple[Parameters, Parameters, Parameters]],
+        results: list[dict[str, Any] | None],
+    ):
+        spec = PrototypeSpec.of(prototype)
+        pool = self.__remote_pool()
+        chunks, futures = [], []
+        chunk = queue.next_chunk()
+        while chunk:
+            chunks.append(chunk)
+            futures.append(
+                pool.submit(
+                    RemoteWorker.evaluate,
+                    spec,
+                    [
+                        tuple((i.coolprop_key, i.value) for i in states[index])
+                        for index in chunk
+                    ],
+                    tuple(properties),
+                )
+            )
+            chunk = queue.next_chunk()
+        for chunk, future in zip(chunks, futures):
+            rows, durations = future.result()
+            totals: dict[tuple, list[float]] = {}
+            for index, row, duration in zip(chunk, rows, durations):
+                results[index] = row
+                total = totals.setdefault(keys[index], [0.0, 0])
+                total[0] += duration
+                total[1] += 1
+            for key, (duration, count) in totals.items():
+                self.__cost_model.record(key, duration, count)
+
+    @staticmethod
+    def _evaluate_state(
+        prototype: Prototype,
+        instance: Prototype | None,
+        inputs: Sequence[AbstractInput],
+        properties: Sequence[str | tuple[Parameters, Parameters, Parameters]],
+    ) -> tuple[Prototype | None, dict[str, Any] | None]:
+        try:
+            if instance is None:
+                instance = prototype.with_state(*inputs)
+            else:
+                instance.update(*inputs)
+            return instance, {
+                key: (
+                    instance.partial_derivative(*key)
+                    if isinstance(key, tuple)
+                    else getattr(instance, key)
+                )
+                for key in properties
+            }
+        except ValueError:
+            return instance, None
+
+    @staticmethod
+    def _check_properties(
+        prototype: Prototype,
+        properties: Sequence[str | tuple[Parameters, Parameters, Parameters]],
+    ):
+        invalid = [
+            str(key)
+            for key in properties
+            if not (
+                isinstance(getattr(prototype.__class__, key, None), property)
+                if isinstance(key, str)
+                else isinstance(prototype, AbstractFluid)
+                and isinstance(key, tuple)
+                and len(key) == 3
+                and all(isinstance(i, Parameters) for i in key)
+            )
+        ]
+        if invalid:
+            raise ValueError(f"Invalid properties: {', '.join(invalid)}!")
+
+    def __remote_pool(self) -> Executor:
+        with self.__pool_lock:
+            if self.__pool is None:
+                pool = (
+                    ProcessPoolExecutor(self.__max_workers)
+                    if self.__executor == Executors.Process
+                    else InterpreterPoolExecutor(self.__max_workers)
+                )
+                try:
+                    pool.submit(RemoteWorker.probe).result()
+                except Exception as e:
+                    pool.shutdown()
+                    raise RuntimeError(
+                        f"PyFluids cannot be used by the {self.__executor.name.lower()}"
+                        f" workers: {e}"
+                    ) from e
+                self.__pool = pool
+            return self.__pool
+
+    def __instance_key(self, prototype: Prototype) -> PrototypeSpec | None:
+        if not self.__keep_instances:
+            return None
+        try:
+            return PrototypeSpec.of(prototype)
+        except ValueError:
+            return None
+
+    def __take_instance(self, key: PrototypeSpec | None) -> Prototype | None:
+        if key is None:
+            return None
+        with self.__instances_lock:
+            instances = self.__instances.get(key)
+            return instances.pop() if instances else None
+
+    def __keep_instance(self, key: PrototypeSpec | None, instance: Prototype | None):
+        if key is None or instance is None:
+            return
+        with self.__instances_lock:
+            self.__instances.setdefault(key, []).append(instance)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Hashable, Sequence, Union
+
+import CoolProp
+
+from ..fluids import Fluid, Mixture
+from ..fluids.abstract_fluid import AbstractFluid
+from ..humid_air import HumidAir
+from ..io.abstract_input import AbstractInput
+
+__all__ = ["CostModel"]
+
+Prototype = Union[AbstractFluid, HumidAir]
+
+
+class CostModel:
+    """Estimator of the states evaluation cost."""
+
+    # Typical evaluation time of the pure fluid state [s] by inputs pair
+    __FLUID_COSTS: dict[frozenset, float] = {
+        frozenset((CoolProp.iDmass, CoolProp.iP)): 1e-5,
+        frozenset((CoolProp.iDmass, CoolProp.iT)): 1e-5,
+        frozenset((CoolProp.iHmass, CoolProp.iP)): 1.5e-5,
+        frozenset((CoolProp.iP, CoolProp.iQ)): 1e-5,
+        frozenset((CoolProp.iP, CoolProp.iSmass)): 1.5e-5,
+        frozenset((CoolProp.iP, CoolProp.iT)): 2e-5,
+        frozenset((CoolProp.iP, CoolProp.iUmass)): 3e-5,
+        frozenset((CoolProp.iQ, CoolProp.iT)): 1e-5,
+    }
+    __FLUID_DEFAULT_COST: float = 3e-4
+    __MIXTURE_COST: float = 1e-2
+    __MIXTURE_TWO_PHASE_COST: float = 2e-3
+    # Typical evaluation time of the humid air property [s] by input key
+    __HUMID_AIR_COSTS: dict[str, float] = {
+        "B": 8e-3,
+        "Hha": 5e-4,
+        "Sha": 5e-4,
+    }
+    __HUMID_AIR_DEFAULT_COST: float = 7e-5
+    __PHASE_HINT_FACTOR: float = 0.5
+
+    def __init__(self, smoothing: float = 0.25):
+        """
+        Estimator of the states evaluation cost.
+
+        A priori estimates depend on the fluid type, the inputs pair and
+        the specified phase. They are refined by the running statistics
+        of the measured evaluation time.
+
+        :param smoothing: Smoothing factor of the running statistics
+            (exponential moving average) (optional).
+        :raises ValueError: If smoothing factor is invalid.
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError("Invalid smoothing factor! It should be in (0;1].")
+        self.__smoothing: float = smoothing
+        self.__statistics: dict[Hashable, float] = {}
+        self.__lock: Lock = Lock()
+
+    @property
+    def smoothing(self) -> float:
+        """Smoothing factor of the running statistics."""
+        return self.__smoothing
+
+    def key(self, prototype: Prototype, inputs: Sequence[AbstractInput]) -> tuple:
+        """
+        Cost category of the state.
+
+        :param prototype: Fluid, mixture or humid air instance.
+        :param inputs: Inputs which define the state.
+        :return: Key of the cost category.
+        """
+        return (
+            self.__category(prototype),
+            self.__identity(prototype),
+            frozenset(i.coolprop_key for i in inputs),
+            getattr(prototype, "_specified_phase", None),
+        )
+
+    def estimate(self, key: tuple) -> float:
+        """
+        Estimated evaluation time of the state.
+
+        :param key: Key of the cost category.
+        :return: Estimated evaluation time [s].
+        """
+        measured = self.__statistics.get(key)
+        return measured if measured is not None else self.__prior(key)
+
+    def record(self, key: tuple, duration: float, count: int = 1):
+        """
+        Updates the running statistics of the evaluation time.
+
+        :param key: Key of the cost category.
+        :param duration: Total evaluation time of the states [s].
+        :param count: Number of evaluated states (optional).
+        """
+        if count < 1:
+            return
+        sample = duration / count
+        with self.__lock:
+            measured = self.__statistics.get(key)
+            self.__statistics[key] = (
+                sample
+                if measured is None
+                else measured + self.__smoothing * (sample - measured)
+            )
+
+    def reset(self):
+        """Resets the running statistics."""
+        with self.__lock:
+            self.__statistics.clear()
+
+    def __prior(self, key: tuple) -> float:
+        category, _, pair, phase = key
+        if category is HumidAir:
+            return max(
+                (
+                    self.__HUMID_AIR_COSTS.get(i, self.__HUMID_AIR_DEFAULT_COST)
+                    for i in pair
+                ),
+                default=self.__HUMID_AIR_DEFAULT_COST,
+            )
+        if category is Mixture:
+            cost = (
+                self.__MIXTURE_TWO_PHASE_COST
+                if CoolProp.iQ in pair
+                else self.__MIXTURE_COST
+            )
+        else:
+            cost = self.__FLUID_COSTS.get(pair, self.__FLUID_DEFAULT_COST)
+        return cost * (self.__PHASE_HINT_FACTOR if phase is not None else 1)
+
+    @staticmethod
+    def __category(prototype: Prototype) -> type:
+        for category in (HumidAir, Mixture, Fluid):
+            if isinstance(prototype, category):
+                return category
+        return AbstractFluid
+
+    @staticmethod
+    def __identity(prototype: Prototype) -> Hashable:
+        if isinstance(prototype, Fluid):
+            return (
+                prototype.name.coolprop_name,
+                prototype.fraction,
+                prototype.coolprop_backend,
+            )
+        if isinstance(prototype, Mixture):
+            return (
+                tuple(i.coolprop_name for i in prototype.fluids),
+                tuple(prototype.fractions),
+                prototype.coolprop_backend,
+            )
+        return None
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Sequence
+
+import CoolProp
+
+__all__ = ["DurationHistogram"]
+
+
+class DurationHistogram:
+    """Thread-safe histograms of the evaluation time by inputs pair."""
+
+    def __init__(self, bounds: Sequence[float] | None = None):
+        """
+        Thread-safe histograms of the evaluation time by inputs pair.
+
+        :param bounds: Upper bounds of the buckets [s] (optional).
+            By default, from 1 µs to 10 s, two buckets per decade.
+            Longer durations are counted by the overflow bucket.
+        :raises ValueError: If bounds are invalid.
+        """
+        bounds = (
+            tuple(bounds)
+            if bounds is not None
+            else tuple(10 ** (i / 2) for i in range(-12, 3))
+        )
+        if not bounds or any(i <= 0 for i in bounds) or list(bounds) != sorted(bounds):
+            raise ValueError(
+                "Invalid bounds! They should be positive and sorted in ascending order."
+            )
+        self.__bounds: tuple[float, ...] = bounds
+        self.__counts: dict[str, list[int]] = {}
+        self.__timeouts: dict[str, int] = {}
+        self.__lock: Lock = Lock()
+
+    @property
+    def bounds(self) -> tuple[float, ...]:
+        """Upper bounds of the buckets [s]."""
+        return self.__bounds
+
+    @staticmethod
+    def pair(coolprop_keys: Sequence[int | str]) -> str:
+        """
+        Name of the inputs pair (or triple for humid air).
+
+        :param coolprop_keys: CoolProp internal keys of inputs.
+        :return: Short names of inputs joined by "&" (e.g., "P&T").
+        """
+        return "&".join(
+            sorted(
+                (
+                    CoolProp.CoolProp.get_parameter_information(key, "short")
+                    if isinstance(key, int)
+                    else key
+                )
+                for key in coolprop_keys
+            )
+        )
+
+    def record(self, pair: str, duration: float):
+        """
+        Records the evaluation time.
+
+        :param pair: Name of the inputs pair.
+        :param duration: Evaluation time [s].
+        """
+        with self.__lock:
+            counts = self.__counts.get(pair)
+            if counts is None:
+                counts = self.__counts[pair] = [0] * (len(self.__bounds) + 1)
+            counts[bisect_left(self.__bounds, duration)] += 1
+
+    def record_timeout(self, pair: str):
+        """
+        Records the evaluation which exceeded the latency budget.
+
+        :param pair: Name of the inputs pair.
+        """
+        with self.__lock:
+            self.__timeouts[pair] = self.__timeouts.get(pair, 0) + 1
+
+    def counts(self, pair: str) -> list[int]:
+        """
+        Number of evaluations in each bucket (the last one is the overflow bucket).
+
+        :param pair: Name of the inputs pair.
+        :return: Counts of the buckets.
+        """
+        with self.__lock:
+            return list(self.__counts.get(pair, [0] * (len(self.__bounds) + 1)))
+
+    def timeouts(self, pair: str) -> int:
+        """
+        Number of evaluations which exceeded the latency budget.
+
+        :param pair: Name of the inputs pair.
+        :return: Number of timeouts.
+        """
+        with self.__lock:
+            return self.__timeouts.get(pair, 0)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Histograms of all the inputs pairs.
+
+        :return: Counts of the non-empty buckets (by their upper bounds, in seconds)
+            and number of timeouts of each inputs pair.
+        """
+        with self.__lock:
+            pairs = sorted(set(self.__counts) | set(self.__timeouts))
+            return {
+                pair: {
+                    "buckets": {
+                        f"{bound:g}": count
+                        for bound, count in zip(
+                            (*self.__bounds, float("inf")),
+                            self.__counts.get(pair, ()),
+                        )
+                        if count
+                    },
+                    "timeouts": self.__timeouts.get(pair, 0),
+                }
+                for pair in pairs
+            }
+
+    def reset(self):
+        """Resets all the histograms."""
+        with self.__lock:
+            self.__counts.clear()
+            self.__timeouts.clear()
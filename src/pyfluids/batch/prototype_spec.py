@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Union
+
+from ..enums import FluidsList, Phases
+from ..fluids import Fluid, Mixture
+from ..fluids.abstract_fluid import AbstractFluid
+from ..humid_air import HumidAir
+from ..io import Input, InputHumidAir
+from ..io.abstract_input import AbstractInput
+
+__all__ = ["PrototypeSpec"]
+
+Prototype = Union[AbstractFluid, HumidAir]
+
+
+@dataclass(frozen=True)
+class PrototypeSpec:
+    """
+    Hashable and picklable specification of the fluid,
+    mixture or humid air instance with no defined state.
+    """
+
+    kind: str
+    name: FluidsList | None = None
+    fraction: float | None = None
+    coolprop_backend: str | None = None
+    fluids: tuple[FluidsList, ...] = ()
+    fractions: tuple[float, ...] = ()
+    phase: Phases | None = None
+
+    @classmethod
+    def of(cls, prototype: Prototype) -> PrototypeSpec:
+        """
+        Specification of the existing instance.
+
+        :param prototype: Fluid, mixture or humid air instance.
+        :return: Specification of the instance.
+        :raises ValueError: If the instance type is not supported
+            (only `Fluid`, `Mixture` and `HumidAir` are supported,
+            not their subclasses).
+        """
+        if type(prototype) is Fluid:
+            return cls(
+                "fluid",
+                prototype.name,
+                prototype.fraction if not prototype.name.pure else None,
+                prototype.coolprop_backend,
+                phase=prototype._specified_phase,
+            )
+        if type(prototype) is Mixture:
+            return cls(
+                "mixture",
+                coolprop_backend=prototype.coolprop_backend,
+                fluids=tuple(prototype.fluids),
+                fractions=tuple(prototype.fractions),
+                phase=prototype._specified_phase,
+            )
+        if type(prototype) is HumidAir:
+            return cls("humid_air")
+        raise ValueError(
+            "Invalid prototype! Only Fluid, Mixture and HumidAir are supported."
+        )
+
+    def create(self) -> Prototype:
+        """
+        Creates a new instance with no defined state.
+
+        :return: A new fluid, mixture or humid air instance.
+        :raises ValueError: If specification is invalid.
+        """
+        if self.kind == "fluid":
+            prototype = Fluid(self.name, self.fraction, self.coolprop_backend)
+        elif self.kind == "mixture":
+            prototype = Mixture(
+                list(self.fluids), list(self.fractions), self.coolprop_backend
+            )
+        elif self.kind == "humid_air":
+            return HumidAir()
+        else:
+            raise ValueError(f"Invalid prototype kind: {self.kind}!")
+        if self.phase is not None:
+            prototype.specify_phase(self.phase)
+        return prototype
+
+    def input(self, coolprop_key: int | str, value: float) -> AbstractInput:
+        """
+        Creates the input of the suitable type.
+
+        :param coolprop_key: CoolProp internal key.
+        :param value: Input value in SI units.
+        :return: Input for the specified instance.
+        """
+        return (
+            InputHumidAir(coolprop_key, value)
+            if self.kind == "humid_air"
+            else Input(coolprop_key, value)
+        )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Sequence, Union
+
+from .prototype_spec import PrototypeSpec
+from ..enums import Parameters
+from ..fluids.abstract_fluid import AbstractFluid
+from ..humid_air import HumidAir
+
+__all__ = ["RemoteWorker"]
+
+Prototype = Union[AbstractFluid, HumidAir]
+
+
+class RemoteWorker:
+    """
+    Batch evaluation in another process or sub-interpreter.
+
+    PyFluids is imported once per process (sub-interpreter), and each of them
+    keeps its own pool of fluid instances (with their CoolProp backends),
+    one per specification, which is reused by all the evaluations.
+    """
+
+    __instances: dict[PrototypeSpec, Prototype] = {}
+
+    @staticmethod
+    def probe() -> bool:
+        """Checks that PyFluids (and CoolProp) can be used by the worker."""
+        return True
+
+    @classmethod
+    def evaluate(
+        cls,
+        spec: PrototypeSpec,
+        states: Sequence[Sequence[tuple[int | str, float]]],
+        properties: Sequence[str | tuple[Parameters, Parameters, Parameters]],
+    ) -> tuple[list[dict[str, Any] | None], list[float]]:
+        """
+        Evaluates properties of the fluid (mixture or humid air)
+        at each of the given states.
+
+        :param spec: Specification of the fluid, mixture or humid air.
+        :param states: Pairs of CoolProp keys and SI values
+            of inputs which define each of the states.
+        :param properties: Names of properties and/or partial derivatives
+            to be evaluated (see `BatchEvaluator.evaluate`).
+        :return: Values of properties for each of the states
+            (None for invalid states) and evaluation time of each state [s].
+        :raises ValueError: If specification is invalid.
+        """
+        instance = cls.__instances.get(spec)
+        if instance is None:
+            instance = cls.__instances.setdefault(spec, spec.create())
+        rows, durations = [], []
+        for inputs in states:
+            start = perf_counter()
+            try:
+                instance.update(*(spec.input(key, value) for key, value in inputs))
+                rows.append(
+                    {
+                        key: (
+                            instance.partial_derivative(*key)
+                            if isinstance(key, tuple)
+                            else getattr(instance, key)
+                        )
+                        for key in properties
+                    }
+                )
+            except ValueError:
+                rows.append(None)
+            durations.append(perf_counter() - start)
+        return rows, durations
+
+    @classmethod
+    def instances(cls) -> int:
+        """Number of fluid instances kept by the worker."""
+        return len(cls.__instances)
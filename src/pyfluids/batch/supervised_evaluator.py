@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Sequence, Union
+
+from .batch_evaluator import BatchEvaluator
+from .cost_model import CostModel
+from .duration_histogram import DurationHistogram
+from .prototype_spec import PrototypeSpec
+from .supervised_worker import SupervisedWorker
+from .work_queue import WorkQueue
+from ..fluids.abstract_fluid import AbstractFluid
+from ..humid_air import HumidAir
+from ..io.abstract_input import AbstractInput
+
+__all__ = ["SupervisedEvaluator"]
+
+Prototype = Union[AbstractFluid, HumidAir]
+
+
+class _TimedOutResult(dict):
+    """Result of the state evaluation which exceeded the latency budget."""
+
+
+class SupervisedEvaluator:
+    """Evaluator of fluids, mixtures and humid air states with a latency budget."""
+
+    def __init__(
+        self,
+        budget: float,
+        max_workers: int = 1,
+        cost_model: CostModel | None = None,
+        histogram: DurationHistogram | None = None,
+    ):
+        """
+        Evaluator of fluids, mixtures and humid air states with a latency budget.
+
+        Each state is evaluated by a supervised worker process.
+        If the evaluation of a single state (a flash calculation)
+        exceeds the budget, the worker process is killed and replaced,
+        and the state is reported as timed out
+        (all its properties are NaN, see `SupervisedEvaluator.timed_out`).
+        To start the replacing worker processes faster,
+        call `SupervisedWorker.preload` once at application startup.
+        The evaluation time of each state is recorded
+        by the histogram of its inputs pair.
+
+        :param budget: Latency budget of a single state evaluation [s].
+        :param max_workers: Number of worker processes (optional).
+            By default, one.
+        :param cost_model: Estimator of the states evaluation cost (optional).
+            By default, a new one is created and refined by
+            all evaluations of this evaluator.
+        :param histogram: Histograms of the evaluation time (optional).
+            By default, a new one is created.
+        :raises ValueError: If latency budget or number of workers is invalid.
+        """
+        if budget <= 0:
+            raise ValueError("Invalid latency budget! It should be positive.")
+        if max_workers < 1:
+            raise ValueError("Invalid number of workers! It should be positive.")
+        self.__budget: float = budget
+        self.__max_workers: int = max_workers
+        self.__cost_model: CostModel = (
+            cost_model if cost_model is not None else CostModel()
+        )
+        self.__histogram: DurationHistogram = (
+            histogram if histogram is not None else DurationHistogram()
+        )
+        self.__workers: list[SupervisedWorker] = []
+        self.__idle_workers: list[SupervisedWorker] = []
+        self.__timeouts: int = 0
+        self.__lock: Lock = Lock()
+
+    def __enter__(self) -> SupervisedEvaluator:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def budget(self) -> float:
+        """Latency budget of a single state evaluation [s]."""
+        return self.__budget
+
+    @property
+    def max_workers(self) -> int:
+        """Number of worker processes."""
+        return self.__max_workers
+
+    @property
+    def cost_model(self) -> CostModel:
+        """Estimator of the states evaluation cost."""
+        return self.__cost_model
+
+    @property
+    def histogram(self) -> DurationHistogram:
+        """Histograms of the evaluation time by inputs pair."""
+        return self.__histogram
+
+    @property
+    def timeouts(self) -> int:
+        """Number of states which exceeded the latency budget."""
+        with self.__lock:
+            return self.__timeouts
+
+    @property
+    def recycled_workers(self) -> int:
+        """Number of times the worker processes were killed and replaced."""
+        with self.__lock:
+            return sum(i.recycled for i in self.__workers)
+
+    @staticmethod
+    def timed_out(result: dict[str, Any] | None) -> bool:
+        """
+        Checks whether the state evaluation exceeded the latency budget.
+
+        :param result: Result of the state evaluation.
+        :return: True if the state is timed out
+            (a state which is evaluated to NaN values is not).
+        """
+        return isinstance(result, _TimedOutResult)
+
+    def close(self):
+        """Stops all the worker processes."""
+        with self.__lock:
+            for worker in self.__workers:
+                worker.close()
+            self.__workers.clear()
+            self.__idle_workers.clear()
+
+    def evaluate(
+        self,
+        prototype: Prototype,
+        states: Sequence[Sequence[AbstractInput]],
+        properties: Sequence[str],
+    ) -> list[dict[str, Any] | None]:
+        """
+        Evaluates properties of the fluid (mixture or humid air)
+        at each of the given states.
+
+        :param prototype: Fluid, mixture or humid air instance
+            used as a template for all states (specified phase is kept).
+            Only `Fluid`, `Mixture` and `HumidAir` instances
+            (not their subclasses) are supported.
+        :param states: Inputs which define each of the states.
+        :param properties: Names of properties to be evaluated.
+        :return: Values of properties for each of the states
+            (in the same order), None for invalid states
+            or NaN values for the states which exceeded the latency budget.
+        :raises ValueError: If property names are invalid or
+            the prototype is not supported.
+        :raises RuntimeError: If the worker processes cannot be started.
+        """
+        BatchEvaluator._check_properties(prototype, properties)
+        spec = PrototypeSpec.of(prototype)
+        keys = [self.__cost_model.key(prototype, inputs) for inputs in states]
+        estimates = {key: self.__cost_model.estimate(key) for key in set(keys)}
+        workers = max(1, min(self.__max_workers, len(states)))
+        queue = WorkQueue([estimates[key] for key in keys], workers)
+        raw_states = [
+            tuple((i.coolprop_key, i.value) for i in inputs) for inputs in states
+        ]
+        pairs = {key: self.__histogram.pair(tuple(key[2])) for key in estimates.keys()}
+        results: list[dict[str, Any] | None] = [None] * len(states)
+        args = (queue, spec, raw_states, keys, pairs, tuple(properties), results)
+        if workers == 1:
+            self.__work(*args)
+            return results
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.__work, *args) for _ in range(workers)]
+            for future in futures:
+                future.result()
+        return results
+
+    def __work(
+        self,
+        queue: WorkQueue,
+        spec: PrototypeSpec,
+        states: Sequence[tuple[tuple[int | str, float], ...]],
+        keys: Sequence[tuple],
+        pairs: dict[tuple, str],
+        properties: tuple[str, ...],
+        results: list[dict[str, Any] | None],
+    ):
+        worker = self.__take_worker()
+        try:
+            chunk = queue.next_chunk()
+            while chunk:
+                self.__evaluate_chunk(
+                    worker, chunk, spec, states, keys, pairs, properties, results
+                )
+                chunk = queue.next_chunk()
+        finally:
+            with self.__lock:
+                self.__idle_workers.append(worker)
+
+    def __evaluate_chunk(
+        self,
+        worker: SupervisedWorker,
+        chunk: list[int],
+        spec: PrototypeSpec,
+        states: Sequence[tuple[tuple[int | str, float], ...]],
+        keys: Sequence[tuple],
+        pairs: dict[tuple, str],
+        properties: tuple[str, ...],
+        results: list[dict[str, Any] | None],
+    ):
+        while chunk:
+            worker.submit(spec, [states[index] for index in chunk], properties)
+            for position, index in enumerate(chunk):
+                try:
+                    results[index], duration = worker.receive(self.__budget)
+                except TimeoutError:
+                    results[index] = _TimedOutResult.fromkeys(properties, math.nan)
+                    self.__histogram.record_timeout(pairs[keys[index]])
+                    self.__cost_model.record(keys[index], self.__budget)
+                    with self.__lock:
+                        self.__timeouts += 1
+                except RuntimeError:
+                    results[index] = None
+                else:
+                    self.__histogram.record(pairs[keys[index]], duration)
+                    self.__cost_model.record(keys[index], duration)
+                    continue
+                # The worker was recycled, so the rest of the chunk is submitted again
+                chunk = chunk[position + 1 :]
+                break
+            else:
+                chunk = []
+
+    def __take_worker(self) -> SupervisedWorker:
+        with self.__lock:
+            if self.__idle_workers:
+                return self.__idle_workers.pop()
+            worker = SupervisedWorker()
+            self.__workers.append(worker)
+            return worker
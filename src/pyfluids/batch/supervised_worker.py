@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any, Sequence
+
+from .prototype_spec import PrototypeSpec
+from .remote_worker import RemoteWorker
+
+__all__ = ["SupervisedWorker"]
+
+
+class SupervisedWorker:
+    """Worker process which can be killed if an evaluation takes too long."""
+
+    def __init__(self):
+        """
+        Worker process which can be killed if an evaluation takes too long.
+
+        The process is started lazily and streams the result of each state
+        back as soon as it is evaluated, so every single evaluation
+        can be awaited with its own timeout.
+        """
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self.__context = multiprocessing.get_context("forkserver")
+        else:  # pragma: no cover
+            self.__context = multiprocessing.get_context("spawn")
+        self.__process: multiprocessing.process.BaseProcess | None = None
+        self.__connection: Connection | None = None
+        self.__recycled: int = 0
+
+    @staticmethod
+    def preload():
+        """
+        Makes the fork server import PyFluids once,
+        so the (recycled) worker processes are started almost instantly.
+
+        It changes a process-wide setting of the `multiprocessing` module,
+        so it should be called explicitly (once, at application startup)
+        before the first worker process is started.
+        It has no effect on the platforms without the fork server.
+        """
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            multiprocessing.get_context("forkserver").set_forkserver_preload(
+                ["pyfluids"]
+            )
+
+    @property
+    def alive(self) -> bool:
+        """True if the worker process is running."""
+        return self.__process is not None and self.__process.is_alive()
+
+    @property
+    def recycled(self) -> int:
+        """Number of times the worker process was killed and replaced."""
+        return self.__recycled
+
+    def submit(
+        self,
+        spec: PrototypeSpec,
+        states: Sequence[Sequence[tuple[int | str, float]]],
+        properties: Sequence[str],
+    ):
+        """
+        Submits the states for evaluation.
+        Waits (with no timeout) until the worker is ready to evaluate them,
+        i.e. PyFluids is imported and the fluid instance is created.
+
+        :param spec: Specification of the fluid, mixture or humid air.
+        :param states: Pairs of CoolProp keys and SI values
+            of inputs which define each of the states.
+        :param properties: Names of properties to be evaluated.
+        :raises ValueError: If specification is invalid.
+        :raises RuntimeError: If the worker process cannot be started.
+        """
+        if not self.alive:
+            self.__start()
+        try:
+            self.__connection.send((spec, tuple(states), tuple(properties)))
+            message = self.__connection.recv()
+        except (EOFError, OSError) as e:
+            self.__terminate()
+            raise RuntimeError(f"Worker process cannot be started: {e}") from e
+        self.__unwrap(message)
+
+    def receive(self, timeout: float | None) -> tuple[dict[str, Any] | None, float]:
+        """
+        Waits for the result of the next submitted state.
+
+        :param timeout: Maximum waiting time [s] (None for no limit).
+        :return: Values of properties (None for invalid state)
+            and evaluation time [s].
+        :raises TimeoutError: If the evaluation takes longer than the timeout;
+            the worker process is recycled, so the rest of the submitted states
+            should be submitted again.
+        :raises RuntimeError: If the worker process crashed during the evaluation;
+            it is recycled as well.
+        """
+        if not self.__connection.poll(timeout):
+            self.recycle()
+            raise TimeoutError(f"Evaluation took longer than {timeout:g} s!")
+        try:
+            return self.__unwrap(self.__connection.recv())
+        except EOFError as e:
+            self.recycle()
+            raise RuntimeError("Worker process crashed during the evaluation!") from e
+
+    def recycle(self):
+        """Kills the worker process (a new one is started on the next submit)."""
+        self.__terminate()
+        self.__recycled += 1
+
+    def close(self):
+        """Stops the worker process."""
+        if self.alive:
+            try:
+                self.__connection.send(None)
+                self.__process.join(1)
+            except OSError:  # pragma: no cover
+                pass
+        self.__terminate()
+
+    @staticmethod
+    def _serve(connection: Connection):
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                return
+            if message is None:
+                return
+            spec, states, properties = message
+            try:
+                RemoteWorker.evaluate(spec, (), properties)
+            except Exception as e:
+                connection.send(e)
+                continue
+            connection.send(None)
+            for state in states:
+                rows, durations = RemoteWorker.evaluate(spec, (state,), properties)
+                connection.send((rows[0], durations[0]))
+
+    def __start(self):
+        self.__connection, child = self.__context.Pipe()
+        self.__process = self.__context.Process(
+            target=self._serve, args=(child,), name="pyfluids-worker", daemon=True
+        )
+        self.__process.start()
+        child.close()
+
+    def __terminate(self):
+        if self.__process is not None:
+            if self.__process.is_alive():
+                self.__process.kill()
+            self.__process.join()
+            self.__process = None
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+    @staticmethod
+    def __unwrap(message: Any) -> Any:
+        if isinstance(message, Exception):
+            raise message
+        return message
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Sequence
+
+__all__ = ["WorkQueue"]
+
+
+class WorkQueue:
+    """Thread-safe queue of states with adaptive chunk sizes."""
+
+    def __init__(
+        self, costs: Sequence[float], workers: int, chunk_size: int | None = None
+    ):
+        """
+        Thread-safe queue of states with adaptive chunk sizes.
+
+        The states are taken in descending order of their estimated cost.
+        Unless the chunk size is fixed, each chunk costs about a half of
+        the remaining cost per worker (guided self-scheduling), so the most
+        expensive states are spread between the workers, and the chunks
+        become smaller towards the end of the queue.
+
+        :param costs: Estimated cost of each state.
+        :param workers: Number of workers.
+        :param chunk_size: Fixed number of states per chunk (optional).
+        :raises ValueError: If number of workers or chunk size is invalid.
+        """
+        if workers < 1:
+            raise ValueError("Invalid number of workers! It should be positive.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("Invalid chunk size! It should be positive.")
+        self.__costs: Sequence[float] = costs
+        self.__order: list[int] = sorted(
+            range(len(costs)), key=costs.__getitem__, reverse=True
+        )
+        self.__remaining_cost: float = sum(costs)
+        self.__workers: int = workers
+        self.__chunk_size: int | None = chunk_size
+        self.__cursor: int = 0
+        self.__lock: Lock = Lock()
+
+    @property
+    def remaining(self) -> int:
+        """Number of states remaining in the queue."""
+        return len(self.__order) - self.__cursor
+
+    def next_chunk(self) -> list[int]:
+        """
+        Takes the next chunk of states from the queue.
+
+        :return: Indexes of the states (empty if the queue is exhausted).
+        """
+        with self.__lock:
+            if self.__chunk_size is not None:
+                chunk = self.__order[self.__cursor : self.__cursor + self.__chunk_size]
+            else:
+                target_cost = self.__remaining_cost / (2 * self.__workers)
+                end, cost = self.__cursor, 0.0
+                while end < len(self.__order) and (
+                    end == self.__cursor
+                    or cost + self.__costs[self.__order[end]] <= target_cost
+                ):
+                    cost += self.__costs[self.__order[end]]
+                    end += 1
+                chunk = self.__order[self.__cursor : end]
+            self.__cursor += len(chunk)
+            self.__remaining_cost -= sum(self.__costs[i] for i in chunk)
+            return chunk
@@ -0,0 +1,40 @@
+import os
+from inspect import ismethod
+from itertools import count
+from typing import Callable, Optional
+from weakref import WeakMethod
+
+# Registered callbacks by registration number
+_callbacks: dict[int, Callable[[], Optional[Callable[[], None]]]] = {}
+_numbers = count()
+
+
+def reinit_after_fork(method: Callable[[], None]):
+    """
+    Registers the method which reinitializes the lock(s) of its owner
+    in the child process after fork: the locks may be held by other threads
+    of the parent process at the moment of fork,
+    and no thread of the child process would ever release them.
+
+    The bound methods are referenced weakly, so the registration
+    does not keep their owners (e.g., fluid instances) alive.
+
+    :param method: Method (or function) with no arguments.
+    """
+    number = next(_numbers)
+    _callbacks[number] = (
+        WeakMethod(method, lambda _: _callbacks.pop(number, None))
+        if ismethod(method)
+        else lambda: method
+    )
+
+
+def _reinit_in_child():
+    for reference in list(_callbacks.values()):
+        method = reference()
+        if method is not None:
+            method()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_in_child)
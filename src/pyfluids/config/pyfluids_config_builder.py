@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import json
+import os
 from configparser import ConfigParser
 from os.path import abspath
 from pathlib import Path
+from threading import RLock
 
 import tomli
 
 from .pyfluids_config import PyFluidsConfig
+from .fork_safety import reinit_after_fork
 from .singleton import Singleton
 from .units_system import UnitsSystem
 
@@ -21,12 +24,14 @@ class PyFluidsConfigBuilder(metaclass=Singleton):
     def __init__(self):
         """PyFluids configuration builder."""
         self.__config: PyFluidsConfig | None = None
+        self.__lock: RLock = RLock()
         self.__config_names: list[str] = [
             "pyfluids.ini",
             "pyfluids.json",
             "pyproject.toml",
             "tox.ini",
         ]
+        reinit_after_fork(self.__reinit_lock)
 
     @property
     def __current_path(self) -> Path:
@@ -57,16 +62,23 @@ class PyFluidsConfigBuilder(metaclass=Singleton):
         """
         if self.__config is not None:
             return self.__config
-        if self.__config_file is None:
-            return self.__create_default_config()
-        if self.__config_file.suffix == ".ini":
-            return self.__load_config_from_ini_file()
-        if self.__config_file.suffix == ".json":
-            return self.__load_config_from_json_file()
-        return self.__load_config_from_toml_file()
+        with self.__lock:
+            if self.__config is not None:
+                return self.__config
+            if self.__config_file is None:
+                return self.__create_default_config()
+            if self.__config_file.suffix == ".ini":
+                return self.__load_config_from_ini_file()
+            if self.__config_file.suffix == ".json":
+                return self.__load_config_from_json_file()
+            return self.__load_config_from_toml_file()
 
     def _reset(self):
-        self.__config = None
+        with self.__lock:
+            self.__config = None
+
+    def __reinit_lock(self):
+        self.__lock = RLock()
 
     def __create_default_config(self) -> PyFluidsConfig:
         self.__config = PyFluidsConfig()
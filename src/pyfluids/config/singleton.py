@@ -1,7 +1,24 @@
+from threading import Lock
+
+from .fork_safety import reinit_after_fork
+
+
 class Singleton(type):
     _instances = {}
+    _lock = Lock()
 
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+            with cls._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(Singleton, cls).__call__(
+                        *args, **kwargs
+                    )
         return cls._instances[cls]
+
+    @classmethod
+    def _reinit_lock(mcs):
+        mcs._lock = Lock()
+
+
+reinit_after_fork(Singleton._reinit_lock)
@@ -0,0 +1,11 @@
+from .compression_solution import *
+from .cycle_solution import *
+from .multi_stage_compression import *
+from .vapor_compression_cycle import *
+
+__all__ = (
+    compression_solution.__all__
+    + cycle_solution.__all__
+    + multi_stage_compression.__all__
+    + vapor_compression_cycle.__all__
+)
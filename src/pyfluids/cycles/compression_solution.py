@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..fluids.abstract_fluid import AbstractFluid
+
+__all__ = ["CompressionSolution"]
+
+
+@dataclass(frozen=True)
+class CompressionSolution:
+    """States and energy performance of the multi-stage compression."""
+
+    stage_inlets: tuple[AbstractFluid, ...]
+    """The states at the inlet of each stage (the first one is the inlet state)."""
+
+    stage_outlets: tuple[AbstractFluid, ...]
+    """The states at the outlet of each stage (the last one is the outlet state)."""
+
+    @property
+    def stages(self) -> int:
+        """Number of compression stages."""
+        return len(self.stage_outlets)
+
+    @property
+    def intermediate_pressures(self) -> tuple[float, ...]:
+        """Absolute pressures between the stages [Pa]."""
+        return tuple(i.pressure for i in self.stage_outlets[:-1])
+
+    @property
+    def outlet(self) -> AbstractFluid:
+        """The state at the outlet of the last stage."""
+        return self.stage_outlets[-1]
+
+    @property
+    def stage_works(self) -> tuple[float, ...]:
+        """Specific work of each stage [J/kg]."""
+        return tuple(
+            j.enthalpy - i.enthalpy
+            for i, j in zip(self.stage_inlets, self.stage_outlets)
+        )
+
+    @property
+    def specific_work(self) -> float:
+        """Total specific work of all the stages [J/kg]."""
+        return sum(self.stage_works)
+
+    @property
+    def specific_intercooling_heat(self) -> float:
+        """Total specific heat removed by the intercoolers [J/kg]."""
+        return sum(
+            i.enthalpy - j.enthalpy
+            for i, j in zip(self.stage_outlets[:-1], self.stage_inlets[1:])
+        )
+
+    @property
+    def pressure_ratios(self) -> tuple[float, ...]:
+        """Pressure ratio of each stage [-]."""
+        return tuple(
+            j.pressure / i.pressure
+            for i, j in zip(self.stage_inlets, self.stage_outlets)
+        )
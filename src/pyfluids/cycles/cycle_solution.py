@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..fluids.abstract_fluid import AbstractFluid
+
+__all__ = ["CycleSolution"]
+
+
+@dataclass(frozen=True)
+class CycleSolution:
+    """States and energy performance of the vapor-compression cycle."""
+
+    evaporator_outlet: AbstractFluid
+    """The state at the evaporator outlet (compressor inlet)."""
+
+    compressor_outlet: AbstractFluid
+    """The state at the compressor outlet (condenser inlet)."""
+
+    condenser_outlet: AbstractFluid
+    """The state at the condenser outlet (expansion valve inlet)."""
+
+    evaporator_inlet: AbstractFluid
+    """The state at the evaporator inlet (expansion valve outlet)."""
+
+    @property
+    def specific_cooling_capacity(self) -> float:
+        """Specific cooling capacity of the evaporator [J/kg]."""
+        return self.evaporator_outlet.enthalpy - self.evaporator_inlet.enthalpy
+
+    @property
+    def specific_heating_capacity(self) -> float:
+        """Specific heating capacity of the condenser [J/kg]."""
+        return self.compressor_outlet.enthalpy - self.condenser_outlet.enthalpy
+
+    @property
+    def specific_work(self) -> float:
+        """Specific work of the compressor [J/kg]."""
+        return self.compressor_outlet.enthalpy - self.evaporator_outlet.enthalpy
+
+    @property
+    def cooling_cop(self) -> float:
+        """Coefficient of performance in the cooling mode [-]."""
+        return self.specific_cooling_capacity / self.specific_work
+
+    @property
+    def heating_cop(self) -> float:
+        """Coefficient of performance in the heating mode [-]."""
+        return self.specific_heating_capacity / self.specific_work
+
+    @property
+    def pressure_ratio(self) -> float:
+        """Compressor pressure ratio [-]."""
+        return self.compressor_outlet.pressure / self.evaporator_outlet.pressure
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from math import exp, log
+from typing import Sequence
+
+import numpy as np
+
+from .compression_solution import CompressionSolution
+from ..enums import Phases
+from ..fluids.abstract_fluid import AbstractFluid
+from ..io import Input
+
+__all__ = ["MultiStageCompression"]
+
+
+class MultiStageCompression:
+    """Multi-stage compression with intercooling."""
+
+    def __init__(
+        self,
+        inlet: AbstractFluid,
+        outlet_pressure: float,
+        intercooling_temperature: float,
+    ):
+        """
+        Multi-stage compression with intercooling between the stages
+        (e.g., for the high-lift CO2 or ammonia systems).
+
+        At the outlet of each stage except the last one, the fluid is cooled
+        to the intercooling temperature (if it is hotter), but not below
+        the dew point temperature at the intermediate pressure.
+        The pressure drops in the intercoolers are neglected.
+
+        :param inlet: The state at the inlet of the first stage.
+        :param outlet_pressure: Absolute pressure at the outlet
+            of the last stage [Pa].
+        :param intercooling_temperature: Temperature at the outlet
+            of the intercoolers
+            [by default, °C; you can change this using the configuration file].
+        :raises ValueError: If outlet pressure is invalid.
+        """
+        if not outlet_pressure > inlet.pressure:
+            raise ValueError(
+                "Compressor outlet pressure should be higher than inlet pressure!"
+            )
+        self.__inlet: AbstractFluid = inlet
+        self.__outlet_pressure: float = outlet_pressure
+        self.__intercooling_temperature: float = intercooling_temperature
+
+    @property
+    def inlet(self) -> AbstractFluid:
+        """The state at the inlet of the first stage."""
+        return self.__inlet
+
+    @property
+    def outlet_pressure(self) -> float:
+        """Absolute pressure at the outlet of the last stage [Pa]."""
+        return self.__outlet_pressure
+
+    @property
+    def intercooling_temperature(self) -> float:
+        """
+        Temperature at the outlet of the intercoolers
+        [by default, °C; you can change this using the configuration file].
+        """
+        return self.__intercooling_temperature
+
+    def solve(
+        self,
+        intermediate_pressures: Sequence[float],
+        isentropic_efficiency: float | Sequence[float],
+    ) -> CompressionSolution:
+        """
+        Solves the compression with given intermediate pressures.
+
+        :param intermediate_pressures: Absolute pressures between the stages
+            (one less than the number of stages) [Pa].
+        :param isentropic_efficiency: Isentropic efficiency
+            of all the stages or of each stage
+            [by default, %; you can change this using the configuration file].
+        :return: States and energy performance of the compression.
+        :raises ValueError: If intermediate pressures
+            or isentropic efficiencies are invalid.
+        """
+        return self.solve_batch([intermediate_pressures], [isentropic_efficiency])[0]
+
+    def solve_batch(
+        self,
+        intermediate_pressures: Sequence[Sequence[float]] | np.ndarray,
+        isentropic_efficiencies: float | Sequence[float | Sequence[float]] | np.ndarray,
+    ) -> list[CompressionSolution]:
+        """
+        Solves the compression at many points
+        (e.g., for the search of the optimal intermediate pressures).
+
+        The stages are evaluated one by one for all the points at once:
+        all the compression processes from the same inlet state
+        are evaluated at once (see `compression_to_pressures`),
+        and the intercooled states are evaluated only once
+        for each unique intermediate pressure and shared between the points.
+
+        :param intermediate_pressures: Absolute pressures between the stages
+            for each point (the same number for all the points;
+            e.g., a two-dimensional NumPy array) [Pa].
+        :param isentropic_efficiencies: Isentropic efficiency
+            of all the stages at all the points or for each point
+            (of all the stages or of each stage)
+            [by default, %; you can change this using the configuration file].
+        :return: States and energy performance of the compression for each point.
+        :raises ValueError: If intermediate pressures
+            or isentropic efficiencies are invalid.
+        """
+        points = self.__points(intermediate_pressures, isentropic_efficiencies)
+        if not points:
+            return []
+        inlets = [self.__inlet] * len(points)
+        stage_inlets: list[list[AbstractFluid]] = [[] for _ in points]
+        stage_outlets: list[list[AbstractFluid]] = [[] for _ in points]
+        intercooled: dict[float, AbstractFluid] = {}
+        stages = len(points[0][0])
+        for stage in range(stages):
+            outlets = self.__compressed(
+                inlets,
+                [point[0][stage] for point in points],
+                [point[1][stage] for point in points],
+            )
+            for index, (inlet, outlet) in enumerate(zip(inlets, outlets)):
+                stage_inlets[index].append(inlet)
+                stage_outlets[index].append(outlet)
+            if stage < stages - 1:
+                inlets = [self.__intercooled(i, intercooled) for i in outlets]
+        return [
+            CompressionSolution(tuple(i), tuple(j))
+            for i, j in zip(stage_inlets, stage_outlets)
+        ]
+
+    def optimal(
+        self,
+        stages: int,
+        isentropic_efficiency: float | Sequence[float],
+        points: int = 10,
+        refinements: int = 3,
+    ) -> CompressionSolution:
+        """
+        Finds the intermediate pressures with the minimum total specific work.
+
+        The intermediate pressures are searched coordinate-wise
+        on the logarithmic grid, starting from the equal pressure ratios
+        of all the stages: each intermediate pressure in turn is varied
+        between its neighbours, while the others are fixed at the best point,
+        and the passes over all the intermediate pressures are repeated
+        until none of them changes the best point. Then the grid is refined
+        around the best point, several times.
+        All the points of each line are solved at once (see `solve_batch`).
+
+        Each pass solves at most ``points * (stages - 1)`` points,
+        so the cost grows linearly with the number of stages
+        (instead of ``points ** (stages - 1)`` for the full grid).
+
+        :param stages: Number of compression stages.
+        :param isentropic_efficiency: Isentropic efficiency
+            of all the stages or of each stage
+            [by default, %; you can change this using the configuration file].
+        :param points: Number of values of each intermediate pressure
+            on each grid (optional).
+        :param refinements: Number of the grid refinements (optional).
+        :return: States and energy performance of the optimal compression.
+        :raises ValueError: If number of stages, points or refinements
+            or isentropic efficiencies are invalid.
+        """
+        if stages < 2:
+            raise ValueError("Invalid number of stages! It should be at least 2.")
+        if points < 2:
+            raise ValueError("Invalid number of points! It should be at least 2.")
+        if refinements < 0:
+            raise ValueError("Invalid number of refinements!")
+        lower, upper = log(self.__inlet.pressure), log(self.__outlet_pressure)
+        centers = [lower + (upper - lower) * i / stages for i in range(1, stages)]
+        best = self.solve([exp(i) for i in centers], isentropic_efficiency)
+        # The first grid covers the whole range of pressures
+        half_width = (upper - lower) / 2 - (upper - lower) / (points + 1)
+        for _ in range(refinements + 1):
+            # The search stops when the lines of all the intermediate pressures
+            # in a row do not change the best point
+            index, unchanged = 0, 0
+            while unchanged < stages - 1:
+                bounds = (
+                    centers[index - 1] if index > 0 else lower,
+                    centers[index + 1] if index < stages - 2 else upper,
+                )
+                candidates = [
+                    [exp(j) for j in centers[:index] + [i] + centers[index + 1 :]]
+                    for i in (
+                        centers[index] - half_width + 2 * half_width * j / (points - 1)
+                        for j in range(points)
+                    )
+                    if bounds[0] < i < bounds[1] and i != centers[index]
+                ]
+                solutions = self.solve_batch(
+                    candidates, [isentropic_efficiency] * len(candidates)
+                )
+                position = min(
+                    range(len(solutions)),
+                    key=lambda i: solutions[i].specific_work,
+                    default=None,
+                )
+                if (
+                    position is not None
+                    and solutions[position].specific_work < best.specific_work
+                ):
+                    best = solutions[position]
+                    centers = [log(i) for i in best.intermediate_pressures]
+                    # The same line is searched again only if the minimum
+                    # is at its end
+                    unchanged = int(0 < position < len(solutions) - 1)
+                else:
+                    unchanged += 1
+                index = (index + 1) % (stages - 1)
+            half_width = 2 * half_width / (points - 1)
+        return best
+
+    def __points(
+        self,
+        intermediate_pressures: Sequence[Sequence[float]] | np.ndarray,
+        isentropic_efficiencies: float | Sequence[float | Sequence[float]] | np.ndarray,
+    ) -> list[tuple[tuple[float, ...], tuple[float, ...]]]:
+        intermediate_pressures = [
+            self.__as_list(i) for i in self.__as_list(intermediate_pressures)
+        ]
+        isentropic_efficiencies = self.__as_list(isentropic_efficiencies)
+        if len({len(i) for i in intermediate_pressures}) > 1:
+            raise ValueError(
+                "Need to define the same number of intermediate pressures "
+                "for all points!"
+            )
+        if not isinstance(isentropic_efficiencies, Sequence):
+            isentropic_efficiencies = [isentropic_efficiencies] * len(
+                intermediate_pressures
+            )
+        if len(isentropic_efficiencies) != len(intermediate_pressures):
+            raise ValueError("Need to define the isentropic efficiency for each point!")
+        points = []
+        for pressures, efficiencies in zip(
+            intermediate_pressures, isentropic_efficiencies
+        ):
+            efficiencies = self.__as_list(efficiencies)
+            pressures = (*pressures, self.__outlet_pressure)
+            if not all(
+                i < j for i, j in zip((self.__inlet.pressure, *pressures), pressures)
+            ):
+                raise ValueError(
+                    "Invalid intermediate pressures! They should increase "
+                    "from the inlet pressure to the outlet pressure."
+                )
+            if not isinstance(efficiencies, Sequence):
+                efficiencies = [efficiencies] * len(pressures)
+            if len(efficiencies) != len(pressures):
+                raise ValueError(
+                    "Need to define the isentropic efficiency for each stage!"
+                )
+            points.append((pressures, tuple(efficiencies)))
+        return points
+
+    @staticmethod
+    def __as_list(values: float | Sequence | np.ndarray) -> float | Sequence:
+        # NumPy arrays (and their scalars) are converted to lists (and floats)
+        return (
+            values.tolist() if isinstance(values, (np.ndarray, np.generic)) else values
+        )
+
+    @staticmethod
+    def __compressed(
+        inlets: list[AbstractFluid],
+        pressures: list[float],
+        isentropic_efficiencies: list[float],
+    ) -> list[AbstractFluid]:
+        groups: dict[int, list[int]] = {}
+        for index, inlet in enumerate(inlets):
+            groups.setdefault(id(inlet), []).append(index)
+        outlets: list[AbstractFluid | None] = [None] * len(inlets)
+        for indexes in groups.values():
+            for index, outlet in zip(
+                indexes,
+                inlets[indexes[0]].compression_to_pressures(
+                    [pressures[i] for i in indexes],
+                    [isentropic_efficiencies[i] for i in indexes],
+                ),
+            ):
+                outlets[index] = outlet
+        return outlets
+
+    def __intercooled(
+        self, outlet: AbstractFluid, intercooled: dict[float, AbstractFluid]
+    ) -> AbstractFluid:
+        if not outlet.temperature > self.__intercooling_temperature:
+            return outlet
+        if outlet.pressure not in intercooled:
+            state = outlet.with_state(
+                Input.pressure(outlet.pressure),
+                Input.temperature(self.__intercooling_temperature),
+            )
+            intercooled[outlet.pressure] = (
+                outlet.dew_point_at_pressure(outlet.pressure)
+                if state.phase in (Phases.Liquid, Phases.TwoPhase)
+                else state
+            )
+        return intercooled[outlet.pressure]
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .cycle_solution import CycleSolution
+from ..fluids.abstract_fluid import AbstractFluid
+
+__all__ = ["VaporCompressionCycle"]
+
+
+class VaporCompressionCycle:
+    """Single-stage vapor-compression cycle."""
+
+    def __init__(self, refrigerant: AbstractFluid):
+        """
+        Single-stage vapor-compression cycle
+        (evaporator, compressor, condenser and expansion valve).
+
+        The evaporating pressure is the dew point pressure
+        at the evaporating temperature, the condensing pressure is
+        the bubble point pressure at the condensing temperature
+        (for pure fluids, they are the saturation pressures).
+        The pressure drops and heat losses are neglected.
+
+        :param refrigerant: Refrigerant (its state is not used).
+        """
+        self.__refrigerant: AbstractFluid = refrigerant
+
+    @property
+    def refrigerant(self) -> AbstractFluid:
+        """Refrigerant."""
+        return self.__refrigerant
+
+    def solve(
+        self,
+        evaporating_temperature: float,
+        condensing_temperature: float,
+        isentropic_efficiency: float,
+        superheat: float = 0,
+        subcooling: float = 0,
+    ) -> CycleSolution:
+        """
+        Solves the cycle at the operating point.
+
+        :param evaporating_temperature: Evaporating temperature
+            [by default, °C; you can change this using the configuration file].
+        :param condensing_temperature: Condensing temperature
+            [by default, °C; you can change this using the configuration file].
+        :param isentropic_efficiency: Compressor isentropic efficiency
+            [by default, %; you can change this using the configuration file].
+        :param superheat: Superheat at the evaporator outlet (optional) [K].
+        :param subcooling: Subcooling at the condenser outlet (optional) [K].
+        :return: States and energy performance of the cycle.
+        :raises ValueError: If the operating point is invalid.
+        """
+        return self.solve_batch(
+            evaporating_temperature,
+            condensing_temperature,
+            isentropic_efficiency,
+            superheat,
+            subcooling,
+        )[0]
+
+    def solve_batch(
+        self,
+        evaporating_temperatures: float | Sequence[float] | np.ndarray,
+        condensing_temperatures: float | Sequence[float] | np.ndarray,
+        isentropic_efficiencies: float | Sequence[float] | np.ndarray,
+        superheats: float | Sequence[float] | np.ndarray = 0,
+        subcoolings: float | Sequence[float] | np.ndarray = 0,
+    ) -> list[CycleSolution]:
+        """
+        Solves the cycle at many operating points.
+
+        Each argument is a single value (the same for all the points)
+        or a sequence (or a one-dimensional NumPy array) of values
+        (one for each point).
+        The saturation states and the states at the evaporator and condenser
+        outlets are evaluated only once for each unique value (or pair of values)
+        and shared between the solutions, and all the compression processes
+        from the same inlet state are evaluated at once
+        (see `compression_to_pressures`).
+
+        :param evaporating_temperatures: Evaporating temperatures
+            [by default, °C; you can change this using the configuration file].
+        :param condensing_temperatures: Condensing temperatures
+            [by default, °C; you can change this using the configuration file].
+        :param isentropic_efficiencies: Compressor isentropic efficiencies
+            [by default, %; you can change this using the configuration file].
+        :param superheats: Superheats at the evaporator outlet (optional) [K].
+        :param subcoolings: Subcoolings at the condenser outlet (optional) [K].
+        :return: States and energy performance of the cycle for each point.
+        :raises ValueError: If any operating point is invalid.
+        """
+        points = self.__operating_points(
+            evaporating_temperatures,
+            condensing_temperatures,
+            isentropic_efficiencies,
+            superheats,
+            subcoolings,
+        )
+        dew_points = {
+            i: self.__refrigerant.dew_point_at_temperature(i)
+            for i in {point[0] for point in points}
+        }
+        bubble_points = {
+            i: self.__refrigerant.bubble_point_at_temperature(i)
+            for i in {point[1] for point in points}
+        }
+        evaporator_outlets = {
+            (i, j): (
+                dew_points[i].heating_to_temperature(i + j) if j > 0 else dew_points[i]
+            )
+            for i, j in {(point[0], point[3]) for point in points}
+        }
+        condenser_outlets = {
+            (i, j): (
+                bubble_points[i].cooling_to_temperature(i - j)
+                if j > 0
+                else bubble_points[i]
+            )
+            for i, j in {(point[1], point[4]) for point in points}
+        }
+        evaporator_inlets = {
+            (i, j, k): condenser_outlets[(i, j)].isenthalpic_expansion_to_pressure(
+                dew_points[k].pressure
+            )
+            for i, j, k in {(point[1], point[4], point[0]) for point in points}
+        }
+        compressor_outlets = self.__compressor_outlets(
+            points, evaporator_outlets, bubble_points
+        )
+        return [
+            CycleSolution(
+                evaporator_outlets[(point[0], point[3])],
+                compressor_outlet,
+                condenser_outlets[(point[1], point[4])],
+                evaporator_inlets[(point[1], point[4], point[0])],
+            )
+            for point, compressor_outlet in zip(points, compressor_outlets)
+        ]
+
+    @staticmethod
+    def __compressor_outlets(
+        points: list[tuple[float, float, float, float, float]],
+        evaporator_outlets: dict[tuple[float, float], AbstractFluid],
+        bubble_points: dict[float, AbstractFluid],
+    ) -> list[AbstractFluid]:
+        groups: dict[tuple[float, float], list[int]] = {}
+        for index, point in enumerate(points):
+            groups.setdefault((point[0], point[3]), []).append(index)
+        compressor_outlets: list[AbstractFluid | None] = [None] * len(points)
+        for key, indexes in groups.items():
+            outlets = evaporator_outlets[key].compression_to_pressures(
+                [bubble_points[points[i][1]].pressure for i in indexes],
+                [points[i][2] for i in indexes],
+            )
+            for index, outlet in zip(indexes, outlets):
+                compressor_outlets[index] = outlet
+        return compressor_outlets
+
+    @staticmethod
+    def __operating_points(
+        *values: float | Sequence[float] | np.ndarray,
+    ) -> list[tuple[float, float, float, float, float]]:
+        if any(np.ndim(i) > 1 for i in values):
+            raise ValueError("Operating points should be one-dimensional!")
+        arrays = [np.atleast_1d(np.asarray(i, dtype=float)).tolist() for i in values]
+        lengths = {len(j) for i, j in zip(values, arrays) if np.ndim(i) == 1}
+        if len(lengths) > 1:
+            raise ValueError(
+                "Need to define the same number of values for all operating points!"
+            )
+        count = lengths.pop() if lengths else 1
+        points = list(
+            zip(*(j if np.ndim(i) == 1 else j * count for i, j in zip(values, arrays)))
+        )
+        for evaporating, condensing, _, superheat, subcooling in points:
+            if not condensing > evaporating:
+                raise ValueError(
+                    "Condensing temperature should be higher "
+                    "than evaporating temperature!"
+                )
+            if superheat < 0:
+                raise ValueError("Invalid superheat!")
+            if subcooling < 0:
+                raise ValueError("Invalid subcooling!")
+        return points
@@ -0,0 +1,4 @@
+from .isoline import *
+from .isoline_generator import *
+
+__all__ = isoline.__all__ + isoline_generator.__all__
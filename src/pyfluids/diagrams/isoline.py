@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..io import Input
+
+__all__ = ["Isoline"]
+
+
+@dataclass(frozen=True)
+class Isoline:
+    """
+    Line of the constant property on the thermodynamic diagrams
+    (points in ascending order of the varying input).
+    """
+
+    constant: Input
+    """The constant property of the line."""
+
+    pressures: tuple[float, ...]
+    """Absolute pressures [Pa]."""
+
+    temperatures: tuple[float, ...]
+    """Temperatures
+    [by default, °C; you can change this using the configuration file]."""
+
+    densities: tuple[float, ...]
+    """Mass densities [kg/m3]."""
+
+    enthalpies: tuple[float, ...]
+    """Mass specific enthalpies [J/kg]."""
+
+    entropies: tuple[float, ...]
+    """Mass specific entropies [J/kg/K]."""
+
+    qualities: tuple[float | None, ...]
+    """Vapor qualities (None outside the two-phase region)
+    [by default, %; you can change this using the configuration file]."""
+
+    def __len__(self) -> int:
+        return len(self.pressures)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from math import sqrt
+from threading import Lock
+from typing import Callable, Hashable, Optional, Sequence
+
+from .isoline import Isoline
+from ..config import UnitsSystem
+from ..enums import Phases
+from ..fluids.abstract_fluid import AbstractFluid
+from ..io import Input
+
+__all__ = ["IsolineGenerator"]
+
+# Pressure, temperature, density, enthalpy, entropy, quality and phase state
+Point = tuple[float, float, float, float, float, Optional[float], Phases]
+
+
+class IsolineGenerator:
+    """Generator of isolines for the thermodynamic diagrams."""
+
+    __LIQUID: str = "Liquid"
+    __GAS: str = "Gas"
+
+    def __init__(self, refinements: int = 8, cache_size: int = 256):
+        """
+        Generator of isolines for the thermodynamic diagrams
+        (e.g., isotherms, isentropes, isochores and lines of constant quality
+        on the p-h diagram, isobars and isenthalps on the T-s diagram, etc.).
+
+        Each isoline is evaluated on the uniform grid of the varying input,
+        each flash calculation is warm-started from the previous point
+        (see `update`). Then the intervals, where the isoline crosses
+        the saturation line (or the boundary of the valid states,
+        e.g. the lines of constant quality end at the critical point),
+        are bisected, so the breaks of the isolines are sharp.
+        The generated isolines are cached by the fluid composition,
+        the constant property and the grid of the varying input.
+
+        :param refinements: Number of bisections of the intervals,
+            where the isoline crosses the saturation line (optional, by default, 8).
+        :param cache_size: Maximum number of cached isolines
+            (optional, by default, 256; 0 to turn off the cache).
+        :raises ValueError: If number of refinements or cache size is invalid.
+        """
+        if refinements < 0:
+            raise ValueError("Invalid number of refinements!")
+        if cache_size < 0:
+            raise ValueError("Invalid cache size!")
+        self.__refinements: int = refinements
+        self.__cache_size: int = cache_size
+        self.__cache: OrderedDict[Hashable, Isoline] = OrderedDict()
+        self.__lock: Lock = Lock()
+
+    @property
+    def refinements(self) -> int:
+        """Number of bisections of the intervals near the saturation line."""
+        return self.__refinements
+
+    @property
+    def cache_size(self) -> int:
+        """Maximum number of cached isolines."""
+        return self.__cache_size
+
+    @property
+    def cached_lines(self) -> int:
+        """Number of cached isolines."""
+        return len(self.__cache)
+
+    def clear_cache(self):
+        """Removes all cached isolines."""
+        with self.__lock:
+            self.__cache.clear()
+
+    def isolines(
+        self,
+        fluid: AbstractFluid,
+        constants: Sequence[Input],
+        varying_input: Callable[[float], Input],
+        start: float,
+        stop: float,
+        points: int = 100,
+        logarithmic: bool = False,
+    ) -> list[Isoline]:
+        """
+        Isolines of the fluid (mixture).
+
+        All the isolines, which are not cached yet,
+        are evaluated on a single new fluid instance.
+        The points, where the state cannot be evaluated, are skipped.
+
+        :param fluid: Fluid or mixture (its state is not used).
+        :param constants: Constant properties of the isolines
+            (e.g., ``Input.temperature(20)``, ``Input.quality(50)``).
+        :param varying_input: Factory of the varying input
+            (e.g., ``Input.pressure``).
+        :param start: The first value of the varying input.
+        :param stop: The last value of the varying input.
+        :param points: Number of points of the uniform grid
+            (optional, by default, 100).
+        :param logarithmic: True if the grid is uniform
+            in the logarithmic scale (optional, e.g., for pressure).
+        :return: Isolines (in the same order as the constant properties).
+        :raises ValueError: If the grid of the varying input is invalid.
+        """
+        if points < 2:
+            raise ValueError("Invalid number of points! It should be at least 2.")
+        if not start < stop or (logarithmic and start <= 0):
+            raise ValueError("Invalid range of the varying input!")
+        values = [
+            (
+                start * (stop / start) ** (i / (points - 1))
+                if logarithmic
+                else start + (stop - start) * i / (points - 1)
+            )
+            for i in range(points)
+        ]
+        composition = fluid._composition_key()
+        keys = [
+            (
+                (composition, i, varying_input, start, stop, points, logarithmic)
+                if composition is not None
+                else None
+            )
+            for i in constants
+        ]
+        isolines = [self.__cached(i) for i in keys]
+        if any(i is None for i in isolines):
+            instance = fluid.factory()
+            for index, key in enumerate(keys):
+                if isolines[index] is None:
+                    isolines[index] = self.__isoline(
+                        instance, constants[index], varying_input, values, logarithmic
+                    )
+                    self.__cache_isoline(key, isolines[index])
+        return isolines
+
+    def __isoline(
+        self,
+        fluid: AbstractFluid,
+        constant: Input,
+        varying_input: Callable[[float], Input],
+        values: list[float],
+        logarithmic: bool,
+    ) -> Isoline:
+        # Points by the values of the varying input (SI values are used for sorting)
+        points: dict[float, tuple[float, Point | None]] = {}
+        for value in values:
+            varying = varying_input(value)
+            points[value] = varying.value, self.__point(fluid, constant, varying, fluid)
+        for _ in range(self.__refinements):
+            ordered = sorted(points)
+            midpoints = [
+                sqrt(left * right) if logarithmic else (left + right) / 2
+                for left, right in zip(ordered, ordered[1:])
+                if self.__region(points[left][1]) != self.__region(points[right][1])
+            ]
+            if not midpoints:
+                break
+            for value in midpoints:
+                varying = varying_input(value)
+                points[value] = varying.value, self.__point(fluid, constant, varying)
+        rows = sorted(
+            ((key, 0, point) for key, point in points.values() if point is not None),
+            key=lambda row: row[:2],
+        )
+        rows += self.__saturated_rows(
+            fluid, constant, varying_input(values[0]).coolprop_key, rows
+        )
+        rows.sort(key=lambda row: row[:2])
+        columns = list(zip(*(row[2] for row in rows))) if rows else [()] * 7
+        return Isoline(constant, *columns[:6])
+
+    def __saturated_rows(
+        self,
+        fluid: AbstractFluid,
+        constant: Input,
+        varying_key: int,
+        rows: list[tuple[float, int, Point]],
+    ) -> list[tuple[float, int, Point]]:
+        # The isolines of constant temperature or pressure jump from
+        # the liquid to the vapor, so the saturated states are added
+        # (in the direction of the isoline)
+        saturated_rows = []
+        for left, right in zip(rows, rows[1:]):
+            regions = self.__region(left[2]), self.__region(right[2])
+            if set(regions) != {self.__LIQUID, self.__GAS}:
+                continue
+            qualities = (0, 1) if regions[0] == self.__LIQUID else (1, 0)
+            for order, quality in enumerate(qualities, 1):
+                point = self.__point(
+                    fluid, constant, Input.quality(quality * self.__full_quality(fluid))
+                )
+                if point is None:
+                    continue
+                key = fluid._keyed_output(varying_key)
+                if left[0] <= key <= right[0]:
+                    saturated_rows.append((key, order, point))
+        return saturated_rows
+
+    @staticmethod
+    def __full_quality(fluid: AbstractFluid) -> float:
+        return 100 if fluid.units_system == UnitsSystem.SIWithCelsiusAndPercents else 1
+
+    @staticmethod
+    def __point(
+        fluid: AbstractFluid,
+        constant: Input,
+        varying: Input,
+        guess_from: AbstractFluid | None = None,
+    ) -> Point | None:
+        try:
+            fluid.update(constant, varying, guess_from)
+            try:
+                phase = fluid.phase
+            except ValueError:  # e.g., for incompressible fluids
+                phase = Phases.Unknown
+            return (
+                fluid.pressure,
+                fluid.temperature,
+                fluid.density,
+                fluid.enthalpy,
+                fluid.entropy,
+                fluid.quality,
+                phase,
+            )
+        except ValueError:
+            return None
+
+    @classmethod
+    def __region(cls, point: Point | None) -> str | None:
+        if point is None:
+            return None
+        if point[-1] in (Phases.Liquid, Phases.SupercriticalLiquid):
+            return cls.__LIQUID
+        if point[-1] in (Phases.Gas, Phases.SupercriticalGas, Phases.Supercritical):
+            return cls.__GAS
+        return point[-1].name
+
+    def __cached(self, key: Hashable | None) -> Isoline | None:
+        if key is None:
+            return None
+        with self.__lock:
+            isoline = self.__cache.get(key)
+            if isoline is not None:
+                self.__cache.move_to_end(key)
+            return isoline
+
+    def __cache_isoline(self, key: Hashable | None, isoline: Isoline):
+        if key is None or self.__cache_size == 0:
+            return
+        with self.__lock:
+            self.__cache[key] = isoline
+            self.__cache.move_to_end(key)
+            while len(self.__cache) > self.__cache_size:
+                self.__cache.popitem(last=False)
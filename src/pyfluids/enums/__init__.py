@@ -1,5 +1,13 @@
+from .executors import *
 from .fluids_list import *
 from .mix import *
+from .parameters import *
 from .phases import *
 
-__all__ = fluids_list.__all__ + mix.__all__ + phases.__all__
+__all__ = (
+    executors.__all__
+    + fluids_list.__all__
+    + mix.__all__
+    + parameters.__all__
+    + phases.__all__
+)
@@ -0,0 +1,17 @@
+from enum import Enum
+
+__all__ = ["Executors"]
+
+
+class Executors(Enum):
+    """Types of workers for the batch evaluation."""
+
+    Thread = "Threads sharing all the CoolProp data"
+    Process = "Processes with their own CoolProp data"
+    Interpreter = "Sub-interpreters with their own CoolProp data (Python 3.14+)"
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def __str__(self) -> str:
+        return self.name
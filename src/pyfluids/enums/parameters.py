@@ -0,0 +1,22 @@
+import CoolProp
+
+from enum import Enum
+
+__all__ = ["Parameters"]
+
+
+class Parameters(Enum):
+    """State variables of fluids and mixtures used in partial derivatives."""
+
+    Density = CoolProp.iDmass
+    Enthalpy = CoolProp.iHmass
+    Entropy = CoolProp.iSmass
+    InternalEnergy = CoolProp.iUmass
+    Pressure = CoolProp.iP
+    Temperature = CoolProp.iT
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def __str__(self) -> str:
+        return self.name
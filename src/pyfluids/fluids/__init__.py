@@ -1,4 +1,17 @@
+from .critical_point import *
 from .fluid import *
 from .mixture import *
+from .phase_envelope import *
+from .saturation_line import *
+from .saturation_table import *
+from .state_solution import *
 
-__all__ = fluid.__all__ + mixture.__all__
+__all__ = (
+    critical_point.__all__
+    + fluid.__all__
+    + mixture.__all__
+    + phase_envelope.__all__
+    + saturation_line.__all__
+    + saturation_table.__all__
+    + state_solution.__all__
+)
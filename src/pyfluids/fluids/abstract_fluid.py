@@ -2,19 +2,63 @@ from __future__ import annotations
 
 import json
 from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Callable, Hashable, Iterable, Iterator, Sequence
 
 import CoolProp
 from CoolProp import AbstractState
 from CoolProp.CoolProp import generate_update_pair
 
+from ..backends.critical_points_cache import CriticalPointsCache
+from ..backends.isobar_spline_cache import IsobarSplineCache
+from ..backends.phase_envelope_cache import PhaseEnvelopeCache
+from ..backends.superancillary_cache import SuperancillaryCache
 from ..config import UnitConverter, UnitsSystem
-from ..enums import Phases
+from ..config.fork_safety import reinit_after_fork
+from ..enums import Parameters, Phases
+from .critical_point import CriticalPoint
+from .inverse_solver import InverseSolver
+from .phase_envelope import PhaseEnvelope
+from .saturation_line import SaturationLine
+from .saturation_table import SaturationTable
+from .state_solution import StateSolution
 from ..io import Input, OutputsValidator
+from ..io.abstract_input import AbstractInput
 
 
 class AbstractFluid(ABC):
     """Base class of fluids."""
 
+    # Single phase states, which can be hinted as gas or liquid
+    __GAS_PHASES: frozenset[int] = frozenset(
+        (
+            CoolProp.iphase_gas,
+            CoolProp.iphase_supercritical_gas,
+            CoolProp.iphase_supercritical,
+        )
+    )
+    __LIQUID_PHASES: frozenset[int] = frozenset(
+        (CoolProp.iphase_liquid, CoolProp.iphase_supercritical_liquid)
+    )
+    # Maximum number of iterations of the flash calculations of mixtures
+    # with pressure and enthalpy (or entropy) as inputs
+    __MIXTURE_ITERATIONS: int = 50
+    # Outputs, which do not depend on the state
+    __TRIVIAL_OUTPUTS: frozenset[int] = frozenset(
+        (
+            CoolProp.iT_critical,
+            CoolProp.iP_critical,
+            CoolProp.iT_freeze,
+            CoolProp.iP_max,
+            CoolProp.iT_max,
+            CoolProp.iP_min,
+            CoolProp.iT_min,
+            CoolProp.imolar_mass,
+            CoolProp.iP_triple,
+            CoolProp.iT_triple,
+        )
+    )
+
     @abstractmethod
     def __init__(self):
         """Base class of fluids."""
@@ -45,7 +89,15 @@ class AbstractFluid(ABC):
         self.__temperature: float | None = None
         self.__triple_pressure: float | None = None
         self.__triple_temperature: float | None = None
-        self.__specified_phase: Phases | None = None
+        self.__derivatives: dict[tuple[Parameters, Parameters, Parameters], float] = {}
+        self.__interpolated_outputs: dict[int, float] | None = None
+        self.__interpolated_flashed: bool = False
+        self._specified_phase: Phases | None = None
+        self.__phase_hints: bool = False
+        self.__two_phase_interpolation: bool = False
+        self.__prepared_isobars: dict[float, float] = {}
+        self.__lock: Lock = Lock()
+        reinit_after_fork(self.__reinit_lock)
         self._unit_converter: UnitConverter = UnitConverter()
         self._fraction_unit: str = (
             " %" if self.units_system == UnitsSystem.SIWithCelsiusAndPercents else ""
@@ -74,7 +126,7 @@ class AbstractFluid(ABC):
     def critical_pressure(self) -> float | None:
         """Absolute pressure at the critical point [Pa]."""
         if self.__critical_pressure is None:
-            self.__critical_pressure = self._nullable_keyed_output(CoolProp.iP_critical)
+            self.__critical_pressure = self.__critical_output(CoolProp.iP_critical)
         return self.__critical_pressure
 
     @property
@@ -84,7 +136,7 @@ class AbstractFluid(ABC):
         [by default, °C; you can change this using the configuration file].
         """
         if self.__critical_temperature is None:
-            value = self._nullable_keyed_output(CoolProp.iT_critical)
+            value = self.__critical_output(CoolProp.iT_critical)
             self.__critical_temperature = (
                 self._unit_converter.convert_temperature_from_si(value)
                 if value is not None
@@ -312,41 +364,562 @@ class AbstractFluid(ABC):
         """Performs deep (full) copy of the fluid instance."""
         return self.with_state(*self._inputs)
 
-    def with_state(self, first_input: Input, second_input: Input) -> AbstractFluid:
+    def with_state(
+        self,
+        first_input: Input,
+        second_input: Input,
+        guess_from: AbstractFluid | None = None,
+    ) -> AbstractFluid:
         """
         Returns a new fluid instance with a defined state.
 
         :param first_input: First input property.
         :param second_input: Second input property.
+        :param guess_from: Fluid instance with a defined state,
+            which is used as the initial guess (optional, see `update`).
         :return: A new fluid instance with a defined state.
         :raises ValueError: If input is invalid.
         """
+        fluid = self._derive()
+        fluid.update(first_input, second_input, guess_from)
+        return fluid
+
+    def _derive(self) -> AbstractFluid:
+        """
+        Returns a new fluid instance with no defined state and the same settings
+        (specified phase, phase hints, two-phase interpolation and prepared isobars).
+        """
         fluid = self.factory()
-        if self.__specified_phase is not None:
-            fluid.specify_phase(self.__specified_phase)
-        fluid.update(first_input, second_input)
+        if self._specified_phase is not None:
+            fluid.specify_phase(self._specified_phase)
+        fluid.__phase_hints = self.__phase_hints
+        fluid.__two_phase_interpolation = self.__two_phase_interpolation
+        fluid.__prepared_isobars = dict(self.__prepared_isobars)
         return fluid
 
-    def update(self, first_input: Input, second_input: Input):
+    def sweep(
+        self,
+        fixed_input: Input,
+        varying_input: Callable[[float], Input],
+        values: Iterable[float],
+    ) -> Iterator[AbstractFluid]:
+        """
+        Iterates over the states along the isoline
+        (e.g., along the isobar for the discretized heat exchanger models).
+        Each state is used as the initial guess for the next one
+        (the first one starts from the current state of the fluid, if defined).
+
+        The same new fluid instance is updated on each step,
+        so read the required properties before the next step
+        (or use `clone` to keep the state).
+
+        :param fixed_input: Input property which is fixed along the isoline.
+        :param varying_input: Factory of the varying input property
+            (e.g., `Input.enthalpy`).
+        :param values: Values of the varying input property.
+        :return: Iterator over the states along the isoline.
+        :raises ValueError: If any input is invalid.
+        """
+        fluid = self._derive()
+        guess = self if len(self._inputs) == 2 else None
+        for value in values:
+            fluid.update(fixed_input, varying_input(value), guess)
+            guess = fluid
+            yield fluid
+
+    def solve_state(
+        self,
+        first_target: AbstractInput,
+        second_target: AbstractInput,
+        guess: Sequence[Input] | None = None,
+        tolerance: float = 1e-9,
+        max_iterations: int = 50,
+    ) -> StateSolution:
+        """
+        Finds the state with given values of any two outputs,
+        including those which CoolProp cannot take as inputs
+        (e.g., temperature and dynamic viscosity).
+
+        If CoolProp cannot solve it directly, the Newton iterations
+        with analytical derivatives (or finite differences for the transport
+        properties) are performed on the backend of the new fluid instance.
+
+        :param first_target: First target output (see `Target` and `Input`).
+        :param second_target: Second target output (see `Target` and `Input`).
+        :param guess: Inputs which define the initial guess state (optional).
+            By default, the current state of the fluid.
+        :param tolerance: Relative tolerance of the targets (optional).
+        :param max_iterations: Maximum number of Newton iterations (optional).
+        :return: The fluid instance at the found state
+            and number of iterations and flash calculations.
+        :raises ValueError: If targets or initial guess are invalid
+            or the solver does not converge.
+        """
+        if first_target.coolprop_key == second_target.coolprop_key:
+            raise ValueError("Need to define 2 unique targets!")
+        fluid = self._derive()
+        # The direct flash calculation (even the failed one) is counted
+        flashes = 1
+        try:
+            fluid.update(
+                Input(first_target.coolprop_key, first_target.value),
+                Input(second_target.coolprop_key, second_target.value),
+            )
+            return StateSolution(fluid, 0, flashes)
+        except ValueError:
+            pass
+        guess = guess if guess is not None else self._inputs
+        if len(guess) != 2:
+            raise ValueError("Need to define the initial guess!")
+        fluid.update(*guess)
+        with fluid.__lock:
+            fluid.__flash_interpolated()
+        flashes += 1
+        solver = InverseSolver(fluid._backend, tolerance, max_iterations)
+        inputs, iterations = solver.solve([first_target, second_target])
+        flashes += solver.flashes
+        # The backend is already at the converged state
+        fluid.reset()
+        fluid._inputs = inputs
+        return StateSolution(fluid, iterations, flashes)
+
+    def update(
+        self,
+        first_input: Input,
+        second_input: Input,
+        guess_from: AbstractFluid | None = None,
+    ):
         """
         Updates the state of the fluid.
 
+        If the initial guess is specified, the flash calculation starts
+        from its state (Newton iterations on the backend)
+        instead of from scratch, which is much faster for the close states
+        (e.g., PH, PS and HS flashes along the isolines).
+        If it does not converge, the usual flash calculation is performed.
+
+        For pure fluids with the two-phase interpolation enabled
+        (see `enable_two_phase_interpolation`), the two-phase states
+        at given pressure and quality, enthalpy or entropy are not flashed
+        at all: the outputs, which are linear in quality (temperature, enthalpy,
+        entropy, internal energy and specific volume), are interpolated
+        between the saturated liquid and vapor states
+        (see `SuperancillaryCache.saturated_states`).
+        The single-phase states at the pressures of the isobars prepared
+        by this instance (or the one it was created from) and given enthalpy
+        or entropy are interpolated along these isobars (see `prepare_isobars`). The backend is updated only
+        when any other output is required.
+
+        CoolProp cannot flash the mixtures with pressure and enthalpy
+        (or entropy) as inputs, so if its flash calculation fails,
+        the bubble and dew points at given pressure are evaluated,
+        and then the quality (inside the dome) or the temperature
+        (outside of it) is found iteratively.
+
+        The fluid instance should not be shared between threads:
+        its lock only keeps the CoolProp backend consistent, so the update
+        of another thread may run between this update and the reading
+        of the properties. Use a separate instance in each thread
+        (e.g., `with_state` returns a new one).
+
         :param first_input: First input property.
         :param second_input: Second input property.
+        :param guess_from: Fluid instance with a defined state,
+            which is used as the initial guess (optional).
+            It can be the current instance itself.
         :raises ValueError: If input is invalid.
         """
         if first_input.coolprop_key == second_input.coolprop_key:
             raise ValueError("Need to define 2 unique inputs!")
+        guess = (
+            guess_from._guess(first_input, second_input)
+            if guess_from is not None
+            else None
+        )
         self.reset()
-        self._backend.update(
-            *generate_update_pair(
-                first_input.coolprop_key,
-                first_input.value,
-                second_input.coolprop_key,
-                second_input.value,
+        with self.__lock:
+            if (
+                not self.__update_in_dome(first_input, second_input)
+                and not self.__update_from_isobar_spline(first_input, second_input)
+                and not (
+                    guess is not None
+                    and self.__update_from_guess(first_input, second_input, guess)
+                )
+                and not (
+                    self.__update_at_saturation(first_input, second_input)
+                    or self.__update_from_phase_envelope(first_input, second_input)
+                )
+            ):
+                try:
+                    self._backend.update(
+                        *generate_update_pair(
+                            first_input.coolprop_key,
+                            first_input.value,
+                            second_input.coolprop_key,
+                            second_input.value,
+                        )
+                    )
+                except ValueError:
+                    if not self.__update_mixture_at_pressure(first_input, second_input):
+                        raise
+        self._inputs = [first_input, second_input]
+
+    def _guess(self, first_input: Input, second_input: Input) -> list[float] | None:
+        """
+        Initial guess for the flash calculation with given inputs.
+
+        :param first_input: First input property.
+        :param second_input: Second input property.
+        :return: SI density, pressure and temperature of the current state
+            or None if the state is not defined or the guess is useless
+            (the quality or density and temperature are among the inputs,
+            or the current state is two-phase, since the flash calculations
+            in the two-phase region are fast enough).
+        """
+        keys = {first_input.coolprop_key, second_input.coolprop_key}
+        if (
+            len(self._inputs) != 2
+            or CoolProp.iQ in keys
+            or keys == {CoolProp.iDmass, CoolProp.iT}
+        ):
+            return None
+        if self.__interpolated_outputs is not None:
+            outputs = self.__interpolated_outputs
+            return (
+                [outputs[CoolProp.iDmass], outputs[CoolProp.iP], outputs[CoolProp.iT]]
+                if outputs[CoolProp.iQ] == -1
+                else None
             )
+        with self.__lock:
+            try:
+                if self._backend.phase() == CoolProp.iphase_twophase:
+                    return None
+            except ValueError:
+                pass
+            return [self._backend.rhomass(), self._backend.p(), self._backend.T()]
+
+    def _superancillary_key(self) -> tuple[str, str] | None:
+        """
+        Type of CoolProp backend and CoolProp fluid name
+        for the superancillary functions.
+
+        :return: None if the fluid is not pure.
+        """
+        return None
+
+    def _composition_key(self) -> Hashable | None:
+        """
+        Key of the fluid composition (the identity of the fluid
+        regardless of its state) for the caches of the fluid-specific data.
+
+        :return: None if the fluid cannot be identified
+            (the data of such fluids is not cached).
+        """
+        return None
+
+    def __update_in_dome(self, first_input: Input, second_input: Input) -> bool:
+        # The outputs of the two-phase states of pure fluids, which are linear
+        # in quality, are interpolated between the cached saturated states
+        values = {i.coolprop_key: i.value for i in (first_input, second_input)}
+        key = self._superancillary_key()
+        if (
+            not self.__two_phase_interpolation
+            or CoolProp.iP not in values
+            or len(values.keys() & {CoolProp.iQ, CoolProp.iHmass, CoolProp.iSmass}) != 1
+            or key is None
+            or self._specified_phase is not None
+            or not SuperancillaryCache().is_available(*key)
+        ):
+            return False
+        try:
+            liquid, vapor = SuperancillaryCache().saturated_states(
+                *key, values[CoolProp.iP]
+            )
+        except ValueError:
+            return False
+        output = next(i for i in values if i != CoolProp.iP)
+        quality = (
+            values[output]
+            if output == CoolProp.iQ
+            else (values[output] - liquid[output]) / (vapor[output] - liquid[output])
         )
-        self._inputs = [first_input, second_input]
+        if not 0 <= quality <= 1:
+            return False
+        outputs = {
+            i: liquid[i] + quality * (vapor[i] - liquid[i])
+            for i in (CoolProp.iT, CoolProp.iHmass, CoolProp.iSmass, CoolProp.iUmass)
+        }
+        outputs[CoolProp.iDmass] = 1 / (
+            (1 - quality) / liquid[CoolProp.iDmass] + quality / vapor[CoolProp.iDmass]
+        )
+        outputs[CoolProp.iP] = values[CoolProp.iP]
+        outputs[CoolProp.iQ] = quality
+        outputs[CoolProp.iPhase] = CoolProp.iphase_twophase
+        self.__interpolated_outputs = outputs
+        return True
+
+    def __update_from_isobar_spline(
+        self, first_input: Input, second_input: Input
+    ) -> bool:
+        # The single-phase states at the prepared isobars are interpolated
+        values = {i.coolprop_key: i.value for i in (first_input, second_input)}
+        # (only for the instances which prepared them, see `prepare_isobars`)
+        key = self._composition_key()
+        if (
+            values.get(CoolProp.iP) not in self.__prepared_isobars
+            or len(values.keys() & {CoolProp.iHmass, CoolProp.iSmass}) != 1
+            or key is None
+            or self._specified_phase is not None
+        ):
+            return False
+        output = CoolProp.iHmass if CoolProp.iHmass in values else CoolProp.iSmass
+        outputs = IsobarSplineCache().outputs(
+            key,
+            values[CoolProp.iP],
+            output,
+            values[output],
+            self.__prepared_isobars[values[CoolProp.iP]],
+        )
+        if outputs is None:
+            return False
+        self.__interpolated_outputs = outputs
+        return True
+
+    def __flash_interpolated(self):
+        # Updates the backend to the interpolated state
+        # (should be called with the acquired lock)
+        if self.__interpolated_outputs is None or self.__interpolated_flashed:
+            return
+        outputs = self.__interpolated_outputs
+        if outputs[CoolProp.iQ] != -1:
+            self._backend.update(
+                CoolProp.QT_INPUTS, outputs[CoolProp.iQ], outputs[CoolProp.iT]
+            )
+        elif not self.__update_from_guess(
+            *self._inputs,
+            [outputs[CoolProp.iDmass], outputs[CoolProp.iP], outputs[CoolProp.iT]],
+        ):
+            self._backend.update(
+                *generate_update_pair(
+                    self._inputs[0].coolprop_key,
+                    self._inputs[0].value,
+                    self._inputs[1].coolprop_key,
+                    self._inputs[1].value,
+                )
+            )
+        self.__interpolated_flashed = True
+
+    def __update_at_saturation(
+        self,
+        first_input: Input,
+        second_input: Input,
+        temperature: float | None = None,
+    ) -> bool:
+        # Pressure and quality inputs are replaced by the saturation temperature
+        # and quality, which are evaluated by the superancillary functions
+        values = {i.coolprop_key: i.value for i in (first_input, second_input)}
+        key = self._superancillary_key()
+        if (
+            values.keys() != {CoolProp.iP, CoolProp.iQ}
+            or key is None
+            or self._specified_phase is not None
+            or not SuperancillaryCache().is_available(*key)
+        ):
+            return False
+        try:
+            if temperature is None:
+                temperature = SuperancillaryCache().saturation_temperature(
+                    *key, values[CoolProp.iP]
+                )
+            self._backend.update(CoolProp.QT_INPUTS, values[CoolProp.iQ], temperature)
+            return True
+        except ValueError:
+            return False
+
+    def __critical_output(self, coolprop_key: int) -> float | None:
+        # CoolProp fails if the mixture has several critical points
+        # (it spends as much time as finding all of them),
+        # so the only stable one is used (cached for each composition)
+        if not self.__is_mixture():
+            return self._nullable_keyed_output(coolprop_key)
+        try:
+            stable = [i for i in self.__critical_points() if i[3]]
+        except ValueError:
+            return None
+        if len(stable) != 1:
+            return None
+        return stable[0][1] if coolprop_key == CoolProp.iP_critical else stable[0][0]
+
+    def __critical_points(self) -> list[tuple[float, float, float, bool]]:
+        # SI temperatures, pressures, mass densities and stability flags
+        if self.__is_mixture():
+            return list(
+                CriticalPointsCache().critical_points(
+                    self._composition_key(), lambda: self.factory()._backend
+                )
+            )
+        with self.__lock:
+            return [
+                (
+                    self._backend.T_critical(),
+                    self._backend.p_critical(),
+                    self._backend.rhomass_critical(),
+                    True,
+                )
+            ]
+
+    def __is_mixture(self) -> bool:
+        with self.__lock:
+            try:
+                return len(self._backend.get_mole_fractions()) > 1
+            except ValueError:  # e.g., for incompressible fluids
+                return False
+
+    def __update_from_phase_envelope(
+        self, first_input: Input, second_input: Input
+    ) -> bool:
+        # Bubble and dew points of mixtures at given pressure
+        # start from the guesses interpolated from the cached phase envelope
+        values = {i.coolprop_key: i.value for i in (first_input, second_input)}
+        key = self._composition_key()
+        if (
+            values.keys() != {CoolProp.iP, CoolProp.iQ}
+            or key is None
+            or self._specified_phase is not None
+            or not PhaseEnvelopeCache().is_cached(key)
+        ):
+            return False
+        guesses = PhaseEnvelopeCache().guesses(
+            key, values[CoolProp.iP], values[CoolProp.iQ]
+        )
+        if guesses is None:
+            return False
+        try:
+            self._backend.update_with_guesses(
+                CoolProp.PQ_INPUTS, values[CoolProp.iP], values[CoolProp.iQ], guesses
+            )
+            return True
+        except ValueError:
+            return False
+
+    def __update_mixture_at_pressure(
+        self, first_input: Input, second_input: Input
+    ) -> bool:
+        values = {i.coolprop_key: i.value for i in (first_input, second_input)}
+        outputs = values.keys() & {CoolProp.iHmass, CoolProp.iSmass}
+        if (
+            CoolProp.iP not in values
+            or len(outputs) != 1
+            or len(values) != 2
+            or self._specified_phase is not None
+        ):
+            return False
+        try:
+            if len(self._backend.get_mole_fractions()) < 2:
+                return False
+        except ValueError:  # e.g., for incompressible fluids
+            return False
+        output = outputs.pop()
+        pressure, target = values[CoolProp.iP], values[output]
+        key = self._composition_key()
+        try:
+            saturated = []
+            for quality in (0, 1):
+                guesses = (
+                    PhaseEnvelopeCache().guesses(key, pressure, quality)
+                    if key is not None
+                    else None
+                )
+                if guesses is not None:
+                    self._backend.update_with_guesses(
+                        CoolProp.PQ_INPUTS, pressure, quality, guesses
+                    )
+                else:
+                    self._backend.update(CoolProp.PQ_INPUTS, pressure, quality)
+                saturated.append(
+                    (self._backend.keyed_output(output), self._backend.T())
+                )
+            (liquid, bubble), (vapor, dew) = saturated
+            tolerance = 1e-10 * abs(vapor - liquid)
+            if liquid <= target <= vapor:
+                # Regula falsi on quality, which is almost linear in enthalpy
+                low, high, low_value, high_value = 0.0, 1.0, liquid, vapor
+                for _ in range(self.__MIXTURE_ITERATIONS):
+                    quality = low + (target - low_value) * (high - low) / (
+                        high_value - low_value
+                    )
+                    self._backend.update(CoolProp.PQ_INPUTS, pressure, quality)
+                    value = self._backend.keyed_output(output)
+                    if abs(value - target) <= tolerance:
+                        return True
+                    if value < target:
+                        low, low_value = quality, value
+                    else:
+                        high, high_value = quality, value
+                return False
+            # Newton iterations on temperature with the imposed phase,
+            # starting from the saturation line
+            is_liquid = target < liquid
+            self._backend.specify_phase(
+                CoolProp.iphase_liquid if is_liquid else CoolProp.iphase_gas
+            )
+            try:
+                temperature = bubble - 1e-6 if is_liquid else dew + 1e-6
+                for _ in range(self.__MIXTURE_ITERATIONS):
+                    self._backend.update(CoolProp.PT_INPUTS, pressure, temperature)
+                    value = self._backend.keyed_output(output)
+                    if abs(value - target) <= tolerance:
+                        return True
+                    temperature += (target - value) / self._backend.first_partial_deriv(
+                        output, CoolProp.iT, CoolProp.iP
+                    )
+                    temperature = (
+                        min(temperature, bubble) if is_liquid else max(temperature, dew)
+                    )
+                return False
+            finally:
+                self._backend.unspecify_phase()
+        except ValueError:
+            return False
+
+    def __update_from_guess(
+        self, first_input: Input, second_input: Input, guess: list[float]
+    ) -> bool:
+        if self.__is_inside_dome(first_input, second_input):
+            return False
+        density, pressure, temperature = guess
+        try:
+            try:
+                self._backend.update(CoolProp.DmassT_INPUTS, density, temperature)
+            except ValueError:
+                self._backend.update(CoolProp.PT_INPUTS, pressure, temperature)
+            InverseSolver(self._backend, 1e-10, 20).solve([first_input, second_input])
+            return True
+        except ValueError:
+            return False
+
+    def __is_inside_dome(self, first_input: Input, second_input: Input) -> bool:
+        # Newton iterations into the two-phase region are much slower
+        # than the usual flash calculation, so the enthalpy or entropy
+        # is compared with its values at the saturation lines
+        # (evaluated by the superancillary functions)
+        values = {i.coolprop_key: i.value for i in (first_input, second_input)}
+        key = self._superancillary_key()
+        if (
+            CoolProp.iP not in values
+            or len(values.keys() & {CoolProp.iHmass, CoolProp.iSmass}) != 1
+            or key is None
+            or not SuperancillaryCache().is_available(*key)
+        ):
+            return False
+        output = CoolProp.iHmass if CoolProp.iHmass in values else CoolProp.iSmass
+        try:
+            liquid, vapor = SuperancillaryCache().saturated_states(
+                *key, values[CoolProp.iP]
+            )
+        except ValueError:
+            return False
+        return liquid[output] <= values[output] <= vapor[output]
 
     # noinspection DuplicatedCode
     def reset(self):
@@ -367,6 +940,28 @@ class AbstractFluid(ABC):
         self.__specific_heat = None
         self.__surface_tension = None
         self.__temperature = None
+        self.__derivatives.clear()
+        self.__interpolated_outputs = None
+        self.__interpolated_flashed = False
+
+    # noinspection DuplicatedCode
+    def _reset_composition(self):
+        """
+        Resets all properties, including the trivial ones,
+        which depend only on the composition of the fluid
+        (e.g., after the fractions of the mixture are changed).
+        """
+        self.reset()
+        self.__critical_pressure = None
+        self.__critical_temperature = None
+        self.__freezing_temperature = None
+        self.__max_pressure = None
+        self.__max_temperature = None
+        self.__min_pressure = None
+        self.__min_temperature = None
+        self.__molar_mass = None
+        self.__triple_pressure = None
+        self.__triple_temperature = None
 
     def specify_phase(self, phase: Phases) -> AbstractFluid:
         """
@@ -375,8 +970,9 @@ class AbstractFluid(ABC):
         :param phase: Phase state.
         :return: Current fluid instance.
         """
-        self._backend.specify_phase(phase.value)
-        self.__specified_phase = phase
+        with self.__lock:
+            self._backend.specify_phase(phase.value)
+        self._specified_phase = phase
         return self
 
     def unspecify_phase(self) -> AbstractFluid:
@@ -385,10 +981,118 @@ class AbstractFluid(ABC):
 
         :return: Current fluid instance.
         """
-        self._backend.unspecify_phase()
-        self.__specified_phase = None
+        with self.__lock:
+            self._backend.unspecify_phase()
+        self._specified_phase = None
         return self
 
+    def enable_phase_hints(self) -> AbstractFluid:
+        """
+        Enable the phase hints for all further processes
+        (e.g., the compression of a gas results in a gas,
+        the cooling of a liquid results in a liquid).
+
+        The expected phase state is imposed on the Newton iterations,
+        which start from the state at the beginning of the process,
+        and the found state is verified by a single unimposed flash calculation.
+        If the hint is wrong, the usual flash calculation is performed.
+        The hints are ignored if the phase state is specified
+        (see `specify_phase`).
+
+        :return: Current fluid instance.
+        """
+        self.__phase_hints = True
+        return self
+
+    def disable_phase_hints(self) -> AbstractFluid:
+        """
+        Disable the phase hints for all further processes.
+
+        :return: Current fluid instance.
+        """
+        self.__phase_hints = False
+        return self
+
+    def enable_two_phase_interpolation(self) -> AbstractFluid:
+        """
+        Enable the interpolation of the two-phase states of pure fluids
+        at given pressure and quality, enthalpy or entropy
+        for all further updates (see `update`).
+
+        The outputs, which are linear in quality (temperature, enthalpy,
+        entropy, internal energy and specific volume), are interpolated
+        between the cached saturated liquid and vapor states
+        (see `SuperancillaryCache.saturated_states`) instead of the flash
+        calculation, so they may differ from the flashed ones
+        in the last digits. The other properties are evaluated
+        by the usual flash calculation on demand.
+        It is used only if the superancillary functions are available
+        (see `SuperancillaryCache`) and the phase state is not specified.
+
+        :return: Current fluid instance.
+        """
+        self.__two_phase_interpolation = True
+        return self
+
+    def disable_two_phase_interpolation(self) -> AbstractFluid:
+        """
+        Disable the interpolation of the two-phase states
+        for all further updates (by default, it is disabled).
+
+        :return: Current fluid instance.
+        """
+        self.__two_phase_interpolation = False
+        return self
+
+    def partial_derivative(
+        self, of: Parameters, wrt: Parameters, constant: Parameters
+    ) -> float:
+        """
+        Partial derivative of one state variable with respect to another one
+        at constant third one, evaluated analytically at the current state.
+        The result is cached until the next update of the state.
+
+        Example: (∂ρ/∂P)_T is ``partial_derivative(Parameters.Density,
+        Parameters.Pressure, Parameters.Temperature)``.
+
+        :param of: State variable to be differentiated.
+        :param wrt: State variable with respect to which
+            the derivative is evaluated.
+        :param constant: State variable held constant.
+        :return: Value of the partial derivative in SI units
+            (the same for all units systems, since the temperature differences
+            in °C and K are equal).
+        :raises ValueError: If the state is not defined, state variables are
+            not unique or the derivative cannot be evaluated (in the two-phase
+            region, only the derivatives supported by CoolProp are available,
+            e.g. (∂ρ/∂h)_P or (∂ρ/∂P)_h).
+        """
+        key = (of, wrt, constant)
+        value = self.__derivatives.get(key)
+        if value is not None:
+            return value
+        if len({of, wrt, constant}) < 3:
+            raise ValueError("Need to define 3 unique state variables!")
+        if not self._inputs:
+            raise ValueError("Need to define the state!")
+        with self.__lock:
+            self.__flash_interpolated()
+            try:
+                two_phase = self._backend.phase() == CoolProp.iphase_twophase
+            except ValueError:  # e.g., for incompressible fluids
+                two_phase = False
+            value = (
+                # Single-phase derivatives are not valid in the two-phase region
+                self._backend.first_two_phase_deriv(of.value, wrt.value, constant.value)
+                if two_phase
+                else self._backend.first_partial_deriv(
+                    of.value, wrt.value, constant.value
+                )
+            )
+        OutputsValidator(value).validate()
+        self.__derivatives[key] = value
+        return value
+
     def isentropic_compression_to_pressure(self, pressure: float) -> AbstractFluid:
         """
         The process of isentropic compression to given pressure.
@@ -397,11 +1101,12 @@ class AbstractFluid(ABC):
         :return: The state of the fluid at the end of the process.
         :raises ValueError: If pressure is invalid.
         """
-        if not pressure > self.pressure:
-            raise ValueError(
-                "Compressor outlet pressure should be higher than inlet pressure!"
-            )
-        return self.with_state(Input.pressure(pressure), Input.entropy(self.entropy))
+        self.__check_outlet_pressure(pressure, compression=True)
+        return self.__end_state(
+            Input.pressure(pressure),
+            Input.entropy(self.entropy),
+            CoolProp.iphase_gas,
+        )
 
     def compression_to_pressure(
         self, pressure: float, isentropic_efficiency: float
@@ -415,21 +1120,32 @@ class AbstractFluid(ABC):
         :return: The state of the fluid at the end of the process.
         :raises ValueError: If pressure or isentropic efficiency is invalid.
         """
-        isentropic_efficiency = self._unit_converter.convert_decimal_fraction_to_si(
-            isentropic_efficiency
+        isentropic_efficiency = self.__isentropic_efficiency_to_si(
+            isentropic_efficiency, compression=True
         )
-        if not 0 < isentropic_efficiency < 1:
-            raise ValueError("Invalid compressor isentropic efficiency!")
-        return self.with_state(
-            Input.pressure(pressure),
-            Input.enthalpy(
-                self.enthalpy
-                + (
-                    self.isentropic_compression_to_pressure(pressure).enthalpy
-                    - self.enthalpy
-                )
-                / isentropic_efficiency
-            ),
+        self.__check_outlet_pressure(pressure, compression=True)
+        return self.__real_end_state(pressure, isentropic_efficiency, compression=True)
+
+    def compression_to_pressures(
+        self, pressures: Sequence[float], isentropic_efficiencies: Sequence[float]
+    ) -> list[AbstractFluid]:
+        """
+        The processes of compression to given pressures
+        (e.g., for the compressor maps).
+
+        The isentropic end states are evaluated only once for each unique pressure,
+        on a single backend. Both isentropic and real end states are sorted
+        by pressure, and each one starts from the previous one (see `sweep`).
+
+        :param pressures: Absolute pressures [Pa].
+        :param isentropic_efficiencies: Compressor isentropic efficiencies
+            for each pressure
+            [by default, %; you can change this using the configuration file].
+        :return: The states of the fluid at the end of the processes.
+        :raises ValueError: If pressures or isentropic efficiencies are invalid.
+        """
+        return self.__real_end_states(
+            pressures, isentropic_efficiencies, compression=True
         )
 
     def isenthalpic_expansion_to_pressure(self, pressure: float) -> AbstractFluid:
@@ -444,7 +1160,11 @@ class AbstractFluid(ABC):
             raise ValueError(
                 "Expansion valve outlet pressure should be lower than inlet pressure!"
             )
-        return self.with_state(Input.pressure(pressure), Input.enthalpy(self.enthalpy))
+        return self.__end_state(
+            Input.pressure(pressure),
+            Input.enthalpy(self.enthalpy),
+            CoolProp.iphase_gas,
+        )
 
     def isentropic_expansion_to_pressure(self, pressure: float) -> AbstractFluid:
         """
@@ -454,11 +1174,12 @@ class AbstractFluid(ABC):
         :return: The state of the fluid at the end of the process.
         :raises ValueError: If pressure is invalid.
         """
-        if not pressure < self.pressure:
-            raise ValueError(
-                "Expander outlet pressure should be lower than inlet pressure!"
-            )
-        return self.with_state(Input.pressure(pressure), Input.entropy(self.entropy))
+        self.__check_outlet_pressure(pressure, compression=False)
+        return self.__end_state(
+            Input.pressure(pressure),
+            Input.entropy(self.entropy),
+            CoolProp.iphase_gas,
+        )
 
     def expansion_to_pressure(
         self, pressure: float, isentropic_efficiency: float
@@ -472,21 +1193,32 @@ class AbstractFluid(ABC):
         :return: The state of the fluid at the end of the process.
         :raises ValueError: If pressure or isentropic efficiency is invalid.
         """
-        isentropic_efficiency = self._unit_converter.convert_decimal_fraction_to_si(
-            isentropic_efficiency
+        isentropic_efficiency = self.__isentropic_efficiency_to_si(
+            isentropic_efficiency, compression=False
         )
-        if not 0 < isentropic_efficiency < 1:
-            raise ValueError("Invalid expander isentropic efficiency!")
-        return self.with_state(
-            Input.pressure(pressure),
-            Input.enthalpy(
-                self.enthalpy
-                - (
-                    self.enthalpy
-                    - self.isentropic_expansion_to_pressure(pressure).enthalpy
-                )
-                * isentropic_efficiency
-            ),
+        self.__check_outlet_pressure(pressure, compression=False)
+        return self.__real_end_state(pressure, isentropic_efficiency, compression=False)
+
+    def expansion_to_pressures(
+        self, pressures: Sequence[float], isentropic_efficiencies: Sequence[float]
+    ) -> list[AbstractFluid]:
+        """
+        The processes of expansion to given pressures
+        (e.g., for the expander maps).
+
+        The isentropic end states are evaluated only once for each unique pressure,
+        on a single backend. Both isentropic and real end states are sorted
+        by pressure, and each one starts from the previous one (see `sweep`).
+
+        :param pressures: Absolute pressures [Pa].
+        :param isentropic_efficiencies: Expander isentropic efficiencies
+            for each pressure
+            [by default, %; you can change this using the configuration file].
+        :return: The states of the fluid at the end of the processes.
+        :raises ValueError: If pressures or isentropic efficiencies are invalid.
+        """
+        return self.__real_end_states(
+            pressures, isentropic_efficiencies, compression=False
         )
 
     def cooling_to_temperature(
@@ -505,7 +1237,9 @@ class AbstractFluid(ABC):
             raise ValueError(
                 "During the cooling process, the temperature should decrease!"
             )
-        return self.__heat_transfer_to_temperature(temperature, pressure_drop)
+        return self.__heat_transfer_to_temperature(
+            temperature, pressure_drop, CoolProp.iphase_liquid
+        )
 
     def cooling_to_enthalpy(
         self, enthalpy: float, pressure_drop: float = 0
@@ -522,7 +1256,9 @@ class AbstractFluid(ABC):
             raise ValueError(
                 "During the cooling process, the enthalpy should decrease!"
             )
-        return self.__heat_transfer_to_enthalpy(enthalpy, pressure_drop)
+        return self.__heat_transfer_to_enthalpy(
+            enthalpy, pressure_drop, CoolProp.iphase_liquid
+        )
 
     def heating_to_temperature(
         self, temperature: float, pressure_drop: float = 0
@@ -540,7 +1276,9 @@ class AbstractFluid(ABC):
             raise ValueError(
                 "During the heating process, the temperature should increase!"
             )
-        return self.__heat_transfer_to_temperature(temperature, pressure_drop)
+        return self.__heat_transfer_to_temperature(
+            temperature, pressure_drop, CoolProp.iphase_gas
+        )
 
     def heating_to_enthalpy(
         self, enthalpy: float, pressure_drop: float = 0
@@ -557,7 +1295,9 @@ class AbstractFluid(ABC):
             raise ValueError(
                 "During the heating process, the enthalpy should increase!"
             )
-        return self.__heat_transfer_to_enthalpy(enthalpy, pressure_drop)
+        return self.__heat_transfer_to_enthalpy(
+            enthalpy, pressure_drop, CoolProp.iphase_gas
+        )
 
     def bubble_point_at_pressure(self, pressure: float) -> AbstractFluid:
         """
@@ -620,6 +1360,231 @@ class AbstractFluid(ABC):
         """
         return self.with_state(Input.pressure(pressure), Input.quality(quality))
 
+    def two_phase_points_at_pressures(
+        self, pressures: Sequence[float], quality: float
+    ) -> list[AbstractFluid]:
+        """
+        Two phase points at given pressures.
+
+        For pure fluids, the saturation temperatures of all points
+        are evaluated at once by the superancillary functions
+        (see `SuperancillaryCache`).
+
+        :param pressures: Absolute pressures [Pa].
+        :param quality: Vapor quality
+            [by default, %; you can change this using the configuration file].
+        :return: Two phase points at given pressures.
+        :raises ValueError: If any pressure or quality is invalid.
+        """
+        points = []
+        for pressure, temperature in zip(
+            pressures, self.__saturation_temperatures(pressures)
+        ):
+            inputs = [Input.pressure(pressure), Input.quality(quality)]
+            point = self.factory()
+            if self._specified_phase is not None:
+                point.specify_phase(self._specified_phase)
+            if temperature is not None and point.__update_at_saturation(
+                *inputs, temperature
+            ):
+                point._inputs = inputs
+            else:
+                point.update(*inputs)
+            points.append(point)
+        return points
+
+    def critical_points(self) -> list[CriticalPoint]:
+        """
+        Critical points of the fluid (mixture).
+
+        The mixtures may have several critical points
+        (including unstable ones). They are found once for each composition
+        and cached (see `CriticalPointsCache`), so only the first call
+        for the composition is expensive.
+
+        :return: Critical points (for pure and pseudo-pure fluids,
+            the only critical point).
+        :raises ValueError: If the critical points cannot be found
+            (e.g., for incompressible fluids).
+        """
+        return [
+            CriticalPoint(
+                pressure,
+                self._unit_converter.convert_temperature_from_si(temperature),
+                density,
+                stable,
+            )
+            for temperature, pressure, density, stable in self.__critical_points()
+        ]
+
+    def phase_envelope(self) -> PhaseEnvelope:
+        """
+        Phase envelope of the mixture.
+
+        It is built once for each composition and cached
+        (see `PhaseEnvelopeCache`), so the first call is expensive.
+        After that, the bubble and dew points at given pressure
+        (e.g., `bubble_point_at_pressure`, `dew_point_at_pressure`,
+        `update` with pressure and quality as inputs)
+        start from the initial guesses interpolated from the envelope.
+
+        :return: Phase envelope of the mixture.
+        :raises ValueError: If the phase envelope cannot be built
+            (e.g., for pure and pseudo-pure fluids or incompressible mixtures).
+        """
+        envelope = PhaseEnvelopeCache().envelope(
+            self._composition_key(), lambda: self.factory()._backend
+        )
+        with self.__lock:
+            molar_mass = self._backend.molar_mass()
+        dew_quality = (
+            100 if self.units_system == UnitsSystem.SIWithCelsiusAndPercents else 1
+        )
+        return PhaseEnvelope(
+            list(envelope.p),
+            [self._unit_converter.convert_temperature_from_si(i) for i in envelope.T],
+            [dew_quality * i for i in envelope.Q],
+            [i * molar_mass for i in envelope.rhomolar_vap],
+            [i / molar_mass for i in envelope.hmolar_vap],
+            [i / molar_mass for i in envelope.smolar_vap],
+        )
+
+    def prepare_isobars(
+        self, pressures: Iterable[float], tolerance: float = 1e-6
+    ) -> AbstractFluid:
+        """
+        Prepares the splines of the single-phase properties
+        along given isobars (e.g., for the heat exchanger or pipe models
+        with a handful of fixed pressures).
+
+        The splines are built once for each composition and pressure
+        and cached (see `IsobarSplineCache`), so this call is expensive
+        (about as much as hundreds of flash calculations for each isobar).
+        After that, the single-phase states at exactly these pressures
+        and given enthalpy or entropy (e.g., `update`, `with_state`,
+        `sweep`, `heating_to_enthalpy`) are interpolated
+        instead of the flash calculations. It is opt-in: only this instance
+        and the instances created from it (e.g., by `with_state`, `sweep`
+        or the processes) use the splines, and only as accurate
+        as the given tolerance. The other instances are not affected.
+        The properties, which cannot be interpolated
+        (e.g., the partial derivatives), are evaluated on demand
+        by the usual flash calculation.
+
+        :param pressures: Absolute pressures [Pa].
+        :param tolerance: Relative tolerance of the interpolation (optional).
+        :return: Current fluid instance.
+        :raises ValueError: If tolerance is invalid
+            or the splines cannot be built.
+        """
+        key = self._composition_key()
+        for pressure in pressures:
+            IsobarSplineCache().spline(
+                key, pressure, lambda: self.factory()._backend, tolerance
+            )
+            self.__prepared_isobars[pressure] = tolerance
+        return self
+
+    def saturation_table(
+        self,
+        temperatures: Sequence[float] | None = None,
+        pressures: Sequence[float] | None = None,
+    ) -> SaturationTable:
+        """
+        Saturation table at given temperatures or pressures.
+
+        All the saturation states are evaluated on a single new backend
+        without creating a fluid instance for each of them.
+        For pure fluids, the saturation temperatures at given pressures
+        are evaluated at once by the superancillary functions
+        (see `SuperancillaryCache`), and the bubble and dew lines
+        have the same pressures and temperatures.
+        For pseudo-pure fluids and mixtures, they differ
+        (e.g., the dew point temperature at given pressure
+        is higher than the bubble point temperature).
+
+        :param temperatures: Temperatures (optional)
+            [by default, °C; you can change this using the configuration file].
+        :param pressures: Absolute pressures [Pa] (optional).
+        :return: Properties along the bubble and dew lines
+            (one row for each of the given temperatures or pressures).
+        :raises ValueError: If neither or both temperatures and pressures
+            are defined or any of them is invalid.
+        """
+        if (temperatures is None) == (pressures is None):
+            raise ValueError("Need to define either temperatures or pressures!")
+        if temperatures is not None:
+            inputs = [Input.temperature(i) for i in temperatures]
+            saturation_temperatures = [None] * len(inputs)
+        else:
+            inputs = [Input.pressure(i) for i in pressures]
+            saturation_temperatures = self.__saturation_temperatures(pressures)
+        fluid = self.factory()
+        return SaturationTable(
+            *(
+                fluid.__saturation_line(inputs, saturation_temperatures, quality)
+                for quality in (
+                    0,
+                    (
+                        100
+                        if self.units_system == UnitsSystem.SIWithCelsiusAndPercents
+                        else 1
+                    ),
+                )
+            )
+        )
+
+    def __saturation_line(
+        self,
+        inputs: list[Input],
+        temperatures: list[float | None],
+        quality: float,
+    ) -> SaturationLine:
+        columns = [[] for _ in range(10)]
+        for first_input, temperature in zip(inputs, temperatures):
+            second_input = Input.quality(quality)
+            self.reset()
+            if temperature is not None and self.__update_at_saturation(
+                first_input, second_input, temperature
+            ):
+                self._inputs = [first_input, second_input]
+            else:
+                self.update(first_input, second_input)
+            for column, value in zip(
+                columns,
+                (
+                    self.pressure,
+                    self.temperature,
+                    self.density,
+                    self.enthalpy,
+                    self.entropy,
+                    self.specific_heat,
+                    self.conductivity,
+                    self.dynamic_viscosity,
+                    self.prandtl,
+                    self.surface_tension,
+                ),
+            ):
+                column.append(value)
+        return SaturationLine(*columns)
+
+    def __saturation_temperatures(
+        self, pressures: Sequence[float]
+    ) -> list[float | None]:
+        # Saturation temperatures of pure fluids evaluated at once
+        # by the superancillary functions (None if they are not available)
+        key = self._superancillary_key()
+        if (
+            key is not None
+            and self._specified_phase is None
+            and SuperancillaryCache().is_available(*key)
+        ):
+            try:
+                return SuperancillaryCache().saturation_temperatures(*key, pressures)
+            except ValueError:
+                pass
+        return [None] * len(pressures)
+
     def mixing(
         self,
         first_specific_mass_flow: float,
@@ -688,11 +1653,18 @@ class AbstractFluid(ABC):
         cached_input = next(
             (i for i in self._inputs if i.coolprop_key == coolprop_key), None
         )
-        value = (
-            cached_input.value
-            if cached_input is not None
-            else self._backend.keyed_output(coolprop_key)
-        )
+        if cached_input is not None:
+            value = cached_input.value
+        elif (
+            self.__interpolated_outputs is not None
+            and coolprop_key in self.__interpolated_outputs
+        ):
+            value = self.__interpolated_outputs[coolprop_key]
+        else:
+            with self.__lock:
+                if coolprop_key not in self.__TRIVIAL_OUTPUTS:
+                    self.__flash_interpolated()
+                value = self._backend.keyed_output(coolprop_key)
         OutputsValidator(value).validate()
         return value
 
@@ -705,24 +1677,208 @@ class AbstractFluid(ABC):
         )
 
     def __heat_transfer_to_temperature(
-        self, temperature: float, pressure_drop: float
+        self, temperature: float, pressure_drop: float, expected_phase: int
     ) -> AbstractFluid:
         self.__check_pressure_drop(pressure_drop)
-        return self.with_state(
+        return self.__end_state(
             Input.pressure(self.pressure - pressure_drop),
             Input.temperature(temperature),
+            expected_phase,
         )
 
     def __heat_transfer_to_enthalpy(
-        self, enthalpy: float, pressure_drop: float
+        self, enthalpy: float, pressure_drop: float, expected_phase: int
     ) -> AbstractFluid:
         self.__check_pressure_drop(pressure_drop)
-        return self.with_state(
+        return self.__end_state(
             Input.pressure(self.pressure - pressure_drop),
             Input.enthalpy(enthalpy),
+            expected_phase,
         )
 
+    def __end_state(
+        self,
+        first_input: Input,
+        second_input: Input,
+        expected_phase: int,
+        fluid: AbstractFluid | None = None,
+    ) -> AbstractFluid:
+        # The backend of the given fluid instance is reused (if any)
+        if fluid is None:
+            fluid = self._derive()
+        # The expected phase state at the end of the process is hinted
+        # only if the fluid is in the similar phase state now
+        hint = self.__phase_hint(expected_phase)
+        guess = self._guess(first_input, second_input) if hint is not None else None
+        if guess is None or not fluid.__update_with_phase_hint(
+            first_input, second_input, guess, hint
+        ):
+            fluid.update(first_input, second_input)
+        return fluid
+
+    def __real_end_state(
+        self, pressure: float, isentropic_efficiency: float, compression: bool
+    ) -> AbstractFluid:
+        # The isentropic end state is evaluated on the backend of the real one
+        fluid = self.__end_state(
+            Input.pressure(pressure), Input.entropy(self.entropy), CoolProp.iphase_gas
+        )
+        return self.__end_state(
+            Input.pressure(pressure),
+            Input.enthalpy(
+                self.__real_enthalpy(fluid.enthalpy, isentropic_efficiency, compression)
+            ),
+            CoolProp.iphase_gas,
+            fluid,
+        )
+
+    def __real_end_states(
+        self,
+        pressures: Sequence[float],
+        isentropic_efficiencies: Sequence[float],
+        compression: bool,
+    ) -> list[AbstractFluid]:
+        if len(pressures) != len(isentropic_efficiencies):
+            raise ValueError(
+                "Need to define the isentropic efficiency for each pressure!"
+            )
+        isentropic_efficiencies = [
+            self.__isentropic_efficiency_to_si(i, compression)
+            for i in isentropic_efficiencies
+        ]
+        for pressure in pressures:
+            self.__check_outlet_pressure(pressure, compression)
+        # Sorted away from the inlet pressure, to start each isentropic end state
+        # from the previous one
+        unique_pressures = sorted(set(pressures), reverse=not compression)
+        isentropic_enthalpies = {
+            pressure: state.enthalpy
+            for pressure, state in zip(
+                unique_pressures,
+                self.sweep(
+                    Input.entropy(self.entropy), Input.pressure, unique_pressures
+                ),
+            )
+        }
+        # The end states are also sorted, to start each one from the previous one
+        order = sorted(
+            range(len(pressures)),
+            key=lambda i: (pressures[i], isentropic_efficiencies[i]),
+            reverse=not compression,
+        )
+        states: list[AbstractFluid | None] = [None] * len(pressures)
+        previous = self
+        for index in order:
+            previous = states[index] = self.with_state(
+                Input.pressure(pressures[index]),
+                Input.enthalpy(
+                    self.__real_enthalpy(
+                        isentropic_enthalpies[pressures[index]],
+                        isentropic_efficiencies[index],
+                        compression,
+                    )
+                ),
+                previous,
+            )
+        return states
+
+    def __real_enthalpy(
+        self,
+        isentropic_enthalpy: float,
+        isentropic_efficiency: float,
+        compression: bool,
+    ) -> float:
+        return (
+            self.enthalpy
+            + (isentropic_enthalpy - self.enthalpy) / isentropic_efficiency
+            if compression
+            else self.enthalpy
+            - (self.enthalpy - isentropic_enthalpy) * isentropic_efficiency
+        )
+
+    def __isentropic_efficiency_to_si(
+        self, isentropic_efficiency: float, compression: bool
+    ) -> float:
+        isentropic_efficiency = self._unit_converter.convert_decimal_fraction_to_si(
+            isentropic_efficiency
+        )
+        if not 0 < isentropic_efficiency < 1:
+            raise ValueError(
+                f"Invalid {'compressor' if compression else 'expander'} "
+                "isentropic efficiency!"
+            )
+        return isentropic_efficiency
+
+    def __check_outlet_pressure(self, pressure: float, compression: bool):
+        if compression and not pressure > self.pressure:
+            raise ValueError(
+                "Compressor outlet pressure should be higher than inlet pressure!"
+            )
+        if not compression and not pressure < self.pressure:
+            raise ValueError(
+                "Expander outlet pressure should be lower than inlet pressure!"
+            )
+
+    def __phase_hint(self, expected_phase: int) -> int | None:
+        if (
+            not self.__phase_hints
+            or self._specified_phase is not None
+            or len(self._inputs) != 2
+        ):
+            return None
+        with self.__lock:
+            self.__flash_interpolated()
+            try:
+                phase = self._backend.phase()
+            except ValueError:
+                return None
+        similar_phases = (
+            self.__GAS_PHASES
+            if expected_phase == CoolProp.iphase_gas
+            else self.__LIQUID_PHASES
+        )
+        return expected_phase if phase in similar_phases else None
+
+    def __update_with_phase_hint(
+        self, first_input: Input, second_input: Input, guess: list[float], hint: int
+    ) -> bool:
+        density, _, temperature = guess
+        values = {i.coolprop_key: i.value for i in (first_input, second_input)}
+        self.reset()
+        with self.__lock:
+            try:
+                self._backend.specify_phase(hint)
+                if values.keys() == {CoolProp.iP, CoolProp.iT}:
+                    # Pressure and temperature are the flash inputs themselves
+                    # (the Newton iterations in density and temperature
+                    # hardly converge for the liquid, since it is stiff)
+                    self._backend.update(
+                        CoolProp.PT_INPUTS, values[CoolProp.iP], values[CoolProp.iT]
+                    )
+                else:
+                    self._backend.update(CoolProp.DmassT_INPUTS, density, temperature)
+                    InverseSolver(self._backend, 1e-10, 20).solve(
+                        [first_input, second_input]
+                    )
+                density, temperature = self._backend.rhomass(), self._backend.T()
+                # The found state is metastable if the stable one is two-phase
+                self._backend.unspecify_phase()
+                self._backend.update(CoolProp.DmassT_INPUTS, density, temperature)
+                if self._backend.phase() not in (
+                    self.__GAS_PHASES | self.__LIQUID_PHASES
+                ):
+                    return False
+            except ValueError:
+                return False
+            finally:
+                self._backend.unspecify_phase()
+        self._inputs = [first_input, second_input]
+        return True
+
     @staticmethod
     def __check_pressure_drop(pressure_drop: float):
         if pressure_drop < 0:
             raise ValueError("Invalid pressure drop in the heat exchanger!")
+
+    def __reinit_lock(self):
+        self.__lock = Lock()
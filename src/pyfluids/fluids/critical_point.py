@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+__all__ = ["CriticalPoint"]
+
+
+@dataclass(frozen=True)
+class CriticalPoint:
+    """Critical point of the fluid (mixture)."""
+
+    pressure: float
+    """Absolute pressure [Pa]."""
+
+    temperature: float
+    """Temperature
+    [by default, °C; you can change this using the configuration file]."""
+
+    density: float
+    """Mass density [kg/m3]."""
+
+    stable: bool
+    """True if the critical point is stable."""
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from CoolProp import AbstractState
+from typing import Hashable
 
 from .abstract_fluid import AbstractFluid
+from ..backends import BackendPool
 from ..config import UnitsSystem
 from ..enums import FluidsList, Mix
 
@@ -52,7 +53,7 @@ class Fluid(AbstractFluid):
             if coolprop_backend is not None
             else self.__name.coolprop_backend
         )
-        self._backend = AbstractState(
+        self._backend = BackendPool().create(
             self.__coolprop_backend, self.__name.coolprop_name
         )
         if not self.__name.pure:
@@ -61,6 +62,16 @@ class Fluid(AbstractFluid):
     def factory(self) -> Fluid:
         return Fluid(self.__name, self.__fraction, self.__coolprop_backend)
 
+    def _superancillary_key(self) -> tuple[str, str] | None:
+        return (
+            (self.__coolprop_backend, self.__name.coolprop_name)
+            if self.__name.pure
+            else None
+        )
+
+    def _composition_key(self) -> Hashable | None:
+        return self.__name.coolprop_name, self.__fraction, self.__coolprop_backend
+
     @property
     def name(self) -> FluidsList:
         """Selected fluid name."""
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from math import exp, isfinite, log
+from typing import Sequence
+
+import CoolProp
+from CoolProp import AbstractState
+
+from ..io import Input
+from ..io.abstract_input import AbstractInput
+
+__all__ = ["InverseSolver"]
+
+
+class InverseSolver:
+    """Newton solver of the fluid state with given values of any two outputs."""
+
+    # Outputs which can be negative (their residuals are relative differences,
+    # the residuals of other outputs are logarithms of ratios)
+    __SIGNED_OUTPUTS: frozenset[int] = frozenset(
+        (CoolProp.iHmass, CoolProp.iSmass, CoolProp.iUmass, CoolProp.iGmass)
+    )
+    # Step of the finite differences in logarithms of variables
+    # (for the outputs without analytical derivatives, e.g. transport properties)
+    __STEP: float = 1e-7
+    __MAX_HALVINGS: int = 30
+
+    def __init__(self, backend: AbstractState, tolerance: float, max_iterations: int):
+        """
+        Newton solver of the fluid state with given values of any two outputs.
+
+        All the iterations are performed on the same CoolProp backend.
+        The independent variables are the logarithms of density and temperature
+        (or pressure and temperature, if the backend does not support
+        density and temperature as inputs, e.g. for incompressible fluids).
+        The Jacobian is evaluated analytically for thermodynamic outputs and
+        by finite differences for others (e.g. transport properties).
+
+        :param backend: CoolProp backend at the initial guess state.
+        :param tolerance: Relative tolerance of the targets.
+        :param max_iterations: Maximum number of Newton iterations.
+        """
+        self.__backend: AbstractState = backend
+        self.__tolerance: float = tolerance
+        self.__max_iterations: int = max_iterations
+        self.__flashes: int = 0
+
+    @property
+    def flashes(self) -> int:
+        """Number of flash calculations performed by the solver."""
+        return self.__flashes
+
+    def solve(self, targets: Sequence[AbstractInput]) -> tuple[list[Input], int]:
+        """
+        Finds the state with given values of outputs.
+
+        :param targets: Two targets (CoolProp keys and SI values of outputs).
+        :return: Inputs which define the found state and number of iterations.
+        :raises ValueError: If targets are invalid or the solver does not converge.
+        """
+        if any(
+            i.coolprop_key not in self.__SIGNED_OUTPUTS and i.value <= 0
+            for i in targets
+        ):
+            raise ValueError("Invalid target value! It should be positive.")
+        variables, pair = self.__variables()
+        x = [log(self.__backend.keyed_output(key)) for key in variables]
+        residuals = self.__residuals(targets)
+        iteration = 0
+        while max(abs(i) for i in residuals) > self.__tolerance:
+            if iteration == self.__max_iterations:
+                raise ValueError(
+                    f"The solver did not converge in {self.__max_iterations} "
+                    "iterations! Try another initial guess."
+                )
+            iteration += 1
+            jacobian = self.__jacobian(targets, variables, pair, x)
+            determinant = (
+                jacobian[0][0] * jacobian[1][1] - jacobian[0][1] * jacobian[1][0]
+            )
+            if determinant == 0 or not isfinite(determinant):
+                raise ValueError(
+                    "The targets are not independent at the current state! "
+                    "Try another initial guess."
+                )
+            step = [
+                (jacobian[0][1] * residuals[1] - jacobian[1][1] * residuals[0])
+                / determinant,
+                (jacobian[1][0] * residuals[0] - jacobian[0][0] * residuals[1])
+                / determinant,
+            ]
+            x, residuals = self.__line_search(targets, pair, x, step, residuals)
+        return [Input(key, exp(value)) for key, value in zip(variables, x)], iteration
+
+    def __variables(self) -> tuple[tuple[int, int], int]:
+        pressure, density, temperature = (
+            self.__backend.p(),
+            self.__backend.rhomass(),
+            self.__backend.T(),
+        )
+        try:
+            self.__update(CoolProp.DmassT_INPUTS, [log(density), log(temperature)])
+            return (CoolProp.iDmass, CoolProp.iT), CoolProp.DmassT_INPUTS
+        except ValueError:
+            self.__update(CoolProp.PT_INPUTS, [log(pressure), log(temperature)])
+            return (CoolProp.iP, CoolProp.iT), CoolProp.PT_INPUTS
+
+    def __update(self, pair: int, x: Sequence[float]):
+        try:
+            values = exp(x[0]), exp(x[1])
+        except OverflowError as e:
+            raise ValueError("Invalid state!") from e
+        self.__flashes += 1
+        self.__backend.update(pair, *values)
+
+    def __residuals(self, targets: Sequence[AbstractInput]) -> list[float]:
+        residuals = []
+        for target in targets:
+            value = self.__backend.keyed_output(target.coolprop_key)
+            if not isfinite(value):
+                raise ValueError("Invalid output value!")
+            if target.coolprop_key in self.__SIGNED_OUTPUTS:
+                residuals.append((value - target.value) / (abs(target.value) or 1))
+            elif value > 0:
+                residuals.append(log(value / target.value))
+            else:
+                raise ValueError("Invalid output value!")
+        return residuals
+
+    def __scale(self, target: AbstractInput, value: float) -> float:
+        # Derivative of the residual with respect to the output value
+        return (
+            1 / (abs(target.value) or 1)
+            if target.coolprop_key in self.__SIGNED_OUTPUTS
+            else 1 / value
+        )
+
+    def __jacobian(
+        self,
+        targets: Sequence[AbstractInput],
+        variables: tuple[int, int],
+        pair: int,
+        x: list[float],
+    ) -> list[list[float]]:
+        jacobian = [[0.0, 0.0], [0.0, 0.0]]
+        values = [self.__backend.keyed_output(i.coolprop_key) for i in targets]
+        variable_values = [exp(i) for i in x]
+        numerical = []
+        try:
+            # Single-phase derivatives are not valid in the two-phase region
+            two_phase = self.__backend.phase() == CoolProp.iphase_twophase
+        except ValueError:  # e.g., for incompressible fluids
+            two_phase = False
+        for i, target in enumerate(targets):
+            scale = self.__scale(target, values[i])
+            for j in range(2):
+                try:
+                    if two_phase:
+                        raise ValueError
+                    derivative = self.__backend.first_partial_deriv(
+                        target.coolprop_key, variables[j], variables[1 - j]
+                    )
+                    if not isfinite(derivative):
+                        raise ValueError
+                    jacobian[i][j] = derivative * variable_values[j] * scale
+                except ValueError:
+                    numerical.append((i, j))
+        for j in sorted({j for _, j in numerical}):
+            self.__update(
+                pair,
+                [x[0] + self.__STEP, x[1]] if j == 0 else [x[0], x[1] + self.__STEP],
+            )
+            for i, column in numerical:
+                if column == j:
+                    value = self.__backend.keyed_output(targets[i].coolprop_key)
+                    jacobian[i][j] = (
+                        (value - values[i])
+                        / self.__STEP
+                        * self.__scale(targets[i], values[i])
+                    )
+        return jacobian
+
+    def __line_search(
+        self,
+        targets: Sequence[AbstractInput],
+        pair: int,
+        x: list[float],
+        step: list[float],
+        residuals: list[float],
+    ) -> tuple[list[float], list[float]]:
+        norm = sum(i * i for i in residuals)
+        factor = 1.0
+        for _ in range(self.__MAX_HALVINGS):
+            trial = [x[0] + factor * step[0], x[1] + factor * step[1]]
+            factor /= 2
+            try:
+                self.__update(pair, trial)
+                trial_residuals = self.__residuals(targets)
+            except ValueError:
+                continue
+            if sum(i * i for i in trial_residuals) < norm:
+                return trial, trial_residuals
+        raise ValueError(
+            "The solver cannot reduce the residuals! Try another initial guess."
+        )
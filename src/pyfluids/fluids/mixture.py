@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from CoolProp import AbstractState
+from typing import Any, Hashable, Iterable, Iterator, Sequence
+
+import CoolProp
 
 from .abstract_fluid import AbstractFluid
+from ..backends import BackendPool
 from ..config import UnitsSystem
 from ..enums import FluidsList
+from ..io import Input
 
 __all__ = ["Mixture"]
 
@@ -12,29 +16,210 @@ __all__ = ["Mixture"]
 class Mixture(AbstractFluid):
     """Mass-based mixture of pure fluids."""
 
-    __AVAILABLE_BACKEND = "HEOS"
+    __AVAILABLE_BACKENDS: tuple[str, ...] = ("HEOS", "PR", "SRK")
 
-    def __init__(self, fluids: list[FluidsList], fractions: list[float]):
+    def __init__(
+        self,
+        fluids: list[FluidsList],
+        fractions: list[float],
+        coolprop_backend: str | None = None,
+    ):
         """
         Mass-based mixture of pure fluids.
 
         :param fluids: List of selected names of pure fluids.
         :param fractions: List of mass-based fractions
             [by default, %; you can change this using the configuration file].
-        :raises ValueError: If fluids or fractions are invalid.
+        :param coolprop_backend: CoolProp backend to be used: 'HEOS' (by default),
+            or the much faster, but less accurate cubic equations of state
+            'PR' (Peng-Robinson) and 'SRK' (Soave-Redlich-Kwong).
+            The tabular backends of CoolProp do not support mixtures.
+        :raises ValueError: If fluids, fractions or backend are invalid.
         """
         super().__init__()
-        if len(fluids) != len(fractions):
+        self.__coolprop_backend: str = (
+            coolprop_backend if coolprop_backend is not None else "HEOS"
+        )
+        if self.__coolprop_backend not in self.__AVAILABLE_BACKENDS:
             raise ValueError(
-                "Invalid input! Fluids and fractions should be of the same length."
+                "Invalid backend! It should be one of: "
+                f"{', '.join(self.__AVAILABLE_BACKENDS)}."
             )
-        if not all(
-            fluid.pure and fluid.coolprop_backend == self.__AVAILABLE_BACKEND
-            for fluid in fluids
-        ):
+        components_error = ValueError(
+            "Invalid components! All of them should be "
+            f"a pure fluid with {self.__coolprop_backend} backend."
+        )
+        if not all(fluid.pure and fluid.coolprop_backend == "HEOS" for fluid in fluids):
+            raise components_error
+        self.__fluids: list[FluidsList] = fluids
+        self.__fractions: list[float] = []
+        try:
+            self._backend = BackendPool().create(
+                self.__coolprop_backend,
+                "&".join(fluid.coolprop_name for fluid in self.__fluids),
+            )
+        except ValueError as e:
+            # Some fluids are not available for the cubic backends
+            raise components_error from e
+        # The cubic backends support only mole fractions
+        self.__molar_masses: list[float] | None = (
+            [
+                self._backend.get_fluid_constant(i, CoolProp.imolar_mass)
+                for i in range(len(self.__fluids))
+            ]
+            if self.__coolprop_backend != "HEOS"
+            else None
+        )
+        self.__set_fractions(fractions)
+
+    def factory(self) -> Mixture:
+        return Mixture(self.__fluids, self.__fractions, self.__coolprop_backend)
+
+    def with_fractions(self, fractions: list[float]) -> Mixture:
+        """
+        Returns a new mixture instance of the same fluids
+        with other fractions and no defined state (specified phase is kept).
+
+        Each mixture instance owns its CoolProp backend (the backend holds
+        the state), so the new instance cannot share the backend
+        of the current one. To change the fractions without creating
+        a new backend, use `set_fractions` (or `composition_sweep`).
+
+        :param fractions: List of mass-based fractions
+            [by default, %; you can change this using the configuration file].
+        :return: A new mixture instance with given fractions.
+        :raises ValueError: If fractions are invalid.
+        """
+        mixture = Mixture(self.__fluids, fractions, self.__coolprop_backend)
+        if self._specified_phase is not None:
+            mixture.specify_phase(self._specified_phase)
+        return mixture
+
+    def set_fractions(self, fractions: list[float]) -> Mixture:
+        """
+        Changes the fractions of the fluids of the current instance.
+
+        The existing CoolProp backend is reused: only its fractions are reset,
+        so the mixture model is not rebuilt. The state is reset
+        (the specified phase is kept).
+
+        :param fractions: List of mass-based fractions
+            [by default, %; you can change this using the configuration file].
+        :return: Current mixture instance with given fractions
+            and no defined state.
+        :raises ValueError: If fractions are invalid.
+        """
+        self.__set_fractions(fractions)
+        return self
+
+    def composition_sweep(
+        self,
+        fractions: Iterable[list[float]],
+        first_input: Input,
+        second_input: Input,
+    ) -> Iterator[Mixture]:
+        """
+        Iterates over the states with the same inputs
+        and different fractions of the fluids.
+
+        The same new mixture instance (with a single CoolProp backend)
+        is updated on each step: only the fractions of its backend are reset,
+        so the mixture model is not rebuilt for each composition.
+        Read the required properties before the next step
+        (or use `clone` to keep the state).
+
+        :param fractions: Lists of mass-based fractions
+            [by default, %; you can change this using the configuration file].
+        :param first_input: First input property.
+        :param second_input: Second input property.
+        :return: Iterator over the states of the mixture with given fractions.
+        :raises ValueError: If any fractions or input are invalid.
+        """
+        mixture = self.factory()
+        if self._specified_phase is not None:
+            mixture.specify_phase(self._specified_phase)
+        for i in fractions:
+            mixture.__set_fractions(i)
+            mixture.update(first_input, second_input)
+            yield mixture
+
+    def composition_grid(
+        self,
+        fractions: Sequence[list[float]],
+        states: Sequence[Sequence[Input]],
+        properties: Sequence[str],
+    ) -> dict[str, list[list[Any]]]:
+        """
+        Evaluates properties of the mixture at each pair
+        of given fractions and states (the composition × state grid).
+
+        All the grid is evaluated on a single CoolProp backend,
+        whose fractions are reset only once for each row
+        (see `composition_sweep`).
+
+        :param fractions: Lists of mass-based fractions (rows of the grid)
+            [by default, %; you can change this using the configuration file].
+        :param states: Inputs which define each of the states
+            (columns of the grid).
+        :param properties: Names of properties to be evaluated.
+        :return: Values of each property as rows (one for each composition)
+            of values (one for each state) or None for invalid states.
+        :raises ValueError: If any fractions or property names are invalid.
+        """
+        invalid = [
+            key
+            for key in properties
+            if not isinstance(getattr(self.__class__, key, None), property)
+        ]
+        if invalid:
+            raise ValueError(f"Invalid properties: {', '.join(invalid)}!")
+        mixture = self.factory()
+        if self._specified_phase is not None:
+            mixture.specify_phase(self._specified_phase)
+        grid: dict[str, list[list[Any]]] = {key: [] for key in properties}
+        for i in fractions:
+            mixture.__set_fractions(i)
+            for key in properties:
+                grid[key].append([])
+            for inputs in states:
+                try:
+                    mixture.update(*inputs)
+                    values = [getattr(mixture, key) for key in properties]
+                except ValueError:
+                    values = [None] * len(properties)
+                for key, value in zip(properties, values):
+                    grid[key][-1].append(value)
+        return grid
+
+    def _composition_key(self) -> Hashable | None:
+        return (
+            tuple(i.coolprop_name for i in self.__fluids),
+            tuple(self.__fractions),
+            self.__coolprop_backend,
+        )
+
+    @property
+    def fluids(self) -> list[FluidsList]:
+        """List of selected names of pure fluids."""
+        return self.__fluids
+
+    @property
+    def fractions(self) -> list[float]:
+        """
+        List of mass-based fractions
+        [by default, %; you can change this using the configuration file].
+        """
+        return self.__fractions
+
+    @property
+    def coolprop_backend(self) -> str:
+        """CoolProp backend used."""
+        return self.__coolprop_backend
+
+    def __set_fractions(self, fractions: list[float]):
+        if len(self.__fluids) != len(fractions):
             raise ValueError(
-                "Invalid components! All of them should be "
-                f"a pure fluid with {self.__AVAILABLE_BACKEND} backend."
+                "Invalid input! Fluids and fractions should be of the same length."
             )
         if not all(
             0 < self._unit_converter.convert_decimal_fraction_to_si(fraction) < 1
@@ -57,33 +242,17 @@ class Mixture(AbstractFluid):
                 "Invalid components mass fractions! "
                 f"Their sum should be equal to {fractions_sum}{self._fraction_unit}."
             )
-        self.__fluids, self.__fractions = fluids, fractions
-        self._backend = AbstractState(
-            self.__AVAILABLE_BACKEND,
-            "&".join(fluid.coolprop_name for fluid in self.__fluids),
-        )
-        self._backend.set_mass_fractions(
-            [
-                self._unit_converter.convert_decimal_fraction_to_si(fraction)
-                for fraction in self.__fractions
-            ]
-        )
-
-    def factory(self) -> Mixture:
-        return Mixture(self.__fluids, self.__fractions)
-
-    @property
-    def fluids(self) -> list[FluidsList]:
-        """List of selected names of pure fluids."""
-        return self.__fluids
-
-    @property
-    def fractions(self) -> list[float]:
-        """
-        List of mass-based fractions
-        [by default, %; you can change this using the configuration file].
-        """
-        return self.__fractions
+        self._reset_composition()
+        self.__fractions = fractions
+        mass_fractions = [
+            self._unit_converter.convert_decimal_fraction_to_si(fraction)
+            for fraction in self.__fractions
+        ]
+        if self.__molar_masses is None:
+            self._backend.set_mass_fractions(mass_fractions)
+            return
+        moles = [i / j for i, j in zip(mass_fractions, self.__molar_masses)]
+        self._backend.set_mole_fractions([i / sum(moles) for i in moles])
 
     def __eq__(self, other: Mixture) -> bool:
         return isinstance(other, Mixture) and hash(self) == hash(other)
@@ -96,6 +265,7 @@ class Mixture(AbstractFluid):
             (
                 "&".join(str(i.coolprop_name) for i in self.__fluids),
                 "&".join(str(i) for i in self.__fractions),
+                self.__coolprop_backend,
                 super().__hash__(),
             )
         )
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+__all__ = ["PhaseEnvelope"]
+
+
+@dataclass(frozen=True)
+class PhaseEnvelope:
+    """
+    Phase envelope of the mixture: the saturated states of the mixture
+    from the dew line at low pressure through the critical region
+    to the bubble line at low pressure.
+    """
+
+    pressures: list[float]
+    """Absolute pressures [Pa]."""
+
+    temperatures: list[float]
+    """Temperatures
+    [by default, °C; you can change this using the configuration file]."""
+
+    qualities: list[float]
+    """Vapor qualities (0 for bubble points, 100 % for dew points)
+    [by default, %; you can change this using the configuration file]."""
+
+    densities: list[float]
+    """Mass densities of the saturated mixture [kg/m3]."""
+
+    enthalpies: list[float]
+    """Mass specific enthalpies of the saturated mixture [J/kg]."""
+
+    entropies: list[float]
+    """Mass specific entropies of the saturated mixture [J/kg/K]."""
+
+    @property
+    def cricondenbar(self) -> float:
+        """Maximum pressure of the two-phase region [Pa]."""
+        return max(self.pressures)
+
+    @property
+    def cricondentherm(self) -> float:
+        """
+        Maximum temperature of the two-phase region
+        [by default, °C; you can change this using the configuration file].
+        """
+        return max(self.temperatures)
+
+    def __len__(self) -> int:
+        return len(self.pressures)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+__all__ = ["SaturationLine"]
+
+
+@dataclass(frozen=True)
+class SaturationLine:
+    """Properties of the fluid along the bubble or dew line (one value per row)."""
+
+    pressures: list[float]
+    """Absolute pressures [Pa]."""
+
+    temperatures: list[float]
+    """Temperatures
+    [by default, °C; you can change this using the configuration file]."""
+
+    densities: list[float]
+    """Mass densities [kg/m3]."""
+
+    enthalpies: list[float]
+    """Mass specific enthalpies [J/kg]."""
+
+    entropies: list[float]
+    """Mass specific entropies [J/kg/K]."""
+
+    specific_heats: list[float]
+    """Mass specific constant pressure specific heats [J/kg/K]."""
+
+    conductivities: list[float | None]
+    """Thermal conductivities [W/m/K]."""
+
+    dynamic_viscosities: list[float | None]
+    """Dynamic viscosities [Pa*s]."""
+
+    prandtls: list[float | None]
+    """Prandtl numbers [-]."""
+
+    surface_tensions: list[float | None]
+    """Surface tensions [N/m]."""
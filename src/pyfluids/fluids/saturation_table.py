@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .saturation_line import SaturationLine
+
+__all__ = ["SaturationTable"]
+
+
+@dataclass(frozen=True)
+class SaturationTable:
+    """Columnar saturation table of the fluid."""
+
+    bubble_line: SaturationLine
+    """Properties of the saturated liquid (bubble points)."""
+
+    dew_line: SaturationLine
+    """Properties of the saturated vapor (dew points)."""
+
+    def __len__(self) -> int:
+        return len(self.bubble_line.pressures)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .abstract_fluid import AbstractFluid
+
+__all__ = ["StateSolution"]
+
+
+@dataclass(frozen=True)
+class StateSolution:
+    """Result of the inverse solution of the fluid state."""
+
+    fluid: AbstractFluid
+    """The fluid instance at the found state."""
+
+    iterations: int
+    """Number of Newton iterations (0 if CoolProp could solve it directly)."""
+
+    flashes: int
+    """Number of flash calculations performed by the solver."""
@@ -0,0 +1,4 @@
+from .counterflow_heat_exchanger import *
+from .temperature_profile import *
+
+__all__ = counterflow_heat_exchanger.__all__ + temperature_profile.__all__
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from ..fluids.abstract_fluid import AbstractFluid
+from ..io import Input
+from .temperature_profile import TemperatureProfile
+
+__all__ = ["CounterflowHeatExchanger"]
+
+
+class CounterflowHeatExchanger:
+    """Counterflow heat exchanger discretized into segments of equal duty."""
+
+    def __init__(self, segments: int = 20):
+        """
+        Counterflow heat exchanger discretized into segments of equal duty.
+
+        The enthalpy of each stream changes linearly with the transferred
+        heat flow, and the pressure drop is distributed in proportion to it.
+        The nodes of each stream are evaluated in the flow direction
+        on a single fluid instance, each flash calculation is warm-started
+        from the previous node (see `update`) if both nodes are on the same side
+        of the two-phase region, so the profiles are cheap enough
+        to be evaluated many times (e.g., inside the optimization loops).
+
+        :param segments: Number of segments (optional, by default, 20).
+        :raises ValueError: If number of segments is invalid.
+        """
+        if segments < 1:
+            raise ValueError("Invalid number of segments!")
+        self.__segments: int = segments
+
+    @property
+    def segments(self) -> int:
+        """Number of segments."""
+        return self.__segments
+
+    def profile(
+        self,
+        hot_inlet: AbstractFluid,
+        hot_mass_flow_rate: float,
+        cold_inlet: AbstractFluid,
+        cold_mass_flow_rate: float,
+        heat_flow: float,
+        hot_pressure_drop: float = 0,
+        cold_pressure_drop: float = 0,
+    ) -> TemperatureProfile:
+        """
+        Temperature – heat flow profiles of the streams.
+
+        :param hot_inlet: The state of the hot stream at the inlet.
+        :param hot_mass_flow_rate: Mass flow rate of the hot stream [kg/s].
+        :param cold_inlet: The state of the cold stream at the inlet.
+        :param cold_mass_flow_rate: Mass flow rate of the cold stream [kg/s].
+        :param heat_flow: Heat flow transferred from the hot stream
+            to the cold stream (duty) [W].
+        :param hot_pressure_drop: Pressure drop of the hot stream (optional) [Pa].
+        :param cold_pressure_drop: Pressure drop of the cold stream (optional) [Pa].
+        :return: Temperature profiles of the streams at the nodes
+            (from the hot inlet end to the hot outlet end) and the outlet states.
+        :raises ValueError: If input is invalid
+            or any state of the streams cannot be evaluated.
+        """
+        if hot_mass_flow_rate <= 0 or cold_mass_flow_rate <= 0:
+            raise ValueError("Invalid mass flow rate!")
+        if heat_flow <= 0:
+            raise ValueError("Invalid heat flow!")
+        if hot_pressure_drop < 0 or cold_pressure_drop < 0:
+            raise ValueError("Invalid pressure drop in the heat exchanger!")
+        heat_flows = [
+            heat_flow * i / self.__segments for i in range(self.__segments + 1)
+        ]
+        hot_outlet, hot_temperatures = self.__stream(
+            hot_inlet,
+            [-i / hot_mass_flow_rate for i in heat_flows],
+            [hot_pressure_drop * i / heat_flow for i in heat_flows],
+        )
+        cold_outlet, cold_temperatures = self.__stream(
+            cold_inlet,
+            [(heat_flow - i) / cold_mass_flow_rate for i in reversed(heat_flows)],
+            [
+                cold_pressure_drop * (heat_flow - i) / heat_flow
+                for i in reversed(heat_flows)
+            ],
+        )
+        return TemperatureProfile(
+            heat_flows,
+            hot_temperatures,
+            list(reversed(cold_temperatures)),
+            hot_outlet,
+            cold_outlet,
+        )
+
+    @staticmethod
+    def __stream(
+        inlet: AbstractFluid,
+        enthalpy_changes: list[float],
+        pressure_drops: list[float],
+    ) -> tuple[AbstractFluid, list[float]]:
+        # Nodes of the stream in the flow direction
+        fluid, guess, temperatures = inlet.factory(), inlet, []
+        dome = CounterflowHeatExchanger.__dome(
+            inlet, {inlet.pressure, inlet.pressure - pressure_drops[-1]}
+        )
+        for enthalpy_change, pressure_drop in zip(enthalpy_changes, pressure_drops):
+            enthalpy = inlet.enthalpy + enthalpy_change
+            # The previous node is used as the initial guess only
+            # if both nodes are on the same side of the two-phase region
+            same_side = dome is None or (
+                max(guess.enthalpy, enthalpy) < dome[0]
+                or min(guess.enthalpy, enthalpy) > dome[1]
+            )
+            fluid.update(
+                Input.pressure(inlet.pressure - pressure_drop),
+                Input.enthalpy(enthalpy),
+                guess if same_side else None,
+            )
+            temperatures.append(fluid.temperature)
+            guess = fluid
+        return fluid, temperatures
+
+    @staticmethod
+    def __dome(
+        inlet: AbstractFluid, pressures: set[float]
+    ) -> tuple[float, float] | None:
+        # Enthalpy range of the two-phase region at the pressures of the stream
+        # (None if there is no two-phase region, e.g., for supercritical
+        # pressures or incompressible fluids)
+        try:
+            return (
+                min(inlet.bubble_point_at_pressure(i).enthalpy for i in pressures),
+                max(inlet.dew_point_at_pressure(i).enthalpy for i in pressures),
+            )
+        except ValueError:
+            return None
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..fluids.abstract_fluid import AbstractFluid
+
+__all__ = ["TemperatureProfile"]
+
+
+@dataclass(frozen=True)
+class TemperatureProfile:
+    """Discretized temperature – heat flow profiles of the heat exchanger streams."""
+
+    heat_flows: list[float]
+    """Heat flows transferred from the hot inlet end to the nodes [W]."""
+
+    hot_temperatures: list[float]
+    """Temperatures of the hot stream at the nodes
+    [by default, °C; you can change this using the configuration file]."""
+
+    cold_temperatures: list[float]
+    """Temperatures of the cold stream at the nodes
+    [by default, °C; you can change this using the configuration file]."""
+
+    hot_outlet: AbstractFluid
+    """The state of the hot stream at the outlet."""
+
+    cold_outlet: AbstractFluid
+    """The state of the cold stream at the outlet."""
+
+    @property
+    def temperature_differences(self) -> list[float]:
+        """Temperature differences between the streams at the nodes [K]."""
+        return [
+            hot - cold
+            for hot, cold in zip(self.hot_temperatures, self.cold_temperatures)
+        ]
+
+    @property
+    def minimum_temperature_difference(self) -> float:
+        """
+        Minimum temperature difference between the streams
+        (approach temperature at the pinch point) [K].
+        It is negative if the temperature profiles cross.
+        """
+        return min(self.temperature_differences)
+
+    @property
+    def pinch_heat_flow(self) -> float:
+        """Heat flow transferred from the hot inlet end to the pinch point [W]."""
+        differences = self.temperature_differences
+        return self.heat_flows[differences.index(min(differences))]
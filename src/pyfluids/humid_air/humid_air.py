@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+from threading import Lock
 
 from CoolProp.HumidAirProp import HAPropsSI
 
 from ..config import UnitConverter, UnitsSystem
+from ..config.fork_safety import reinit_after_fork
 from ..io import InputHumidAir, OutputsValidator
 
 __all__ = ["HumidAir"]
@@ -13,6 +15,10 @@ __all__ = ["HumidAir"]
 class HumidAir:
     """Real humid air (see ASHRAE RP-1485)."""
 
+    # CoolProp humid air routines share global state,
+    # so they should not be called concurrently without the GIL
+    __lock: Lock = Lock()
+
     def __init__(self):
         """Real humid air (see ASHRAE RP-1485)."""
         self._inputs: list[InputHumidAir] = []
@@ -510,22 +516,26 @@ class HumidAir:
         cached_input = next(
             (i for i in self._inputs if i.coolprop_key == coolprop_key), None
         )
-        value = (
-            cached_input.value
-            if cached_input is not None
-            else HAPropsSI(
-                coolprop_key,
-                self._inputs[0].coolprop_key,
-                self._inputs[0].value,
-                self._inputs[1].coolprop_key,
-                self._inputs[1].value,
-                self._inputs[2].coolprop_key,
-                self._inputs[2].value,
-            )
-        )
+        if cached_input is not None:
+            value = cached_input.value
+        else:
+            with HumidAir.__lock:
+                value = HAPropsSI(
+                    coolprop_key,
+                    self._inputs[0].coolprop_key,
+                    self._inputs[0].value,
+                    self._inputs[1].coolprop_key,
+                    self._inputs[1].value,
+                    self._inputs[2].coolprop_key,
+                    self._inputs[2].value,
+                )
         OutputsValidator(value).validate()
         return value
 
+    @classmethod
+    def _reinit_lock(cls):
+        cls.__lock = Lock()
+
     def __eq__(self, other: HumidAir) -> bool:
         return isinstance(other, HumidAir) and hash(self) == hash(other)
 
@@ -657,3 +667,6 @@ class HumidAir:
     def __check_pressure_drop(pressure_drop: float):
         if pressure_drop < 0:
             raise ValueError("Invalid pressure drop in the heat exchanger!")
+
+
+reinit_after_fork(HumidAir._reinit_lock)
@@ -1,5 +1,8 @@
 from .input import *
 from .input_humid_air import *
 from .outputs_validator import *
+from .target import *
 
-__all__ = input.__all__ + input_humid_air.__all__ + outputs_validator.__all__
+__all__ = (
+    input.__all__ + input_humid_air.__all__ + outputs_validator.__all__ + target.__all__
+)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import CoolProp
+
+from .abstract_input import AbstractInput
+from ..config import UnitConverter
+
+__all__ = ["Target"]
+
+
+class Target(AbstractInput):
+    """CoolProp keyed target value of the fluid or mixture output."""
+
+    def __init__(self, coolprop_key: int, value: float):
+        """
+        CoolProp keyed target value of the fluid or mixture output.
+
+        :param coolprop_key: CoolProp internal key.
+        :param value: Target value in SI units.
+        """
+        super().__init__(coolprop_key, value)
+
+    @classmethod
+    def compressibility(cls, value: float) -> Target:
+        """
+        Compressibility factor.
+
+        :param value: The target value [-].
+        :return: Compressibility factor for the target.
+        """
+        return cls(CoolProp.iZ, value)
+
+    @classmethod
+    def conductivity(cls, value: float) -> Target:
+        """
+        Thermal conductivity.
+
+        :param value: The target value [W/m/K].
+        :return: Thermal conductivity for the target.
+        """
+        return cls(CoolProp.iconductivity, value)
+
+    @classmethod
+    def density(cls, value: float) -> Target:
+        """
+        Mass density.
+
+        :param value: The target value [kg/m3].
+        :return: Mass density for the target.
+        """
+        return cls(CoolProp.iDmass, value)
+
+    @classmethod
+    def dynamic_viscosity(cls, value: float) -> Target:
+        """
+        Dynamic viscosity.
+
+        :param value: The target value [Pa*s].
+        :return: Dynamic viscosity for the target.
+        """
+        return cls(CoolProp.iviscosity, value)
+
+    @classmethod
+    def enthalpy(cls, value: float) -> Target:
+        """
+        Mass specific enthalpy.
+
+        :param value: The target value [J/kg].
+        :return: Mass specific enthalpy for the target.
+        """
+        return cls(CoolProp.iHmass, value)
+
+    @classmethod
+    def entropy(cls, value: float) -> Target:
+        """
+        Mass specific entropy.
+
+        :param value: The target value [J/kg/K].
+        :return: Mass specific entropy for the target.
+        """
+        return cls(CoolProp.iSmass, value)
+
+    @classmethod
+    def internal_energy(cls, value: float) -> Target:
+        """
+        Mass specific internal energy.
+
+        :param value: The target value [J/kg].
+        :return: Mass specific internal energy for the target.
+        """
+        return cls(CoolProp.iUmass, value)
+
+    @classmethod
+    def prandtl(cls, value: float) -> Target:
+        """
+        Prandtl number.
+
+        :param value: The target value [-].
+        :return: Prandtl number for the target.
+        """
+        return cls(CoolProp.iPrandtl, value)
+
+    @classmethod
+    def pressure(cls, value: float) -> Target:
+        """
+        Absolute pressure.
+
+        :param value: The target value [Pa].
+        :return: Absolute pressure for the target.
+        """
+        return cls(CoolProp.iP, value)
+
+    @classmethod
+    def sound_speed(cls, value: float) -> Target:
+        """
+        Sound speed.
+
+        :param value: The target value [m/s].
+        :return: Sound speed for the target.
+        """
+        return cls(CoolProp.ispeed_sound, value)
+
+    @classmethod
+    def specific_heat(cls, value: float) -> Target:
+        """
+        Mass specific constant pressure specific heat.
+
+        :param value: The target value [J/kg/K].
+        :return: Mass specific constant pressure specific heat for the target.
+        """
+        return cls(CoolProp.iCpmass, value)
+
+    @classmethod
+    def specific_volume(cls, value: float) -> Target:
+        """
+        Mass specific volume.
+
+        :param value: The target value [m3/kg].
+        :return: Mass specific volume for the target.
+        """
+        return cls(CoolProp.iDmass, 1 / value)
+
+    @classmethod
+    def temperature(cls, value: float) -> Target:
+        """
+        Temperature.
+
+        :param value: The target value
+            [by default, °C; you can change this using the configuration file].
+        :return: Temperature for the target.
+        """
+        return cls(CoolProp.iT, UnitConverter().convert_temperature_to_si(value))
@@ -0,0 +1,11 @@
+from .property_server import *
+from .request_coalescer import *
+from .server_metrics import *
+from .state_request import *
+
+__all__ = (
+    property_server.__all__
+    + request_coalescer.__all__
+    + server_metrics.__all__
+    + state_request.__all__
+)
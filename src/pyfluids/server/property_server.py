@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import BaseServer
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Any, Hashable, Union
+
+from .request_coalescer import RequestCoalescer
+from .server_metrics import ServerMetrics
+from .state_request import StateRequest
+from ..batch import BatchEvaluator, PrototypeSpec, SupervisedEvaluator
+from ..enums import Phases
+from ..fluids.abstract_fluid import AbstractFluid
+from ..humid_air import HumidAir
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    from socketserver import ThreadingUnixStreamServer
+except ImportError:  # pragma: no cover
+    ThreadingUnixStreamServer = None
+
+__all__ = ["PropertyServer"]
+
+Prototype = Union[AbstractFluid, HumidAir]
+
+
+class PropertyServer:
+    """Local property server with batched requests and pooled backends."""
+
+    NDJSON: str = "application/x-ndjson"
+    MSGPACK: str = "application/msgpack"
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        unix_socket: str | None = None,
+        max_workers: int | None = None,
+        coalescing_window: float = 0.002,
+        max_batch_size: int = 4096,
+        cache_size: int = 100000,
+        latency_budget: float | None = None,
+    ):
+        """
+        Local property server with batched requests and pooled backends.
+
+        Endpoints:
+
+        - ``POST /evaluate`` - evaluates the batch of state requests
+          (see `StateRequest.from_dict`), sent as NDJSON (one request per line)
+          or as a msgpack list (if the `msgpack` package is installed and the
+          "Content-Type" header is "application/msgpack"). The response has
+          the same format, with one result per request:
+          ``{"id": ..., "outputs": {...}}`` or ``{"id": ..., "error": "..."}``;
+        - ``GET /metrics`` - throughput and latency metrics as JSON.
+
+        Concurrent requests are coalesced into batch evaluations.
+        The fluid instances (with their CoolProp backends) are kept warm,
+        and the results are cached between the requests.
+
+        :param host: Host to listen on (optional). By default, localhost.
+        :param port: TCP port to listen on (optional).
+            By default, an arbitrary free port.
+        :param unix_socket: Path of the Unix socket to listen on (optional).
+            If provided, host and port are ignored.
+        :param max_workers: Maximum number of evaluation threads (optional).
+        :param coalescing_window: Coalescing window of concurrent requests [s]
+            (optional).
+        :param max_batch_size: Maximum number of states per batch (optional).
+        :param cache_size: Maximum number of cached results (optional).
+        :param latency_budget: Latency budget of a single state evaluation [s]
+            (optional). If provided, the states are evaluated by supervised
+            worker processes (see `SupervisedEvaluator`), and the states which
+            exceed the budget are reported as errors. The histograms of the
+            evaluation time by inputs pair are added to the metrics.
+        :raises ValueError: If settings are invalid.
+        """
+        if cache_size < 0:
+            raise ValueError("Invalid cache size! It should be non-negative.")
+        if unix_socket is not None and ThreadingUnixStreamServer is None:
+            raise ValueError("Unix sockets are not supported on this platform!")
+        self.__evaluator: BatchEvaluator | SupervisedEvaluator = (
+            SupervisedEvaluator(latency_budget, max_workers or 1)
+            if latency_budget is not None
+            else BatchEvaluator(max_workers, keep_instances=True)
+        )
+        self.__metrics: ServerMetrics = ServerMetrics()
+        self.__coalescer: RequestCoalescer = RequestCoalescer(
+            self.__evaluator,
+            coalescing_window,
+            max_batch_size,
+            self.__metrics.record_batch,
+        )
+        self.__prototypes: dict[PrototypeSpec, Prototype] = {}
+        self.__cache: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
+        self.__cache_size: int = cache_size
+        self.__lock: Lock = Lock()
+        self.__unix_socket: str | None = unix_socket
+        self.__server: BaseServer = self.__create_server(host, port)
+        self.__thread: Thread | None = None
+
+    def __enter__(self) -> PropertyServer:
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+    @property
+    def address(self) -> tuple[str, int] | str:
+        """Address of the server (host and port or path of the Unix socket)."""
+        return self.__unix_socket or self.__server.server_address[:2]
+
+    @property
+    def url(self) -> str | None:
+        """URL of the server (None for the Unix socket)."""
+        if self.__unix_socket is not None:
+            return None
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Throughput and latency metrics."""
+        metrics: dict[str, Any] = self.__metrics.as_dict()
+        if isinstance(self.__evaluator, SupervisedEvaluator):
+            metrics["timeouts"] = self.__evaluator.timeouts
+            metrics["durations"] = self.__evaluator.histogram.as_dict()
+        return metrics
+
+    def start(self) -> PropertyServer:
+        """
+        Starts serving in a background thread.
+
+        :return: Current server instance.
+        """
+        if self.__thread is None:
+            self.__thread = Thread(
+                target=self.__server.serve_forever, name="pyfluids-server", daemon=True
+            )
+            self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and releases all the resources."""
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.__server.server_close()
+        self.__coalescer.close()
+        if isinstance(self.__evaluator, SupervisedEvaluator):
+            self.__evaluator.close()
+        else:
+            self.__evaluator.release_instances()
+        if self.__unix_socket is not None and os.path.exists(self.__unix_socket):
+            os.remove(self.__unix_socket)
+
+    def evaluate(self, requests: list[Any]) -> list[dict[str, Any]]:
+        """
+        Evaluates the batch of state requests.
+
+        :param requests: Requests as dicts (see `StateRequest.from_dict`).
+        :return: Results for each request.
+        """
+        start = perf_counter()
+        results: list[dict[str, Any] | None] = [None] * len(requests)
+        pending, cache_hits = [], 0
+        for index, data in enumerate(requests):
+            request_id = data.get("id") if isinstance(data, dict) else None
+            try:
+                request = StateRequest.from_dict(data)
+                prototype = self.__prototype(request.prototype)
+            except ValueError as e:
+                results[index] = {"id": request_id, "error": str(e)}
+                continue
+            cache_key = self.__cache_key(request)
+            cached = self.__cached(cache_key)
+            if cached is not None:
+                cache_hits += 1
+                results[index] = {"id": request.id, "outputs": cached}
+                continue
+            try:
+                future = self.__coalescer.submit(
+                    prototype, request.inputs, request.outputs
+                )
+            except RuntimeError as e:
+                results[index] = {"id": request.id, "error": str(e)}
+                continue
+            pending.append((index, request, cache_key, future))
+        for index, request, cache_key, future in pending:
+            try:
+                outputs = future.result()
+            except (ValueError, RuntimeError) as e:
+                results[index] = {"id": request.id, "error": str(e)}
+                continue
+            if outputs is None:
+                results[index] = {
+                    "id": request.id,
+                    "error": "Invalid or not defined state!",
+                }
+                continue
+            if SupervisedEvaluator.timed_out(outputs):
+                results[index] = {"id": request.id, "error": "Latency budget exceeded!"}
+                continue
+            outputs = {key: self.__serializable(i) for key, i in outputs.items()}
+            self.__cache_result(cache_key, outputs)
+            results[index] = {"id": request.id, "outputs": outputs}
+        self.__metrics.record_request(
+            len(requests),
+            sum(1 for i in results if "error" in i),
+            cache_hits,
+            perf_counter() - start,
+        )
+        return results
+
+    def __create_server(self, host: str, port: int) -> BaseServer:
+        server = self
+
+        class Handler(_RequestHandler):
+            property_server = server
+
+        if self.__unix_socket is not None:
+            if os.path.exists(self.__unix_socket):
+                os.remove(self.__unix_socket)
+            unix_server = ThreadingUnixStreamServer(self.__unix_socket, Handler)
+            unix_server.daemon_threads = True
+            return unix_server
+        tcp_server = ThreadingHTTPServer((host, port), Handler)
+        tcp_server.daemon_threads = True
+        return tcp_server
+
+    def __prototype(self, spec: PrototypeSpec) -> Prototype:
+        with self.__lock:
+            prototype = self.__prototypes.get(spec)
+        if prototype is not None:
+            return prototype
+        prototype = spec.create()
+        with self.__lock:
+            return self.__prototypes.setdefault(spec, prototype)
+
+    def __cached(self, key: Hashable) -> dict[str, Any] | None:
+        if self.__cache_size == 0:
+            return None
+        with self.__lock:
+            outputs = self.__cache.get(key)
+            if outputs is not None:
+                self.__cache.move_to_end(key)
+            return outputs
+
+    def __cache_result(self, key: Hashable, outputs: dict[str, Any]):
+        if self.__cache_size == 0:
+            return
+        with self.__lock:
+            self.__cache[key] = outputs
+            self.__cache.move_to_end(key)
+            while len(self.__cache) > self.__cache_size:
+                self.__cache.popitem(last=False)
+
+    @staticmethod
+    def __cache_key(request: StateRequest) -> Hashable:
+        return (
+            request.prototype,
+            tuple((i.coolprop_key, i.value) for i in request.inputs),
+            request.outputs,
+        )
+
+    @staticmethod
+    def __serializable(value: Any) -> Any:
+        return value.name if isinstance(value, Phases) else value
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    property_server: PropertyServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.__send(404, "application/json", b'{"error": "Not found!"}')
+            return
+        self.__send(
+            200,
+            "application/json",
+            json.dumps(self.property_server.metrics).encode("utf-8"),
+        )
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/evaluate":
+            self.__send(404, "application/json", b'{"error": "Not found!"}')
+            return
+        content_type = self.headers.get("Content-Type", PropertyServer.NDJSON)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        use_msgpack = content_type.startswith(PropertyServer.MSGPACK)
+        if use_msgpack and msgpack is None:
+            self.__send(
+                415,
+                "application/json",
+                b'{"error": "Install the msgpack package to use msgpack!"}',
+            )
+            return
+        try:
+            requests = (
+                msgpack.unpackb(body)
+                if use_msgpack
+                else [json.loads(line) for line in body.splitlines() if line.strip()]
+            )
+            if not isinstance(requests, list):
+                raise ValueError("Invalid batch! It should be a list of requests.")
+        except ValueError as e:
+            self.__send(
+                400, "application/json", json.dumps({"error": str(e)}).encode("utf-8")
+            )
+            return
+        results = self.property_server.evaluate(requests)
+        if use_msgpack:
+            self.__send(200, PropertyServer.MSGPACK, msgpack.packb(results))
+        else:
+            self.__send(
+                200,
+                PropertyServer.NDJSON,
+                "".join(json.dumps(i) + "\n" for i in results).encode("utf-8"),
+            )
+
+    def log_message(self, *_):
+        pass
+
+    def address_string(self) -> str:
+        return str(self.client_address or "unix")
+
+    def __send(self, code: int, content_type: str, body: bytes):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
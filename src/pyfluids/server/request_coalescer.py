@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from queue import Empty, Queue
+from threading import Thread
+from time import monotonic
+from typing import Any, Callable, Sequence, Union
+
+from ..batch import BatchEvaluator, SupervisedEvaluator
+from ..fluids.abstract_fluid import AbstractFluid
+from ..humid_air import HumidAir
+from ..io.abstract_input import AbstractInput
+
+__all__ = ["RequestCoalescer"]
+
+Prototype = Union[AbstractFluid, HumidAir]
+
+
+class RequestCoalescer:
+    """Coalesces concurrent state requests into batch evaluations."""
+
+    def __init__(
+        self,
+        evaluator: BatchEvaluator | SupervisedEvaluator,
+        window: float = 0.002,
+        max_batch_size: int = 4096,
+        on_batch: Callable[[int], None] | None = None,
+    ):
+        """
+        Coalesces concurrent state requests into batch evaluations.
+
+        The dispatcher thread waits for the first request, then collects
+        all requests submitted within the coalescing window
+        (or until the batch is full), and evaluates them
+        with one batch call per fluid and set of outputs.
+
+        :param evaluator: Batch evaluator (with or without a latency budget).
+        :param window: Coalescing window [s] (optional).
+        :param max_batch_size: Maximum number of states per batch (optional).
+        :param on_batch: Callback invoked with the size of each batch (optional).
+        :raises ValueError: If coalescing window or maximum batch size is invalid.
+        """
+        if window < 0:
+            raise ValueError("Invalid coalescing window! It should be non-negative.")
+        if max_batch_size < 1:
+            raise ValueError("Invalid maximum batch size! It should be positive.")
+        self.__evaluator: BatchEvaluator | SupervisedEvaluator = evaluator
+        self.__window: float = window
+        self.__max_batch_size: int = max_batch_size
+        self.__on_batch: Callable[[int], None] | None = on_batch
+        self.__queue: Queue = Queue()
+        self.__dispatcher: Thread = Thread(
+            target=self.__dispatch, name="pyfluids-coalescer", daemon=True
+        )
+        self.__closed: bool = False
+        self.__dispatcher.start()
+
+    @property
+    def window(self) -> float:
+        """Coalescing window [s]."""
+        return self.__window
+
+    @property
+    def max_batch_size(self) -> int:
+        """Maximum number of states per batch."""
+        return self.__max_batch_size
+
+    def submit(
+        self,
+        prototype: Prototype,
+        inputs: Sequence[AbstractInput],
+        outputs: Sequence[str],
+    ) -> Future:
+        """
+        Submits the state request.
+
+        :param prototype: Fluid, mixture or humid air instance
+            used as a template for the state.
+        :param inputs: Inputs which define the state.
+        :param outputs: Names of properties to be evaluated.
+        :return: Future with the values of properties (None for invalid state).
+        :raises RuntimeError: If the coalescer is closed.
+        """
+        if self.__closed:
+            raise RuntimeError("The request coalescer is closed!")
+        future = Future()
+        self.__queue.put((prototype, tuple(inputs), tuple(outputs), future))
+        return future
+
+    def close(self):
+        """Stops the dispatcher after all submitted requests are evaluated."""
+        if not self.__closed:
+            self.__closed = True
+            self.__queue.put(None)
+            self.__dispatcher.join()
+
+    def __dispatch(self):
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                return
+            batch, stop = [item], False
+            deadline = monotonic() + self.__window
+            while len(batch) < self.__max_batch_size:
+                try:
+                    item = self.__queue.get(timeout=max(0.0, deadline - monotonic()))
+                except Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self.__evaluate(batch)
+            if stop:
+                return
+
+    def __evaluate(self, batch: list[tuple]):
+        groups: dict[tuple, list[tuple]] = {}
+        for item in batch:
+            groups.setdefault((id(item[0]), item[2]), []).append(item)
+        for items in groups.values():
+            prototype, _, outputs, _ = items[0]
+            try:
+                results: list[Any] = self.__evaluator.evaluate(
+                    prototype, [item[1] for item in items], outputs
+                )
+            except Exception as e:
+                for item in items:
+                    item[3].set_exception(e)
+                continue
+            if self.__on_batch is not None:
+                self.__on_batch(len(items))
+            for item, result in zip(items, results):
+                item[3].set_result(result)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import deque
+from threading import Lock
+from time import monotonic
+
+__all__ = ["ServerMetrics"]
+
+
+class ServerMetrics:
+    """Throughput and latency metrics of the property server."""
+
+    def __init__(self, window: int = 10000):
+        """
+        Throughput and latency metrics of the property server.
+
+        :param window: Number of the latest requests
+            used to calculate the latency percentiles (optional).
+        """
+        self.__started: float = monotonic()
+        self.__requests: int = 0
+        self.__states: int = 0
+        self.__errors: int = 0
+        self.__cache_hits: int = 0
+        self.__batches: int = 0
+        self.__batched_states: int = 0
+        self.__latencies: deque[float] = deque(maxlen=window)
+        self.__lock: Lock = Lock()
+
+    def record_request(self, states: int, errors: int, cache_hits: int, latency: float):
+        """
+        Records the served request.
+
+        :param states: Number of requested states.
+        :param errors: Number of invalid states.
+        :param cache_hits: Number of states served from the cache.
+        :param latency: Request latency [s].
+        """
+        with self.__lock:
+            self.__requests += 1
+            self.__states += states
+            self.__errors += errors
+            self.__cache_hits += cache_hits
+            self.__latencies.append(latency)
+
+    def record_batch(self, states: int):
+        """
+        Records the batch evaluation.
+
+        :param states: Number of states in the batch.
+        """
+        with self.__lock:
+            self.__batches += 1
+            self.__batched_states += states
+
+    def as_dict(self) -> dict[str, float]:
+        """Converts the metrics to a dict."""
+        with self.__lock:
+            uptime = monotonic() - self.__started
+            latencies = sorted(self.__latencies)
+            return {
+                "uptime": uptime,
+                "requests": self.__requests,
+                "states": self.__states,
+                "errors": self.__errors,
+                "cache_hits": self.__cache_hits,
+                "batches": self.__batches,
+                "mean_batch_size": (
+                    self.__batched_states / self.__batches if self.__batches else 0
+                ),
+                "throughput": self.__states / uptime if uptime > 0 else 0,
+                "latency_p50": self.__percentile(latencies, 0.5),
+                "latency_p90": self.__percentile(latencies, 0.9),
+                "latency_p99": self.__percentile(latencies, 0.99),
+            }
+
+    @staticmethod
+    def __percentile(values: list[float], rank: float) -> float:
+        if not values:
+            return 0
+        return values[min(len(values) - 1, int(rank * len(values)))]
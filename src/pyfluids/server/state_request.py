@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from ..batch import PrototypeSpec
+from ..enums import FluidsList, Phases
+from ..io import Input, InputHumidAir
+from ..io.abstract_input import AbstractInput
+
+__all__ = ["StateRequest"]
+
+
+@dataclass(frozen=True)
+class StateRequest:
+    """Request for the properties of the fluid, mixture or humid air state."""
+
+    id: Any
+    prototype: PrototypeSpec
+    inputs: tuple[AbstractInput, ...]
+    outputs: tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StateRequest:
+        """
+        Parses the request.
+
+        Examples of requests (the values are in the configured units system;
+        inputs are the names of the `Input` or `InputHumidAir` factory methods,
+        outputs are the names of properties):
+
+        - ``{"id": 1, "fluid": {"name": "Water"}, "inputs": {"pressure": 101325,
+          "temperature": 20}, "outputs": ["density"]}``;
+        - ``{"id": 2, "fluid": {"name": "MPG", "fraction": 60, "phase": "Liquid"},
+          "inputs": {...}, "outputs": [...]}``;
+        - ``{"id": 3, "mixture": {"fluids": ["Argon", "IsoButane"],
+          "fractions": [50, 50], "coolprop_backend": "PR"}, "inputs": {...},
+          "outputs": [...]}``;
+        - ``{"id": 4, "humid_air": {}, "inputs": {"altitude": 0,
+          "temperature": 20, "relative_humidity": 50}, "outputs": [...]}``.
+
+        :param data: Request as a dict.
+        :return: Parsed request.
+        :raises ValueError: If request is invalid.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Invalid request! It should be an object.")
+        kinds = [kind for kind in ("fluid", "mixture", "humid_air") if kind in data]
+        if len(kinds) != 1:
+            raise ValueError(
+                "Invalid request! It should contain one of the keys: "
+                "'fluid', 'mixture' or 'humid_air'."
+            )
+        kind = kinds[0]
+        spec = data[kind] if isinstance(data[kind], dict) else {}
+        input_type = InputHumidAir if kind == "humid_air" else Input
+        inputs = data.get("inputs")
+        outputs = data.get("outputs")
+        if not isinstance(inputs, dict) or not inputs:
+            raise ValueError("Invalid request! Inputs should be a non-empty object.")
+        if (
+            not isinstance(outputs, list)
+            or not outputs
+            or not all(isinstance(i, str) for i in outputs)
+        ):
+            raise ValueError(
+                "Invalid request! Outputs should be a non-empty list of names."
+            )
+        return cls(
+            data.get("id"),
+            cls.__prototype(kind, spec),
+            tuple(cls.__input(input_type, key, value) for key, value in inputs.items()),
+            tuple(outputs),
+        )
+
+    @staticmethod
+    def __prototype(kind: str, spec: dict[str, Any]) -> PrototypeSpec:
+        try:
+            phase = Phases[spec["phase"]] if spec.get("phase") is not None else None
+            if kind == "fluid":
+                if not isinstance(spec.get("fraction") or 0, (int, float)):
+                    raise TypeError("fraction should be a number")
+                if not isinstance(spec.get("coolprop_backend") or "", str):
+                    raise TypeError("coolprop_backend should be a string")
+                return PrototypeSpec(
+                    kind,
+                    FluidsList[spec["name"]],
+                    spec.get("fraction"),
+                    spec.get("coolprop_backend"),
+                    phase=phase,
+                )
+            if kind == "mixture":
+                if not all(isinstance(i, (int, float)) for i in spec["fractions"]):
+                    raise TypeError("fractions should be numbers")
+                if not isinstance(spec.get("coolprop_backend") or "", str):
+                    raise TypeError("coolprop_backend should be a string")
+                return PrototypeSpec(
+                    kind,
+                    coolprop_backend=spec.get("coolprop_backend"),
+                    fluids=tuple(FluidsList[i] for i in spec["fluids"]),
+                    fractions=tuple(spec["fractions"]),
+                    phase=phase,
+                )
+            return PrototypeSpec(kind)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid {kind} specification: {e}!") from e
+
+    @staticmethod
+    def __input(input_type: type, key: str, value: Any) -> AbstractInput:
+        factory = getattr(input_type, key, None)
+        if key.startswith("_") or not callable(factory):
+            raise ValueError(f"Invalid input: {key}!")
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise ValueError(f"Invalid value of the input: {key}!")
+        return factory(value)
@@ -0,0 +1,4 @@
+from .chebyshev_surrogate import *
+from .quadtree_table import *
+
+__all__ = chebyshev_surrogate.__all__ + quadtree_table.__all__
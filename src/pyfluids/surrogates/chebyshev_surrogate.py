@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import json
+from math import cos, log, pi
+from typing import Any, Callable, Sequence
+
+import CoolProp
+import numpy as np
+from numpy.polynomial.chebyshev import chebvander
+
+from ..enums import Phases
+from ..fluids.abstract_fluid import AbstractFluid
+from ..io import Input
+
+__all__ = ["ChebyshevSurrogate"]
+
+# Bounds of the patch in the scaled inputs (first min, first max, second min, ...)
+Patch = tuple[float, float, float, float]
+
+
+class ChebyshevSurrogate:
+    """Piecewise Chebyshev surrogate model of the single-phase properties."""
+
+    # Properties, whose zero is arbitrary (their errors are related
+    # to the maximum magnitude on the patch instead of the pointwise values)
+    __OFFSET_PROPERTIES: tuple[str, ...] = (
+        "enthalpy",
+        "entropy",
+        "internal_energy",
+        "temperature",
+    )
+
+    def __init__(
+        self,
+        inputs: Sequence[str],
+        properties: Sequence[str],
+        bounds: np.ndarray,
+        coefficients: np.ndarray,
+        max_error: float,
+    ):
+        """
+        Piecewise Chebyshev surrogate model of the single-phase properties
+        over the rectangle of two inputs (use `fit` to build it).
+
+        The rectangle is split into the patches (the leaves of the quadtree),
+        and each property on each patch is the tensor product
+        Chebyshev expansion of the scaled inputs
+        (the pressure is scaled logarithmically).
+
+        :param inputs: Names of the `Input` factory methods
+            of the first and second inputs (e.g., 'pressure', 'temperature').
+        :param properties: Names of the approximated properties.
+        :param bounds: Bounds of the patches in the configured units system
+            (first min, first max, second min, second max for each patch).
+        :param coefficients: Chebyshev coefficients of each patch
+            (the shape is patches × (degree + 1) × (degree + 1) × properties).
+        :param max_error: Maximum relative error on the validation grid.
+        :raises ValueError: If inputs, properties or arrays are invalid.
+        """
+        if len(inputs) != 2 or not all(
+            callable(getattr(Input, key, None)) for key in inputs
+        ):
+            raise ValueError("Invalid inputs! They should be two Input factories.")
+        invalid = [
+            key
+            for key in properties
+            if not isinstance(getattr(AbstractFluid, key, None), property)
+        ]
+        if not properties or invalid:
+            raise ValueError(f"Invalid properties: {', '.join(invalid)}!")
+        bounds = np.asarray(bounds, dtype=float)
+        coefficients = np.asarray(coefficients, dtype=float)
+        if (
+            bounds.ndim != 2
+            or bounds.shape[1] != 4
+            or coefficients.ndim != 4
+            or coefficients.shape[0] != bounds.shape[0]
+            or coefficients.shape[1] != coefficients.shape[2]
+            or coefficients.shape[3] != len(properties)
+            or bounds.shape[0] == 0
+        ):
+            raise ValueError("Invalid shapes of bounds or coefficients!")
+        self.__inputs: tuple[str, str] = (inputs[0], inputs[1])
+        self.__properties: tuple[str, ...] = tuple(properties)
+        self.__bounds: np.ndarray = bounds
+        self.__coefficients: np.ndarray = coefficients
+        self.__max_error: float = max_error
+        self.__logarithmic: tuple[bool, bool] = (
+            self.__is_pressure(getattr(Input, inputs[0])),
+            self.__is_pressure(getattr(Input, inputs[1])),
+        )
+        self.__scaled_bounds: np.ndarray = np.column_stack(
+            [self.__scale(bounds[:, i], self.__logarithmic[i // 2]) for i in range(4)]
+        )
+        self.__build_index()
+
+    @classmethod
+    def fit(
+        cls,
+        fluid: AbstractFluid,
+        first_input: Callable[[float], Input],
+        first_range: tuple[float, float],
+        second_input: Callable[[float], Input],
+        second_range: tuple[float, float],
+        properties: Sequence[str],
+        tolerance: float = 1e-6,
+        degree: int = 12,
+        validation_points: int = 9,
+        max_depth: int = 4,
+    ) -> ChebyshevSurrogate:
+        """
+        Fits the surrogate model of the single-phase properties of the fluid
+        over the rectangle of two inputs (e.g., pressure and temperature
+        or pressure and enthalpy).
+
+        The properties are evaluated on the Chebyshev nodes of the patch
+        (one flash calculation for each node), and the fitted expansions
+        are verified against the flash calculations on the uniform
+        validation grid. The patches, where the relative error exceeds
+        given tolerance, are split into four ones.
+        The relative errors of the enthalpy, entropy, internal energy
+        and temperature are related to their maximum magnitude on the patch,
+        since their zero is arbitrary.
+
+        All the states are evaluated on a single new instance of the fluid
+        (with the same specified phase).
+
+        :param fluid: Fluid or mixture instance.
+        :param first_input: Factory of the first input (e.g., `Input.pressure`).
+        :param first_range: Range of the first input
+            [in the configured units system].
+        :param second_input: Factory of the second input
+            (e.g., `Input.temperature`).
+        :param second_range: Range of the second input
+            [in the configured units system].
+        :param properties: Names of properties to be approximated.
+        :param tolerance: Relative tolerance (optional, by default, 1e-6).
+        :param degree: Degree of the Chebyshev expansions
+            (optional, by default, 12).
+        :param validation_points: Number of validation points along each input
+            on each patch (optional, by default, 9).
+        :param max_depth: Maximum number of patch splits
+            (optional, by default, 4).
+        :return: Fitted surrogate model.
+        :raises ValueError: If any input is invalid, the rectangle contains
+            two-phase states or the tolerance cannot be met.
+        """
+        if not tolerance > 0:
+            raise ValueError("Invalid tolerance! It should be positive.")
+        if degree < 1:
+            raise ValueError("Invalid degree! It should be at least 1.")
+        if validation_points < 1:
+            raise ValueError("Invalid number of validation points!")
+        if max_depth < 0:
+            raise ValueError("Invalid maximum depth! It should be non-negative.")
+        invalid = [
+            key
+            for key in properties
+            if not isinstance(getattr(fluid.__class__, key, None), property)
+        ]
+        if not properties or invalid:
+            raise ValueError(f"Invalid properties: {', '.join(invalid)}!")
+        logarithmic = (cls.__is_pressure(first_input), cls.__is_pressure(second_input))
+        ranges = (tuple(first_range), tuple(second_range))
+        for i in range(2):
+            if not ranges[i][0] < ranges[i][1] or (
+                logarithmic[i] and not ranges[i][0] > 0
+            ):
+                raise ValueError(
+                    "Invalid ranges! They should be increasing "
+                    "(and positive for the pressure)."
+                )
+        instance = fluid.factory()
+        if fluid._specified_phase is not None:
+            instance.specify_phase(fluid._specified_phase)
+        offsets = np.array([key in cls.__OFFSET_PROPERTIES for key in properties])
+        nodes = np.array(
+            [cos(pi * (i + 0.5) / (degree + 1)) for i in range(degree + 1)]
+        )
+        vandermonde = chebvander(nodes, degree)
+        validation = np.array(
+            [2 * (i + 0.5) / validation_points - 1 for i in range(validation_points)]
+        )
+
+        def unscale(u: np.ndarray, low: float, high: float, index: int) -> list:
+            t = 0.5 * (low + high) + 0.5 * (high - low) * u
+            return list(np.exp(t) if logarithmic[index] else t)
+
+        def sample(patch: Patch, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+            values = np.empty((len(first), len(second), len(properties)))
+            first_values = unscale(first, patch[0], patch[1], 0)
+            second_values = unscale(second, patch[2], patch[3], 1)
+            for i, x in enumerate(first_values):
+                for j, y in enumerate(second_values):
+                    instance.update(first_input(x), second_input(y))
+                    if instance.phase == Phases.TwoPhase:
+                        raise ValueError(
+                            "Invalid ranges! The rectangle "
+                            "should contain only single-phase states."
+                        )
+                    for k, key in enumerate(properties):
+                        value = getattr(instance, key)
+                        values[i, j, k] = value if value is not None else np.nan
+            return values
+
+        patches: list[Patch] = []
+        fits: list[np.ndarray] = []
+        max_error = 0.0
+        scaled = [cls.__scale(np.array(ranges[i]), logarithmic[i]) for i in range(2)]
+        queue: list[tuple[Patch, int]] = [((*scaled[0], *scaled[1]), 0)]
+        while queue:
+            patch, depth = queue.pop()
+            samples = sample(patch, nodes, nodes)
+            if np.isnan(samples).any():
+                raise ValueError(
+                    "Unable to evaluate properties on the Chebyshev nodes!"
+                )
+            coefficients = np.einsum(
+                "ia,jb,abk->ijk",
+                np.linalg.inv(vandermonde),
+                np.linalg.inv(vandermonde),
+                samples,
+            )
+            expected = sample(patch, validation, validation)
+            actual = cls.__chebyshev(validation, validation, coefficients)
+            scale = np.where(
+                offsets,
+                np.abs(expected).max(axis=(0, 1)),
+                np.abs(expected),
+            )
+            error = float((np.abs(actual - expected) / scale).max())
+            if error > tolerance and depth < max_depth:
+                first_middle = 0.5 * (patch[0] + patch[1])
+                second_middle = 0.5 * (patch[2] + patch[3])
+                queue.extend(
+                    ((*first, *second), depth + 1)
+                    for first in ((patch[0], first_middle), (first_middle, patch[1]))
+                    for second in ((patch[2], second_middle), (second_middle, patch[3]))
+                )
+                continue
+            if not error <= tolerance:
+                raise ValueError(
+                    f"Unable to meet the tolerance! "
+                    f"Maximum relative error = {error:g}."
+                )
+            patches.append(patch)
+            fits.append(coefficients)
+            max_error = max(max_error, error)
+        scaled_bounds = np.array(patches)
+        bounds = np.empty_like(scaled_bounds)
+        for i in range(2):
+            columns = scaled_bounds[:, 2 * i : 2 * i + 2]
+            bounds[:, 2 * i : 2 * i + 2] = np.where(
+                columns == scaled[i][0],
+                ranges[i][0],
+                np.where(
+                    columns == scaled[i][1],
+                    ranges[i][1],
+                    np.exp(columns) if logarithmic[i] else columns,
+                ),
+            )
+        return cls(
+            [first_input.__name__, second_input.__name__],
+            properties,
+            bounds,
+            np.array(fits),
+            max_error,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ChebyshevSurrogate:
+        """
+        Restores the surrogate model from a dict (see `as_dict`).
+
+        :param data: Surrogate model as a dict.
+        :return: Restored surrogate model.
+        :raises ValueError: If data is invalid.
+        """
+        try:
+            return cls(
+                data["inputs"],
+                data["properties"],
+                np.array(data["bounds"], dtype=float),
+                np.array(data["coefficients"], dtype=float),
+                float(data["max_error"]),
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError("Invalid surrogate model data!") from e
+
+    @classmethod
+    def from_json(cls, value: str) -> ChebyshevSurrogate:
+        """
+        Restores the surrogate model from a JSON string (see `as_json`).
+
+        :param value: Surrogate model as a JSON string.
+        :return: Restored surrogate model.
+        :raises ValueError: If JSON string is invalid.
+        """
+        return cls.from_dict(json.loads(value))
+
+    @property
+    def inputs(self) -> tuple[str, str]:
+        """Names of the `Input` factory methods of the first and second inputs."""
+        return self.__inputs
+
+    @property
+    def properties(self) -> tuple[str, ...]:
+        """Names of the approximated properties."""
+        return self.__properties
+
+    @property
+    def degree(self) -> int:
+        """Degree of the Chebyshev expansions."""
+        return self.__coefficients.shape[1] - 1
+
+    @property
+    def patches(self) -> int:
+        """Number of patches."""
+        return self.__bounds.shape[0]
+
+    @property
+    def first_range(self) -> tuple[float, float]:
+        """Range of the first input [in the configured units system]."""
+        return float(self.__bounds[:, 0].min()), float(self.__bounds[:, 1].max())
+
+    @property
+    def second_range(self) -> tuple[float, float]:
+        """Range of the second input [in the configured units system]."""
+        return float(self.__bounds[:, 2].min()), float(self.__bounds[:, 3].max())
+
+    @property
+    def max_error(self) -> float:
+        """Maximum relative error on the validation grid."""
+        return self.__max_error
+
+    def evaluate(
+        self, first: float | np.ndarray, second: float | np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """
+        Evaluates the approximated properties (vectorized).
+
+        :param first: Values of the first input [in the configured units system].
+        :param second: Values of the second input
+            [in the configured units system].
+        :return: Values of each property
+            (the shape is the broadcast shape of the inputs;
+            NaN for the points outside of the rectangle).
+        """
+        first, second = np.broadcast_arrays(
+            np.asarray(first, dtype=float), np.asarray(second, dtype=float)
+        )
+        shape = first.shape
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = self.__scale(first.ravel(), self.__logarithmic[0])
+            y = self.__scale(second.ravel(), self.__logarithmic[1])
+        values = np.full((x.size, len(self.__properties)), np.nan)
+        patches = self.__locate(x, y)
+        order = np.argsort(patches, kind="stable")
+        indices, starts = np.unique(patches[order], return_index=True)
+        ends = np.append(starts[1:], order.size)
+        for index, start, end in zip(indices, starts, ends):
+            if index < 0:
+                continue
+            points = order[start:end]
+            low_x, high_x, low_y, high_y = self.__scaled_bounds[index]
+            u = (2 * x[points] - low_x - high_x) / (high_x - low_x)
+            v = (2 * y[points] - low_y - high_y) / (high_y - low_y)
+            values[points] = self.__chebyshev(
+                u, v, self.__coefficients[index], tensor=False
+            )
+        return {
+            key: values[:, i].reshape(shape) for i, key in enumerate(self.__properties)
+        }
+
+    def as_json(self, indented: bool = True) -> str:
+        """
+        Converts the surrogate model to a JSON string.
+
+        :param indented: True if indented.
+        :return: The surrogate model as a JSON string.
+        """
+        return json.dumps(
+            self.as_dict(), indent=4 if indented else None, default=str, sort_keys=False
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Converts the surrogate model to a dict."""
+        return {
+            "inputs": list(self.__inputs),
+            "properties": list(self.__properties),
+            "max_error": self.__max_error,
+            "bounds": self.__bounds.tolist(),
+            "coefficients": self.__coefficients.tolist(),
+        }
+
+    def __locate(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        low_x, high_x = (
+            self.__scaled_bounds[:, 0].min(),
+            self.__scaled_bounds[:, 1].max(),
+        )
+        low_y, high_y = (
+            self.__scaled_bounds[:, 2].min(),
+            self.__scaled_bounds[:, 3].max(),
+        )
+        cells = self.__index.shape[0]
+        inside = (x >= low_x) & (x <= high_x) & (y >= low_y) & (y <= high_y)
+        i = np.zeros(x.size, dtype=int)
+        j = np.zeros(y.size, dtype=int)
+        i[inside] = np.clip(
+            ((x[inside] - low_x) / (high_x - low_x) * cells).astype(int), 0, cells - 1
+        )
+        j[inside] = np.clip(
+            ((y[inside] - low_y) / (high_y - low_y) * cells).astype(int), 0, cells - 1
+        )
+        return np.where(inside, self.__index[i, j], -1)
+
+    def __build_index(self):
+        # The patches are the leaves of the quadtree, so the uniform grid
+        # of the smallest cells maps each point to its patch without search
+        bounds = self.__scaled_bounds
+        low_x, high_x = bounds[:, 0].min(), bounds[:, 1].max()
+        low_y, high_y = bounds[:, 2].min(), bounds[:, 3].max()
+        depth = int(
+            round(log((high_x - low_x) / (bounds[:, 1] - bounds[:, 0]).min(), 2))
+        )
+        cells = 2**depth
+        self.__index: np.ndarray = np.full((cells, cells), -1, dtype=int)
+        for index, (x_min, x_max, y_min, y_max) in enumerate(bounds):
+            self.__index[
+                round((x_min - low_x) / (high_x - low_x) * cells) : round(
+                    (x_max - low_x) / (high_x - low_x) * cells
+                ),
+                round((y_min - low_y) / (high_y - low_y) * cells) : round(
+                    (y_max - low_y) / (high_y - low_y) * cells
+                ),
+            ] = index
+
+    @staticmethod
+    def __chebyshev(
+        u: np.ndarray, v: np.ndarray, coefficients: np.ndarray, tensor: bool = True
+    ) -> np.ndarray:
+        degree = coefficients.shape[0] - 1
+        first, second = chebvander(u, degree), chebvander(v, degree)
+        partial = np.tensordot(first, coefficients, axes=(1, 0))
+        if tensor:
+            return np.einsum("aik,bi->abk", partial, second)
+        return np.einsum("aik,ai->ak", partial, second)
+
+    @staticmethod
+    def __scale(values: np.ndarray, logarithmic: bool) -> np.ndarray:
+        return np.log(values) if logarithmic else values
+
+    @staticmethod
+    def __is_pressure(factory: Callable[[float], Input]) -> bool:
+        return factory(1).coolprop_key == CoolProp.iP
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import json
+from math import exp, log
+from os import PathLike
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from ..enums import Phases
+from ..fluids.abstract_fluid import AbstractFluid
+from ..io import Input
+
+__all__ = ["QuadtreeTable"]
+
+# Cell of the quadtree: depth and indices along the log(pressure) and enthalpy axes
+Cell = tuple[int, int, int]
+
+
+class QuadtreeTable:
+    """Adaptive quadtree table of the properties in the (log P, h) plane."""
+
+    # Properties, whose zero is arbitrary (their errors are related
+    # to the maximum magnitude on the cell instead of the pointwise values)
+    __OFFSET_PROPERTIES: tuple[str, ...] = (
+        "enthalpy",
+        "entropy",
+        "internal_energy",
+        "temperature",
+    )
+    # Number of header items of the flat array (nodes, bounds of the root cell)
+    __HEADER: int = 5
+    # The error is verified only at the centers of the quarters of the cell
+    __SAFETY_FACTOR: float = 0.5
+
+    def __init__(self, properties: Sequence[str], data: np.ndarray, tolerance: float):
+        """
+        Adaptive quadtree table of the properties in the (log P, h) plane
+        (use `build` to build it or `load` to load the saved one).
+
+        The whole tree is stored in the flat array: the header
+        (number of nodes and bounds of the root cell in pressure and enthalpy),
+        one item for each node (index of the first of its four children,
+        minus position of the leaf values in the flat array for the leaves
+        or zero for the invalid leaves) and the values of the properties
+        at 3 × 3 nodes of each leaf, which are interpolated biquadratically.
+
+        :param properties: Names of the tabulated properties.
+        :param data: Flat array of the tree (may be memory-mapped).
+        :param tolerance: Relative tolerance of the interpolation.
+        :raises ValueError: If properties or data are invalid.
+        """
+        invalid = [
+            key
+            for key in properties
+            if not isinstance(getattr(AbstractFluid, key, None), property)
+        ]
+        if not properties or invalid:
+            raise ValueError(f"Invalid properties: {', '.join(invalid)}!")
+        if (
+            data.ndim != 1
+            or data.size <= self.__HEADER
+            or not 0 < data[0] <= data.size - self.__HEADER
+        ):
+            raise ValueError("Invalid table data!")
+        self.__properties: tuple[str, ...] = tuple(properties)
+        self.__data: np.ndarray = data
+        self.__tolerance: float = tolerance
+        self.__nodes: int = int(data[0])
+        self.__tree: np.ndarray = data[self.__HEADER : self.__HEADER + self.__nodes]
+
+    @classmethod
+    def build(
+        cls,
+        fluid: AbstractFluid,
+        pressure_range: tuple[float, float],
+        enthalpy_range: tuple[float, float],
+        properties: Sequence[str],
+        tolerance: float = 1e-4,
+        min_depth: int = 2,
+        max_depth: int = 10,
+    ) -> QuadtreeTable:
+        """
+        Builds the table of the properties of the fluid
+        over the (pressure, enthalpy) rectangle.
+
+        The rectangle is recursively subdivided in the (log P, h) plane.
+        The properties are evaluated at 3 × 3 nodes of each cell
+        and verified against the flash calculations at the centers
+        of its quarters (which are the nodes of the quarters after subdivision,
+        so each state is evaluated only once). The cells are refined
+        where the relative error of the biquadratic interpolation exceeds
+        half of given tolerance (since it is verified only at four points),
+        as well as the cells crossed by the saturation lines
+        (the phase states of the samples differ or the bubble or dew point
+        enthalpy is inside the cell). The cells, which do not meet
+        the tolerance at maximum depth, are marked as invalid
+        (the lookups return NaN there).
+        The relative errors of the enthalpy, entropy, internal energy
+        and temperature are related to their maximum magnitude on the cell,
+        since their zero is arbitrary.
+
+        All the states are evaluated on a single new instance of the fluid
+        (with the same specified phase).
+
+        :param fluid: Fluid or mixture instance.
+        :param pressure_range: Range of the absolute pressure [Pa].
+        :param enthalpy_range: Range of the mass specific enthalpy [J/kg].
+        :param properties: Names of properties to be tabulated.
+        :param tolerance: Relative tolerance (optional, by default, 1e-4).
+        :param min_depth: Minimum depth of the leaves (optional, by default, 2).
+        :param max_depth: Maximum depth of the leaves (optional, by default, 10).
+        :return: Built table.
+        :raises ValueError: If any input is invalid.
+        """
+        if not tolerance > 0:
+            raise ValueError("Invalid tolerance! It should be positive.")
+        if not 0 <= min_depth <= max_depth:
+            raise ValueError(
+                "Invalid depths! They should be non-negative, "
+                "and the minimum one should not exceed the maximum one."
+            )
+        invalid = [
+            key
+            for key in properties
+            if not isinstance(getattr(fluid.__class__, key, None), property)
+        ]
+        if not properties or invalid:
+            raise ValueError(f"Invalid properties: {', '.join(invalid)}!")
+        if not 0 < pressure_range[0] < pressure_range[1] or (
+            not enthalpy_range[0] < enthalpy_range[1]
+        ):
+            raise ValueError(
+                "Invalid ranges! They should be increasing "
+                "(and positive for the pressure)."
+            )
+        instance = fluid.factory()
+        if fluid._specified_phase is not None:
+            instance.specify_phase(fluid._specified_phase)
+        offsets = np.array([key in cls.__OFFSET_PROPERTIES for key in properties])
+        # The samples are on the integer grid of the quarters of the deepest cells
+        resolution = 2 ** (max_depth + 2)
+        x_min, x_max = log(pressure_range[0]), log(pressure_range[1])
+        y_min, y_max = enthalpy_range
+
+        def pressure(i: int) -> float:
+            if i in (0, resolution):
+                return pressure_range[i // resolution]
+            return exp(x_min + (x_max - x_min) * i / resolution)
+
+        def enthalpy(j: int) -> float:
+            return y_min + (y_max - y_min) * j / resolution
+
+        samples: dict[tuple[int, int], tuple[np.ndarray, bool] | None] = {}
+        saturation: dict[int, list[float]] = {}
+
+        def sample(i: int, j: int) -> tuple[np.ndarray, bool] | None:
+            if (i, j) not in samples:
+                try:
+                    instance.update(
+                        Input.pressure(pressure(i)), Input.enthalpy(enthalpy(j))
+                    )
+                    values = [getattr(instance, key) for key in properties]
+                    samples[(i, j)] = (
+                        np.array([np.nan if k is None else k for k in values]),
+                        instance.phase == Phases.TwoPhase,
+                    )
+                except ValueError:
+                    samples[(i, j)] = None
+            return samples[(i, j)]
+
+        def saturated_enthalpies(i: int) -> list[float]:
+            if i not in saturation:
+                saturation[i] = []
+                for method in (
+                    instance.bubble_point_at_pressure,
+                    instance.dew_point_at_pressure,
+                ):
+                    try:
+                        saturation[i].append(method(pressure(i)).enthalpy)
+                    except ValueError:
+                        pass
+            return saturation[i]
+
+        def fit(cell: Cell) -> np.ndarray | None:
+            depth, i, j = cell
+            step = resolution // 2 ** (depth + 1)
+            i, j = i * 2 * step, j * 2 * step
+            nodes = [
+                sample(i + a * step, j + b * step) for a in range(3) for b in range(3)
+            ]
+            checks = [
+                sample(i + a * step // 2, j + b * step // 2)
+                for a in (1, 3)
+                for b in (1, 3)
+            ]
+            if any(k is None for k in nodes + checks):
+                return None
+            if len({k[1] for k in nodes + checks}) > 1:
+                return None
+            low, high = enthalpy(j), enthalpy(j + 2 * step)
+            if any(
+                low < k < high
+                for a in range(3)
+                for k in saturated_enthalpies(i + a * step)
+            ):
+                return None
+            values = np.array([k[0] for k in nodes])
+            expected = np.array([k[0] for k in checks])
+            actual = cls.__interpolate(
+                np.array([-0.5, -0.5, 0.5, 0.5]),
+                np.array([-0.5, 0.5, -0.5, 0.5]),
+                np.broadcast_to(values, (4, *values.shape)),
+            )
+            with np.errstate(invalid="ignore", divide="ignore"):
+                scale = np.where(
+                    offsets,
+                    np.nanmax(np.abs(np.vstack([values, expected])), axis=0),
+                    np.abs(expected),
+                )
+                error = np.abs(actual - expected) / scale
+            # The properties, which are undefined in the whole cell
+            # (e.g., the transport properties of the two-phase states), are NaN
+            error = np.where(np.isnan(actual) & np.isnan(expected), 0, error)
+            if not np.all(error <= cls.__SAFETY_FACTOR * tolerance):
+                return None
+            return values
+
+        tree: list[int] = []
+        leaves: list[np.ndarray] = []
+        cells: list[Cell] = [(0, 0, 0)]
+        for depth, i, j in cells:
+            values = fit((depth, i, j)) if depth >= min_depth else None
+            if values is None and depth < max_depth:
+                tree.append(len(cells))
+                cells.extend(
+                    (depth + 1, 2 * i + a, 2 * j + b)
+                    for a in range(2)
+                    for b in range(2)
+                )
+            elif values is None:
+                tree.append(0)
+            else:
+                tree.append(-len(leaves) - 1)
+                leaves.append(values.ravel())
+        offset = cls.__HEADER + len(tree)
+        size = len(properties) * 9
+        data = np.concatenate(
+            [
+                [len(tree), *pressure_range, *enthalpy_range],
+                [k if k >= 0 else -(offset + size * (-k - 1)) for k in tree],
+                *leaves,
+            ]
+        )
+        return cls(properties, data, tolerance)
+
+    @classmethod
+    def load(cls, path: str | PathLike, memory_map: bool = True) -> QuadtreeTable:
+        """
+        Loads the table saved by `save`.
+
+        :param path: Path of the table array (.npy); the metadata
+            is loaded from the JSON file with the same name.
+        :param memory_map: True if the table array is memory-mapped
+            instead of reading it (optional, by default, True).
+        :return: Loaded table.
+        :raises ValueError: If the files are invalid.
+        """
+        path = Path(path)
+        try:
+            metadata = json.loads(path.with_suffix(".json").read_text("utf-8"))
+            data = np.load(path, mmap_mode="r" if memory_map else None)
+            return cls(metadata["properties"], data, float(metadata["tolerance"]))
+        except (OSError, KeyError, TypeError) as e:
+            raise ValueError("Invalid table files!") from e
+
+    @property
+    def properties(self) -> tuple[str, ...]:
+        """Names of the tabulated properties."""
+        return self.__properties
+
+    @property
+    def tolerance(self) -> float:
+        """Relative tolerance of the interpolation."""
+        return self.__tolerance
+
+    @property
+    def pressure_range(self) -> tuple[float, float]:
+        """Range of the absolute pressure [Pa]."""
+        return float(self.__data[1]), float(self.__data[2])
+
+    @property
+    def enthalpy_range(self) -> tuple[float, float]:
+        """Range of the mass specific enthalpy [J/kg]."""
+        return float(self.__data[3]), float(self.__data[4])
+
+    @property
+    def nodes(self) -> int:
+        """Number of nodes of the tree."""
+        return self.__nodes
+
+    @property
+    def leaves(self) -> int:
+        """Number of valid leaves of the tree."""
+        return int(np.count_nonzero(self.__tree < 0))
+
+    @property
+    def invalid_leaves(self) -> int:
+        """Number of invalid leaves of the tree (the lookups return NaN there)."""
+        return int(np.count_nonzero(self.__tree == 0))
+
+    @property
+    def depth(self) -> int:
+        """Maximum depth of the leaves."""
+        depths = np.zeros(self.__nodes, dtype=int)
+        for index in np.flatnonzero(self.__tree > 0):
+            first = int(self.__tree[index])
+            depths[first : first + 4] = depths[index] + 1
+        return int(depths.max())
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the table array [bytes]."""
+        return self.__data.nbytes
+
+    def evaluate(
+        self, pressure: float | np.ndarray, enthalpy: float | np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """
+        Looks up the tabulated properties (vectorized).
+
+        :param pressure: Absolute pressure [Pa].
+        :param enthalpy: Mass specific enthalpy [J/kg].
+        :return: Values of each property
+            (the shape is the broadcast shape of the inputs;
+            NaN for the points outside of the table or in the invalid leaves).
+        """
+        pressure, enthalpy = np.broadcast_arrays(
+            np.asarray(pressure, dtype=float), np.asarray(enthalpy, dtype=float)
+        )
+        shape = pressure.shape
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = np.log(pressure.ravel())
+        y = enthalpy.ravel()
+        x_min, x_max = log(float(self.__data[1])), log(float(self.__data[2]))
+        y_min, y_max = float(self.__data[3]), float(self.__data[4])
+        values = np.full((x.size, len(self.__properties)), np.nan)
+        inside = np.flatnonzero(
+            (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+        )
+        x, y = x[inside], y[inside]
+        node = np.zeros(x.size, dtype=int)
+        low_x, high_x = np.full(x.size, x_min), np.full(x.size, x_max)
+        low_y, high_y = np.full(y.size, y_min), np.full(y.size, y_max)
+        entry = np.asarray(self.__tree[node])
+        internal = np.flatnonzero(entry > 0)
+        while internal.size:
+            middle_x = 0.5 * (low_x[internal] + high_x[internal])
+            middle_y = 0.5 * (low_y[internal] + high_y[internal])
+            right, upper = x[internal] >= middle_x, y[internal] >= middle_y
+            node[internal] = entry[internal].astype(int) + 2 * right + upper
+            low_x[internal] = np.where(right, middle_x, low_x[internal])
+            high_x[internal] = np.where(right, high_x[internal], middle_x)
+            low_y[internal] = np.where(upper, middle_y, low_y[internal])
+            high_y[internal] = np.where(upper, high_y[internal], middle_y)
+            entry[internal] = self.__tree[node[internal]]
+            internal = internal[entry[internal] > 0]
+        valid = np.flatnonzero(entry < 0)
+        size = len(self.__properties) * 9
+        positions = (-entry[valid]).astype(int)[:, np.newaxis] + np.arange(size)
+        values[inside[valid]] = self.__interpolate(
+            (2 * x[valid] - low_x[valid] - high_x[valid])
+            / (high_x[valid] - low_x[valid]),
+            (2 * y[valid] - low_y[valid] - high_y[valid])
+            / (high_y[valid] - low_y[valid]),
+            np.asarray(self.__data[positions]).reshape(
+                valid.size, 9, len(self.__properties)
+            ),
+        )
+        return {
+            key: values[:, i].reshape(shape) for i, key in enumerate(self.__properties)
+        }
+
+    def save(self, path: str | PathLike):
+        """
+        Saves the table: the flat table array to the .npy file
+        (which can be memory-mapped, see `load`) and the metadata
+        to the JSON file with the same name.
+
+        :param path: Path of the table array (.npy).
+        """
+        path = Path(path)
+        np.save(path, np.asarray(self.__data), allow_pickle=False)
+        path.with_suffix(".json").write_text(
+            json.dumps(
+                {"properties": list(self.__properties), "tolerance": self.__tolerance},
+                indent=4,
+            ),
+            "utf-8",
+        )
+
+    @staticmethod
+    def __interpolate(u: np.ndarray, v: np.ndarray, values: np.ndarray) -> np.ndarray:
+        # Biquadratic Lagrange interpolation on the 3 × 3 nodes (at -1, 0, 1)
+        first = np.column_stack([0.5 * u * (u - 1), 1 - u**2, 0.5 * u * (u + 1)])
+        second = np.column_stack([0.5 * v * (v - 1), 1 - v**2, 0.5 * v * (v + 1)])
+        weights = (first[:, :, np.newaxis] * second[:, np.newaxis, :]).reshape(-1, 9)
+        return np.einsum("an,ank->ak", weights, values)
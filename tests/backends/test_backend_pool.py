@@ -0,0 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from CoolProp import AbstractState
+
+from pyfluids import BackendPool
+
+
+class TestBackendPool:
+    pool: BackendPool = BackendPool()
+
+    def test_backend_pool_is_singleton(self):
+        assert BackendPool() is BackendPool()
+
+    def test_create_returns_new_backend_each_time(self):
+        first = self.pool.create("HEOS", "Water")
+        second = self.pool.create("HEOS", "Water")
+        assert isinstance(first, AbstractState)
+        assert first is not second
+
+    def test_create_marks_backend_as_loaded(self):
+        self.pool.create("HEOS", "Argon&Nitrogen")
+        assert self.pool.is_loaded("HEOS", "Argon&Nitrogen")
+        assert not self.pool.is_loaded("HEOS", "Nitrogen&Argon&Oxygen")
+
+    def test_create_invalid_fluid_raises_value_error(self):
+        with pytest.raises(ValueError):
+            self.pool.create("HEOS", "Unobtainium")
+        assert not self.pool.is_loaded("HEOS", "Unobtainium")
+
+    def test_create_multi_threading_is_thread_safe(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            backends = list(
+                executor.map(lambda _: self.pool.create("HEOS", "R32"), range(32))
+            )
+        assert len(set(id(backend) for backend in backends)) == 32
+        assert self.pool.is_loaded("HEOS", "R32")
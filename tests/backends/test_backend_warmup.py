@@ -0,0 +1,95 @@
+import os
+import time
+
+import pytest
+
+from pyfluids import (
+    BackendPool,
+    Fluid,
+    FluidsList,
+    HumidAir,
+    Input,
+    InputHumidAir,
+    IsobarSplineCache,
+    Mixture,
+    warmup,
+)
+
+
+class TestBackendWarmup:
+    def test_warmup_loads_backends_of_fluids(self):
+        warmup(
+            [
+                FluidsList.Water,
+                FluidsList.MPG,
+                Fluid(FluidsList.MEG, 50),
+                Mixture([FluidsList.Argon, FluidsList.IsoButane], [50, 50]),
+            ],
+            humid_air=True,
+        )
+        pool = BackendPool()
+        assert pool.is_loaded("HEOS", "Water")
+        assert pool.is_loaded("INCOMP", "MPG")
+        assert pool.is_loaded("INCOMP", "MEG")
+        assert pool.is_loaded("HEOS", "Argon&IsoButane")
+
+    def test_warmup_tables_skips_mixtures(self):
+        warmup(
+            [Mixture([FluidsList.Argon, FluidsList.IsoButane], [50, 50])],
+            tables=True,
+        )
+        pool = BackendPool()
+        assert pool.is_loaded("HEOS", "Argon&IsoButane")
+        assert not pool.is_loaded("BICUBIC&HEOS", "Argon&IsoButane")
+
+    def test_warmup_invalid_fluid_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            warmup(["Water"])
+        assert "Invalid fluid: 'Water'!" in str(e.value)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Fork is not supported")
+    def test_fork_with_held_locks_does_not_deadlock_child(self):
+        warmup([FluidsList.Water], humid_air=True)
+        water = Fluid(FluidsList.Water)
+        # Locks held by other threads of the parent at the moment of fork
+        locks = [
+            BackendPool()._BackendPool__lock,
+            HumidAir._HumidAir__lock,
+            IsobarSplineCache()._IsobarSplineCache__lock,
+            water._AbstractFluid__lock,
+        ]
+        for lock in locks:
+            lock.acquire()
+        try:
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    water.update(Input.pressure(101325), Input.temperature(20))
+                    water.density
+                    water.prepare_isobars([101325], 1e-3)
+                    Fluid(FluidsList.Ammonia).with_state(
+                        Input.pressure(101325), Input.temperature(20)
+                    ).density
+                    HumidAir().with_state(
+                        InputHumidAir.pressure(101325),
+                        InputHumidAir.temperature(20),
+                        InputHumidAir.relative_humidity(50),
+                    ).humidity
+                    code = 0
+                finally:
+                    os._exit(code)
+        finally:
+            for lock in locks:
+                lock.release()
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            finished, status = os.waitpid(pid, os.WNOHANG)
+            if finished:
+                break
+            time.sleep(0.05)
+        else:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            pytest.fail("Child process is deadlocked!")
+        assert os.waitstatus_to_exitcode(status) == 0
@@ -0,0 +1,52 @@
+import pytest
+from CoolProp import AbstractState
+
+from pyfluids import CriticalPointsCache
+
+
+def create_backend(fluid_names: str = "R32&R125") -> AbstractState:
+    backend = AbstractState("HEOS", fluid_names)
+    backend.set_mass_fractions([0.5, 0.5])
+    return backend
+
+
+def create_incompressible_backend() -> AbstractState:
+    backend = AbstractState("INCOMP", "MEG")
+    backend.set_mass_fractions([0.4])
+    return backend
+
+
+class TestCriticalPointsCache:
+    cache: CriticalPointsCache = CriticalPointsCache()
+    key: tuple = ("test", "R32&R125")
+
+    def test_critical_points_cache_is_singleton(self):
+        assert CriticalPointsCache() is CriticalPointsCache()
+
+    def test_critical_points_are_found_once(self):
+        points = self.cache.critical_points(self.key, create_backend)
+        assert self.cache.is_cached(self.key)
+        assert self.cache.critical_points(self.key, lambda: pytest.fail()) is points
+        stable = [i for i in points if i[3]]
+        assert len(stable) == 1
+        assert stable[0][0] == pytest.approx(344.49, 1e-4)
+        assert stable[0][1] == pytest.approx(4.9012e6, 1e-4)
+
+    def test_critical_points_without_key_are_not_cached(self):
+        count = self.cache.cached_compositions
+        self.cache.critical_points(None, create_backend)
+        assert self.cache.cached_compositions == count
+
+    def test_critical_points_failure_is_cached(self):
+        key = ("test", "MEG")
+        for factory in (create_incompressible_backend, lambda: pytest.fail()):
+            with pytest.raises(
+                ValueError, match="Unable to find the critical points of the mixture!"
+            ):
+                self.cache.critical_points(key, factory)
+
+    def test_clear_removes_all_critical_points(self):
+        self.cache.critical_points(self.key, create_backend)
+        self.cache.clear()
+        assert self.cache.cached_compositions == 0
+        assert not self.cache.is_cached(self.key)
@@ -0,0 +1,97 @@
+import CoolProp
+import pytest
+from CoolProp import AbstractState
+
+from pyfluids import IsobarSpline
+
+
+class TestIsobarSpline:
+    outputs: tuple[int, ...] = (
+        CoolProp.iT,
+        CoolProp.iDmass,
+        CoolProp.iSmass,
+        CoolProp.iCpmass,
+        CoolProp.ispeed_sound,
+        CoolProp.iconductivity,
+        CoolProp.iviscosity,
+    )
+
+    @pytest.mark.parametrize(
+        "fluid_name, pressure, temperatures",
+        [
+            ("Water", 101325, [280, 340.123, 372, 374, 500.5, 1200]),
+            ("Water", 3e7, [300, 600, 650.123, 700, 1500]),
+            ("R32", 1e6, [200, 280.456, 300, 400]),
+            ("Air", 1e6, [80, 200.789, 600]),
+        ],
+    )
+    def test_outputs_matches_flash_calculation(
+        self, fluid_name: str, pressure: float, temperatures: list[float]
+    ):
+        spline = IsobarSpline(AbstractState("HEOS", fluid_name), pressure, 1e-6)
+        backend = AbstractState("HEOS", fluid_name)
+        for temperature in temperatures:
+            backend.update(CoolProp.PT_INPUTS, pressure, temperature)
+            actual = spline.outputs(CoolProp.iHmass, backend.hmass())
+            assert actual[CoolProp.iP] == pressure
+            assert actual[CoolProp.iQ] == -1
+            assert actual[CoolProp.iPhase] == backend.phase()
+            for output in self.outputs:
+                assert actual[output] == pytest.approx(
+                    backend.keyed_output(output), 2e-6
+                )
+            actual = spline.outputs(CoolProp.iSmass, backend.smass())
+            assert actual[CoolProp.iHmass] == pytest.approx(backend.hmass(), 1e-6)
+
+    def test_outputs_out_of_splines_returns_none(self):
+        spline = IsobarSpline(AbstractState("HEOS", "Water"), 101325, 1e-4)
+        backend = AbstractState("HEOS", "Water")
+        backend.update(CoolProp.PQ_INPUTS, 101325, 0.5)
+        assert spline.outputs(CoolProp.iHmass, backend.hmass()) is None
+        assert spline.outputs(CoolProp.iSmass, backend.smass()) is None
+        assert spline.outputs(CoolProp.iHmass, -1e6) is None
+        assert spline.outputs(CoolProp.iT, 300) is None
+
+    def test_outputs_of_incompressible_fluid(self):
+        spline = IsobarSpline(AbstractState("INCOMP", "Water"), 2e6, 1e-6)
+        backend = AbstractState("INCOMP", "Water")
+        backend.update(CoolProp.PT_INPUTS, 2e6, 321.123)
+        actual = spline.outputs(CoolProp.iHmass, backend.hmass())
+        assert actual[CoolProp.iT] == pytest.approx(321.123, 1e-6)
+        assert actual[CoolProp.iDmass] == pytest.approx(backend.rhomass(), 1e-6)
+
+    def test_nodes_are_refined_until_tolerance_is_met(self):
+        coarse = IsobarSpline(AbstractState("HEOS", "Water"), 101325, 1e-3)
+        fine = IsobarSpline(AbstractState("HEOS", "Water"), 101325, 1e-6)
+        assert coarse.pressure == fine.pressure == 101325
+        assert coarse.tolerance == 1e-3
+        assert coarse.nodes < fine.nodes
+        assert coarse.invalid_intervals == fine.invalid_intervals == 0
+
+    def test_intervals_without_nodes_are_not_interpolated(self):
+        spline = IsobarSpline(AbstractState("HEOS", "Water"), 101325, 1e-6, 9)
+        backend = AbstractState("HEOS", "Water")
+        backend.update(CoolProp.PT_INPUTS, 101325, 300)
+        assert spline.nodes == 18
+        assert spline.invalid_intervals > 0
+        assert spline.outputs(CoolProp.iHmass, backend.hmass()) is None
+
+    @pytest.mark.parametrize(
+        "pressure, tolerance, max_nodes, message",
+        [
+            (101325, 0, 2048, "Invalid tolerance! It should be positive."),
+            (
+                101325,
+                1e-6,
+                8,
+                "Invalid maximum number of nodes! It should be at least 9.",
+            ),
+            (-1, 1e-6, 2048, ""),
+        ],
+    )
+    def test_invalid_inputs_raises_value_error(
+        self, pressure: float, tolerance: float, max_nodes: int, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            IsobarSpline(AbstractState("HEOS", "Water"), pressure, tolerance, max_nodes)
+        assert message in str(e.value)
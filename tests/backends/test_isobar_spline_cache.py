@@ -0,0 +1,78 @@
+import CoolProp
+import pytest
+from CoolProp import AbstractState
+
+from pyfluids import IsobarSplineCache
+
+
+def create_backend() -> AbstractState:
+    return AbstractState("HEOS", "R32")
+
+
+class TestIsobarSplineCache:
+    cache: IsobarSplineCache = IsobarSplineCache()
+    key: tuple = ("test", "R32")
+
+    def test_isobar_spline_cache_is_singleton(self):
+        assert IsobarSplineCache() is IsobarSplineCache()
+
+    def test_spline_is_built_once(self):
+        spline = self.cache.spline(self.key, 1e6, create_backend, 1e-4)
+        assert self.cache.is_cached(self.key, 1e6)
+        assert not self.cache.is_cached(self.key, 2e6)
+        assert self.cache.spline(self.key, 1e6, lambda: pytest.fail(), 1e-3) is spline
+        more_accurate = self.cache.spline(self.key, 1e6, create_backend, 1e-6)
+        assert more_accurate.tolerance == 1e-6
+        assert more_accurate.nodes > spline.nodes
+        self.cache.clear()
+
+    def test_spline_without_key_is_not_cached(self):
+        count = self.cache.cached_isobars
+        self.cache.spline(None, 1e6, create_backend, 1e-4)
+        assert self.cache.cached_isobars == count
+
+    def test_spline_failure_is_cached(self):
+        for factory in (create_backend, lambda: pytest.fail()):
+            with pytest.raises(
+                ValueError, match="Unable to build the splines along the isobar!"
+            ):
+                self.cache.spline(self.key, -1, factory)
+        self.cache.clear()
+
+    def test_spline_invalid_tolerance_raises_value_error(self):
+        with pytest.raises(
+            ValueError, match="Invalid tolerance! It should be positive."
+        ):
+            self.cache.spline(self.key, 1e6, create_backend, 0)
+
+    def test_outputs_only_from_enabled_cache(self):
+        spline = self.cache.spline(self.key, 1e6, create_backend, 1e-4)
+        backend = create_backend()
+        backend.update(CoolProp.PT_INPUTS, 1e6, 350)
+        assert self.cache.outputs(
+            self.key, 1e6, CoolProp.iHmass, backend.hmass()
+        ) == spline.outputs(CoolProp.iHmass, backend.hmass())
+        assert self.cache.outputs(self.key, 2e6, CoolProp.iHmass, 5e5) is None
+        self.cache.enabled = False
+        try:
+            assert (
+                self.cache.outputs(self.key, 1e6, CoolProp.iHmass, backend.hmass())
+                is None
+            )
+        finally:
+            self.cache.enabled = True
+        self.cache.clear()
+
+    def test_outputs_only_from_accurate_enough_splines(self):
+        spline = self.cache.spline(self.key, 1e6, create_backend, 1e-4)
+        assert self.cache.outputs(
+            self.key, 1e6, CoolProp.iHmass, 5e5, 1e-4
+        ) == spline.outputs(CoolProp.iHmass, 5e5)
+        assert self.cache.outputs(self.key, 1e6, CoolProp.iHmass, 5e5, 1e-6) is None
+        self.cache.clear()
+
+    def test_clear_removes_all_splines(self):
+        self.cache.spline(self.key, 1e6, create_backend, 1e-4)
+        self.cache.clear()
+        assert self.cache.cached_isobars == 0
+        assert not self.cache.is_cached(self.key, 1e6)
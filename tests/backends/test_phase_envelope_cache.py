@@ -0,0 +1,78 @@
+import CoolProp
+import pytest
+from CoolProp import AbstractState
+
+from pyfluids import PhaseEnvelopeCache
+
+
+def create_backend(fluid_names: str = "R32&R125") -> AbstractState:
+    backend = AbstractState("HEOS", fluid_names)
+    if "&" in fluid_names:
+        backend.set_mass_fractions([0.5, 0.5])
+    return backend
+
+
+class TestPhaseEnvelopeCache:
+    cache: PhaseEnvelopeCache = PhaseEnvelopeCache()
+    key: tuple = ("test", "R32&R125")
+
+    def test_phase_envelope_cache_is_singleton(self):
+        assert PhaseEnvelopeCache() is PhaseEnvelopeCache()
+
+    def test_envelope_is_built_once(self):
+        envelope = self.cache.envelope(self.key, create_backend)
+        assert self.cache.is_cached(self.key)
+        assert self.cache.envelope(self.key, lambda: pytest.fail()) is envelope
+        assert set(envelope.Q) == {0, 1}
+
+    def test_envelope_without_key_is_not_cached(self):
+        count = self.cache.cached_envelopes
+        self.cache.envelope(None, create_backend)
+        assert self.cache.cached_envelopes == count
+
+    @pytest.mark.parametrize("fluid_names", ["Water", "R407C"])
+    def test_envelope_of_pure_fluid_raises_value_error(self, fluid_names: str):
+        with pytest.raises(
+            ValueError, match="The phase envelope is available only for HEOS mixtures!"
+        ):
+            self.cache.envelope(None, lambda: create_backend(fluid_names))
+
+    @pytest.mark.parametrize("quality", [0, 1])
+    @pytest.mark.parametrize("pressure", [1e5, 1e6, 3e6])
+    def test_guesses_lead_to_same_state(self, pressure: float, quality: float):
+        self.cache.envelope(self.key, create_backend)
+        guesses = self.cache.guesses(self.key, pressure, quality)
+        actual, expected = create_backend(), create_backend()
+        actual.update_with_guesses(CoolProp.PQ_INPUTS, pressure, quality, guesses)
+        expected.update(CoolProp.PQ_INPUTS, pressure, quality)
+        assert guesses.T == pytest.approx(expected.T(), 1e-3)
+        assert actual.T() == pytest.approx(expected.T(), 1e-9)
+        assert actual.rhomass() == pytest.approx(expected.rhomass(), 1e-6)
+
+    @pytest.mark.parametrize(
+        "key, pressure, quality",
+        [
+            (("test", "unknown"), 1e6, 0),
+            (key, 1e8, 0),
+            (key, 1e6, 0.5),
+        ],
+    )
+    def test_guesses_are_not_available_returns_none(
+        self, key: tuple, pressure: float, quality: float
+    ):
+        self.cache.envelope(self.key, create_backend)
+        assert self.cache.guesses(key, pressure, quality) is None
+
+    def test_guesses_when_disabled_returns_none(self):
+        self.cache.envelope(self.key, create_backend)
+        self.cache.enabled = False
+        try:
+            assert self.cache.guesses(self.key, 1e6, 0) is None
+        finally:
+            self.cache.enabled = True
+
+    def test_clear_removes_all_envelopes(self):
+        self.cache.envelope(self.key, create_backend)
+        self.cache.clear()
+        assert self.cache.cached_envelopes == 0
+        assert not self.cache.is_cached(self.key)
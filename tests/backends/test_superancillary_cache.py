@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import CoolProp
+import pytest
+from CoolProp.CoolProp import PropsSI
+
+from pyfluids import SuperancillaryCache
+
+
+class TestSuperancillaryCache:
+    cache: SuperancillaryCache = SuperancillaryCache()
+
+    def test_superancillary_cache_is_singleton(self):
+        assert SuperancillaryCache() is SuperancillaryCache()
+
+    @pytest.mark.parametrize(
+        "backend, fluid_name, expected",
+        [
+            ("HEOS", "Water", True),
+            ("HEOS", "R32", True),
+            ("HEOS", "Air", False),
+            ("HEOS", "Argon&Nitrogen", False),
+            ("INCOMP", "MPG", False),
+            ("IF97", "Water", False),
+        ],
+    )
+    def test_is_available_only_for_pure_heos_fluids(
+        self, backend: str, fluid_name: str, expected: bool
+    ):
+        assert self.cache.is_available(backend, fluid_name) == expected
+
+    def test_is_available_when_disabled_returns_false(self):
+        self.cache.enabled = False
+        try:
+            assert not self.cache.is_available("HEOS", "Water")
+        finally:
+            self.cache.enabled = True
+
+    def test_saturation_temperatures_matches_with_coolprop(self):
+        pressures = [1e3, 101325, 1e6, 2e7]
+        actual = self.cache.saturation_temperatures("HEOS", "Water", pressures)
+        for pressure, temperature in zip(pressures, actual):
+            assert temperature == pytest.approx(
+                PropsSI("T", "P", pressure, "Q", 0, "Water"), 1e-12
+            )
+
+    def test_saturation_temperature_matches_batch_variant(self):
+        assert (
+            self.cache.saturation_temperature("HEOS", "Water", 101325)
+            == self.cache.saturation_temperatures("HEOS", "Water", [101325])[0]
+        )
+
+    @pytest.mark.parametrize(
+        "fluid_name, pressure, message",
+        [
+            (
+                "Air",
+                101325,
+                "The superancillary functions are not available for this fluid!",
+            ),
+            ("Water", 1e8, "may not be above the numerical critical point"),
+        ],
+    )
+    def test_saturation_temperature_invalid_inputs_raises_value_error(
+        self, fluid_name: str, pressure: float, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            self.cache.saturation_temperature("HEOS", fluid_name, pressure)
+        assert message in str(e.value)
+
+    def test_saturation_temperature_multi_threading_is_thread_safe(self):
+        pressures = [1e5 + 1e4 * i for i in range(64)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            actual = list(
+                executor.map(
+                    lambda i: self.cache.saturation_temperature("HEOS", "R32", i),
+                    pressures,
+                )
+            )
+        assert actual == self.cache.saturation_temperatures("HEOS", "R32", pressures)
+
+    @pytest.mark.parametrize("quality", [0, 1])
+    def test_saturated_states_matches_with_coolprop(self, quality: int):
+        states = self.cache.saturated_states("HEOS", "Water", 101325)
+        for output in ("T", "Dmass", "Hmass", "Smass", "Umass"):
+            assert states[quality][getattr(CoolProp, f"i{output}")] == pytest.approx(
+                PropsSI(output, "P", 101325, "Q", quality, "Water"), 1e-12
+            )
+
+    def test_saturated_states_are_cached(self):
+        self.cache.clear()
+        assert self.cache.cached_saturated_states == 0
+        states = self.cache.saturated_states("HEOS", "R32", 1e6)
+        assert self.cache.saturated_states("HEOS", "R32", 1e6) is states
+        assert self.cache.cached_saturated_states == 1
+        self.cache.clear()
+        assert self.cache.cached_saturated_states == 0
+
+    def test_saturated_states_invalid_inputs_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            self.cache.saturated_states("HEOS", "Water", 1e8)
+        assert "may not be above the numerical critical point" in str(e.value)
@@ -0,0 +1,233 @@
+import sys
+
+import pytest
+
+from pyfluids import (
+    BatchEvaluator,
+    CostModel,
+    Executors,
+    Fluid,
+    FluidsList,
+    HumidAir,
+    Input,
+    InputHumidAir,
+    Mixture,
+    Parameters,
+    Phases,
+)
+
+
+class FluidSubclass(Fluid):
+    pass
+
+
+class TestBatchEvaluator:
+    fluid: Fluid = Fluid(FluidsList.Water)
+    fluid_states: list[tuple[Input, Input]] = [
+        (Input.pressure(101325), Input.temperature(temperature))
+        for temperature in range(5, 200, 5)
+    ]
+    humid_air_states: list[tuple[InputHumidAir, ...]] = [
+        (
+            InputHumidAir.pressure(101325),
+            InputHumidAir.temperature(temperature),
+            InputHumidAir.relative_humidity(50),
+        )
+        for temperature in range(0, 40, 5)
+    ]
+
+    @pytest.mark.parametrize(
+        "max_workers, chunk_size, message",
+        [
+            (0, None, "Invalid number of workers! It should be positive."),
+            (None, 0, "Invalid chunk size! It should be positive."),
+        ],
+    )
+    def test_invalid_settings_raises_value_error(
+        self, max_workers: int, chunk_size: int, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            BatchEvaluator(max_workers, chunk_size)
+        assert message in str(e.value)
+
+    def test_evaluate_invalid_properties_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            BatchEvaluator(2).evaluate(
+                self.fluid, self.fluid_states, ["density", "magic", "factory"]
+            )
+        assert "Invalid properties: magic, factory!" in str(e.value)
+
+    @pytest.mark.parametrize("max_workers, chunk_size", [(1, None), (4, None), (4, 3)])
+    def test_evaluate_fluid_matches_sequential_evaluation(
+        self, max_workers: int, chunk_size: int
+    ):
+        results = BatchEvaluator(max_workers, chunk_size).evaluate(
+            self.fluid, self.fluid_states, ["density", "enthalpy", "phase"]
+        )
+        assert results == [
+            {
+                "density": fluid.density,
+                "enthalpy": fluid.enthalpy,
+                "phase": fluid.phase,
+            }
+            for fluid in (self.fluid.with_state(*i) for i in self.fluid_states)
+        ]
+
+    def test_evaluate_mixture_matches_sequential_evaluation(self):
+        mixture = Mixture([FluidsList.Argon, FluidsList.IsoButane], [50, 50])
+        states = [
+            (Input.pressure(101325), Input.temperature(temperature))
+            for temperature in range(20, 100, 10)
+        ]
+        assert BatchEvaluator(4).evaluate(mixture, states, ["density"]) == [
+            {"density": mixture.with_state(*i).density} for i in states
+        ]
+
+    def test_evaluate_humid_air_matches_sequential_evaluation(self):
+        results = BatchEvaluator(4).evaluate(
+            HumidAir(), self.humid_air_states, ["enthalpy", "humidity"]
+        )
+        assert results == [
+            {"enthalpy": humid_air.enthalpy, "humidity": humid_air.humidity}
+            for humid_air in (HumidAir().with_state(*i) for i in self.humid_air_states)
+        ]
+
+    def test_evaluate_invalid_states_returns_none(self):
+        states = [
+            (Input.pressure(-1), Input.temperature(20)),
+            (Input.pressure(101325), Input.temperature(20)),
+            (Input.pressure(101325), Input.pressure(101325)),
+        ]
+        results = BatchEvaluator(1).evaluate(self.fluid, states, ["density"])
+        assert results[0] is None
+        assert results[1] == {"density": self.fluid.with_state(*states[1]).density}
+        assert results[2] is None
+
+    def test_evaluate_keeps_specified_phase(self):
+        prototype = Fluid(FluidsList.Water).specify_phase(Phases.Gas)
+        states = [(Input.pressure(101325), Input.temperature(50))]
+        assert BatchEvaluator(1).evaluate(prototype, states, ["density"]) == [None]
+
+    def test_evaluate_no_states_returns_empty_list(self):
+        assert BatchEvaluator(4).evaluate(self.fluid, [], ["density"]) == []
+
+    def test_evaluate_records_timing_statistics(self):
+        model = CostModel()
+        key = model.key(self.fluid, self.fluid_states[0])
+        prior = model.estimate(key)
+        evaluator = BatchEvaluator(2, cost_model=model)
+        evaluator.evaluate(self.fluid, self.fluid_states, ["density"])
+        assert evaluator.cost_model is model
+        assert model.estimate(key) != prior
+
+    def test_evaluate_heterogeneous_states_matches_sequential_evaluation(self):
+        states = [
+            (Input.enthalpy(2.7e6), Input.entropy(7e3)),
+            *self.fluid_states,
+            (Input.pressure(101325), Input.quality(50)),
+        ]
+        results = BatchEvaluator(3).evaluate(self.fluid, states, ["temperature"])
+        assert results == [
+            {"temperature": self.fluid.with_state(*i).temperature} for i in states
+        ]
+
+    def test_evaluate_keep_instances_reuses_instances_between_evaluations(self):
+        evaluator = BatchEvaluator(2, keep_instances=True)
+        first = evaluator.evaluate(self.fluid, self.fluid_states, ["density"])
+        kept = evaluator.kept_instances
+        second = evaluator.evaluate(self.fluid, self.fluid_states, ["density"])
+        assert first == second
+        assert 0 < kept == evaluator.kept_instances <= 2
+        evaluator.release_instances()
+        assert evaluator.kept_instances == 0
+
+    def test_evaluate_keep_instances_distinguishes_fractions(self):
+        evaluator = BatchEvaluator(1, keep_instances=True)
+        states = [(Input.pressure(101325), Input.temperature(20))]
+        for fraction in (20, 60):
+            brine = Fluid(FluidsList.MPG, fraction)
+            assert evaluator.evaluate(brine, states, ["density"]) == [
+                {"density": brine.with_state(*states[0]).density}
+            ]
+
+    def test_evaluate_keep_instances_distinguishes_specified_phases(self):
+        evaluator = BatchEvaluator(1, keep_instances=True)
+        states = [(Input.pressure(101325), Input.temperature(20))]
+        evaluator.evaluate(self.fluid, states, ["phase"])
+        liquid = Fluid(FluidsList.Water).specify_phase(Phases.Liquid)
+        assert evaluator.evaluate(liquid, states, ["phase"]) == [
+            {"phase": Phases.Liquid}
+        ]
+        assert evaluator.kept_instances == 2
+
+    def test_evaluate_keep_instances_does_not_keep_subclasses(self):
+        evaluator = BatchEvaluator(1, keep_instances=True)
+        evaluator.evaluate(
+            FluidSubclass(FluidsList.Water), self.fluid_states, ["density"]
+        )
+        assert evaluator.kept_instances == 0
+
+    def test_evaluate_by_default_does_not_keep_instances(self):
+        evaluator = BatchEvaluator(2)
+        evaluator.evaluate(self.fluid, self.fluid_states, ["density"])
+        assert not evaluator.keep_instances
+        assert evaluator.kept_instances == 0
+
+    def test_evaluate_process_executor_matches_sequential_evaluation(self):
+        with BatchEvaluator(2, executor=Executors.Process) as evaluator:
+            fluid_results = evaluator.evaluate(
+                self.fluid, self.fluid_states, ["density", "phase"]
+            )
+            humid_air_results = evaluator.evaluate(
+                HumidAir(), self.humid_air_states, ["humidity"]
+            )
+            assert evaluator.executor == Executors.Process
+        assert fluid_results == [
+            {"density": fluid.density, "phase": fluid.phase}
+            for fluid in (self.fluid.with_state(*i) for i in self.fluid_states)
+        ]
+        assert humid_air_results == [
+            {"humidity": HumidAir().with_state(*i).humidity}
+            for i in self.humid_air_states
+        ]
+
+    def test_evaluate_process_executor_unsupported_prototype_raises_value_error(
+        self,
+    ):
+        with BatchEvaluator(1, executor=Executors.Process) as evaluator:
+            with pytest.raises(ValueError) as e:
+                evaluator.evaluate(
+                    FluidSubclass(FluidsList.Water), self.fluid_states, ["density"]
+                )
+        assert "Only Fluid, Mixture and HumidAir are supported" in str(e.value)
+
+    @pytest.mark.skipif(
+        sys.version_info >= (3, 14), reason="Sub-interpreter pools are available"
+    )
+    def test_interpreter_executor_before_python_3_14_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            BatchEvaluator(1, executor=Executors.Interpreter)
+        assert "available only since Python 3.14" in str(e.value)
+
+    @pytest.mark.parametrize("executor", [Executors.Thread, Executors.Process])
+    def test_evaluate_partial_derivatives_matches_sequential_evaluation(
+        self, executor: Executors
+    ):
+        derivative = (Parameters.Density, Parameters.Pressure, Parameters.Temperature)
+        with BatchEvaluator(2, executor=executor) as evaluator:
+            results = evaluator.evaluate(
+                self.fluid, self.fluid_states, ["density", derivative]
+            )
+        assert results == [
+            {
+                "density": fluid.density,
+                derivative: fluid.partial_derivative(*derivative),
+            }
+            for fluid in (self.fluid.with_state(*i) for i in self.fluid_states)
+        ]
+
+    def test_evaluate_humid_air_partial_derivatives_raises_value_error(self):
+        derivative = (Parameters.Density, Parameters.Pressure, Parameters.Temperature)
+        with pytest.raises(ValueError) as e:
+            BatchEvaluator(1).evaluate(HumidAir(), self.humid_air_states, [derivative])
+        assert "Invalid properties: (Density, Pressure, Temperature)!" in str(e.value)
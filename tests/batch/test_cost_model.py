@@ -0,0 +1,101 @@
+import pytest
+
+from pyfluids import (
+    CostModel,
+    Fluid,
+    FluidsList,
+    HumidAir,
+    Input,
+    InputHumidAir,
+    Mixture,
+    Phases,
+)
+
+
+class TestCostModel:
+    fluid: Fluid = Fluid(FluidsList.Water)
+    mixture: Mixture = Mixture([FluidsList.Argon, FluidsList.IsoButane], [50, 50])
+    pt: tuple[Input, Input] = (Input.pressure(101325), Input.temperature(20))
+    hs: tuple[Input, Input] = (Input.enthalpy(2.7e6), Input.entropy(7e3))
+
+    @pytest.mark.parametrize("smoothing", [0, -1, 1.5])
+    def test_invalid_smoothing_raises_value_error(self, smoothing: float):
+        with pytest.raises(ValueError) as e:
+            CostModel(smoothing)
+        assert "Invalid smoothing factor! It should be in (0;1]." in str(e.value)
+
+    def test_key_does_not_depend_on_inputs_values_and_order(self):
+        model = CostModel()
+        assert model.key(self.fluid, self.pt) == model.key(
+            self.fluid, (Input.temperature(50), Input.pressure(1e6))
+        )
+
+    def test_key_depends_on_fluid_and_specified_phase(self):
+        model = CostModel()
+        keys = {
+            model.key(self.fluid, self.pt),
+            model.key(Fluid(FluidsList.Ethanol), self.pt),
+            model.key(Fluid(FluidsList.Water).specify_phase(Phases.Liquid), self.pt),
+            model.key(self.mixture, self.pt),
+        }
+        assert len(keys) == 4
+
+    def test_key_depends_on_fraction_of_binary_mixture(self):
+        model = CostModel()
+        assert model.key(Fluid(FluidsList.MPG, 20), self.pt) != model.key(
+            Fluid(FluidsList.MPG, 60), self.pt
+        )
+
+    def test_estimate_hs_flash_is_more_expensive_than_pt_flash(self):
+        model = CostModel()
+        assert model.estimate(model.key(self.fluid, self.hs)) > model.estimate(
+            model.key(self.fluid, self.pt)
+        )
+
+    def test_estimate_mixture_is_more_expensive_than_pure_fluid(self):
+        model = CostModel()
+        assert model.estimate(model.key(self.mixture, self.pt)) > model.estimate(
+            model.key(self.fluid, self.pt)
+        )
+
+    def test_estimate_specified_phase_is_cheaper(self):
+        model = CostModel()
+        liquid = Fluid(FluidsList.Water).specify_phase(Phases.Liquid)
+        assert model.estimate(model.key(liquid, self.pt)) < model.estimate(
+            model.key(self.fluid, self.pt)
+        )
+
+    def test_estimate_humid_air_wet_bulb_is_more_expensive(self):
+        model = CostModel()
+        pressure, temperature = InputHumidAir.pressure(
+            101325
+        ), InputHumidAir.temperature(20)
+        assert model.estimate(
+            model.key(
+                HumidAir(),
+                (pressure, temperature, InputHumidAir.wet_bulb_temperature(15)),
+            )
+        ) > model.estimate(
+            model.key(
+                HumidAir(),
+                (pressure, temperature, InputHumidAir.relative_humidity(50)),
+            )
+        )
+
+    def test_record_updates_estimate_by_moving_average(self):
+        model = CostModel(0.5)
+        key = model.key(self.fluid, self.pt)
+        model.record(key, 4.0, 2)
+        assert model.estimate(key) == 2.0
+        model.record(key, 4.0)
+        assert model.estimate(key) == 3.0
+        model.record(key, 1.0, 0)
+        assert model.estimate(key) == 3.0
+
+    def test_reset_restores_prior_estimate(self):
+        model = CostModel()
+        key = model.key(self.fluid, self.pt)
+        prior = model.estimate(key)
+        model.record(key, 1.0)
+        model.reset()
+        assert model.estimate(key) == prior
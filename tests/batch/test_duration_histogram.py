@@ -0,0 +1,52 @@
+import pytest
+from CoolProp import CoolProp
+
+from pyfluids import DurationHistogram
+
+
+class TestDurationHistogram:
+    @pytest.mark.parametrize("bounds", [[], [0, 1], [1e-3, 1e-4]])
+    def test_invalid_bounds_raises_value_error(self, bounds: list[float]):
+        with pytest.raises(ValueError) as e:
+            DurationHistogram(bounds)
+        assert (
+            "Invalid bounds! They should be positive and sorted in ascending order."
+            in str(e.value)
+        )
+
+    def test_default_bounds_cover_microseconds_to_seconds(self):
+        bounds = DurationHistogram().bounds
+        assert bounds[0] == pytest.approx(1e-6)
+        assert bounds[-1] == pytest.approx(10)
+
+    @pytest.mark.parametrize(
+        "coolprop_keys, expected",
+        [
+            ((CoolProp.iT, CoolProp.iP), "P&T"),
+            ((CoolProp.iHmass, CoolProp.iSmass), "Hmass&Smass"),
+            (("T", "P", "R"), "P&R&T"),
+        ],
+    )
+    def test_pair_returns_sorted_short_names(self, coolprop_keys: tuple, expected: str):
+        assert DurationHistogram.pair(coolprop_keys) == expected
+
+    def test_record_counts_durations_by_buckets(self):
+        histogram = DurationHistogram([1e-3, 1e-2])
+        for duration in (1e-4, 1e-3, 5e-3, 1):
+            histogram.record("P&T", duration)
+        histogram.record_timeout("P&T")
+        histogram.record_timeout("Hmass&Smass")
+        assert histogram.counts("P&T") == [2, 1, 1]
+        assert histogram.counts("D&P") == [0, 0, 0]
+        assert histogram.timeouts("P&T") == 1
+        assert histogram.as_dict() == {
+            "Hmass&Smass": {"buckets": {}, "timeouts": 1},
+            "P&T": {"buckets": {"0.001": 2, "0.01": 1, "inf": 1}, "timeouts": 1},
+        }
+
+    def test_reset_clears_histograms(self):
+        histogram = DurationHistogram()
+        histogram.record("P&T", 1e-5)
+        histogram.record_timeout("P&T")
+        histogram.reset()
+        assert histogram.as_dict() == {}
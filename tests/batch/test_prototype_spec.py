@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+
+from pyfluids import (
+    Fluid,
+    FluidsList,
+    HumidAir,
+    Input,
+    InputHumidAir,
+    Mixture,
+    Phases,
+    PrototypeSpec,
+    RemoteWorker,
+)
+
+
+class FluidSubclass(Fluid):
+    pass
+
+
+class TestPrototypeSpec:
+    @pytest.mark.parametrize(
+        "prototype",
+        [
+            Fluid(FluidsList.Water),
+            Fluid(FluidsList.MPG, 60),
+            Fluid(FluidsList.Water).specify_phase(Phases.Liquid),
+            Mixture([FluidsList.Argon, FluidsList.IsoButane], [50, 50]),
+            Mixture([FluidsList.R32, FluidsList.R125], [50, 50], "PR"),
+            HumidAir(),
+        ],
+    )
+    def test_create_returns_same_prototype(self, prototype: Fluid | HumidAir):
+        spec = PrototypeSpec.of(prototype)
+        created = spec.create()
+        assert type(created) is type(prototype)
+        assert created is not prototype
+        assert PrototypeSpec.of(created) == spec
+        assert hash(PrototypeSpec.of(created)) == hash(spec)
+
+    def test_of_unsupported_prototype_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            PrototypeSpec.of(FluidSubclass(FluidsList.Water))
+        assert (
+            "Invalid prototype! Only Fluid, Mixture and HumidAir are supported."
+            in str(e.value)
+        )
+
+    def test_create_invalid_kind_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            PrototypeSpec("magic").create()
+        assert "Invalid prototype kind: magic!" in str(e.value)
+
+    def test_input_returns_input_of_suitable_type(self):
+        pressure = Input.pressure(101325)
+        assert PrototypeSpec("fluid").input(pressure.coolprop_key, 101325) == pressure
+        assert PrototypeSpec("humid_air").input("P", 101325) == (
+            InputHumidAir.pressure(101325)
+        )
+
+
+class TestRemoteWorker:
+    def test_evaluate_reuses_instances(self):
+        spec = PrototypeSpec.of(Fluid(FluidsList.Water))
+        states = [
+            tuple((i.coolprop_key, i.value) for i in inputs)
+            for inputs in (
+                (Input.pressure(101325), Input.temperature(20)),
+                (Input.pressure(-1), Input.temperature(20)),
+            )
+        ]
+        rows, durations = RemoteWorker.evaluate(spec, states, ["density"])
+        instances = RemoteWorker.instances()
+        RemoteWorker.evaluate(spec, states, ["density"])
+        assert rows == [
+            {
+                "density": Fluid(FluidsList.Water)
+                .with_state(Input.pressure(101325), Input.temperature(20))
+                .density
+            },
+            None,
+        ]
+        assert len(durations) == 2
+        assert RemoteWorker.probe()
+        assert RemoteWorker.instances() == instances
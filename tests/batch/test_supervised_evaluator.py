@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import pytest
+
+from pyfluids import (
+    DurationHistogram,
+    Fluid,
+    FluidsList,
+    HumidAir,
+    Input,
+    InputHumidAir,
+    Mixture,
+    SupervisedEvaluator,
+    SupervisedWorker,
+)
+
+
+class FluidSubclass(Fluid):
+    pass
+
+
+class TestSupervisedEvaluator:
+    fluid: Fluid = Fluid(FluidsList.Water)
+    fluid_states: list[tuple[Input, Input]] = [
+        (Input.pressure(101325), Input.temperature(temperature))
+        for temperature in range(5, 100, 5)
+    ]
+    mixture: Mixture = Mixture([FluidsList.Argon, FluidsList.IsoButane], [50, 50])
+    mixture_states: list[tuple[Input, Input]] = [
+        (Input.pressure(101325), Input.temperature(temperature))
+        for temperature in range(20, 50, 10)
+    ]
+
+    @pytest.mark.parametrize(
+        "budget, max_workers, message",
+        [
+            (0, 1, "Invalid latency budget! It should be positive."),
+            (1, 0, "Invalid number of workers! It should be positive."),
+        ],
+    )
+    def test_invalid_settings_raises_value_error(
+        self, budget: float, max_workers: int, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            SupervisedEvaluator(budget, max_workers)
+        assert message in str(e.value)
+
+    def test_evaluate_unsupported_prototype_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            SupervisedEvaluator(1).evaluate(
+                FluidSubclass(FluidsList.Water), self.fluid_states, ["density"]
+            )
+        assert "Only Fluid, Mixture and HumidAir are supported" in str(e.value)
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_evaluate_matches_sequential_evaluation(self, max_workers: int):
+        humid_air_states = [
+            (
+                InputHumidAir.pressure(101325),
+                InputHumidAir.temperature(20),
+                InputHumidAir.relative_humidity(50),
+            )
+        ]
+        with SupervisedEvaluator(10, max_workers) as evaluator:
+            fluid_results = evaluator.evaluate(
+                self.fluid, self.fluid_states, ["density", "phase"]
+            )
+            humid_air_results = evaluator.evaluate(
+                HumidAir(), humid_air_states, ["humidity"]
+            )
+            assert evaluator.timeouts == 0
+        assert fluid_results == [
+            {"density": fluid.density, "phase": fluid.phase}
+            for fluid in (self.fluid.with_state(*i) for i in self.fluid_states)
+        ]
+        assert humid_air_results == [
+            {"humidity": HumidAir().with_state(*humid_air_states[0]).humidity}
+        ]
+
+    def test_evaluate_invalid_states_returns_none(self):
+        states = [
+            (Input.pressure(-1), Input.temperature(20)),
+            (Input.pressure(101325), Input.temperature(20)),
+        ]
+        with SupervisedEvaluator(10) as evaluator:
+            results = evaluator.evaluate(self.fluid, states, ["density"])
+        assert results[0] is None
+        assert not SupervisedEvaluator.timed_out(results[0])
+        assert results[1] == {"density": self.fluid.with_state(*states[1]).density}
+
+    def test_evaluate_over_budget_states_returns_nan_and_recycles_worker(self):
+        with SupervisedEvaluator(1e-5) as evaluator:
+            results = evaluator.evaluate(
+                self.mixture, self.mixture_states, ["density", "enthalpy"]
+            )
+            assert evaluator.timeouts == len(self.mixture_states)
+            assert evaluator.recycled_workers == len(self.mixture_states)
+            assert evaluator.histogram.timeouts("P&T") == len(self.mixture_states)
+        assert all(SupervisedEvaluator.timed_out(i) for i in results)
+        assert all(math.isnan(i["enthalpy"]) for i in results)
+
+    @pytest.mark.parametrize(
+        "result",
+        [None, {}, {"density": math.nan}, {"density": math.nan, "phase": None}],
+    )
+    def test_timed_out_evaluated_result_returns_false(
+        self, result: dict[str, Any] | None
+    ):
+        assert not SupervisedEvaluator.timed_out(result)
+
+    def test_evaluate_with_preloaded_fork_server_returns_results(self):
+        SupervisedWorker.preload()
+        with SupervisedEvaluator(10) as evaluator:
+            assert evaluator.evaluate(
+                self.fluid, self.fluid_states[:1], ["density"]
+            ) == [{"density": self.fluid.with_state(*self.fluid_states[0]).density}]
+
+    def test_evaluate_after_timeouts_returns_results(self):
+        with SupervisedEvaluator(1e-5) as evaluator:
+            evaluator.evaluate(self.mixture, self.mixture_states, ["density"])
+        with SupervisedEvaluator(10) as evaluator:
+            assert evaluator.evaluate(
+                self.mixture, self.mixture_states, ["density"]
+            ) == [
+                {"density": self.mixture.with_state(*i).density}
+                for i in self.mixture_states
+            ]
+
+    def test_evaluate_records_durations_by_inputs_pair(self):
+        histogram = DurationHistogram()
+        states = [*self.fluid_states, (Input.pressure(101325), Input.quality(50))]
+        with SupervisedEvaluator(10, histogram=histogram) as evaluator:
+            evaluator.evaluate(self.fluid, states, ["density"])
+            assert evaluator.histogram is histogram
+        assert sum(histogram.counts("P&T")) == len(self.fluid_states)
+        assert sum(histogram.counts("P&Q")) == 1
@@ -0,0 +1,40 @@
+import pytest
+
+from pyfluids import WorkQueue
+
+
+class TestWorkQueue:
+    @pytest.mark.parametrize(
+        "workers, chunk_size, message",
+        [
+            (0, None, "Invalid number of workers! It should be positive."),
+            (1, 0, "Invalid chunk size! It should be positive."),
+        ],
+    )
+    def test_invalid_settings_raises_value_error(
+        self, workers: int, chunk_size: int, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            WorkQueue([1.0], workers, chunk_size)
+        assert message in str(e.value)
+
+    def test_next_chunk_returns_each_state_once_most_expensive_first(self):
+        costs = [1.0, 100.0, 1.0, 50.0, 1.0, 1.0, 1.0, 1.0]
+        queue = WorkQueue(costs, 2)
+        chunks = []
+        while queue.remaining:
+            chunks.append(queue.next_chunk())
+        assert chunks[0] == [1]
+        assert sorted(i for chunk in chunks for i in chunk) == list(range(len(costs)))
+        assert queue.next_chunk() == []
+
+    def test_next_chunk_adaptive_size_grows_for_cheap_states(self):
+        queue = WorkQueue([1000.0] * 4 + [1.0] * 1000, 2)
+        assert len(queue.next_chunk()) == 1
+        for _ in range(3):
+            queue.next_chunk()
+        assert len(queue.next_chunk()) > 100
+
+    def test_next_chunk_fixed_size(self):
+        queue = WorkQueue([1.0] * 10, 2, 4)
+        assert [len(queue.next_chunk()) for _ in range(4)] == [4, 4, 2, 0]
@@ -0,0 +1,32 @@
+import gc
+
+from pyfluids import Fluid, FluidsList
+from pyfluids.config.fork_safety import _callbacks, reinit_after_fork
+
+
+class Owner:
+    def __init__(self):
+        self.reinitialized = 0
+        reinit_after_fork(self.reinit)
+
+    def reinit(self):
+        self.reinitialized += 1
+
+
+class TestForkSafety:
+    def test_registered_method_is_referenced_weakly(self):
+        owner = Owner()
+        method = _callbacks[max(_callbacks)]()
+        method()
+        assert owner.reinitialized == 1
+
+    def test_registration_does_not_keep_owners_alive(self):
+        # The singletons are registered once
+        Fluid(FluidsList.Water)
+        gc.collect()
+        count = len(_callbacks)
+        fluids = [Fluid(FluidsList.Water) for _ in range(10)]
+        assert len(_callbacks) == count + len(fluids)
+        del fluids
+        gc.collect()
+        assert len(_callbacks) == count
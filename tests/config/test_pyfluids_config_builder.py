@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -36,6 +37,15 @@ class TestPyFluidsConfigBuilder:
         second_config_builder = PyFluidsConfigBuilder()
         assert hash(first_config_builder) == hash(second_config_builder)
 
+    def test_build_multi_threading_returns_same_config(self, tmp_path: Path):
+        os.chdir(tmp_path)
+        self.config_builder._reset()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            configs = list(
+                executor.map(lambda _: PyFluidsConfigBuilder().build(), range(32))
+            )
+        assert len(set(id(config) for config in configs)) == 1
+
     def test_build_invokes_once_then_returns_config_from_cache(self, tmp_path: Path):
         os.chdir(tmp_path)
         self.config_builder._reset()
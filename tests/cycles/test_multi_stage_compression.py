@@ -0,0 +1,188 @@
+import numpy as np
+import pytest
+
+from pyfluids import (
+    CompressionSolution,
+    Fluid,
+    FluidsList,
+    Input,
+    MultiStageCompression,
+)
+
+
+class TestMultiStageCompression:
+    inlet: Fluid = (
+        Fluid(FluidsList.Ammonia)
+        .dew_point_at_temperature(-35)
+        .heating_to_temperature(-30)
+    )
+    outlet_pressure: float = 15e5
+    compression: MultiStageCompression = MultiStageCompression(
+        inlet, outlet_pressure, 35
+    )
+
+    def test_properties_are_the_same(self):
+        assert self.compression.inlet is self.inlet
+        assert self.compression.outlet_pressure == self.outlet_pressure
+        assert self.compression.intercooling_temperature == 35
+
+    def test_invalid_outlet_pressure_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            MultiStageCompression(self.inlet, self.inlet.pressure, 35)
+        assert (
+            "Compressor outlet pressure should be higher than inlet pressure!"
+            in str(e.value)
+        )
+
+    def test_solve_matches_compression_built_by_hand(self):
+        first_outlet = self.inlet.compression_to_pressure(4e5, 75)
+        second_inlet = first_outlet.with_state(
+            Input.pressure(4e5), Input.temperature(35)
+        )
+        second_outlet = second_inlet.compression_to_pressure(self.outlet_pressure, 80)
+        solution = self.compression.solve([4e5], [75, 80])
+        assert solution.stages == 2
+        assert solution.intermediate_pressures == (4e5,)
+        assert solution.stage_inlets[0] is self.inlet
+        assert solution.stage_inlets[1].temperature == pytest.approx(35)
+        assert solution.outlet.pressure == self.outlet_pressure
+        assert solution.outlet.temperature == pytest.approx(second_outlet.temperature)
+        assert solution.stage_works == pytest.approx(
+            (
+                first_outlet.enthalpy - self.inlet.enthalpy,
+                second_outlet.enthalpy - second_inlet.enthalpy,
+            )
+        )
+        assert solution.specific_work == pytest.approx(sum(solution.stage_works))
+        assert solution.specific_intercooling_heat == pytest.approx(
+            first_outlet.enthalpy - second_inlet.enthalpy
+        )
+        assert solution.pressure_ratios == pytest.approx(
+            (4e5 / self.inlet.pressure, self.outlet_pressure / 4e5)
+        )
+
+    def test_solve_without_intermediate_pressures_is_single_stage(self):
+        solution = self.compression.solve([], 75)
+        assert solution == CompressionSolution((self.inlet,), (solution.outlet,))
+        assert solution.specific_work == pytest.approx(
+            self.inlet.compression_to_pressure(self.outlet_pressure, 75).enthalpy
+            - self.inlet.enthalpy
+        )
+        assert solution.specific_intercooling_heat == 0
+
+    def test_solve_intercooling_does_not_condense_the_fluid(self):
+        solution = MultiStageCompression(self.inlet, self.outlet_pressure, 20).solve(
+            [12e5], 75
+        )
+        assert solution.stage_inlets[1].temperature == pytest.approx(
+            self.inlet.dew_point_at_pressure(12e5).temperature
+        )
+
+    def test_solve_batch_matches_single_points(self):
+        pressures = [[3e5, 7e5], [4e5, 7e5], [4e5, 9e5]]
+        efficiencies = [75, [70, 75, 80], 80]
+        solutions = self.compression.solve_batch(pressures, efficiencies)
+        for solution, i, j in zip(solutions, pressures, efficiencies):
+            expected = self.compression.solve(i, j)
+            assert solution.stages == 3
+            assert solution.specific_work == pytest.approx(expected.specific_work)
+            assert solution.outlet.temperature == pytest.approx(
+                expected.outlet.temperature
+            )
+        # The intercooled states are shared between the points
+        assert solutions[1].stage_inlets[1] is solutions[2].stage_inlets[1]
+
+    @pytest.mark.parametrize(
+        "efficiencies",
+        [np.array([70.0, 72.0]), np.array([[70.0, 75.0], [72.0, 75.0]]), np.int64(70)],
+    )
+    def test_solve_batch_numpy_arrays_match_sequences(self, efficiencies):
+        pressures = np.array([[3e5], [4e5]])
+        solutions = self.compression.solve_batch(pressures, efficiencies)
+        expected = self.compression.solve_batch(
+            pressures.tolist(), efficiencies.tolist()
+        )
+        assert len(solutions) == 2
+        for solution, expected_solution in zip(solutions, expected):
+            assert solution.specific_work == pytest.approx(
+                expected_solution.specific_work
+            )
+
+    @pytest.mark.parametrize(
+        "pressures, efficiencies, message",
+        [
+            (
+                [[3e5], [3e5, 7e5]],
+                75,
+                "Need to define the same number of intermediate pressures "
+                "for all points!",
+            ),
+            (
+                [[3e5], [4e5]],
+                [75],
+                "Need to define the isentropic efficiency for each point!",
+            ),
+            (
+                [[3e5], [4e5]],
+                [75, [70, 75, 80]],
+                "Need to define the isentropic efficiency for each stage!",
+            ),
+            (
+                [[7e5, 3e5]],
+                75,
+                "Invalid intermediate pressures! They should increase "
+                "from the inlet pressure to the outlet pressure.",
+            ),
+            (
+                [[20e5]],
+                75,
+                "Invalid intermediate pressures! They should increase "
+                "from the inlet pressure to the outlet pressure.",
+            ),
+        ],
+    )
+    def test_solve_batch_invalid_points_raises_value_error(
+        self, pressures: list[list[float]], efficiencies, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            self.compression.solve_batch(pressures, efficiencies)
+        assert message in str(e.value)
+
+    def test_optimal_has_minimum_specific_work(self):
+        solution = self.compression.optimal(2, 75)
+        pressures = [
+            self.inlet.pressure
+            * (self.outlet_pressure / self.inlet.pressure) ** (i / 20)
+            for i in range(1, 20)
+        ]
+        scan = self.compression.solve_batch([[i] for i in pressures], 75)
+        assert solution.specific_work <= min(i.specific_work for i in scan) + 1e-6
+        assert solution.specific_work < self.compression.solve([], 75).specific_work
+
+    def test_optimal_three_stages_has_minimum_specific_work(self):
+        solution = self.compression.optimal(3, 75)
+        pressures = [
+            self.inlet.pressure
+            * (self.outlet_pressure / self.inlet.pressure) ** (i / 12)
+            for i in range(1, 12)
+        ]
+        scan = self.compression.solve_batch(
+            [[i, j] for i in pressures for j in pressures if i < j], 75
+        )
+        assert len(solution.intermediate_pressures) == 2
+        assert solution.specific_work <= min(i.specific_work for i in scan) + 1e-6
+
+    @pytest.mark.parametrize(
+        "stages, points, refinements, message",
+        [
+            (1, 10, 3, "Invalid number of stages! It should be at least 2."),
+            (2, 1, 3, "Invalid number of points! It should be at least 2."),
+            (2, 10, -1, "Invalid number of refinements!"),
+        ],
+    )
+    def test_optimal_invalid_search_raises_value_error(
+        self, stages: int, points: int, refinements: int, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            self.compression.optimal(stages, 75, points, refinements)
+        assert message in str(e.value)
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from pyfluids import CycleSolution, Fluid, FluidsList, VaporCompressionCycle
+
+
+class TestVaporCompressionCycle:
+    refrigerant: Fluid = Fluid(FluidsList.R134a)
+    cycle: VaporCompressionCycle = VaporCompressionCycle(refrigerant)
+
+    def test_refrigerant_is_the_same(self):
+        assert self.cycle.refrigerant is self.refrigerant
+
+    def test_solve_matches_cycle_built_by_hand(self):
+        evaporator_outlet = self.refrigerant.dew_point_at_temperature(
+            0
+        ).heating_to_temperature(5)
+        bubble_point = self.refrigerant.bubble_point_at_temperature(40)
+        compressor_outlet = evaporator_outlet.compression_to_pressure(
+            bubble_point.pressure, 80
+        )
+        condenser_outlet = bubble_point.cooling_to_temperature(37)
+        evaporator_inlet = condenser_outlet.isenthalpic_expansion_to_pressure(
+            evaporator_outlet.pressure
+        )
+        solution = self.cycle.solve(0, 40, 80, superheat=5, subcooling=3)
+        assert solution == CycleSolution(
+            evaporator_outlet, compressor_outlet, condenser_outlet, evaporator_inlet
+        )
+        assert solution.specific_cooling_capacity == pytest.approx(
+            evaporator_outlet.enthalpy - evaporator_inlet.enthalpy
+        )
+        assert solution.specific_heating_capacity == pytest.approx(
+            compressor_outlet.enthalpy - condenser_outlet.enthalpy
+        )
+        assert solution.specific_work == pytest.approx(
+            compressor_outlet.enthalpy - evaporator_outlet.enthalpy
+        )
+        assert solution.cooling_cop == pytest.approx(
+            solution.specific_cooling_capacity / solution.specific_work
+        )
+        assert solution.heating_cop == pytest.approx(solution.cooling_cop + 1)
+        assert solution.pressure_ratio == pytest.approx(
+            bubble_point.pressure / evaporator_outlet.pressure
+        )
+
+    def test_solve_without_superheat_and_subcooling_uses_saturation_states(self):
+        solution = self.cycle.solve(-10, 35, 75)
+        assert solution.evaporator_outlet == self.refrigerant.dew_point_at_temperature(
+            -10
+        )
+        assert (
+            solution.condenser_outlet
+            == self.refrigerant.bubble_point_at_temperature(35)
+        )
+
+    def test_solve_batch_matches_single_points(self):
+        evaporating_temperatures = [-10, 0, 0, 10]
+        condensing_temperatures = [40, 45, 40, 50]
+        efficiencies = [70, 80, 90, 80]
+        solutions = self.cycle.solve_batch(
+            evaporating_temperatures,
+            condensing_temperatures,
+            efficiencies,
+            superheats=5,
+        )
+        assert len(solutions) == 4
+        for solution, point in zip(
+            solutions,
+            zip(evaporating_temperatures, condensing_temperatures, efficiencies),
+        ):
+            expected = self.cycle.solve(*point, superheat=5)
+            assert solution.cooling_cop == pytest.approx(expected.cooling_cop, 1e-9)
+            assert solution.compressor_outlet.temperature == pytest.approx(
+                expected.compressor_outlet.temperature, 1e-9
+            )
+
+    def test_solve_batch_numpy_arrays_match_sequences(self):
+        solutions = self.cycle.solve_batch(
+            np.array([-10.0, 0.0]), np.array([35.0, 40.0]), 70, np.float64(5)
+        )
+        expected = self.cycle.solve_batch([-10, 0], [35, 40], 70, 5)
+        assert len(solutions) == 2
+        for solution, expected_solution in zip(solutions, expected):
+            assert solution.cooling_cop == pytest.approx(expected_solution.cooling_cop)
+
+    def test_solve_batch_always_shares_same_states(self):
+        solutions = self.cycle.solve_batch(0, [40, 45], 80)
+        assert solutions[0].evaporator_outlet is solutions[1].evaporator_outlet
+        assert solutions[0].condenser_outlet is not solutions[1].condenser_outlet
+
+    @pytest.mark.parametrize(
+        "arguments, message",
+        [
+            (
+                ([0, 5], [40, 45, 50], 80),
+                "Need to define the same number of values for all operating points!",
+            ),
+            (
+                (40, 40, 80),
+                "Condensing temperature should be higher "
+                "than evaporating temperature!",
+            ),
+            ((0, 40, 80, -1), "Invalid superheat!"),
+            ((0, 40, 80, 5, -1), "Invalid subcooling!"),
+            ((0, 40, 100), "Invalid compressor isentropic efficiency!"),
+            (
+                (np.zeros((2, 2)), 40, 80),
+                "Operating points should be one-dimensional!",
+            ),
+        ],
+    )
+    def test_solve_batch_invalid_operating_points_raises_value_error(
+        self, arguments: tuple, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            self.cycle.solve_batch(*arguments)
+        assert message in str(e.value)
@@ -0,0 +1,164 @@
+import pytest
+
+from pyfluids import Fluid, FluidsList, Input, Isoline, IsolineGenerator, Mixture
+
+
+class TestIsolineGenerator:
+    fluid: Fluid = Fluid(FluidsList.Water)
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"refinements": -1}, "Invalid number of refinements!"),
+            ({"cache_size": -1}, "Invalid cache size!"),
+        ],
+    )
+    def test_init_invalid_input_raises_value_error(
+        self, kwargs: dict[str, int], message: str
+    ):
+        with pytest.raises(ValueError, match=message):
+            IsolineGenerator(**kwargs)
+
+    def test_properties_return_entered_values(self):
+        generator = IsolineGenerator(4, 16)
+        assert generator.refinements == 4
+        assert generator.cache_size == 16
+        assert generator.cached_lines == 0
+
+    def test_isolines_points_match_with_state(self):
+        isentrope = IsolineGenerator(0).isolines(
+            self.fluid, [Input.entropy(6e3)], Input.pressure, 1e4, 1e6, 5
+        )[0]
+        assert isinstance(isentrope, Isoline)
+        assert isentrope.constant == Input.entropy(6e3)
+        assert len(isentrope) == 5
+        for i, pressure in enumerate([1e4, 2.575e5, 5.05e5, 7.525e5, 1e6]):
+            expected = self.fluid.with_state(
+                Input.entropy(6e3), Input.pressure(pressure)
+            )
+            assert isentrope.pressures[i] == pytest.approx(pressure)
+            assert isentrope.temperatures[i] == pytest.approx(expected.temperature)
+            assert isentrope.densities[i] == pytest.approx(expected.density)
+            assert isentrope.enthalpies[i] == pytest.approx(expected.enthalpy)
+            assert isentrope.entropies[i] == pytest.approx(6e3)
+            assert isentrope.qualities[i] == (
+                pytest.approx(expected.quality)
+                if expected.quality is not None
+                else None
+            )
+
+    def test_isolines_logarithmic_grid(self):
+        isobar = IsolineGenerator(0).isolines(
+            self.fluid, [Input.temperature(20)], Input.pressure, 1e5, 1e7, 3, True
+        )[0]
+        assert isobar.pressures == pytest.approx((1e5, 1e6, 1e7))
+
+    def test_isolines_are_refined_near_saturation_line(self):
+        isentropes = [
+            IsolineGenerator(refinements).isolines(
+                self.fluid, [Input.entropy(7e3)], Input.pressure, 1e3, 1e7, 20, True
+            )[0]
+            for refinements in (0, 8)
+        ]
+        assert len(isentropes[0]) == 20
+        assert len(isentropes[1]) == 28
+        assert all(i in isentropes[1].pressures for i in isentropes[0].pressures)
+
+    def test_isotherm_contains_saturated_states(self):
+        isotherm = IsolineGenerator().isolines(
+            self.fluid, [Input.temperature(150)], Input.pressure, 1e4, 1e7, 50, True
+        )[0]
+        saturation_pressure = self.fluid.dew_point_at_temperature(150).pressure
+        index = isotherm.qualities.index(100)
+        assert isotherm.qualities[index + 1] == 0
+        assert isotherm.pressures[index] == pytest.approx(saturation_pressure)
+        assert isotherm.pressures[index + 1] == pytest.approx(saturation_pressure)
+        assert isotherm.enthalpies[index] == pytest.approx(
+            self.fluid.dew_point_at_temperature(150).enthalpy
+        )
+        assert isotherm.enthalpies[index + 1] == pytest.approx(
+            self.fluid.bubble_point_at_temperature(150).enthalpy
+        )
+        assert list(isotherm.pressures) == sorted(isotherm.pressures)
+
+    def test_isobar_on_ts_diagram_contains_saturated_states(self):
+        isobar = IsolineGenerator().isolines(
+            self.fluid, [Input.pressure(1e6)], Input.temperature, 20, 400, 50
+        )[0]
+        index = isobar.qualities.index(0)
+        assert isobar.qualities[index + 1] == 100
+        assert isobar.entropies[index] < isobar.entropies[index + 1]
+
+    def test_isolines_invalid_points_are_skipped(self):
+        bubble_line = IsolineGenerator().isolines(
+            self.fluid, [Input.quality(0)], Input.pressure, 1e4, 3e7, 10
+        )[0]
+        assert 0 < len(bubble_line) < 10 + IsolineGenerator().refinements
+        assert max(bubble_line.pressures) < self.fluid.critical_pressure
+        assert max(bubble_line.pressures) > 0.99 * self.fluid.critical_pressure
+
+    def test_isolines_mixture(self):
+        mixture = Mixture([FluidsList.Water, FluidsList.Ethanol], [60, 40])
+        isotherm = IsolineGenerator().isolines(
+            mixture, [Input.temperature(20)], Input.pressure, 1e5, 1e6, 5
+        )[0]
+        assert len(isotherm) == 5
+
+    def test_isolines_are_cached(self):
+        generator = IsolineGenerator()
+        constants = [Input.temperature(20), Input.quality(50)]
+        isolines = generator.isolines(self.fluid, constants, Input.pressure, 1e4, 1e6)
+        assert generator.cached_lines == 2
+        cached = generator.isolines(
+            Fluid(FluidsList.Water), constants[::-1], Input.pressure, 1e4, 1e6
+        )
+        assert cached[0] is isolines[1]
+        assert cached[1] is isolines[0]
+        other = generator.isolines(self.fluid, constants, Input.pressure, 1e4, 2e6)
+        assert other[0] is not isolines[0]
+        assert generator.cached_lines == 4
+        generator.clear_cache()
+        assert generator.cached_lines == 0
+
+    def test_isolines_cache_size_is_limited(self):
+        generator = IsolineGenerator(cache_size=2)
+        constants = [Input.temperature(i) for i in (20, 30, 40)]
+        isolines = generator.isolines(self.fluid, constants, Input.pressure, 1e4, 1e6)
+        assert generator.cached_lines == 2
+        assert (
+            generator.isolines(self.fluid, constants[2:], Input.pressure, 1e4, 1e6)[0]
+            is isolines[2]
+        )
+        assert (
+            generator.isolines(self.fluid, constants[:1], Input.pressure, 1e4, 1e6)[0]
+            is not isolines[0]
+        )
+
+    def test_isolines_without_cache(self):
+        generator = IsolineGenerator(cache_size=0)
+        generator.isolines(
+            self.fluid, [Input.temperature(20)], Input.pressure, 1e4, 1e6
+        )
+        assert generator.cached_lines == 0
+
+    @pytest.mark.parametrize(
+        "start, stop, points, logarithmic, message",
+        [
+            (1e4, 1e6, 1, False, "Invalid number of points! It should be at least 2."),
+            (1e6, 1e4, 10, False, "Invalid range of the varying input!"),
+            (0, 1e6, 10, True, "Invalid range of the varying input!"),
+        ],
+    )
+    def test_isolines_invalid_grid_raises_value_error(
+        self, start: float, stop: float, points: int, logarithmic: bool, message: str
+    ):
+        with pytest.raises(ValueError, match=message):
+            IsolineGenerator().isolines(
+                self.fluid,
+                [Input.temperature(20)],
+                Input.pressure,
+                start,
+                stop,
+                points,
+                logarithmic,
+            )
@@ -0,0 +1,13 @@
+import pytest
+
+from pyfluids import Executors
+
+
+class TestExecutors:
+    @pytest.mark.parametrize("executor", list(Executors))
+    def test_repr_always_returns_name(self, executor: Executors):
+        assert repr(executor) == executor.name
+
+    @pytest.mark.parametrize("executor", list(Executors))
+    def test_str_always_returns_name(self, executor: Executors):
+        assert str(executor) == executor.name
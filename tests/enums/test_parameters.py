@@ -0,0 +1,13 @@
+import pytest
+
+from pyfluids import Parameters
+
+
+class TestParameters:
+    @pytest.mark.parametrize("parameter", list(Parameters))
+    def test_repr_always_returns_name(self, parameter: Parameters):
+        assert repr(parameter) == parameter.name
+
+    @pytest.mark.parametrize("parameter", list(Parameters))
+    def test_str_always_returns_name(self, parameter: Parameters):
+        assert str(parameter) == parameter.name
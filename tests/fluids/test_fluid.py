@@ -2,12 +2,23 @@ from __future__ import annotations
 
 import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from math import isinf, isnan
 
 import pytest
 from CoolProp.CoolProp import PropsSI
 
-from pyfluids import Fluid, FluidsList, Phases, Input
+from pyfluids import (
+    Fluid,
+    FluidsList,
+    Parameters,
+    Phases,
+    Input,
+    IsobarSplineCache,
+    SuperancillaryCache,
+    Target,
+)
+from pyfluids.fluids import abstract_fluid
 
 
 class TestFluid:
@@ -99,11 +110,307 @@ class TestFluid:
             self.fluid.with_state(Input.pressure(101325), Input.pressure(1e5))
         assert "Need to define 2 unique inputs!" in str(e.value)
 
+    def test_with_state_in_threads_matches_sequential_evaluation(self):
+        temperatures = [float(i) for i in range(5, 95)] * 5
+        expected = {
+            i: self.fluid.with_state(
+                Input.pressure(101325), Input.temperature(i)
+            ).density
+            for i in temperatures
+        }
+        # Each thread updates and reads its own instance
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            actual = list(
+                executor.map(
+                    lambda i: self.fluid.with_state(
+                        Input.pressure(101325), Input.temperature(i)
+                    ).density,
+                    temperatures,
+                )
+            )
+        assert actual == [expected[i] for i in temperatures]
+
+    def test_update_of_shared_instance_in_threads_keeps_backend_consistent(self):
+        temperatures = [float(i) for i in range(5, 95)] * 5
+        densities = {
+            self.fluid.with_state(Input.pressure(101325), Input.temperature(i)).density
+            for i in temperatures
+        }
+        fluid = self.fluid.factory()
+
+        def evaluate(temperature: float) -> float:
+            fluid.update(Input.pressure(101325), Input.temperature(temperature))
+            return fluid.density
+
+        # The properties may belong to the state of another thread,
+        # but always to a complete one
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert set(executor.map(evaluate, temperatures)) <= densities
+
     def test_update_always_inputs_are_cached(self):
         self.fluid.update(Input.pressure(101325), Input.temperature(20))
         assert self.fluid.pressure == 101325
         assert self.fluid.temperature == 20
 
+    @pytest.mark.parametrize(
+        "fixed_input, varying_input, values",
+        [
+            (Input.pressure(1e6), Input.enthalpy, [1e5, 1.5e5, 2e5]),
+            (Input.pressure(1e6), Input.enthalpy, [7e5, 1.5e6, 2e6]),
+            (Input.pressure(1e6), Input.entropy, [6.6e3, 6.7e3, 6.8e3]),
+            (Input.entropy(7e3), Input.enthalpy, [2.9e6, 3e6, 3.1e6]),
+        ],
+    )
+    def test_sweep_always_matches_with_state(
+        self, fixed_input: Input, varying_input, values: list[float]
+    ):
+        origin = self.fluid.with_state(Input.pressure(101325), Input.temperature(20))
+        states = origin.sweep(fixed_input, varying_input, values)
+        for value, state in zip(values, states):
+            expected = self.fluid.with_state(fixed_input, varying_input(value))
+            assert state.temperature == pytest.approx(expected.temperature, 1e-9)
+            assert state.density == pytest.approx(expected.density, 1e-9)
+            assert state.phase == expected.phase
+
+    def test_sweep_always_updates_same_new_instance(self):
+        states = list(
+            self.fluid.sweep(Input.pressure(101325), Input.temperature, [20, 30, 40])
+        )
+        assert all(state is states[0] for state in states)
+        assert states[0] is not self.fluid
+        assert states[0].temperature == 40
+
+    def test_update_far_guess_falls_back_to_usual_flash(self):
+        guess = self.fluid.with_state(Input.pressure(1e3), Input.temperature(1000))
+        expected = self.fluid.with_state(Input.pressure(1e8), Input.enthalpy(1e5))
+        actual = self.fluid.factory()
+        actual.update(Input.pressure(1e8), Input.enthalpy(1e5), guess_from=guess)
+        assert actual.temperature == pytest.approx(expected.temperature, 1e-9)
+        assert actual.pressure == 1e8
+        assert actual.enthalpy == 1e5
+
+    def test_update_guess_from_itself_uses_previous_state(self):
+        fluid = self.fluid.with_state(Input.pressure(1e6), Input.enthalpy(1e5))
+        fluid.update(Input.pressure(1e6), Input.enthalpy(1.1e5), guess_from=fluid)
+        assert fluid.temperature == pytest.approx(
+            self.fluid.with_state(
+                Input.pressure(1e6), Input.enthalpy(1.1e5)
+            ).temperature,
+            1e-9,
+        )
+
+    @pytest.mark.parametrize(
+        "second_input", [Input.enthalpy(1.5e6), Input.entropy(4e3)]
+    )
+    def test_update_guess_outside_target_two_phase_state_matches_usual_flash(
+        self, second_input: Input
+    ):
+        guess = self.fluid.with_state(Input.pressure(1e6), Input.temperature(200))
+        expected = self.fluid.with_state(Input.pressure(1e6), second_input)
+        actual = self.fluid.factory()
+        actual.update(Input.pressure(1e6), second_input, guess_from=guess)
+        assert actual.phase == Phases.TwoPhase
+        assert actual.quality == pytest.approx(expected.quality, 1e-9)
+        assert actual.temperature == pytest.approx(expected.temperature, 1e-9)
+
+    @pytest.mark.parametrize(
+        "second_input",
+        [Input.enthalpy(1.5e6), Input.entropy(4e3), Input.quality(30)],
+    )
+    def test_update_two_phase_interpolated_state_matches_usual_flash(
+        self, second_input: Input
+    ):
+        fluid = self.fluid.factory().enable_two_phase_interpolation()
+        actual = fluid.with_state(Input.pressure(1e6), second_input)
+        expected = fluid.disable_two_phase_interpolation().with_state(
+            Input.pressure(1e6), second_input
+        )
+        for key, value in expected.as_dict().items():
+            assert getattr(actual, key) == (
+                pytest.approx(value, 1e-12) if isinstance(value, float) else value
+            )
+        assert actual.partial_derivative(
+            Parameters.Density, Parameters.Enthalpy, Parameters.Pressure
+        ) == pytest.approx(
+            expected.partial_derivative(
+                Parameters.Density, Parameters.Enthalpy, Parameters.Pressure
+            ),
+            1e-9,
+        )
+
+    @pytest.mark.parametrize(
+        "second_input",
+        [Input.enthalpy(2e5), Input.enthalpy(3e6), Input.entropy(7e3)],
+    )
+    def test_update_at_prepared_isobar_matches_usual_flash(self, second_input: Input):
+        fluid = self.fluid.factory()
+        assert fluid.prepare_isobars([1.5e6]) is fluid
+        try:
+            actual = fluid.with_state(Input.pressure(1.5e6), second_input)
+            IsobarSplineCache().enabled = False
+            try:
+                expected = fluid.with_state(Input.pressure(1.5e6), second_input)
+            finally:
+                IsobarSplineCache().enabled = True
+        finally:
+            IsobarSplineCache().clear()
+        for key, value in expected.as_dict().items():
+            assert getattr(actual, key) == (
+                pytest.approx(value, 1e-5) if isinstance(value, float) else value
+            )
+        assert actual.partial_derivative(
+            Parameters.Density, Parameters.Enthalpy, Parameters.Pressure
+        ) == pytest.approx(
+            expected.partial_derivative(
+                Parameters.Density, Parameters.Enthalpy, Parameters.Pressure
+            ),
+            1e-8,
+        )
+        assert self.fluid.with_state(
+            Input.pressure(1.5e6),
+            Input.entropy(expected.entropy + 1),
+            guess_from=actual,
+        ).temperature == pytest.approx(
+            expected.with_state(
+                Input.pressure(1.5e6), Input.entropy(expected.entropy + 1)
+            ).temperature,
+            1e-9,
+        )
+
+    def test_prepared_isobars_are_used_only_by_instances_which_asked_for_them(self):
+        state = (Input.pressure(1.5e6), Input.enthalpy(3e6))
+        expected = self.fluid.with_state(*state).temperature
+        prepared = self.fluid.factory().prepare_isobars([1.5e6], 1e-2)
+        try:
+            loose = prepared.with_state(*state).temperature
+            assert loose != expected
+            assert self.fluid.with_state(*state).temperature == expected
+            assert (
+                self.fluid.factory()
+                .prepare_isobars([2e6], 1e-2)
+                .with_state(*state)
+                .temperature
+                == expected
+            )
+            assert self.fluid.factory().prepare_isobars([1.5e6], 1e-8).with_state(
+                *state
+            ).temperature == pytest.approx(expected, 1e-8)
+        finally:
+            IsobarSplineCache().clear()
+
+    def test_prepare_isobars_invalid_tolerance_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            self.fluid.prepare_isobars([1.5e6], 0)
+        assert "Invalid tolerance! It should be positive." in str(e.value)
+
+    def test_update_two_phase_state_by_default_is_not_interpolated(self):
+        SuperancillaryCache().clear()
+        self.fluid.with_state(Input.pressure(1e6), Input.enthalpy(1.5e6))
+        assert SuperancillaryCache().cached_saturated_states == 0
+        self.fluid.factory().enable_two_phase_interpolation().with_state(
+            Input.pressure(1e6), Input.enthalpy(1.5e6)
+        )
+        assert SuperancillaryCache().cached_saturated_states == 1
+        SuperancillaryCache().clear()
+
+    def test_update_outside_dome_is_not_interpolated(self):
+        fluid = self.fluid.with_state(Input.pressure(1e6), Input.enthalpy(3e6))
+        assert fluid.phase == Phases.Gas
+        assert fluid.quality is None
+
+    @pytest.mark.parametrize("name", [FluidsList.R454B, FluidsList.R407CMix])
+    @pytest.mark.parametrize(
+        "pressure, state",
+        [
+            (25e5, Input.temperature(80)),
+            (25e5, Input.quality(40)),
+            (25e5, Input.quality(1)),
+            (25e5, Input.quality(99)),
+            (25e5, Input.temperature(20)),
+            (101325, Input.temperature(-60)),
+            (101325, Input.quality(70)),
+            (101325, Input.temperature(40)),
+        ],
+    )
+    def test_update_zeotropic_blend_with_pressure_and_enthalpy_matches_reference(
+        self, name: FluidsList, pressure: float, state: Input
+    ):
+        # The reference states are flashed by CoolProp with pressure
+        # and temperature or quality as inputs
+        blend = Fluid(name)
+        expected = blend.with_state(Input.pressure(pressure), state)
+        for second_input in (
+            Input.enthalpy(expected.enthalpy),
+            Input.entropy(expected.entropy),
+        ):
+            actual = blend.with_state(Input.pressure(pressure), second_input)
+            assert actual.temperature == pytest.approx(expected.temperature, 1e-9)
+            assert actual.density == pytest.approx(expected.density, 1e-8)
+            if expected.quality is not None:
+                assert actual.quality == pytest.approx(expected.quality, 1e-7)
+
+    @pytest.mark.parametrize(
+        "name, temperature",
+        [
+            (FluidsList.Water, 20),
+            (FluidsList.Water, 250),
+            (FluidsList.R407C, 0),
+            (FluidsList.R407C, 80),
+        ],
+    )
+    def test_update_with_pressure_and_enthalpy_matches_coolprop_flash(
+        self, name: FluidsList, temperature: float
+    ):
+        # The iterative solution for the mixtures is only a fallback,
+        # so the successful CoolProp flash calculations are not affected
+        fluid = Fluid(name).with_state(
+            Input.pressure(1e6), Input.temperature(temperature)
+        )
+        assert (
+            fluid.factory()
+            .with_state(Input.pressure(1e6), Input.enthalpy(fluid.enthalpy))
+            .temperature
+            == PropsSI("T", "P", 1e6, "H", fluid.enthalpy, name.coolprop_name) - 273.15
+        )
+
+    @pytest.mark.parametrize("name", [FluidsList.Water, FluidsList.R407C])
+    def test_critical_points_of_pure_fluid_match_critical_properties(
+        self, name: FluidsList
+    ):
+        fluid = Fluid(name)
+        points = fluid.critical_points()
+        assert len(points) == 1
+        assert points[0].pressure == fluid.critical_pressure
+        assert points[0].temperature == fluid.critical_temperature
+        assert points[0].density == pytest.approx(
+            fluid.with_state(
+                Input.pressure(fluid.critical_pressure),
+                Input.temperature(fluid.critical_temperature),
+            ).density,
+            1e-2,
+        )
+        assert points[0].stable
+
+    def test_critical_points_of_incompressible_fluid_raises_value_error(self):
+        with pytest.raises(ValueError):
+            Fluid(FluidsList.MEG, 40).critical_points()
+
+    def test_phase_envelope_of_predefined_blend(self):
+        fluid = Fluid(FluidsList.R454B)
+        envelope = fluid.phase_envelope()
+        dew_point = fluid.dew_point_at_pressure(envelope.pressures[10])
+        assert dew_point.temperature == pytest.approx(envelope.temperatures[10], 1e-6)
+
+    @pytest.mark.parametrize(
+        "fluid",
+        [Fluid(FluidsList.Water), Fluid(FluidsList.R407C), Fluid(FluidsList.MEG, 40)],
+    )
+    def test_phase_envelope_of_pure_fluid_raises_value_error(self, fluid: Fluid):
+        with pytest.raises(
+            ValueError, match="The phase envelope is available only for HEOS mixtures!"
+        ):
+            fluid.phase_envelope()
+
     @pytest.mark.parametrize("name", fluid_names)
     def test_update_various_fluids_matches_with_coolprop(self, name: FluidsList):
         self.setup_fluid(name)
@@ -215,6 +522,184 @@ class TestFluid:
             Input.pressure(101325), Input.temperature(20)
         )  # does not raise
 
+    def test_partial_derivative_matches_with_coolprop(self):
+        fluid = self.fluid.with_state(Input.pressure(101325), Input.temperature(20))
+        assert fluid.partial_derivative(
+            Parameters.Enthalpy, Parameters.Temperature, Parameters.Pressure
+        ) == pytest.approx(fluid.specific_heat)
+        assert fluid.partial_derivative(
+            Parameters.Density, Parameters.Pressure, Parameters.Temperature
+        ) == pytest.approx(
+            PropsSI(
+                "d(Dmass)/d(P)|T",
+                "P",
+                101325,
+                "T",
+                293.15,
+                FluidsList.Water.coolprop_name,
+            )
+        )
+
+    def test_partial_derivative_always_is_cached_until_update(self):
+        fluid = self.fluid.with_state(Input.pressure(101325), Input.temperature(20))
+        derivative = (Parameters.Density, Parameters.Temperature, Parameters.Pressure)
+        value = fluid.partial_derivative(*derivative)
+        assert fluid.partial_derivative(*derivative) == value
+        fluid.update(Input.pressure(101325), Input.temperature(50))
+        assert fluid.partial_derivative(*derivative) != value
+
+    def test_partial_derivative_two_phase_matches_finite_difference(self):
+        fluid = self.fluid.with_state(Input.pressure(101325), Input.quality(50))
+        step = 1
+        forward, backward = (
+            self.fluid.with_state(
+                Input.pressure(101325), Input.enthalpy(fluid.enthalpy + i * step)
+            )
+            for i in (1, -1)
+        )
+        assert fluid.partial_derivative(
+            Parameters.Density, Parameters.Enthalpy, Parameters.Pressure
+        ) == pytest.approx((forward.density - backward.density) / (2 * step), 1e-4)
+        with pytest.raises(ValueError):
+            fluid.partial_derivative(
+                Parameters.Enthalpy, Parameters.Temperature, Parameters.Pressure
+            )
+
+    @pytest.mark.parametrize(
+        "defined, derivative, message",
+        [
+            (
+                True,
+                (Parameters.Density, Parameters.Density, Parameters.Pressure),
+                "Need to define 3 unique state variables!",
+            ),
+            (
+                False,
+                (Parameters.Density, Parameters.Pressure, Parameters.Temperature),
+                "Need to define the state!",
+            ),
+        ],
+    )
+    def test_partial_derivative_invalid_call_raises_value_error(
+        self, defined: bool, derivative: tuple[Parameters, ...], message: str
+    ):
+        fluid = (
+            self.fluid.with_state(Input.pressure(101325), Input.temperature(20))
+            if defined
+            else self.fluid.factory()
+        )
+        with pytest.raises(ValueError) as e:
+            fluid.partial_derivative(*derivative)
+        assert message in str(e.value)
+
+    @pytest.mark.parametrize(
+        "first_target, second_target",
+        [
+            ("temperature", "dynamic_viscosity"),
+            ("specific_heat", "density"),
+            ("prandtl", "entropy"),
+            ("pressure", "dynamic_viscosity"),
+        ],
+    )
+    def test_solve_state_outputs_pair_matches_expected_state(
+        self, first_target: str, second_target: str
+    ):
+        expected = self.fluid.with_state(Input.pressure(5e6), Input.temperature(150))
+        solution = self.fluid.solve_state(
+            getattr(Target, first_target)(getattr(expected, first_target)),
+            getattr(Target, second_target)(getattr(expected, second_target)),
+            guess=[Input.pressure(1e6), Input.temperature(120)],
+        )
+        assert 0 < solution.iterations <= 50
+        assert solution.flashes > solution.iterations
+        assert solution.fluid.pressure == pytest.approx(expected.pressure, 1e-6)
+        assert solution.fluid.temperature == pytest.approx(expected.temperature)
+
+    def test_solve_state_counts_only_performed_flashes(self, monkeypatch):
+        solvers = []
+
+        class RecordingSolver(abstract_fluid.InverseSolver):
+            def __init__(self, *args):
+                super().__init__(*args)
+                solvers.append(self)
+
+        monkeypatch.setattr(abstract_fluid, "InverseSolver", RecordingSolver)
+        solution = self.fluid.solve_state(
+            Target.temperature(150),
+            Target.dynamic_viscosity(1.8e-4),
+            guess=[Input.pressure(101325), Input.temperature(20)],
+        )
+        # The failed direct flash and the flash at the initial guess
+        assert solution.flashes == solvers[0].flashes + 2
+        assert solution.fluid.temperature == pytest.approx(150)
+        assert solution.fluid.dynamic_viscosity == pytest.approx(1.8e-4)
+
+    def test_solve_state_inputs_pair_is_solved_directly(self):
+        # The initial guess is not required
+        solution = self.fluid.factory().solve_state(
+            Target.pressure(101325), Target.temperature(20)
+        )
+        assert solution.iterations == 0
+        assert solution.flashes == 1
+        assert solution.fluid == self.fluid.with_state(
+            Input.pressure(101325), Input.temperature(20)
+        )
+
+    def test_solve_state_by_default_starts_from_current_state(self):
+        fluid = self.fluid.with_state(Input.pressure(101325), Input.temperature(20))
+        solution = fluid.solve_state(
+            Target.temperature(25),
+            Target.dynamic_viscosity(
+                fluid.with_state(
+                    Input.pressure(2e5), Input.temperature(25)
+                ).dynamic_viscosity
+            ),
+        )
+        assert solution.fluid.temperature == pytest.approx(25)
+        assert solution.fluid is not fluid
+
+    def test_solve_state_incompressible_binary_mixture_matches_expected_state(self):
+        fluid = Fluid(FluidsList.MPG, 40)
+        expected = fluid.with_state(Input.pressure(2e5), Input.temperature(30))
+        solution = fluid.solve_state(
+            Target.pressure(2e5),
+            Target.dynamic_viscosity(expected.dynamic_viscosity),
+            guess=[Input.pressure(1e5), Input.temperature(10)],
+        )
+        assert solution.fluid.temperature == pytest.approx(30)
+
+    @pytest.mark.parametrize(
+        "targets, guess, message",
+        [
+            (
+                [Target.temperature(20), Target.temperature(30)],
+                [Input.pressure(101325), Input.temperature(20)],
+                "Need to define 2 unique targets!",
+            ),
+            (
+                [Target.temperature(20), Target.dynamic_viscosity(1e-3)],
+                None,
+                "Need to define the initial guess!",
+            ),
+            (
+                [Target.temperature(20), Target.dynamic_viscosity(-1)],
+                [Input.pressure(101325), Input.temperature(20)],
+                "Invalid target value! It should be positive.",
+            ),
+            (
+                [Target.temperature(20), Target.dynamic_viscosity(1)],
+                [Input.pressure(101325), Input.temperature(20)],
+                "Try another initial guess.",
+            ),
+        ],
+    )
+    def test_solve_state_invalid_targets_raises_value_error(
+        self, targets: list[Target], guess: list[Input] | None, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            self.fluid.factory().solve_state(*targets, guess=guess)
+        assert message in str(e.value)
+
     def test_equals_same_returns_true(self):
         origin = self.fluid.with_state(Input.pressure(101325), Input.temperature(5))
         same = self.fluid.with_state(Input.pressure(101325), Input.temperature(5))
@@ -1,6 +1,15 @@
+from __future__ import annotations
+
 import pytest
 
-from pyfluids import Fluid, FluidsList, Input
+from pyfluids import (
+    Fluid,
+    FluidsList,
+    Input,
+    Phases,
+    SaturationLine,
+    SuperancillaryCache,
+)
 
 
 class TestFluidProcesses:
@@ -130,6 +139,64 @@ class TestFluidProcesses:
             ),
         )
 
+    @pytest.mark.parametrize(
+        "method, pressure_ratios",
+        [
+            ("compression_to_pressure", [2, 1.5, 2, 3]),
+            ("expansion_to_pressure", [0.5, 0.8, 0.5, 0.2]),
+        ],
+    )
+    def test_batch_processes_matches_single_ones(
+        self, method: str, pressure_ratios: list[float]
+    ):
+        pressures = [i * self.fluid.pressure for i in pressure_ratios]
+        efficiencies = [60, 70, 80, 90]
+        actual = getattr(self.fluid, method.replace("pressure", "pressures"))(
+            pressures, efficiencies
+        )
+        for pressure, efficiency, state in zip(pressures, efficiencies, actual):
+            expected = getattr(self.fluid, method)(pressure, efficiency)
+            assert state.pressure == expected.pressure
+            assert state.enthalpy == pytest.approx(expected.enthalpy, 1e-9)
+            assert state.temperature == pytest.approx(expected.temperature, 1e-9)
+
+    @pytest.mark.parametrize(
+        "method, pressure_ratios, isentropic_efficiencies, message",
+        [
+            (
+                "compression_to_pressures",
+                [2, 3],
+                [80],
+                "Need to define the isentropic efficiency for each pressure!",
+            ),
+            (
+                "compression_to_pressures",
+                [2, 0.5],
+                [80, 80],
+                "Compressor outlet pressure should be higher than inlet pressure!",
+            ),
+            (
+                "expansion_to_pressures",
+                [0.5, 0.2],
+                [80, 100],
+                "Invalid expander isentropic efficiency!",
+            ),
+        ],
+    )
+    def test_batch_processes_wrong_input_raises_value_error(
+        self,
+        method: str,
+        pressure_ratios: list[float],
+        isentropic_efficiencies: list[float],
+        message: str,
+    ):
+        with pytest.raises(ValueError) as e:
+            getattr(self.fluid, method)(
+                [i * self.fluid.pressure for i in pressure_ratios],
+                isentropic_efficiencies,
+            )
+        assert message in str(e.value)
+
     @pytest.mark.parametrize(
         "temperature_delta, pressure_drop, message",
         [
@@ -251,6 +318,174 @@ class TestFluidProcesses:
             101325, 50
         ) == self.fluid.with_state(Input.pressure(101325), Input.quality(50))
 
+    @pytest.mark.parametrize(
+        "method", ["bubble_point_at_pressure", "dew_point_at_pressure"]
+    )
+    def test_saturation_point_superancillary_matches_general_flash(self, method: str):
+        fast = getattr(self.fluid, method)(2e6)
+        SuperancillaryCache().enabled = False
+        try:
+            general = getattr(self.fluid, method)(2e6)
+        finally:
+            SuperancillaryCache().enabled = True
+        assert fast.pressure == general.pressure
+        assert fast.quality == general.quality
+        assert fast.temperature == pytest.approx(general.temperature, 1e-12)
+        assert fast.density == pytest.approx(general.density, 1e-9)
+        assert fast.enthalpy == pytest.approx(general.enthalpy, 1e-9)
+
+    def test_two_phase_points_at_pressures(self):
+        pressures = [1e4, 101325, 2e6]
+        assert self.fluid.two_phase_points_at_pressures(pressures, 50) == [
+            self.fluid.two_phase_point_at_pressure(i, 50) for i in pressures
+        ]
+
+    def test_two_phase_points_at_pressures_pseudo_pure_fluid(self):
+        fluid = Fluid(FluidsList.Air)
+        assert fluid.two_phase_points_at_pressures([101325], 0) == [
+            fluid.bubble_point_at_pressure(101325)
+        ]
+
+    def test_two_phase_points_at_invalid_pressures_raises_value_error(self):
+        with pytest.raises(ValueError):
+            self.fluid.two_phase_points_at_pressures([101325, 1e8], 50)
+
+    @staticmethod
+    def assert_line_matches_points(line: SaturationLine, points: list[Fluid]):
+        for column, name in (
+            (line.pressures, "pressure"),
+            (line.temperatures, "temperature"),
+            (line.densities, "density"),
+            (line.enthalpies, "enthalpy"),
+            (line.entropies, "entropy"),
+            (line.specific_heats, "specific_heat"),
+            (line.conductivities, "conductivity"),
+            (line.dynamic_viscosities, "dynamic_viscosity"),
+            (line.prandtls, "prandtl"),
+            (line.surface_tensions, "surface_tension"),
+        ):
+            assert column == pytest.approx([getattr(i, name) for i in points])
+
+    @pytest.mark.parametrize(
+        "name", [FluidsList.Water, FluidsList.R407C, FluidsList.Air]
+    )
+    def test_saturation_table_at_temperatures(self, name: FluidsList):
+        fluid = Fluid(name)
+        temperatures = [-190, -180] if name == FluidsList.Air else [0, 20, 60]
+        table = fluid.saturation_table(temperatures=temperatures)
+        assert len(table) == len(temperatures)
+        self.assert_line_matches_points(
+            table.bubble_line,
+            [fluid.bubble_point_at_temperature(i) for i in temperatures],
+        )
+        self.assert_line_matches_points(
+            table.dew_line, [fluid.dew_point_at_temperature(i) for i in temperatures]
+        )
+
+    @pytest.mark.parametrize(
+        "name", [FluidsList.Water, FluidsList.R407C, FluidsList.Air]
+    )
+    def test_saturation_table_at_pressures(self, name: FluidsList):
+        fluid = Fluid(name)
+        pressures = [1e5, 5e5, 2e6]
+        table = fluid.saturation_table(pressures=pressures)
+        assert len(table) == len(pressures)
+        self.assert_line_matches_points(
+            table.bubble_line, [fluid.bubble_point_at_pressure(i) for i in pressures]
+        )
+        self.assert_line_matches_points(
+            table.dew_line, [fluid.dew_point_at_pressure(i) for i in pressures]
+        )
+
+    def test_saturation_table_bubble_and_dew_lines_of_zeotropic_blend(self):
+        table = Fluid(FluidsList.R407C).saturation_table(pressures=[1e6])
+        assert table.bubble_line.temperatures[0] < table.dew_line.temperatures[0]
+        table = self.fluid.saturation_table(pressures=[1e6])
+        assert table.bubble_line.temperatures == table.dew_line.temperatures
+
+    @pytest.mark.parametrize(
+        "temperatures, pressures", [(None, None), ([20], [101325])]
+    )
+    def test_saturation_table_invalid_arguments_raises_value_error(
+        self, temperatures: list[float] | None, pressures: list[float] | None
+    ):
+        with pytest.raises(
+            ValueError, match="Need to define either temperatures or pressures!"
+        ):
+            self.fluid.saturation_table(temperatures, pressures)
+
+    def test_saturation_table_invalid_pressure_raises_value_error(self):
+        with pytest.raises(ValueError):
+            self.fluid.saturation_table(pressures=[101325, 1e8])
+
+    @pytest.mark.parametrize(
+        "inlet, process",
+        [
+            (
+                Input.temperature(150),
+                lambda fluid: fluid.isentropic_compression_to_pressure(5e5),
+            ),
+            (
+                Input.temperature(150),
+                lambda fluid: fluid.compression_to_pressure(5e5, 80),
+            ),
+            (
+                Input.temperature(150),
+                lambda fluid: fluid.isenthalpic_expansion_to_pressure(5e4),
+            ),
+            (
+                Input.temperature(150),
+                lambda fluid: fluid.expansion_to_pressure(5e4, 80),
+            ),
+            (Input.temperature(150), lambda fluid: fluid.heating_to_enthalpy(3e6)),
+            (Input.temperature(80), lambda fluid: fluid.cooling_to_enthalpy(2e5)),
+            (
+                Input.temperature(150),
+                lambda fluid: fluid.isentropic_expansion_to_pressure(1e4),
+            ),
+            (Input.temperature(80), lambda fluid: fluid.heating_to_enthalpy(1e6)),
+            (Input.temperature(80), lambda fluid: fluid.cooling_to_temperature(20)),
+            (Input.temperature(150), lambda fluid: fluid.heating_to_temperature(300)),
+            (Input.temperature(150), lambda fluid: fluid.cooling_to_temperature(50)),
+            (Input.temperature(80), lambda fluid: fluid.heating_to_temperature(150)),
+            (
+                Input.temperature(80),
+                lambda fluid: fluid.cooling_to_temperature(20, pressure_drop=1e4),
+            ),
+        ],
+    )
+    def test_processes_with_phase_hints_matches_without_hints(
+        self, inlet: Input, process
+    ):
+        fluid = Fluid(FluidsList.Water).with_state(Input.pressure(101325), inlet)
+        expected = process(fluid)
+        actual = process(fluid.clone().enable_phase_hints())
+        assert actual.pressure == expected.pressure
+        assert actual.phase == expected.phase
+        assert actual.temperature == pytest.approx(expected.temperature, 1e-9)
+        assert actual.enthalpy == pytest.approx(expected.enthalpy, 1e-9)
+        assert actual.entropy == pytest.approx(expected.entropy, 1e-9)
+
+    def test_phase_hints_always_are_inherited_by_end_states(self):
+        fluid = self.fluid.clone().enable_phase_hints()
+        first = fluid.isentropic_compression_to_pressure(self.high_pressure)
+        second = first.cooling_to_temperature(first.temperature - 10)
+        assert (
+            second.compression_to_pressure(2 * second.pressure, 80).phase == Phases.Gas
+        )
+        assert second.disable_phase_hints() is second
+
+    def test_phase_hints_with_specified_phase_are_ignored(self):
+        fluid = (
+            self.fluid.clone()
+            .specify_phase(Phases.Gas)
+            .enable_phase_hints()
+            .isentropic_compression_to_pressure(self.high_pressure)
+        )
+        assert fluid == self.fluid.isentropic_compression_to_pressure(
+            self.high_pressure
+        )
+
     def test_mixing_wrong_fluids_raises_value_error(self):
         first = Fluid(FluidsList.Ammonia).dew_point_at_pressure(101325)
         second = self.fluid.heating_to_temperature(
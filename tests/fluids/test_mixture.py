@@ -4,7 +4,16 @@ import json
 
 import pytest
 
-from pyfluids import Mixture, FluidsList, Input, Phases
+from pyfluids import (
+    CriticalPointsCache,
+    Mixture,
+    FluidsList,
+    Input,
+    Parameters,
+    PhaseEnvelopeCache,
+    Phases,
+    Target,
+)
 
 
 class TestMixture:
@@ -51,6 +60,35 @@ class TestMixture:
             Mixture(fluids, fractions)
         assert message in str(e.value)
 
+    def test_mixture_wrong_backend_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            Mixture(self.mixture.fluids, self.mixture.fractions, "BICUBIC&HEOS")
+        assert "Invalid backend! It should be one of: HEOS, PR, SRK." in str(e.value)
+
+    def test_mixture_components_unavailable_for_backend_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            Mixture([FluidsList.Air, FluidsList.R32], [50, 50], "PR")
+        assert (
+            "Invalid components! All of them should be a pure fluid with PR backend."
+            in str(e.value)
+        )
+
+    @pytest.mark.parametrize("coolprop_backend", ["PR", "SRK"])
+    def test_cubic_backend_matches_heos_approximately(self, coolprop_backend: str):
+        heos = Mixture([FluidsList.R32, FluidsList.R125], [30, 70])
+        cubic = Mixture(heos.fluids, heos.fractions, coolprop_backend)
+        assert heos.coolprop_backend == "HEOS"
+        assert cubic.coolprop_backend == coolprop_backend
+        assert cubic.factory().coolprop_backend == coolprop_backend
+        assert cubic.with_fractions([50, 50]).coolprop_backend == coolprop_backend
+        assert cubic.bubble_point_at_pressure(1e6).temperature == pytest.approx(
+            heos.bubble_point_at_pressure(1e6).temperature, abs=1
+        )
+        inputs = [Input.pressure(101325), Input.temperature(20)]
+        gas = cubic.specify_phase(Phases.Gas).with_state(*inputs)
+        assert gas.density == pytest.approx(heos.with_state(*inputs).density, 1e-2)
+        assert gas != heos.specify_phase(Phases.Gas).with_state(*inputs)
+
     def test_factory_always_fluids_are_constant(self):
         assert self.mixture.factory().fluids == self.mixture.fluids
 
@@ -83,6 +121,172 @@ class TestMixture:
         assert self.mixture.pressure == 101325
         assert self.mixture.temperature == 20
 
+    def test_partial_derivative_matches_specific_heat(self):
+        mixture = self.mixture.with_state(Input.pressure(101325), Input.temperature(20))
+        assert mixture.partial_derivative(
+            Parameters.Enthalpy, Parameters.Temperature, Parameters.Pressure
+        ) == pytest.approx(mixture.specific_heat)
+
+    def test_solve_state_outputs_pair_matches_expected_state(self):
+        expected = self.mixture.with_state(Input.pressure(5e5), Input.temperature(60))
+        solution = self.mixture.solve_state(
+            Target.density(expected.density),
+            Target.enthalpy(expected.enthalpy),
+            guess=[Input.pressure(101325), Input.temperature(40)],
+        )
+        assert solution.iterations > 0
+        assert solution.fluid.pressure == pytest.approx(expected.pressure)
+        assert solution.fluid.temperature == pytest.approx(expected.temperature)
+
+    def test_sweep_pressure_enthalpy_matches_expected_states(self):
+        origin = self.mixture.with_state(Input.pressure(101325), Input.temperature(20))
+        temperatures = [30, 40, 50]
+        expected = [
+            self.mixture.with_state(Input.pressure(2e5), Input.temperature(i))
+            for i in temperatures
+        ]
+        states = origin.sweep(
+            Input.pressure(2e5), Input.enthalpy, [i.enthalpy for i in expected]
+        )
+        for temperature, state in zip(temperatures, states):
+            assert state.temperature == pytest.approx(temperature)
+
+    def test_with_fractions_returns_new_instance_with_other_fractions(self):
+        mixture = self.mixture.with_fractions([70, 30])
+        assert mixture.fluids == self.mixture.fluids
+        assert mixture.fractions == [70, 30]
+        assert mixture.phase == Phases.Unknown
+        assert self.mixture.fractions == [60, 40]
+
+    def test_with_fractions_wrong_fractions_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            self.mixture.with_fractions([50, 20, 30])
+        assert "Invalid input! Fluids and fractions " in str(e.value)
+
+    def test_set_fractions_reuses_backend(self):
+        mixture = self.mixture.with_state(Input.pressure(101325), Input.temperature(20))
+        backend = mixture._backend
+        assert mixture.set_fractions([70, 30]) is mixture
+        assert mixture._backend is backend
+        assert mixture.fractions == [70, 30]
+        mixture.update(Input.pressure(101325), Input.temperature(20))
+        assert (
+            mixture.density
+            == self.mixture.with_fractions([70, 30])
+            .with_state(Input.pressure(101325), Input.temperature(20))
+            .density
+        )
+
+    def test_set_fractions_wrong_fractions_raises_value_error(self):
+        mixture = self.mixture.factory()
+        with pytest.raises(ValueError) as e:
+            mixture.set_fractions([50, 20, 30])
+        assert "Invalid input! Fluids and fractions " in str(e.value)
+        assert mixture.fractions == [60, 40]
+
+    def test_composition_sweep_matches_new_instances(self):
+        fractions = [[i, 100 - i] for i in (10, 20, 30, 40)]
+        inputs = [Input.pressure(101325), Input.temperature(20)]
+        states = self.mixture.composition_sweep(fractions, *inputs)
+        for composition, state in zip(fractions, states):
+            expected = Mixture(self.mixture.fluids, composition).with_state(*inputs)
+            assert state.fractions == composition
+            assert state.density == pytest.approx(expected.density)
+            assert state.molar_mass == pytest.approx(expected.molar_mass)
+
+    def test_composition_sweep_wrong_fractions_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            list(
+                self.mixture.composition_sweep(
+                    [[80, 80]], Input.pressure(101325), Input.temperature(20)
+                )
+            )
+        assert "Their sum should be equal to 100 %." in str(e.value)
+
+    def test_composition_grid_matches_new_instances(self):
+        fractions = [[20, 80], [40, 60]]
+        states = [
+            [Input.pressure(101325), Input.temperature(20)],
+            [Input.pressure(101325), Input.pressure(1e5)],
+            [Input.pressure(1e6), Input.temperature(40)],
+        ]
+        grid = self.mixture.composition_grid(fractions, states, ["density", "enthalpy"])
+        assert list(grid) == ["density", "enthalpy"]
+        for row, composition in enumerate(fractions):
+            mixture = Mixture(self.mixture.fluids, composition)
+            for column, inputs in enumerate(states):
+                if column == 1:
+                    assert grid["density"][row][column] is None
+                    continue
+                expected = mixture.with_state(*inputs)
+                assert grid["density"][row][column] == pytest.approx(expected.density)
+                assert grid["enthalpy"][row][column] == pytest.approx(expected.enthalpy)
+
+    def test_composition_grid_wrong_properties_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            self.mixture.composition_grid([[50, 50]], [], ["density", "foo"])
+        assert "Invalid properties: foo!" in str(e.value)
+
+    def test_critical_points_are_cached_per_composition(self):
+        mixture = Mixture([FluidsList.R32, FluidsList.R125], [50, 50])
+        points = mixture.critical_points()
+        assert CriticalPointsCache().is_cached(mixture._composition_key())
+        assert mixture.factory().critical_points() == points
+        stable = [i for i in points if i.stable]
+        assert len(stable) == 1
+        state = mixture.with_state(Input.pressure(101325), Input.temperature(20))
+        assert state.critical_pressure == stable[0].pressure
+        assert state.critical_temperature == pytest.approx(stable[0].temperature)
+        assert state.critical_temperature == pytest.approx(71.344, abs=1e-3)
+
+    def test_phase_envelope_matches_saturated_states(self):
+        envelope = self.mixture.phase_envelope()
+        assert envelope.qualities[0] == 100
+        assert envelope.qualities[-1] == 0
+        assert envelope.cricondenbar == max(envelope.pressures)
+        assert envelope.cricondentherm == max(envelope.temperatures)
+        for i, point in (
+            (10, self.mixture.dew_point_at_pressure(envelope.pressures[10])),
+            (-10, self.mixture.bubble_point_at_pressure(envelope.pressures[-10])),
+        ):
+            assert envelope.temperatures[i] == pytest.approx(
+                point.temperature, abs=1e-4
+            )
+            assert envelope.densities[i] == pytest.approx(point.density, 1e-4)
+            assert envelope.enthalpies[i] == pytest.approx(point.enthalpy, 1e-4)
+            assert envelope.entropies[i] == pytest.approx(point.entropy, 1e-4)
+
+    def test_phase_envelope_is_cached_per_composition(self):
+        self.mixture.phase_envelope()
+        assert PhaseEnvelopeCache().is_cached(self.mixture._composition_key())
+        assert not PhaseEnvelopeCache().is_cached(
+            Mixture(self.mixture.fluids, [50, 50])._composition_key()
+        )
+
+    @pytest.mark.parametrize("pressure", [1e4, 101325, 1e6])
+    def test_bubble_and_dew_points_from_phase_envelope_match_flash(
+        self, pressure: float
+    ):
+        PhaseEnvelopeCache().enabled = False
+        try:
+            expected = (
+                self.mixture.bubble_point_at_pressure(pressure),
+                self.mixture.dew_point_at_pressure(pressure),
+            )
+        finally:
+            PhaseEnvelopeCache().enabled = True
+        self.mixture.phase_envelope()
+        actual = (
+            self.mixture.bubble_point_at_pressure(pressure),
+            self.mixture.dew_point_at_pressure(pressure),
+        )
+        for point, expected_point in zip(actual, expected):
+            assert point.pressure == pressure
+            assert point.temperature == pytest.approx(
+                expected_point.temperature, abs=1e-6
+            )
+            assert point.density == pytest.approx(expected_point.density, 1e-6)
+
     def test_equals_same_returns_true(self):
         origin = self.mixture.with_state(Input.pressure(101325), Input.temperature(15))
         same = self.mixture.with_state(Input.pressure(101325), Input.temperature(15))
@@ -0,0 +1,171 @@
+import pytest
+
+from pyfluids import (
+    CounterflowHeatExchanger,
+    Fluid,
+    FluidsList,
+    Input,
+    Phases,
+    TemperatureProfile,
+)
+
+
+class TestCounterflowHeatExchanger:
+    refrigerant: Fluid = (
+        Fluid(FluidsList.R134a).dew_point_at_temperature(40).heating_to_temperature(70)
+    )
+    water: Fluid = Fluid(FluidsList.Water).with_state(
+        Input.pressure(2e5), Input.temperature(25)
+    )
+    exchanger: CounterflowHeatExchanger = CounterflowHeatExchanger(10)
+
+    def profile(self, **kwargs) -> TemperatureProfile:
+        arguments = {
+            "hot_inlet": self.refrigerant,
+            "hot_mass_flow_rate": 0.1,
+            "cold_inlet": self.water,
+            "cold_mass_flow_rate": 0.5,
+            "heat_flow": 2e4,
+        }
+        return self.exchanger.profile(**{**arguments, **kwargs})
+
+    @pytest.mark.parametrize("segments", [0, -1])
+    def test_init_invalid_segments_raises_value_error(self, segments: int):
+        with pytest.raises(ValueError, match="Invalid number of segments!"):
+            CounterflowHeatExchanger(segments)
+
+    def test_segments_returns_entered_value(self):
+        assert CounterflowHeatExchanger().segments == 20
+        assert self.exchanger.segments == 10
+
+    def test_profile_nodes_match_independent_states(self):
+        profile = self.profile(hot_pressure_drop=5e3, cold_pressure_drop=1e4)
+        assert len(profile.heat_flows) == 11
+        assert profile.heat_flows[0] == 0
+        assert profile.heat_flows[-1] == pytest.approx(2e4)
+        for i, heat_flow in enumerate(profile.heat_flows):
+            hot = self.refrigerant.with_state(
+                Input.pressure(self.refrigerant.pressure - 5e3 * heat_flow / 2e4),
+                Input.enthalpy(self.refrigerant.enthalpy - heat_flow / 0.1),
+            )
+            cold = self.water.with_state(
+                Input.pressure(self.water.pressure - 1e4 * (2e4 - heat_flow) / 2e4),
+                Input.enthalpy(self.water.enthalpy + (2e4 - heat_flow) / 0.5),
+            )
+            assert profile.hot_temperatures[i] == pytest.approx(hot.temperature)
+            assert profile.cold_temperatures[i] == pytest.approx(cold.temperature)
+
+    @pytest.mark.parametrize("segments", [1, 2])
+    def test_profile_nodes_across_two_phase_region_match_independent_states(
+        self, segments: int
+    ):
+        hot = Fluid(FluidsList.Water).with_state(
+            Input.pressure(5e6), Input.temperature(500)
+        )
+        profile = CounterflowHeatExchanger(segments).profile(
+            hot, 1, self.water, 0.01, 3e4
+        )
+        for i, heat_flow in enumerate(profile.heat_flows):
+            cold = self.water.with_state(
+                Input.pressure(self.water.pressure),
+                Input.enthalpy(self.water.enthalpy + (3e4 - heat_flow) / 0.01),
+            )
+            assert profile.cold_temperatures[i] == pytest.approx(cold.temperature, 1e-9)
+        assert profile.cold_outlet.phase == Phases.Gas
+
+    def test_profile_zeotropic_blend_has_temperature_glide(self):
+        blend = Fluid(FluidsList.R454B).with_state(
+            Input.pressure(25e5), Input.temperature(80)
+        )
+        profile = self.profile(hot_inlet=blend, heat_flow=2.5e4)
+        bubble = blend.bubble_point_at_pressure(25e5)
+        dew = blend.dew_point_at_pressure(25e5)
+        assert all(
+            i > j
+            for i, j in zip(profile.hot_temperatures, profile.hot_temperatures[1:])
+        )
+        condensing = [
+            i
+            for i in profile.hot_temperatures
+            if bubble.temperature < i < dew.temperature
+        ]
+        assert len(condensing) > 2
+        assert profile.hot_outlet.enthalpy == pytest.approx(blend.enthalpy - 2.5e5)
+        assert profile.hot_outlet.temperature < bubble.temperature
+        assert profile.hot_outlet.density == pytest.approx(
+            blend.with_state(
+                Input.pressure(25e5),
+                Input.temperature(profile.hot_outlet.temperature),
+            ).density
+        )
+
+    def test_profile_inlets_and_outlets(self):
+        profile = self.profile(hot_pressure_drop=5e3, cold_pressure_drop=1e4)
+        assert profile.hot_temperatures[0] == pytest.approx(70)
+        assert profile.cold_temperatures[-1] == pytest.approx(25)
+        assert profile.hot_outlet.pressure == pytest.approx(
+            self.refrigerant.pressure - 5e3
+        )
+        assert profile.hot_outlet.enthalpy == pytest.approx(
+            self.refrigerant.enthalpy - 2e5
+        )
+        assert profile.hot_outlet.temperature == pytest.approx(
+            profile.hot_temperatures[-1]
+        )
+        assert profile.cold_outlet.pressure == pytest.approx(self.water.pressure - 1e4)
+        assert profile.cold_outlet.enthalpy == pytest.approx(self.water.enthalpy + 4e4)
+        assert profile.cold_outlet.temperature == pytest.approx(
+            profile.cold_temperatures[0]
+        )
+
+    def test_profile_does_not_change_inlets(self):
+        refrigerant, water = self.refrigerant.clone(), self.water.clone()
+        self.profile()
+        assert self.refrigerant == refrigerant
+        assert self.water == water
+
+    def test_profile_pinch_point(self):
+        profile = self.profile()
+        differences = profile.temperature_differences
+        assert differences == pytest.approx(
+            [
+                hot - cold
+                for hot, cold in zip(
+                    profile.hot_temperatures, profile.cold_temperatures
+                )
+            ]
+        )
+        assert profile.minimum_temperature_difference == min(differences)
+        # Pinch point at the dew point of the refrigerant
+        assert (
+            profile.pinch_heat_flow
+            == profile.heat_flows[differences.index(min(differences))]
+        )
+        assert profile.hot_temperatures[
+            profile.heat_flows.index(profile.pinch_heat_flow)
+        ] == pytest.approx(40, abs=0.1)
+
+    def test_profile_temperature_cross_has_negative_minimum_difference(self):
+        assert self.profile(cold_mass_flow_rate=0.1).minimum_temperature_difference < 0
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"hot_mass_flow_rate": 0}, "Invalid mass flow rate!"),
+            ({"cold_mass_flow_rate": -1}, "Invalid mass flow rate!"),
+            ({"heat_flow": 0}, "Invalid heat flow!"),
+            (
+                {"hot_pressure_drop": -1},
+                "Invalid pressure drop in the heat exchanger!",
+            ),
+            (
+                {"cold_pressure_drop": -1},
+                "Invalid pressure drop in the heat exchanger!",
+            ),
+        ],
+    )
+    def test_profile_invalid_input_raises_value_error(
+        self, kwargs: dict[str, float], message: str
+    ):
+        with pytest.raises(ValueError, match=message):
+            self.profile(**kwargs)
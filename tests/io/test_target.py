@@ -0,0 +1,42 @@
+import CoolProp
+import pytest
+
+from pyfluids import Target
+
+
+class TestTarget:
+    @pytest.mark.parametrize(
+        "target, coolprop_key",
+        [
+            (Target.compressibility(0.9), CoolProp.iZ),
+            (Target.conductivity(0.6), CoolProp.iconductivity),
+            (Target.density(999), CoolProp.iDmass),
+            (Target.dynamic_viscosity(1e-3), CoolProp.iviscosity),
+            (Target.enthalpy(1e3), CoolProp.iHmass),
+            (Target.entropy(5e3), CoolProp.iSmass),
+            (Target.internal_energy(1e4), CoolProp.iUmass),
+            (Target.prandtl(7), CoolProp.iPrandtl),
+            (Target.pressure(101325), CoolProp.iP),
+            (Target.sound_speed(1480), CoolProp.ispeed_sound),
+            (Target.specific_heat(4180), CoolProp.iCpmass),
+            (Target.specific_volume(1 / 999), CoolProp.iDmass),
+            (Target.temperature(20), CoolProp.iT),
+        ],
+    )
+    def test_coolprop_key_all_targets_matches_with_coolprop(
+        self, target: Target, coolprop_key: int
+    ):
+        assert target.coolprop_key == coolprop_key
+
+    @pytest.mark.parametrize(
+        "target, value",
+        [
+            (Target.dynamic_viscosity(1e-3), 1e-3),
+            (Target.specific_volume(1 / 999), 999),
+            (Target.temperature(20), 293.15),
+        ],
+    )
+    def test_value_all_targets_should_be_in_si_units(
+        self, target: Target, value: float
+    ):
+        assert target.value == value
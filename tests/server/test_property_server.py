@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyfluids import (
+    BatchEvaluator,
+    Fluid,
+    FluidsList,
+    HumidAir,
+    Input,
+    InputHumidAir,
+    Mixture,
+    PropertyServer,
+)
+
+REQUESTS = [
+    {
+        "id": 1,
+        "fluid": {"name": "Water"},
+        "inputs": {"pressure": 101325, "temperature": 20},
+        "outputs": ["density", "phase"],
+    },
+    {
+        "id": 2,
+        "mixture": {"fluids": ["Argon", "IsoButane"], "fractions": [50, 50]},
+        "inputs": {"pressure": 101325, "temperature": 20},
+        "outputs": ["density"],
+    },
+    {
+        "id": 3,
+        "humid_air": {},
+        "inputs": {"altitude": 0, "temperature": 20, "relative_humidity": 50},
+        "outputs": ["humidity"],
+    },
+    {
+        "id": 4,
+        "fluid": {"name": "Water"},
+        "inputs": {"pressure": -1, "temperature": 20},
+        "outputs": ["density"],
+    },
+    {
+        "id": 5,
+        "fluid": {"name": "MPG", "fraction": 200},
+        "inputs": {"pressure": 101325, "temperature": 20},
+        "outputs": ["density"],
+    },
+]
+
+
+def ndjson(requests: list[dict[str, Any]]) -> bytes:
+    return "".join(json.dumps(i) + "\n" for i in requests).encode("utf-8")
+
+
+def parse_ndjson(body: bytes) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def post(server: PropertyServer, body: bytes, content_type: str) -> tuple[int, bytes]:
+    connection = http.client.HTTPConnection(*server.address)
+    connection.request("POST", "/evaluate", body, {"Content-Type": content_type})
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+def get(server: PropertyServer, path: str) -> tuple[int, bytes]:
+    connection = http.client.HTTPConnection(*server.address)
+    connection.request("GET", path)
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+class TestPropertyServer:
+    @pytest.fixture
+    def server(self) -> PropertyServer:
+        with PropertyServer(max_workers=2, coalescing_window=0.001) as server:
+            yield server
+
+    def test_invalid_cache_size_raises_value_error(self):
+        with pytest.raises(ValueError) as e:
+            PropertyServer(cache_size=-1)
+        assert "Invalid cache size! It should be non-negative." in str(e.value)
+
+    def test_url_returns_localhost_url(self, server: PropertyServer):
+        assert server.url == f"http://127.0.0.1:{server.address[1]}"
+
+    def test_evaluate_ndjson_returns_results_for_each_request(
+        self, server: PropertyServer
+    ):
+        status, body = post(server, ndjson(REQUESTS), PropertyServer.NDJSON)
+        results = parse_ndjson(body)
+        assert status == 200
+        assert results[0] == {
+            "id": 1,
+            "outputs": {
+                "density": Fluid(FluidsList.Water)
+                .with_state(Input.pressure(101325), Input.temperature(20))
+                .density,
+                "phase": "Liquid",
+            },
+        }
+        assert results[1]["outputs"]["density"] == (
+            Mixture([FluidsList.Argon, FluidsList.IsoButane], [50, 50])
+            .with_state(Input.pressure(101325), Input.temperature(20))
+            .density
+        )
+        assert results[2]["outputs"]["humidity"] == (
+            HumidAir()
+            .with_state(
+                InputHumidAir.altitude(0),
+                InputHumidAir.temperature(20),
+                InputHumidAir.relative_humidity(50),
+            )
+            .humidity
+        )
+        assert results[3] == {"id": 4, "error": "Invalid or not defined state!"}
+        assert "Invalid fraction value!" in results[4]["error"]
+
+    def test_evaluate_msgpack_returns_results_for_each_request(
+        self, server: PropertyServer
+    ):
+        msgpack = pytest.importorskip("msgpack")
+        status, body = post(server, msgpack.packb(REQUESTS), PropertyServer.MSGPACK)
+        assert status == 200
+        assert msgpack.unpackb(body) == parse_ndjson(
+            post(server, ndjson(REQUESTS), PropertyServer.NDJSON)[1]
+        )
+
+    def test_evaluate_invalid_body_returns_bad_request(self, server: PropertyServer):
+        status, body = post(server, b"{not a json", PropertyServer.NDJSON)
+        assert status == 400
+        assert "error" in json.loads(body)
+
+    def test_unknown_paths_return_not_found(self, server: PropertyServer):
+        assert get(server, "/unknown")[0] == 404
+        assert post(server, b"", PropertyServer.NDJSON)[0] == 200
+        connection = http.client.HTTPConnection(*server.address)
+        connection.request("POST", "/unknown", b"")
+        assert connection.getresponse().status == 404
+
+    def test_repeated_requests_are_served_from_cache(self, server: PropertyServer):
+        first = server.evaluate(REQUESTS[:1])
+        second = server.evaluate(REQUESTS[:1])
+        assert first == second
+        assert server.metrics["cache_hits"] == 1
+
+    def test_concurrent_requests_are_coalesced(self):
+        requests = [
+            {
+                "id": i,
+                "fluid": {"name": "Water"},
+                "inputs": {"pressure": 101325, "temperature": i},
+                "outputs": ["density"],
+            }
+            for i in range(1, 33)
+        ]
+        with PropertyServer(max_workers=2, coalescing_window=0.2) as server:
+            with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+                results = list(executor.map(lambda i: server.evaluate([i]), requests))
+            metrics = server.metrics
+        assert [i[0]["id"] for i in results] == list(range(1, 33))
+        assert metrics["batches"] < len(requests)
+        assert metrics["mean_batch_size"] > 1
+
+    def test_metrics_returns_throughput_and_latency(self, server: PropertyServer):
+        post(server, ndjson(REQUESTS), PropertyServer.NDJSON)
+        status, body = get(server, "/metrics")
+        metrics = json.loads(body)
+        assert status == 200
+        assert metrics["requests"] == 1
+        assert metrics["states"] == len(REQUESTS)
+        assert metrics["errors"] == 2
+        assert metrics["throughput"] > 0
+        assert 0 < metrics["latency_p50"] <= metrics["latency_p99"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets only")
+    def test_unix_socket_serves_requests(self, tmp_path: Path):
+        path = str(tmp_path / "pyfluids.sock")
+        with PropertyServer(unix_socket=path) as server:
+            assert server.address == path
+            assert server.url is None
+            body = ndjson(REQUESTS[:1])
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(path)
+                client.sendall(
+                    b"POST /evaluate HTTP/1.1\r\nHost: localhost\r\n"
+                    b"Connection: close\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                response = b""
+                while chunk := client.recv(65536):
+                    response += chunk
+        assert response.startswith(b"HTTP/1.1 200")
+        assert parse_ndjson(response.split(b"\r\n\r\n", 1)[1])[0]["id"] == 1
+        assert not Path(path).exists()
+
+    def test_evaluate_distinguishes_fractions_of_binary_mixtures(self):
+        requests = [
+            {
+                "id": fraction,
+                "fluid": {"name": "MPG", "fraction": fraction},
+                "inputs": {"pressure": 101325, "temperature": 20},
+                "outputs": ["density"],
+            }
+            for fraction in (20, 60)
+        ]
+        with PropertyServer(max_workers=1, coalescing_window=0.001) as server:
+            results = [server.evaluate([request])[0] for request in requests]
+        assert results == [
+            {
+                "id": fraction,
+                "outputs": {
+                    "density": Fluid(FluidsList.MPG, fraction)
+                    .with_state(Input.pressure(101325), Input.temperature(20))
+                    .density
+                },
+            }
+            for fraction in (20, 60)
+        ]
+
+    def test_evaluate_evaluator_runtime_error_returns_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        def evaluate(*_):
+            raise RuntimeError("Worker process cannot be started!")
+
+        monkeypatch.setattr(BatchEvaluator, "evaluate", evaluate)
+        with PropertyServer(coalescing_window=0.001) as server:
+            results = server.evaluate(REQUESTS[:1])
+        assert results == [{"id": 1, "error": "Worker process cannot be started!"}]
+
+    def test_latency_budget_reports_timeouts_and_durations(self):
+        with PropertyServer(coalescing_window=0.001, latency_budget=1e-5) as server:
+            results = server.evaluate(REQUESTS[1:2])
+            metrics = server.metrics
+        assert results == [{"id": 2, "error": "Latency budget exceeded!"}]
+        assert metrics["timeouts"] == 1
+        assert metrics["durations"] == {"P&T": {"buckets": {}, "timeouts": 1}}
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyfluids import BatchEvaluator, Fluid, FluidsList, Input, RequestCoalescer
+
+
+class TestRequestCoalescer:
+    fluid: Fluid = Fluid(FluidsList.Water)
+
+    @pytest.mark.parametrize(
+        "window, max_batch_size, message",
+        [
+            (-1, 1, "Invalid coalescing window! It should be non-negative."),
+            (0, 0, "Invalid maximum batch size! It should be positive."),
+        ],
+    )
+    def test_invalid_settings_raises_value_error(
+        self, window: float, max_batch_size: int, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            RequestCoalescer(BatchEvaluator(1), window, max_batch_size)
+        assert message in str(e.value)
+
+    def test_submit_concurrent_requests_are_coalesced(self):
+        batches = []
+        coalescer = RequestCoalescer(BatchEvaluator(2), 0.2, on_batch=batches.append)
+        states = [
+            (Input.pressure(101325), Input.temperature(temperature))
+            for temperature in range(10, 90, 10)
+        ]
+        with ThreadPoolExecutor(max_workers=len(states)) as executor:
+            futures = list(
+                executor.map(
+                    lambda i: coalescer.submit(self.fluid, i, ["density"]), states
+                )
+            )
+        results = [future.result() for future in futures]
+        coalescer.close()
+        assert results == [
+            {"density": self.fluid.with_state(*i).density} for i in states
+        ]
+        assert sum(batches) == len(states)
+        assert len(batches) < len(states)
+
+    def test_submit_respects_max_batch_size(self):
+        batches = []
+        coalescer = RequestCoalescer(BatchEvaluator(1), 0.2, 3, batches.append)
+        futures = [
+            coalescer.submit(
+                self.fluid, (Input.pressure(101325), Input.temperature(20)), ["density"]
+            )
+            for _ in range(7)
+        ]
+        for future in futures:
+            future.result()
+        coalescer.close()
+        assert max(batches) <= 3
+
+    def test_submit_invalid_outputs_sets_exception(self):
+        coalescer = RequestCoalescer(BatchEvaluator(1), 0)
+        future = coalescer.submit(
+            self.fluid, (Input.pressure(101325), Input.temperature(20)), ["magic"]
+        )
+        with pytest.raises(ValueError):
+            future.result()
+        coalescer.close()
+
+    def test_submit_after_close_raises_runtime_error(self):
+        coalescer = RequestCoalescer(BatchEvaluator(1))
+        coalescer.close()
+        with pytest.raises(RuntimeError) as e:
+            coalescer.submit(self.fluid, (), ["density"])
+        assert "The request coalescer is closed!" in str(e.value)
@@ -0,0 +1,144 @@
+from typing import Any
+
+import pytest
+
+from pyfluids import (
+    FluidsList,
+    Input,
+    InputHumidAir,
+    Phases,
+    PrototypeSpec,
+    StateRequest,
+)
+
+
+class TestStateRequest:
+    def test_from_dict_fluid(self):
+        request = StateRequest.from_dict(
+            {
+                "id": 1,
+                "fluid": {"name": "MPG", "fraction": 60, "phase": "Liquid"},
+                "inputs": {"pressure": 101325, "temperature": 20},
+                "outputs": ["density"],
+            }
+        )
+        assert request.id == 1
+        assert request.prototype == PrototypeSpec(
+            "fluid", FluidsList.MPG, 60, phase=Phases.Liquid
+        )
+        assert request.inputs == (Input.pressure(101325), Input.temperature(20))
+        assert request.outputs == ("density",)
+
+    def test_from_dict_mixture(self):
+        request = StateRequest.from_dict(
+            {
+                "mixture": {"fluids": ["Argon", "IsoButane"], "fractions": [50, 50]},
+                "inputs": {"pressure": 101325, "temperature": 20},
+                "outputs": ["density"],
+            }
+        )
+        assert request.prototype == PrototypeSpec(
+            "mixture",
+            fluids=(FluidsList.Argon, FluidsList.IsoButane),
+            fractions=(50, 50),
+        )
+
+    def test_from_dict_mixture_with_backend(self):
+        request = StateRequest.from_dict(
+            {
+                "mixture": {
+                    "fluids": ["R32", "R125"],
+                    "fractions": [50, 50],
+                    "coolprop_backend": "PR",
+                },
+                "inputs": {"pressure": 101325, "temperature": 20},
+                "outputs": ["density"],
+            }
+        )
+        assert request.prototype.create().coolprop_backend == "PR"
+
+    def test_from_dict_humid_air(self):
+        request = StateRequest.from_dict(
+            {
+                "humid_air": {},
+                "inputs": {"altitude": 0, "temperature": 20, "relative_humidity": 50},
+                "outputs": ["humidity"],
+            }
+        )
+        assert request.prototype == PrototypeSpec("humid_air")
+        assert request.inputs == (
+            InputHumidAir.altitude(0),
+            InputHumidAir.temperature(20),
+            InputHumidAir.relative_humidity(50),
+        )
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            ([], "Invalid request! It should be an object."),
+            ({"inputs": {}}, "It should contain one of the keys"),
+            ({"fluid": {}, "humid_air": {}}, "It should contain one of the keys"),
+            (
+                {"fluid": {"name": "Water"}, "inputs": {}, "outputs": ["density"]},
+                "Inputs should be a non-empty object.",
+            ),
+            (
+                {"fluid": {"name": "Water"}, "inputs": {"pressure": 1}, "outputs": []},
+                "Outputs should be a non-empty list of names.",
+            ),
+            (
+                {
+                    "fluid": {"name": "Unobtainium"},
+                    "inputs": {"pressure": 1},
+                    "outputs": ["density"],
+                },
+                "Invalid fluid specification",
+            ),
+            (
+                {
+                    "fluid": {"name": "MPG", "fraction": [60]},
+                    "inputs": {"pressure": 1},
+                    "outputs": ["density"],
+                },
+                "Invalid fluid specification",
+            ),
+            (
+                {
+                    "mixture": {"fluids": ["Argon"]},
+                    "inputs": {"pressure": 1},
+                    "outputs": ["density"],
+                },
+                "Invalid mixture specification",
+            ),
+            (
+                {
+                    "fluid": {"name": "Water"},
+                    "inputs": {"magic": 1},
+                    "outputs": ["density"],
+                },
+                "Invalid input: magic!",
+            ),
+            (
+                {
+                    "fluid": {"name": "Water"},
+                    "inputs": {"value": 1},
+                    "outputs": ["density"],
+                },
+                "Invalid input: value!",
+            ),
+            (
+                {
+                    "fluid": {"name": "Water"},
+                    "inputs": {"pressure": "1"},
+                    "outputs": ["density"],
+                },
+                "Invalid value of the input: pressure!",
+            ),
+        ],
+    )
+    def test_from_dict_invalid_request_raises_value_error(
+        self, data: Any, message: str
+    ):
+        with pytest.raises(ValueError) as e:
+            StateRequest.from_dict(data)
+        assert message in str(e.value)
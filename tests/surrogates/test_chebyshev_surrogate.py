@@ -0,0 +1,184 @@
+import numpy as np
+import pytest
+
+from pyfluids import ChebyshevSurrogate, Fluid, FluidsList, Input
+
+
+class TestChebyshevSurrogate:
+    fluid: Fluid = Fluid(FluidsList.Water)
+    properties: list[str] = ["density", "enthalpy", "dynamic_viscosity"]
+    liquid: ChebyshevSurrogate = ChebyshevSurrogate.fit(
+        fluid, Input.pressure, (1e5, 1e7), Input.temperature, (10, 90), properties
+    )
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"tolerance": 0}, "Invalid tolerance! It should be positive."),
+            ({"degree": 0}, "Invalid degree! It should be at least 1."),
+            ({"validation_points": 0}, "Invalid number of validation points!"),
+            ({"max_depth": -1}, "Invalid maximum depth! It should be non-negative."),
+            ({"properties": ["density", "foo"]}, "Invalid properties: foo!"),
+            ({"first_range": (1e7, 1e5)}, "Invalid ranges!"),
+            ({"first_range": (0, 1e5)}, "Invalid ranges!"),
+        ],
+    )
+    def test_fit_invalid_input_raises_value_error(self, kwargs: dict, message: str):
+        arguments = {
+            "first_range": (1e5, 1e7),
+            "properties": ["density"],
+        } | kwargs
+        with pytest.raises(ValueError, match=message):
+            ChebyshevSurrogate.fit(
+                self.fluid,
+                Input.pressure,
+                arguments.pop("first_range"),
+                Input.temperature,
+                (10, 90),
+                **arguments,
+            )
+
+    def test_fit_two_phase_region_raises_value_error(self):
+        with pytest.raises(ValueError, match="only single-phase states"):
+            ChebyshevSurrogate.fit(
+                self.fluid,
+                Input.pressure,
+                (1e5, 1e6),
+                Input.enthalpy,
+                (1e6, 3e6),
+                ["density"],
+            )
+
+    def test_fit_across_saturation_line_raises_value_error(self):
+        with pytest.raises(ValueError, match="Unable to meet the tolerance!"):
+            ChebyshevSurrogate.fit(
+                self.fluid,
+                Input.pressure,
+                (1e5, 1e7),
+                Input.temperature,
+                (50, 200),
+                ["density"],
+                max_depth=1,
+            )
+
+    def test_properties_return_fitted_values(self):
+        assert self.liquid.inputs == ("pressure", "temperature")
+        assert self.liquid.properties == tuple(self.properties)
+        assert self.liquid.degree == 12
+        assert self.liquid.patches == 1
+        assert self.liquid.first_range == (1e5, 1e7)
+        assert self.liquid.second_range == (10, 90)
+        assert 0 < self.liquid.max_error <= 1e-6
+
+    @pytest.mark.parametrize(
+        "first_input, first_range, second_input, second_range",
+        [
+            (Input.pressure, (1e5, 1e7), Input.temperature, (10, 90)),
+            (Input.pressure, (1e4, 1e6), Input.enthalpy, (2.8e6, 3.5e6)),
+        ],
+    )
+    def test_evaluate_matches_flash_calculations(
+        self,
+        first_input,
+        first_range: tuple[float, float],
+        second_input,
+        second_range: tuple[float, float],
+    ):
+        surrogate = ChebyshevSurrogate.fit(
+            self.fluid,
+            first_input,
+            first_range,
+            second_input,
+            second_range,
+            self.properties,
+            degree=8,
+        )
+        rng = np.random.default_rng(0)
+        first = np.exp(rng.uniform(*np.log(first_range), 20))
+        second = rng.uniform(*second_range, 20)
+        values = surrogate.evaluate(first, second)
+        for i in range(20):
+            expected = self.fluid.with_state(
+                first_input(first[i]), second_input(second[i])
+            )
+            for key in self.properties:
+                assert values[key][i] == pytest.approx(getattr(expected, key), rel=1e-6)
+
+    def test_evaluate_is_refined_where_tolerance_is_not_met(self):
+        surrogate = ChebyshevSurrogate.fit(
+            self.fluid,
+            Input.pressure,
+            (1e4, 1e6),
+            Input.enthalpy,
+            (2.8e6, 3.5e6),
+            ["density"],
+            degree=6,
+        )
+        assert surrogate.patches > 1
+        assert surrogate.max_error <= 1e-6
+        pressures, enthalpies = np.meshgrid(
+            np.geomspace(1e4, 1e6, 7), np.linspace(2.8e6, 3.5e6, 7)
+        )
+        densities = surrogate.evaluate(pressures, enthalpies)["density"]
+        assert densities.shape == (7, 7)
+        for pressure, enthalpy, density in zip(
+            pressures.ravel(), enthalpies.ravel(), densities.ravel()
+        ):
+            assert density == pytest.approx(
+                self.fluid.with_state(
+                    Input.pressure(pressure), Input.enthalpy(enthalpy)
+                ).density,
+                rel=1e-6,
+            )
+
+    def test_evaluate_out_of_range_returns_nan(self):
+        values = self.liquid.evaluate([1e4, 1e6, 1e6, 1e6], [50, 5, 50, np.nan])
+        assert np.isnan(values["density"][[0, 1, 3]]).all()
+        assert not np.isnan(values["density"][2])
+
+    def test_evaluate_scalars_returns_zero_dimensional_arrays(self):
+        density = self.liquid.evaluate(1e6, 50)["density"]
+        assert density.shape == ()
+        assert float(density) == pytest.approx(
+            self.fluid.with_state(Input.pressure(1e6), Input.temperature(50)).density,
+            rel=1e-6,
+        )
+
+    def test_as_json_from_json_round_trip(self):
+        restored = ChebyshevSurrogate.from_json(self.liquid.as_json())
+        assert restored.as_dict() == self.liquid.as_dict()
+        pressures, temperatures = np.geomspace(1e5, 1e7, 5), np.linspace(10, 90, 5)
+        for key, values in self.liquid.evaluate(pressures, temperatures).items():
+            assert np.array_equal(
+                restored.evaluate(pressures, temperatures)[key], values
+            )
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            ({}, "Invalid surrogate model data!"),
+            (
+                {
+                    "inputs": ["pressure", "foo"],
+                    "properties": ["density"],
+                    "max_error": 0,
+                    "bounds": [[1e5, 1e7, 10, 90]],
+                    "coefficients": [[[[1]]]],
+                },
+                "Invalid inputs!",
+            ),
+            (
+                {
+                    "inputs": ["pressure", "temperature"],
+                    "properties": ["density"],
+                    "max_error": 0,
+                    "bounds": [[1e5, 1e7, 10]],
+                    "coefficients": [[[[1]]]],
+                },
+                "Invalid shapes of bounds or coefficients!",
+            ),
+        ],
+    )
+    def test_from_dict_invalid_data_raises_value_error(self, data: dict, message: str):
+        with pytest.raises(ValueError, match=message):
+            ChebyshevSurrogate.from_dict(data)
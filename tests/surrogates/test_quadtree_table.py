@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyfluids import Fluid, FluidsList, Input, QuadtreeTable
+
+
+class TestQuadtreeTable:
+    fluid: Fluid = Fluid(FluidsList.Water)
+    properties: list[str] = ["temperature", "specific_volume", "entropy"]
+    table: QuadtreeTable = QuadtreeTable.build(
+        fluid, (1e5, 1e6), (1e5, 3.2e6), properties, max_depth=5
+    )
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"tolerance": 0}, "Invalid tolerance! It should be positive."),
+            ({"min_depth": -1}, "Invalid depths!"),
+            ({"min_depth": 3, "max_depth": 2}, "Invalid depths!"),
+            ({"properties": ["density", "foo"]}, "Invalid properties: foo!"),
+            ({"pressure_range": (1e6, 1e5)}, "Invalid ranges!"),
+            ({"pressure_range": (0, 1e5)}, "Invalid ranges!"),
+            ({"enthalpy_range": (3e6, 1e5)}, "Invalid ranges!"),
+        ],
+    )
+    def test_build_invalid_input_raises_value_error(self, kwargs: dict, message: str):
+        arguments = {
+            "pressure_range": (1e5, 1e6),
+            "enthalpy_range": (1e5, 3.2e6),
+            "properties": ["density"],
+        } | kwargs
+        with pytest.raises(ValueError, match=message):
+            QuadtreeTable.build(self.fluid, **arguments)
+
+    def test_properties_return_built_values(self):
+        assert self.table.properties == tuple(self.properties)
+        assert self.table.tolerance == 1e-4
+        assert self.table.pressure_range == (1e5, 1e6)
+        assert self.table.enthalpy_range == (1e5, 3.2e6)
+        assert 2 <= self.table.depth <= 5
+        assert self.table.leaves + self.table.invalid_leaves < self.table.nodes
+        assert (self.table.nodes - 1) % 4 == 0
+        assert self.table.nbytes == 8 * (
+            5 + self.table.nodes + 9 * len(self.properties) * self.table.leaves
+        )
+
+    def test_build_refines_only_where_tolerance_is_not_met(self):
+        coarse = QuadtreeTable.build(
+            self.fluid, (1e5, 1e6), (1e5, 3.2e6), self.properties, 1e-2, 0, 5
+        )
+        assert coarse.nodes < self.table.nodes
+        assert coarse.depth == self.table.depth == 5
+
+    def test_evaluate_matches_flash_calculations(self):
+        rng = np.random.default_rng(0)
+        pressures = np.exp(rng.uniform(np.log(1e5), np.log(1e6), 100))
+        enthalpies = rng.uniform(1e5, 3.2e6, 100)
+        values = self.table.evaluate(pressures, enthalpies)
+        valid = ~np.isnan(values["specific_volume"])
+        assert np.count_nonzero(valid) > 80
+        for i in np.flatnonzero(valid):
+            expected = self.fluid.with_state(
+                Input.pressure(pressures[i]), Input.enthalpy(enthalpies[i])
+            )
+            assert values["specific_volume"][i] == pytest.approx(
+                expected.specific_volume, rel=1e-4
+            )
+            assert values["temperature"][i] == pytest.approx(
+                expected.temperature, rel=1e-4, abs=1e-2
+            )
+            assert values["entropy"][i] == pytest.approx(
+                expected.entropy, rel=1e-4, abs=1
+            )
+
+    @pytest.mark.parametrize("pressure", [1.5e5, 5e5])
+    def test_evaluate_at_saturation_lines_returns_nan(self, pressure: float):
+        bubble = self.fluid.bubble_point_at_pressure(pressure).enthalpy
+        dew = self.fluid.dew_point_at_pressure(pressure).enthalpy
+        values = self.table.evaluate(pressure, [bubble, dew])["temperature"]
+        assert np.isnan(values).all()
+        assert self.table.invalid_leaves > 0
+
+    def test_evaluate_out_of_range_returns_nan(self):
+        values = self.table.evaluate([1e4, 5e5, 5e5, 5e5], [1e6, 5e4, 1e6, np.nan])
+        assert np.isnan(values["temperature"][[0, 1, 3]]).all()
+        assert not np.isnan(values["temperature"][2])
+
+    def test_evaluate_scalars_returns_zero_dimensional_arrays(self):
+        temperature = self.table.evaluate(5e5, 1e6)["temperature"]
+        assert temperature.shape == ()
+        assert float(temperature) == pytest.approx(
+            self.fluid.bubble_point_at_pressure(5e5).temperature, rel=1e-4
+        )
+
+    @pytest.mark.parametrize("memory_map", [True, False])
+    def test_save_load_round_trip(self, tmp_path: Path, memory_map: bool):
+        path = tmp_path / "water.npy"
+        self.table.save(path)
+        assert path.with_suffix(".json").exists()
+        loaded = QuadtreeTable.load(path, memory_map)
+        assert loaded.properties == self.table.properties
+        assert loaded.tolerance == self.table.tolerance
+        assert loaded.nodes == self.table.nodes
+        pressures, enthalpies = np.meshgrid(
+            np.geomspace(1e5, 1e6, 20), np.linspace(1e5, 3.2e6, 20)
+        )
+        expected = self.table.evaluate(pressures, enthalpies)
+        for key, values in loaded.evaluate(pressures, enthalpies).items():
+            assert values.shape == (20, 20)
+            assert np.array_equal(values, expected[key], equal_nan=True)
+
+    def test_load_missing_files_raises_value_error(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="Invalid table files!"):
+            QuadtreeTable.load(tmp_path / "missing.npy")
+
+    def test_init_invalid_data_raises_value_error(self):
+        with pytest.raises(ValueError, match="Invalid table data!"):
+            QuadtreeTable(["density"], np.array([10.0, 1e5, 1e6, 0, 1]), 1e-4)